@@ -0,0 +1,106 @@
+"""Benchmark column checks on the columnar store against column objects.
+
+Run from the repository root with:
+
+    PYTHONPATH=src:benchmarks python benchmarks/bench_column_store.py
+
+The store uses NumPy arrays if NumPy is installed, and lists otherwise.
+"""
+
+import argparse
+import gc
+import time
+from typing import Callable
+
+from synthetic_manifest import make_manifest
+
+from utils.column_store import ColumnStore, get_numpy
+from utils.manifest_object.node.model.model import ManifestModel
+
+NAME_PATTERN = "^[a-z_0-9]+$"
+
+
+def check_column_objects(models: list[ManifestModel]) -> tuple[set[str], set[str]]:
+    """Find the columns without descriptions or matching names, one object at a time.
+
+    Args:
+        models: model objects.
+
+    Returns:
+        unique IDs of the columns without descriptions, and of those whose
+        names do not match the pattern.
+    """
+    columns = [column for model in models for column in model.columns]
+    return (
+        {column.unique_id for column in columns if not column.description},
+        {
+            column.unique_id
+            for column in columns
+            if not column.name_matches_regex(NAME_PATTERN)
+        },
+    )
+
+
+def check_column_store(models: list[ManifestModel]) -> tuple[set[str], set[str]]:
+    """Find the columns without descriptions or matching names, with masks.
+
+    Args:
+        models: model objects.
+
+    Returns:
+        unique IDs of the columns without descriptions, and of those whose
+        names do not match the pattern.
+    """
+    store = ColumnStore.from_parents(models)
+    return (
+        set(store.get_failing_unique_ids(store.has_description)),
+        set(store.get_failing_unique_ids(store.names_match(NAME_PATTERN))),
+    )
+
+
+def measure(check: Callable[[list[ManifestModel]], tuple], nodes: list[dict]) -> float:
+    """Time a check on fresh model objects, so nothing is cached between runs.
+
+    Args:
+        check: function checking the columns of some models.
+        nodes: data for the models.
+
+    Returns:
+        the time taken in seconds.
+    """
+    models = list(map(ManifestModel, nodes))
+    gc.collect()
+    start = time.perf_counter()
+    check(models)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[2500, 10000, 25000])
+    parser.add_argument("--columns-per-node", type=int, default=100)
+    options = parser.parse_args()
+    print(f"backend: {'numpy' if get_numpy() else 'lists'}")
+    print(f"{'columns':>9} {'column objects':>15} {'column store':>13} {'speed-up':>9}")
+    for node_count in options.nodes:
+        nodes = [
+            node_data
+            for node_data in make_manifest(
+                node_count, columns_per_node=options.columns_per_node
+            )["nodes"].values()
+            if node_data["resource_type"] == "model"
+        ]
+        models = list(map(ManifestModel, nodes))
+        assert check_column_objects(models) == check_column_store(models)
+        column_count = sum(len(node_data["columns"]) for node_data in nodes)
+        object_time = min(measure(check_column_objects, nodes) for _ in range(3))
+        store_time = min(measure(check_column_store, nodes) for _ in range(3))
+        print(
+            f"{column_count:>9} {object_time * 1000:>13.1f}ms"
+            f" {store_time * 1000:>11.1f}ms {object_time / store_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark lineage filters on the mapped lineage graph against the lineage maps.
+
+Run from the repository root with:
+
+    PYTHONPATH=src:benchmarks python benchmarks/bench_lineage_graph.py
+
+Both sides time what a run with a cached manifest does: unpickling the parent
+map and child map and traversing them, or mapping the lineage graph into
+memory and traversing it.
+"""
+
+import argparse
+import mmap
+import pickle
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from synthetic_manifest import make_manifest
+
+from utils.lineage_graph import LineageGraph
+from utils.manifest_diff import get_relatives
+
+
+def expand_with_maps(
+    packed_maps: bytes, filter_values: list[frozenset[str]]
+) -> list[set[str]]:
+    """Expand lineage filter values by traversing the lineage maps.
+
+    Args:
+        packed_maps: pickled parent map and child map.
+        filter_values: unique IDs given to each lineage filter.
+
+    Returns:
+        the ancestors and descendants of the objects of each filter.
+    """
+    parent_map, child_map = pickle.loads(packed_maps)
+    return [
+        get_relatives(unique_ids, relation_map)
+        for unique_ids in filter_values
+        for relation_map in (parent_map, child_map)
+    ]
+
+
+def expand_with_graph(
+    graph_path: Path, filter_values: list[frozenset[str]]
+) -> list[frozenset[str]]:
+    """Expand lineage filter values by traversing the mapped lineage graph.
+
+    Args:
+        graph_path: path of the encoded lineage graph.
+        filter_values: unique IDs given to each lineage filter.
+
+    Returns:
+        the ancestors and descendants of the objects of each filter.
+    """
+    with open(graph_path, "rb") as file_handler:
+        graph = LineageGraph(
+            mmap.mmap(file_handler.fileno(), 0, access=mmap.ACCESS_READ)
+        )
+    return [
+        graph.get_relatives_of_any(unique_ids, relation, include_indirect=True)
+        for unique_ids in filter_values
+        for relation in ("parents", "children")
+    ]
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Best wall time of a function, in seconds.
+
+    Args:
+        function: function to time.
+        repeat: number of timed calls.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[5000, 20000, 50000])
+    parser.add_argument(
+        "--filters", type=int, default=4, help="Number of lineage filters per run."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+    print(
+        f"{'nodes':>8} {'edges':>8} {'graph size':>11} {'encode':>9}"
+        f" {'maps':>9} {'graph':>9} {'speed-up':>9}"
+    )
+    for node_count in options.nodes:
+        manifest = make_manifest(node_count, columns_per_node=0)
+        parent_map = manifest["parent_map"]
+        child_map = manifest["child_map"]
+        generator = random.Random(0)
+        filter_values = [
+            frozenset(generator.sample(sorted(parent_map), 3))
+            for _ in range(options.filters)
+        ]
+        packed_maps = pickle.dumps(
+            (parent_map, child_map), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        start = time.perf_counter()
+        content = LineageGraph.encode(parent_map, child_map)
+        encode_time = time.perf_counter() - start
+        with tempfile.TemporaryDirectory() as temporary_dir:
+            graph_path = Path(temporary_dir) / "lineage.bin"
+            graph_path.write_bytes(content)
+            assert expand_with_graph(graph_path, filter_values) == expand_with_maps(
+                packed_maps, filter_values
+            )
+            maps_time = best_time(
+                lambda: expand_with_maps(packed_maps, filter_values),
+                options.repeat,
+            )
+            graph_time = best_time(
+                lambda: expand_with_graph(graph_path, filter_values), options.repeat
+            )
+        edge_count = sum(map(len, parent_map.values()))
+        print(
+            f"{node_count:>8} {edge_count:>8} {len(content) / 1024**2:>9.1f}MB"
+            f" {encode_time * 1000:>7.0f}ms {maps_time * 1000:>7.0f}ms"
+            f" {graph_time * 1000:>7.0f}ms {maps_time / graph_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark loading the used manifest sections, full or lean, against a full decode.
+
+Run from the repository root with:
+
+    PYTHONPATH=src:benchmarks python benchmarks/bench_manifest_loading.py
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from synthetic_manifest import make_manifest
+
+from utils.artifact_data import MANIFEST_SECTIONS, get_json_artifact_data
+
+
+def measure(load: Callable[[], dict]) -> tuple[float, int, int]:
+    """Measure the time taken and memory allocated by a load function.
+
+    Args:
+        load: function which loads the manifest data.
+
+    Returns:
+        the time taken in seconds without tracing memory, and the peak and
+        retained memory allocated in bytes.
+    """
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    data = load()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return elapsed, peak, retained
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 40000])
+    options = parser.parse_args()
+    print(
+        f"{'nodes':>8} {'full decode':>12} {'peak':>9} {'retained':>9}"
+        f" {'used sections':>14} {'peak':>9} {'retained':>9}"
+        f" {'lean sections':>14} {'peak':>9} {'retained':>9}"
+    )
+    for node_count in options.nodes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manifest_path = Path(tmpdir) / "manifest.json"
+            manifest_path.write_text(json.dumps(make_manifest(node_count)))
+            full_time, full_peak, full_retained = measure(
+                lambda: get_json_artifact_data.__wrapped__(manifest_path)
+            )
+            sections_time, sections_peak, sections_retained = measure(
+                lambda: get_json_artifact_data.__wrapped__(
+                    manifest_path, sections=MANIFEST_SECTIONS
+                )
+            )
+            lean_time, lean_peak, lean_retained = measure(
+                lambda: get_json_artifact_data.__wrapped__(
+                    manifest_path, sections=MANIFEST_SECTIONS, lean=True
+                )
+            )
+        print(
+            f"{node_count:>8} {full_time * 1000:>10.1f}ms {full_peak / 2**20:>7.1f}MB"
+            f" {full_retained / 2**20:>7.1f}MB {sections_time * 1000:>12.1f}ms"
+            f" {sections_peak / 2**20:>7.1f}MB {sections_retained / 2**20:>7.1f}MB"
+            f" {lean_time * 1000:>12.1f}ms {lean_peak / 2**20:>7.1f}MB"
+            f" {lean_retained / 2**20:>7.1f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
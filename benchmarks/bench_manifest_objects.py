@@ -0,0 +1,172 @@
+"""Benchmark the slotted manifest objects against dataclass objects.
+
+Run from the repository root with:
+
+    PYTHONPATH=src:benchmarks python benchmarks/bench_manifest_objects.py
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from synthetic_manifest import make_manifest
+
+from utils.manifest_object.node.model.model import ManifestModel
+
+
+@dataclass
+class DataclassColumn:
+    """Column mirroring the manifest objects before they were slotted.
+
+    Attributes:
+        data: data for the column from the manifest file.
+        parent: model the column belongs to.
+    """
+
+    data: dict
+    parent: "DataclassModel"
+
+    @property
+    def unique_id(self) -> str:
+        """The unique ID of the column, built on every access."""
+        return f"{self.parent.unique_id}.{self.data['name']}"
+
+
+@dataclass
+class DataclassModel:
+    """Model mirroring the manifest objects before they were slotted.
+
+    Attributes:
+        data: data for the model from the manifest file.
+    """
+
+    data: dict
+
+    @property
+    def unique_id(self) -> str:
+        """The unique id of the model."""
+        return self.data["unique_id"]
+
+    @property
+    def config(self) -> dict[str, Any]:
+        """The config from the manifest."""
+        return self.data.get("config", {}) or {}
+
+    @property
+    def tags(self) -> set[str]:
+        """All associated tags, built on every access."""
+        config_tags = set(self.config.get("tags", []))
+        manifest_tags = set(self.data.get("tags", []))
+        return config_tags.union(manifest_tags)
+
+    @property
+    def patch_path(self) -> Path | None:
+        """The patch path, built on every access."""
+        path = self.data.get("patch_path")
+        package_name = self.data.get("package_name")
+        if isinstance(path, str) and package_name and path.startswith(package_name):
+            return Path(path.replace(f"{package_name}://", ""))
+        return None
+
+    @property
+    def columns(self) -> list[DataclassColumn]:
+        """Columns of the model, built on every access."""
+        return [
+            DataclassColumn(column_data, parent=self)
+            for column_data in self.data.get("columns", {}).values()
+        ]
+
+
+def access_attributes(models: list) -> None:
+    """Read the derived attributes a check reads on each model.
+
+    Args:
+        models: model objects.
+    """
+    for model in models:
+        model.tags
+        model.patch_path
+        for column in model.columns:
+            column.unique_id
+
+
+def measure_memory(build: Callable[[], list], read_attributes: bool) -> int:
+    """Memory retained by model objects.
+
+    Args:
+        build: function building the model objects.
+        read_attributes: whether to read the derived attributes before measuring,
+            which keeps them on the slotted objects.
+
+    Returns:
+        retained memory in bytes, excluding the manifest data itself.
+    """
+    tracemalloc.start()
+    models = build()
+    if read_attributes:
+        access_attributes(models)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return retained
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 40000])
+    parser.add_argument(
+        "--checks", type=int, default=5, help="Number of checks reading the models."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+    print(
+        f"{'models':>8} {'dataclass object':>17} {'slotted object':>15}"
+        f" {'slotted + cached':>17} {'dataclass access':>17} {'slotted access':>15}"
+        f" {'speed-up':>9}"
+    )
+    for node_count in options.nodes:
+        nodes = [
+            node_data
+            for node_data in make_manifest(node_count)["nodes"].values()
+            if node_data["resource_type"] == "model"
+        ]
+        dataclass_memory = measure_memory(
+            lambda: list(map(DataclassModel, nodes)), read_attributes=False
+        )
+        slotted_memory = measure_memory(
+            lambda: list(map(ManifestModel, nodes)), read_attributes=False
+        )
+        cached_memory = measure_memory(
+            lambda: list(map(ManifestModel, nodes)), read_attributes=True
+        )
+        dataclass_models = list(map(DataclassModel, nodes))
+        slotted_models = list(map(ManifestModel, nodes))
+        dataclass_time = min(
+            timeit.repeat(
+                lambda: access_attributes(dataclass_models),
+                number=options.checks,
+                repeat=options.repeat,
+            )
+        )
+        slotted_time = min(
+            timeit.repeat(
+                lambda: access_attributes(slotted_models),
+                number=options.checks,
+                repeat=options.repeat,
+            )
+        )
+        print(
+            f"{len(nodes):>8} {dataclass_memory / len(nodes):>16.0f}B"
+            f" {slotted_memory / len(nodes):>14.0f}B"
+            f" {cached_memory / len(nodes):>16.0f}B"
+            f" {dataclass_time * 1000:>15.1f}ms {slotted_time * 1000:>13.1f}ms"
+            f" {dataclass_time / slotted_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
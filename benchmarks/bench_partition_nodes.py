@@ -0,0 +1,101 @@
+"""Benchmark single-pass node partitioning against per-type scans.
+
+Run from the repository root with:
+
+    PYTHONPATH=src:benchmarks python benchmarks/bench_partition_nodes.py
+"""
+
+import argparse
+import timeit
+from pathlib import Path
+from unittest.mock import patch
+
+from synthetic_manifest import make_manifest
+
+from utils.artifact_data import NODE_PARTITIONS, ArtifactSession
+
+
+def scan_per_type(nodes: dict) -> dict[str, dict]:
+    """Build the typed node dictionaries with one scan of the nodes per type.
+
+    This mirrors how the typed accessors were built before partitioning.
+
+    Args:
+        nodes: data from the 'nodes' section of the manifest.
+
+    Returns:
+        a dictionary mapping each partition to a dictionary of node objects.
+    """
+    partitions = {}
+    for partition, node_class in NODE_PARTITIONS.items():
+        if partition == "generic_test":
+            partitions[partition] = {
+                node_id: node_class(data=node_data)
+                for node_id, node_data in nodes.items()
+                if node_data.get("resource_type") == "test"
+                and node_data.get("test_metadata")
+            }
+        elif partition == "singular_test":
+            partitions[partition] = {
+                node_id: node_class(data=node_data)
+                for node_id, node_data in nodes.items()
+                if node_data.get("resource_type") == "test"
+                and not node_data.get("test_metadata")
+            }
+        else:
+            partitions[partition] = {
+                node_id: node_class(data=node_data)
+                for node_id, node_data in nodes.items()
+                if node_data.get("resource_type") == partition
+            }
+    return partitions
+
+
+def partition_once(manifest_data: dict) -> dict[str, dict]:
+    """Build the typed node dictionaries with a fresh session.
+
+    Args:
+        manifest_data: synthetic manifest data.
+
+    Returns:
+        a dictionary mapping each partition to a dictionary of node objects.
+    """
+    with patch(
+        "utils.artifact_data.get_json_artifact_data", return_value=manifest_data
+    ):
+        session = ArtifactSession(manifest_dir=Path("target"))
+    return session.partitioned_nodes
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, nargs="+", default=[1000, 10000, 40000])
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+    print(f"{'nodes':>8} {'per-type scans':>16} {'single pass':>12} {'speed-up':>9}")
+    for node_count in options.nodes:
+        manifest_data = make_manifest(node_count, columns_per_node=0)
+        assert scan_per_type(manifest_data["nodes"]) == partition_once(manifest_data)
+        per_type = min(
+            timeit.repeat(
+                lambda: scan_per_type(manifest_data["nodes"]),
+                number=1,
+                repeat=options.repeat,
+            )
+        )
+        single_pass = min(
+            timeit.repeat(
+                lambda: partition_once(manifest_data),
+                number=1,
+                repeat=options.repeat,
+            )
+        )
+        print(
+            f"{node_count:>8} {per_type * 1000:>14.1f}ms {single_pass * 1000:>10.1f}ms"
+            f" {per_type / single_pass:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark the reachability index strategies against per-object lineage traversals.
+
+Run from the repository root with:
+
+    PYTHONPATH=src:benchmarks python benchmarks/bench_reachability.py
+
+For each graph size, both strategies are built and queried, as an indirect
+parents filter with more values than candidate objects does, and the memory
+each holds is reported, to help choose DBTRA_MAX_CLOSURE_NODES. Traversing the
+lineage graph from each object is only timed on graphs up to
+--lookup-max-nodes objects, as its time grows with the square of the number of
+objects.
+"""
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from synthetic_manifest import make_manifest
+
+from utils.lineage_graph import LineageGraph
+from utils.reachability import ClosureReachabilityIndex, IntervalReachabilityIndex
+
+
+def timed(function: Callable[[], object]) -> tuple[object, float]:
+    """Call a function, timing it.
+
+    Args:
+        function: function to call.
+
+    Returns:
+        the result of the function, and its wall time in seconds.
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--nodes", type=int, nargs="+", default=[2000, 10000, 20000, 50000]
+    )
+    parser.add_argument(
+        "--values", type=int, default=200, help="Number of indirect parent values."
+    )
+    parser.add_argument(
+        "--objects", type=int, default=5000, help="Number of objects to filter."
+    )
+    parser.add_argument("--lookup-max-nodes", type=int, default=5000)
+    options = parser.parse_args()
+    print(
+        f"{'nodes':>8} {'strategy':>9} {'build':>9} {'memory':>10}"
+        f" {'filter':>9} {'in scope':>9}"
+    )
+    for node_count in options.nodes:
+        manifest = make_manifest(node_count, columns_per_node=0)
+        graph = LineageGraph.from_maps(manifest["parent_map"], manifest["child_map"])
+        generator = random.Random(0)
+        values = frozenset(generator.sample(graph.unique_ids, options.values))
+        objects = generator.sample(graph.unique_ids, min(options.objects, len(graph)))
+        for index_type in (ClosureReachabilityIndex, IntervalReachabilityIndex):
+            index, build_time = timed(lambda: index_type(graph, "parents"))
+            in_scope, filter_time = timed(
+                lambda: sum(
+                    index.has_relative_in(unique_id, values) for unique_id in objects
+                )
+            )
+            print(
+                f"{node_count:>8} {index_type.strategy:>9}"
+                f" {build_time * 1000:>7.0f}ms"
+                f" {index.memory_size / 1024**2:>8.1f}MB"
+                f" {filter_time * 1000:>7.0f}ms {in_scope:>9}"
+            )
+            del index
+        if node_count <= options.lookup_max_nodes:
+            in_scope, filter_time = timed(
+                lambda: sum(
+                    not graph.get_relatives_of_any(
+                        [unique_id], "parents", include_indirect=True
+                    ).isdisjoint(values)
+                    for unique_id in objects
+                )
+            )
+            print(
+                f"{node_count:>8} {'traverse':>9} {'':>9} {'':>10}"
+                f" {filter_time * 1000:>7.0f}ms {in_scope:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
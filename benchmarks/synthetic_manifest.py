@@ -0,0 +1,129 @@
+"""Synthetic manifest data for benchmarks."""
+
+import random
+from typing import Any
+
+RESOURCE_TYPE_WEIGHTS: dict[str, int] = {
+    "model": 40,
+    "test": 45,
+    "seed": 4,
+    "snapshot": 4,
+    "analysis": 3,
+    "function": 1,
+    "operation": 3,
+}
+
+
+def make_node(index: int, resource_type: str, columns_per_node: int) -> dict[str, Any]:
+    """Build the data for a single synthetic manifest node.
+
+    Args:
+        index: position of the node, used to build unique names.
+        resource_type: resource type of the node.
+        columns_per_node: number of columns to give the node.
+
+    Returns:
+        a dictionary resembling a node from the manifest.json file.
+    """
+    name = f"{resource_type}_{index}"
+    node: dict[str, Any] = {
+        "unique_id": f"{resource_type}.my_project.{name}",
+        "name": name,
+        "resource_type": resource_type,
+        "package_name": "my_project",
+        "original_file_path": f"{resource_type}s/{name}.sql",
+        "patch_path": f"my_project://{resource_type}s/_{resource_type}s.yml",
+        "description": f"Description of {name}" if index % 3 else "",
+        "tags": ["nightly"] if index % 2 else [],
+        "config": {"materialized": "view" if index % 4 else "table", "tags": []},
+        "raw_code": "select 1 as id\n" * 20,
+        "compiled_code": "select 1 as id\n" * 20,
+        "fqn": ["my_project", f"{resource_type}s", name],
+        "path": f"{name}.sql",
+        "database": "analytics",
+        "schema": "dbt",
+        "alias": name,
+        "relation_name": f'"analytics"."dbt"."{name}"',
+        "checksum": {"name": "sha256", "checksum": f"{index:064x}"},
+        "language": "sql",
+        "created_at": 1700000000.0 + index,
+        "build_path": None,
+        "docs": {"show": True, "node_color": None},
+        "unrendered_config": {"materialized": "view"},
+        "refs": [],
+        "sources": [],
+        "depends_on": {
+            "macros": ["macro.dbt.run_query", "macro.dbt.is_incremental"],
+            "nodes": [],
+        },
+        "columns": {
+            f"column_{column}": {
+                "name": f"column_{column}",
+                "description": "a column" if column % 2 else "",
+                "data_type": "integer" if column % 3 else None,
+                "meta": {},
+                "tags": [],
+                "quote": None,
+                "constraints": [],
+                "granularity": None,
+                "doc_blocks": [],
+            }
+            for column in range(columns_per_node)
+        },
+    }
+    if resource_type == "test" and index % 5:
+        node["test_metadata"] = {"name": "not_null", "kwargs": {}}
+    return node
+
+
+def make_manifest(
+    node_count: int, columns_per_node: int = 10, seed: int = 0
+) -> dict[str, Any]:
+    """Build a synthetic manifest with a random layered DAG.
+
+    Args:
+        node_count: number of nodes in the manifest.
+        columns_per_node: number of columns to give each node. Optional, defaults to 10.
+        seed: random seed, so runs are reproducible. Optional, defaults to 0.
+
+    Returns:
+        a dictionary resembling the data in a manifest.json file.
+    """
+    rng = random.Random(seed)
+    resource_types = rng.choices(
+        list(RESOURCE_TYPE_WEIGHTS),
+        weights=list(RESOURCE_TYPE_WEIGHTS.values()),
+        k=node_count,
+    )
+    nodes = {}
+    for index, resource_type in enumerate(resource_types):
+        node = make_node(index, resource_type, columns_per_node)
+        nodes[node["unique_id"]] = node
+    unique_ids = list(nodes)
+    parent_map: dict[str, list[str]] = {unique_id: [] for unique_id in unique_ids}
+    child_map: dict[str, list[str]] = {unique_id: [] for unique_id in unique_ids}
+    for position, unique_id in enumerate(unique_ids[1:], start=1):
+        for parent_id in {
+            unique_ids[rng.randrange(max(0, position - 50), position)]
+            for _ in range(rng.randint(1, 3))
+        }:
+            parent_map[unique_id].append(parent_id)
+            child_map[parent_id].append(unique_id)
+    return {
+        "metadata": {
+            "dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json"
+        },
+        "nodes": nodes,
+        "docs": {
+            f"doc.my_project.doc_{index}": {
+                "name": f"doc_{index}",
+                "block_contents": "Documentation block.\n" * 50,
+            }
+            for index in range(node_count // 4)
+        },
+        "sources": {},
+        "macros": {},
+        "unit_tests": {},
+        "parent_map": parent_map,
+        "child_map": child_map,
+    }
@@ -2,14 +2,24 @@
 
 import argparse
 import json
+import os
 import sys
 from argparse import Namespace
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Iterable, Type
 
+from utils.artifact_cache import CACHE_DIR_ENV_VAR, CACHE_DIR_NAME
+from utils.lean_manifest import FULL_MANIFEST, LEAN_MANIFEST, MANIFEST_REPRESENTATIONS
+from utils.manifest_filter_conditions import (
+    STATE_MODIFIED,
+    STATE_MODIFIED_AND_DESCENDANTS,
+    STATE_SELECTORS,
+)
+
 if TYPE_CHECKING:
-    from utils.check_abc import Check
+    from checks.registry import CheckSpec
 
 
 def get_absolute_path(raw_path: str) -> Path:
@@ -40,6 +50,7 @@ class CliArgument:
         required: Whether the argument is required
         nargs: How to handle multiple values
         default: Default value
+        choices: Allowed values, if restricted
     """
 
     name: str
@@ -48,6 +59,7 @@ class CliArgument:
     required: bool = False
     nargs: str | None = None
     default: Any | None = None
+    choices: tuple[Any, ...] | None = None
 
     @property
     def cli_name(self) -> str:
@@ -75,6 +87,46 @@ UNIVERSAL_ARGUMENTS: tuple[CliArgument, ...] = (
         "Defaults to the the 'target' directory underneath the dbt project path.",
         type=Path,
     ),
+    CliArgument(
+        name="cache_dir",
+        help="Path to the directory where parsed dbt artifacts are cached between runs. "
+        "A run which creates a cache entry loads every section of the manifest. "
+        f"Defaults to the {CACHE_DIR_ENV_VAR} environment variable, if set, or else "
+        f"the '{CACHE_DIR_NAME}' directory underneath the manifest directory. "
+        f"Caching is disabled by --no-cache-dir, or an empty {CACHE_DIR_ENV_VAR}.",
+        type=str,
+    ),
+    CliArgument(
+        name="result_cache_dir",
+        help="Path to the directory where the verdicts of checks on each object are "
+        "cached between runs, so that unchanged objects are not checked again. "
+        "If not given, verdicts are not cached.",
+        type=Path,
+    ),
+    CliArgument(
+        name="state",
+        help="Path to the directory containing the manifest.json file of a baseline, "
+        "such as production. Only objects and columns which are new or modified "
+        "relative to the baseline are checked.",
+        type=Path,
+    ),
+    CliArgument(
+        name="state_selector",
+        help=f"Which objects to check when --state is given: '{STATE_MODIFIED}' "
+        f"objects only, or '{STATE_MODIFIED_AND_DESCENDANTS}' to also check their "
+        f"direct and indirect children. Defaults to '{STATE_MODIFIED}'.",
+        type=str,
+        choices=STATE_SELECTORS,
+    ),
+    CliArgument(
+        name="manifest_representation",
+        help=f"How manifest objects are held in memory: '{FULL_MANIFEST}' keeps "
+        f"every field, while '{LEAN_MANIFEST}' only keeps the fields which checks "
+        "read and shares repeated strings, which uses much less memory on large "
+        f"manifests. Defaults to '{FULL_MANIFEST}'.",
+        type=str,
+        choices=MANIFEST_REPRESENTATIONS,
+    ),
 )
 ADDITIONAL_ARGUMENTS: tuple[CliArgument, ...] = (
     CliArgument(
@@ -330,80 +382,187 @@ ADDITIONAL_ARGUMENTS: tuple[CliArgument, ...] = (
 )
 
 
-def parse_cli_entrypoint_args(
-    argv: list[str], allowed_checks: Iterable[Type["Check"]]
-) -> Namespace:
-    """Parse CLI arguments for the entrypoint script.
+ENTRYPOINT_PROG = "dbt-review-assistant"
+ALL_CHECKS_COMMAND = "all-checks"
 
-    Returns:
-        Namespace of parsed CLI arguments
+
+def add_cli_argument(parser: argparse.ArgumentParser, argument: CliArgument) -> None:
+    """Add a CLI argument to a parser.
+
+    Args:
+        parser: ArgumentParser to add the argument to.
+        argument: CliArgument to add.
     """
-    main_parser = argparse.ArgumentParser(
-        prog="dbt-review-assistant",
-        description="Please choose a check to run, or input 'all-checks' to run every check specified in the config file.",
+    parser.add_argument(
+        argument.cli_name,
+        type=argument.type,
+        help=argument.help,
+        nargs=argument.nargs,
+        required=argument.required,
+        default=argument.default,
+        choices=argument.choices,
     )
-    subparsers = main_parser.add_subparsers()
-    all_checks_parser = subparsers.add_parser(
-        "all-checks",
-        help="Run all checks",
-        prog="all-checks",
+
+
+def add_check_arguments(parser: argparse.ArgumentParser, check: "CheckSpec") -> None:
+    """Add the arguments of a check to its parser.
+
+    Args:
+        parser: ArgumentParser of the check's subcommand.
+        check: CheckSpec of the check.
+    """
+    parser.set_defaults(check_id=check.check_name)
+    for argument in UNIVERSAL_ARGUMENTS:
+        add_cli_argument(parser, argument)
+    parser.add_argument(
+        "--no-cache-dir",
+        dest="cache_dir",
+        action="store_const",
+        const="",
+        help="Parse the dbt artifacts without caching them between runs.",
     )
-    all_checks_parser.set_defaults(check_id="all-checks")
-    for check in allowed_checks:
-        check_parser = subparsers.add_parser(
-            check.check_name,
-        )
-        check_parser.set_defaults(check_id=check.check_name)
-        for argument in UNIVERSAL_ARGUMENTS:
-            check_parser.add_argument(
-                argument.cli_name,
-                type=argument.type,
-                help=argument.help,
-                nargs=argument.nargs,
-                required=argument.required,
-                default=argument.default,
-            )
-        for argument in ADDITIONAL_ARGUMENTS:
-            if argument.name in check.additional_arguments:
-                check_parser.add_argument(
-                    argument.cli_name,
-                    type=argument.type,
-                    help=argument.help,
-                    nargs=argument.nargs,
-                    required=argument.required,
-                    default=argument.default,
-                )
-        check_parser.add_argument(
-            "-c",
-            "--config-dir",
-            dest="config_dir",
-            help="Path to the directory where the config file is located.",
-            type=Path,
-        )
-        check_parser.add_argument(
-            "--files",
-            "-f",
-            nargs="*",
-            help="filepaths passed to the check.",
-            type=Path,
-        )
-    all_checks_parser.add_argument(
+    for argument in ADDITIONAL_ARGUMENTS:
+        if argument.name in check.additional_arguments:
+            add_cli_argument(parser, argument)
+    parser.add_argument(
+        "-c",
+        "--config-dir",
+        dest="config_dir",
+        help="Path to the directory where the config file is located.",
+        type=Path,
+    )
+    parser.add_argument(
+        "--files",
+        "-f",
+        nargs="*",
+        help="filepaths passed to the check.",
+        type=Path,
+    )
+
+
+def add_all_checks_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the all-checks subcommand to its parser.
+
+    Args:
+        parser: ArgumentParser of the all-checks subcommand.
+    """
+    parser.set_defaults(check_id=ALL_CHECKS_COMMAND)
+    parser.add_argument(
         "-c",
         "--config-dir",
         dest="config_dir",
         help="Path to the directory where the config file is located.",
         type=Path,
     )
-    all_checks_parser.add_argument(
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="Number of worker processes to run the checks in. Defaults to 1, "
+        "which runs the checks sequentially.",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
         dest="files",
         nargs="*",
         help="filepaths passed to the check.",
         type=Path,
     )
-    if len(argv) == 0:
-        main_parser.print_help(sys.stderr)
-        raise SystemExit(1)
-    args = main_parser.parse_args(argv)
+
+
+@lru_cache
+def get_entrypoint_parser(
+    allowed_checks: tuple["CheckSpec", ...],
+) -> argparse.ArgumentParser:
+    """Build the argument parser for the entrypoint script, with every subcommand.
+
+    Only used to print the help and usage errors of the entrypoint itself, as
+    building the subparsers of every check costs more than parsing the arguments.
+
+    Args:
+        allowed_checks: tuple of CheckSpec instances of the checks which can be selected from
+
+    Returns:
+        ArgumentParser instance
+    """
+    main_parser = argparse.ArgumentParser(
+        prog=ENTRYPOINT_PROG,
+        description="Please choose a check to run, or input 'all-checks' to run every check specified in the config file.",
+    )
+    subparsers = main_parser.add_subparsers()
+    add_all_checks_arguments(
+        subparsers.add_parser(
+            ALL_CHECKS_COMMAND,
+            help="Run all checks",
+            prog=ALL_CHECKS_COMMAND,
+        )
+    )
+    for check in allowed_checks:
+        add_check_arguments(subparsers.add_parser(check.check_name), check)
+    return main_parser
+
+
+@lru_cache
+def get_check_parser(check: "CheckSpec") -> argparse.ArgumentParser:
+    """Build the argument parser of a single check's subcommand.
+
+    Args:
+        check: CheckSpec of the check.
+
+    Returns:
+        ArgumentParser instance, parsing the arguments after the subcommand.
+    """
+    parser = argparse.ArgumentParser(prog=f"{ENTRYPOINT_PROG} {check.check_name}")
+    add_check_arguments(parser, check)
+    return parser
+
+
+@lru_cache
+def get_all_checks_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the all-checks subcommand.
+
+    Returns:
+        ArgumentParser instance, parsing the arguments after the subcommand.
+    """
+    parser = argparse.ArgumentParser(prog=ALL_CHECKS_COMMAND)
+    add_all_checks_arguments(parser)
+    return parser
+
+
+def parse_cli_entrypoint_args(
+    argv: list[str], allowed_checks: Iterable["CheckSpec"]
+) -> Namespace:
+    """Parse CLI arguments for the entrypoint script.
+
+    Only the parser of the selected subcommand is built, and it is kept for
+    later calls, such as those for each check in the config file. The parser
+    of every subcommand is only built for the help, or for an unknown
+    subcommand.
+
+    Args:
+        argv: CLI arguments, starting with the subcommand.
+        allowed_checks: Iterable of CheckSpec instances of the checks which can
+            be selected from
+
+    Returns:
+        Namespace of parsed CLI arguments
+    """
+    subcommand = argv[0] if argv else None
+    if subcommand == ALL_CHECKS_COMMAND:
+        args = get_all_checks_parser().parse_args(argv[1:])
+    else:
+        check = next(
+            (check for check in allowed_checks if check.check_name == subcommand),
+            None,
+        )
+        if check is not None:
+            args = get_check_parser(check).parse_args(argv[1:])
+        else:
+            main_parser = get_entrypoint_parser(tuple(allowed_checks))
+            if len(argv) == 0:
+                main_parser.print_help(sys.stderr)
+                raise SystemExit(1)
+            args = main_parser.parse_args(argv)
     if not getattr(args, "config_dir", None):
         args.config_dir = None
     if not getattr(args, "files", None):
@@ -414,4 +573,11 @@ def parse_cli_entrypoint_args(
         args.manifest_dir = args.project_dir / "target"
     if not getattr(args, "catalog_dir", None):
         args.catalog_dir = args.manifest_dir
+    cache_dir = getattr(args, "cache_dir", None)
+    if cache_dir is None:
+        cache_dir = os.environ.get(
+            CACHE_DIR_ENV_VAR, args.manifest_dir / CACHE_DIR_NAME
+        )
+    # An empty cache directory, given by --no-cache-dir, disables the cache.
+    args.cache_dir = Path(cache_dir) if cache_dir else None
     return args
@@ -0,0 +1,285 @@
+"""Long-running daemon which runs checks with warm artifacts, for `dbtra serve`."""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import traceback
+import warnings
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Iterable
+
+from checks.entrypoint import (
+    configure_entrypoint,
+    get_run_dependencies,
+    run_all_checks,
+)
+from utils.artifact_data import (
+    CATALOG_FILE_NAME,
+    MANIFEST_FILE_NAME,
+    get_artifact_session,
+    load_json_artifact,
+)
+from utils.config import PROJECT_NAME, load_config
+from utils.daemon_client import get_socket_path
+from utils.run_cache import FileKey
+
+StatKey = tuple[int, int] | None
+
+
+def get_stat_key(path: Path) -> StatKey:
+    """Modification time and size of a file, or None if it does not exist.
+
+    Args:
+        path: Path to the file.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ArtifactWatcher:
+    """Detect changes to the dbt artifacts used by earlier requests.
+
+    Attributes:
+        stat_keys: modification time and size of each artifact, when last seen.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the instance."""
+        self.stat_keys: dict[Path, StatKey] = {}
+
+    def refresh(self, all_check_arguments: Iterable[Namespace]) -> bool:
+        """Forget all parsed artifacts if any artifact used by the checks has changed.
+
+        Args:
+            all_check_arguments: The arguments passed to the checks.
+
+        Returns:
+            whether any artifact has changed since it was last seen.
+        """
+        changed = False
+        for check_arguments in all_check_arguments:
+            for artifact_path in (
+                getattr(check_arguments, "manifest_dir", None)
+                and check_arguments.manifest_dir / MANIFEST_FILE_NAME,
+                getattr(check_arguments, "catalog_dir", None)
+                and check_arguments.catalog_dir / CATALOG_FILE_NAME,
+                getattr(check_arguments, "state", None)
+                and check_arguments.state / MANIFEST_FILE_NAME,
+            ):
+                if not artifact_path:
+                    continue
+                stat_key = get_stat_key(artifact_path)
+                if self.stat_keys.get(artifact_path, stat_key) != stat_key:
+                    changed = True
+                self.stat_keys[artifact_path] = stat_key
+        if changed:
+            get_artifact_session.cache_clear()
+            load_json_artifact.cache_clear()
+        return changed
+
+
+class ConfigCache:
+    """Parsed config files, reloaded when they change.
+
+    Attributes:
+        entries: modification time, size and data of each config file.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the instance."""
+        self.entries: dict[Path, tuple[StatKey, dict[str, Any]]] = {}
+
+    def load(self, config_dir: Path) -> dict[str, Any]:
+        """Load configuration data from the YAML file, unless it is unchanged.
+
+        Args:
+            config_dir: Path to the directory where the configuration file is located
+        """
+        file_path = config_dir / f".{PROJECT_NAME}.yaml"
+        stat_key = get_stat_key(file_path)
+        entry = self.entries.get(file_path)
+        if entry is None or entry[0] != stat_key or stat_key is None:
+            entry = stat_key, load_config(config_dir)
+            self.entries[file_path] = entry
+        return entry[1]
+
+
+class CheckRequestHandler(socketserver.StreamRequestHandler):
+    """Handle one request to run checks, received as a line of JSON."""
+
+    server: "CheckServer"
+
+    def handle(self) -> None:
+        """Run the requested checks, and reply with their exit code and output."""
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        response = self.server.run_request(request)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class CheckServer(socketserver.UnixStreamServer):
+    """Server which runs checks on request, keeping parsed artifacts in memory.
+
+    Requests are handled one at a time, in the server's working directory,
+    which must be the working directory of the client.
+
+    Attributes:
+        socket_path: Path of the Unix socket the server listens on.
+        cwd: working directory of the server.
+        artifact_watcher: ArtifactWatcher instance.
+        config_cache: ConfigCache instance.
+        is_bound: whether the server has bound its socket, so owns it.
+    """
+
+    def __init__(self, socket_path: Path):
+        """Initialise the instance.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on.
+        """
+        self.socket_path = socket_path
+        self.cwd = Path.cwd()
+        self.artifact_watcher = ArtifactWatcher()
+        self.config_cache = ConfigCache()
+        self.is_bound = False
+        super().__init__(str(socket_path), CheckRequestHandler)
+
+    def server_bind(self) -> None:
+        """Bind the socket, replacing a stale one, and restrict it to this user.
+
+        The socket is created with a restrictive umask, so other users can
+        never connect to it.
+
+        Raises:
+            FileExistsError: if another daemon is listening on the socket.
+        """
+        if self.socket_path.exists():
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(str(self.socket_path))
+                except OSError:
+                    self.socket_path.unlink(missing_ok=True)
+                else:
+                    raise FileExistsError(
+                        f"A daemon is already listening on {self.socket_path}"
+                    )
+        umask = os.umask(0o077)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+        self.is_bound = True
+
+    def server_close(self) -> None:
+        """Close the socket, and remove it if this server bound it."""
+        super().server_close()
+        if self.is_bound:
+            self.socket_path.unlink(missing_ok=True)
+
+    def run_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run the checks selected by the CLI arguments of a request.
+
+        Args:
+            request: dictionary with the client's 'argv' and 'cwd'.
+
+        Returns:
+            dictionary with the run's 'exit_code', 'stdout', 'stderr' and the
+            'dependencies' to record it with, or an 'error' if the request
+            cannot be run by this server.
+        """
+        if request.get("cwd") != str(self.cwd):
+            return {"error": f"The daemon serves {self.cwd}, not {request.get('cwd')}"}
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        log_handler = logging.StreamHandler(stderr)
+        log_handler.setFormatter(logging.Formatter("%(message)s"))
+        root_logger = logging.getLogger()
+        handlers = root_logger.handlers
+        root_logger.handlers = [log_handler]
+        try:
+            with (
+                contextlib.redirect_stdout(stdout),
+                contextlib.redirect_stderr(stderr),
+                warnings.catch_warnings(),
+            ):
+                exit_code, dependencies = self.run_checks(list(request.get("argv", [])))
+        finally:
+            root_logger.handlers = handlers
+        return {
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "dependencies": dependencies,
+        }
+
+    def run_checks(self, argv: list[str]) -> tuple[int, dict[str, FileKey] | None]:
+        """Run the checks selected by some CLI arguments.
+
+        Args:
+            argv: CLI arguments, as they would be passed to the dbtra command.
+
+        Returns:
+            the exit code the dbtra command would have exited with, and the file
+            keys of the files the run read, or None if the run did not get as
+            far as running the checks, or crashed, so it must not be recorded.
+        """
+        dependencies = None
+        try:
+            cli_args, all_check_arguments = configure_entrypoint(
+                argv, config_loader=self.config_cache.load
+            )
+            self.artifact_watcher.refresh(all_check_arguments)
+            dependencies = get_run_dependencies(cli_args, all_check_arguments)
+            run_all_checks(all_check_arguments, jobs=getattr(cli_args, "jobs", 1))
+        except SystemExit as error:
+            if error.code is None or isinstance(error.code, int):
+                return error.code or 0, dependencies
+            print(error.code, file=sys.stderr)
+            return 1, dependencies
+        except Exception:
+            traceback.print_exc()
+            return 1, None
+        return 0, dependencies
+
+
+def serve_main(argv: list[str]) -> None:
+    """Serve check runs on a Unix socket until interrupted.
+
+    Args:
+        argv: CLI arguments following 'serve'.
+    """
+    parser = argparse.ArgumentParser(
+        prog="dbt-review-assistant serve",
+        description="Run checks on request from dbtra-client, keeping parsed dbt "
+        "artifacts in memory between runs.",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=get_socket_path(Path.cwd()),
+        help="Path of the Unix socket to listen on. Defaults to the path used by "
+        "dbtra-client when run from the current directory.",
+    )
+    options = parser.parse_args(argv)
+    try:
+        server = CheckServer(options.socket)
+    except FileExistsError as error:
+        sys.exit(str(error))
+    with server:
+        logging.info(f"Serving checks for {server.cwd} on {options.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -1,18 +1,30 @@
 """Entrypoint for the CLI."""
 
+import contextlib
+import io
 import logging
 import sys
+import threading
+import time
 from argparse import Namespace
+from concurrent import futures
 from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Any, Callable, Sequence, TextIO, Tuple
 
 from checks import ALL_CHECKS, ALL_CHECKS_MAP
 from checks.argparser import parse_cli_entrypoint_args
-from utils.config import configure_checks, load_config
+from utils.artifact_data import CATALOG_FILE_NAME, MANIFEST_FILE_NAME
+from utils.check_abc import get_check_session
+from utils.check_plan import CheckExecutor, CheckPlan, SequentialExecutor
+from utils.config import PROJECT_NAME, configure_checks, load_config
 from utils.console_formatting import (
     check_status_header,
 )
+from utils.run_cache import FileKey, RunCache, RunRecord, get_file_key
+
+SERVE_COMMAND = "serve"
+WATCH_COMMAND = "watch"
 
 
 @lru_cache
@@ -40,17 +52,170 @@ def convert_to_paths_relative_to_project_dir(
     return converted_paths
 
 
-def entrypoint() -> None:
+def entrypoint(argv: list[str] | None = None) -> None:
     """Entrypoint for the CLI.
 
-    Determines which checks to run and how they are configured.
+    Determines which checks to run and how they are configured, or starts the
+    daemon or watch mode when the first argument is 'serve' or 'watch'.
+    When the DBTRA_RUN_CACHE_DIR environment variable is set, an invocation
+    identical to a recorded one, whose input files have not changed since, is
+    replayed from the run cache instead.
+
+    Args:
+        argv: CLI arguments. Optional, defaults to sys.argv[1:]
 
     Raises:
         SystemExit: with the overall status of all checks
     """
     logging.basicConfig(format="%(message)s", level=logging.INFO)
-    cli_args = parse_cli_entrypoint_args(sys.argv[1:], ALL_CHECKS)
-    config_data = load_config(cli_args.config_dir) if cli_args.config_dir else None
+    argv = sys.argv[1:] if argv is None else argv
+    # Imported here, as the daemon and watch modules themselves import this module.
+    if argv[:1] == [SERVE_COMMAND]:
+        from checks.daemon import serve_main
+
+        serve_main(argv[1:])
+        return
+    if argv[:1] == [WATCH_COMMAND]:
+        from checks.watch import watch_main
+
+        watch_main(argv[1:])
+        return
+    run_cache = RunCache.from_environment()
+    if run_cache is None:
+        cli_args, all_check_arguments = configure_entrypoint(argv)
+        run_all_checks(all_check_arguments, jobs=getattr(cli_args, "jobs", 1))
+        return
+    entry_path = run_cache.get_entry_path(argv, Path.cwd())
+    record = run_cache.load(entry_path)
+    if record is not None:
+        record.replay()
+    run_all_checks_recording_output(argv, run_cache, entry_path)
+
+
+class TeeOutput(io.TextIOBase):
+    """Text stream which writes to another stream, keeping a copy of the text.
+
+    Attributes:
+        stream: stream the text is written to.
+        copy: buffer the text is copied to.
+    """
+
+    def __init__(self, stream: TextIO, copy: io.StringIO):
+        """Initialise the instance.
+
+        Args:
+            stream: stream the text is written to.
+            copy: buffer the text is copied to.
+        """
+        super().__init__()
+        self.stream = stream
+        self.copy = copy
+
+    def write(self, text: str) -> int:
+        """Write text to the stream, and copy it to the buffer."""
+        self.copy.write(text)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        """Flush the stream."""
+        self.stream.flush()
+
+
+def run_all_checks_recording_output(
+    argv: list[str], run_cache: RunCache, entry_path: Path
+) -> None:
+    """Configure and run the checks, recording their output in the run cache.
+
+    Everything the run logs or writes to stdout and stderr, including
+    warnings, is recorded, so that replaying it writes the same output.
+    Runs which do not get as far as running the checks, such as those with
+    invalid arguments, or which read files modified just before they started,
+    are not recorded.
+
+    Args:
+        argv: CLI arguments.
+        run_cache: RunCache to record the run in.
+        entry_path: Path of the run's cache entry.
+
+    Raises:
+        SystemExit: with the overall status of all checks
+    """
+    started_at_ns = time.time_ns()
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    # Log records already reach stderr through the existing handlers, so they
+    # are only copied to the recorded stderr.
+    handler = logging.StreamHandler(stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    try:
+        with (
+            contextlib.redirect_stdout(TeeOutput(sys.stdout, stdout)),
+            contextlib.redirect_stderr(TeeOutput(sys.stderr, stderr)),
+        ):
+            cli_args, all_check_arguments = configure_entrypoint(argv)
+            dependencies = get_run_dependencies(cli_args, all_check_arguments)
+            try:
+                run_all_checks(all_check_arguments, jobs=getattr(cli_args, "jobs", 1))
+            except SystemExit as system_exit:
+                record = RunRecord(
+                    dependencies=dependencies,
+                    exit_code=system_exit.code,
+                    output=stderr.getvalue(),
+                    stdout=stdout.getvalue(),
+                )
+                if not record.is_racy(started_at_ns):
+                    run_cache.save(entry_path, record)
+                raise
+    finally:
+        root_logger.removeHandler(handler)
+
+
+def get_run_dependencies(
+    cli_args: Namespace, all_check_arguments: Sequence[Namespace]
+) -> dict[str, FileKey]:
+    """File keys of the config file and artifacts read by a run.
+
+    Args:
+        cli_args: parsed CLI arguments.
+        all_check_arguments: The arguments passed to the checks.
+
+    Returns:
+        dictionary mapping the absolute paths of the files to their file keys,
+        including files which do not exist, as creating them changes the run.
+    """
+    paths = set()
+    if getattr(cli_args, "config_dir", None):
+        paths.add(cli_args.config_dir / f".{PROJECT_NAME}.yaml")
+    for check_arguments in all_check_arguments:
+        for directory, file_name in (
+            (getattr(check_arguments, "manifest_dir", None), MANIFEST_FILE_NAME),
+            (getattr(check_arguments, "catalog_dir", None), CATALOG_FILE_NAME),
+            (getattr(check_arguments, "state", None), MANIFEST_FILE_NAME),
+        ):
+            if directory:
+                paths.add(directory / file_name)
+    return {str(path.absolute()): get_file_key(path) for path in sorted(paths, key=str)}
+
+
+def configure_entrypoint(
+    argv: list[str],
+    config_loader: Callable[[Path], dict[str, Any]] | None = None,
+) -> tuple[Namespace, list[Namespace]]:
+    """Parse the CLI arguments, and configure the checks they select.
+
+    Args:
+        argv: CLI arguments.
+        config_loader: function loading the config file from its directory.
+            Optional, defaults to load_config.
+
+    Returns:
+        the parsed CLI arguments, and the arguments of each check to run.
+    """
+    cli_args = parse_cli_entrypoint_args(argv, ALL_CHECKS)
+    config_loader = config_loader or load_config
+    config_data = config_loader(cli_args.config_dir) if cli_args.config_dir else None
     all_check_arguments = configure_checks(
         config_data=config_data,
         cli_args=cli_args,
@@ -61,7 +226,20 @@ def entrypoint() -> None:
             check_args.files = convert_to_paths_relative_to_project_dir(
                 tuple(check_args.files), check_args.project_dir
             )
-    failed_hooks = count_failures(all_check_arguments)
+    return cli_args, all_check_arguments
+
+
+def run_all_checks(all_check_arguments: Sequence[Namespace], jobs: int = 1) -> None:
+    """Run the configured checks, and report their overall status.
+
+    Args:
+        all_check_arguments: The arguments passed to the checks.
+        jobs: number of workers to run the checks in. Optional, defaults to 1.
+
+    Raises:
+        SystemExit: with the overall status of all checks
+    """
+    failed_hooks = count_failures(all_check_arguments, jobs=jobs)
     if failed_hooks:
         raise SystemExit(
             check_status_header(
@@ -77,17 +255,266 @@ def entrypoint() -> None:
     raise SystemExit(0)
 
 
-def count_failures(all_check_arguments: Iterable[Namespace]) -> int:
+def count_failures(all_check_arguments: Sequence[Namespace], jobs: int = 1) -> int:
     """Run each check and compute the sum of check failures.
 
     Args:
         all_check_arguments: The arguments passed to the checks.
+        jobs: number of workers to run the checks in. Optional, defaults
+            to 1, which runs the checks sequentially in this process.
 
     Returns:
         total number of failed checks.
     """
-    failures = 0
-    for check_arguments in all_check_arguments:
-        result = ALL_CHECKS_MAP[check_arguments.check_id](check_arguments).has_failures
-        failures += int(result)
-    return failures
+    plan = CheckPlan.build(all_check_arguments, ALL_CHECKS_MAP)
+    return sum(
+        int(has_failures) for has_failures in plan.execute(get_executor(plan, jobs))
+    )
+
+
+def get_executor(plan: CheckPlan, jobs: int) -> CheckExecutor:
+    """Choose how to run a check plan.
+
+    Args:
+        plan: CheckPlan to run.
+        jobs: number of workers to run the checks in.
+
+    Returns:
+        a SequentialExecutor if there is nothing to run concurrently, otherwise
+        a worker pool executor: threads when the global interpreter lock is
+        disabled, or processes when it would stop threads running concurrently.
+    """
+    if jobs > 1 and len(plan) > 1:
+        if is_gil_enabled():
+            return ProcessPoolExecutor(jobs)
+        return ThreadPoolExecutor(jobs)
+    return SequentialExecutor()
+
+
+def run_check(check_arguments: Namespace) -> bool:
+    """Run a check.
+
+    Args:
+        check_arguments: The arguments passed to the check.
+
+    Returns:
+        whether the check has failures.
+    """
+    return ALL_CHECKS_MAP[check_arguments.check_id](check_arguments).has_failures
+
+
+def is_gil_enabled() -> bool:
+    """Whether the interpreter's global interpreter lock is enabled.
+
+    Returns:
+        False only on free-threaded builds of CPython running without the GIL.
+    """
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_enabled() if is_enabled else True
+
+
+class LogRecordBuffer(logging.Handler):
+    """Logging handler which keeps records to be handled later.
+
+    Attributes:
+        records: log records emitted so far.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the instance."""
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Keep a log record."""
+        self.records.append(record)
+
+
+def run_check_buffering_logs(
+    check_arguments: Namespace,
+) -> tuple[bool, list[logging.LogRecord]]:
+    """Run a check in a worker process, keeping its log records.
+
+    Args:
+        check_arguments: The arguments passed to the check.
+
+    Returns:
+        whether the check has failures, and the log records it emitted.
+    """
+    buffer = LogRecordBuffer()
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers
+    root_logger.handlers = [buffer]
+    try:
+        has_failures = run_check(check_arguments)
+    finally:
+        root_logger.handlers = handlers
+    return has_failures, buffer.records
+
+
+class ThreadLogBuffers(logging.Handler):
+    """Logging handler which keeps log records separately for each thread.
+
+    Records from threads not running a check are passed on immediately.
+
+    Attributes:
+        handlers: handlers the buffered records are eventually passed on to.
+        local: thread-local storage for the records of each check.
+    """
+
+    def __init__(self, handlers: list[logging.Handler]) -> None:
+        """Initialise the instance.
+
+        Args:
+            handlers: handlers the buffered records are eventually passed on to.
+        """
+        super().__init__()
+        self.handlers = handlers
+        self.local = threading.local()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Keep a log record in the buffer of the current thread.
+
+        Records from threads not running a check are passed on immediately.
+        """
+        records = getattr(self.local, "records", None)
+        if records is None:
+            self.pass_on(record)
+        else:
+            records.append(record)
+
+    def pass_on(self, record: logging.LogRecord) -> None:
+        """Pass a log record on to the handlers it would otherwise go to.
+
+        Args:
+            record: log record to pass on.
+        """
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def run_check(
+        self, check_arguments: Namespace
+    ) -> tuple[bool, list[logging.LogRecord]]:
+        """Run a check in a worker thread, keeping its log records.
+
+        Args:
+            check_arguments: The arguments passed to the check.
+
+        Returns:
+            whether the check has failures, and the log records it emitted.
+        """
+        self.local.records = []
+        return run_check(check_arguments), self.local.records
+
+
+def preload_artifacts(plan: CheckPlan) -> None:
+    """Load and index the manifest sections used by the planned checks.
+
+    Args:
+        plan: CheckPlan about to be run.
+    """
+    for planned_check in plan.checks:
+        session = get_check_session(planned_check.args)
+        session.data.load(planned_check.manifest_sections)
+        if "nodes" in session.data.loaded_sections:
+            session.partitioned_nodes
+
+
+class ProcessPoolExecutor(CheckExecutor):
+    """Run the planned checks in a pool of worker processes.
+
+    Artifacts are parsed before the pool is started, so that forked workers
+    inherit the parsed and indexed manifest instead of parsing it again.
+    Log records are emitted in the order of the checks, whichever worker
+    finishes first.
+
+    Attributes:
+        jobs: number of worker processes.
+    """
+
+    def __init__(self, jobs: int):
+        """Initialise the instance.
+
+        Args:
+            jobs: number of worker processes.
+        """
+        self.jobs = jobs
+
+    def execute(self, plan: CheckPlan) -> list[bool]:
+        """Run the planned checks, logging their results in the order of the plan.
+
+        Args:
+            plan: CheckPlan to run.
+
+        Returns:
+            whether each check has failures, in the order of the plan.
+        """
+        # Imported here, as it is slow to import and only used with several jobs.
+        import multiprocessing
+
+        preload_artifacts(plan)
+        start_method = (
+            "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        )
+        root_logger = logging.getLogger()
+        results = []
+        with multiprocessing.get_context(start_method).Pool(
+            processes=self.jobs
+        ) as pool:
+            for has_failures, records in pool.imap(
+                run_check_buffering_logs,
+                [planned_check.args for planned_check in plan.checks],
+            ):
+                for record in records:
+                    root_logger.handle(record)
+                results.append(has_failures)
+        return results
+
+
+class ThreadPoolExecutor(CheckExecutor):
+    """Run the planned checks in a pool of worker threads.
+
+    Artifacts are parsed and indexed before the pool is started, so the
+    threads share one artifact session. Log records are kept per check, then
+    emitted in the order of the checks, whichever thread finishes first.
+
+    Attributes:
+        jobs: number of worker threads.
+    """
+
+    def __init__(self, jobs: int):
+        """Initialise the instance.
+
+        Args:
+            jobs: number of worker threads.
+        """
+        self.jobs = jobs
+
+    def execute(self, plan: CheckPlan) -> list[bool]:
+        """Run the planned checks, logging their results in the order of the plan.
+
+        Args:
+            plan: CheckPlan to run.
+
+        Returns:
+            whether each check has failures, in the order of the plan.
+        """
+        preload_artifacts(plan)
+        root_logger = logging.getLogger()
+        handlers = root_logger.handlers
+        buffers = ThreadLogBuffers(handlers)
+        root_logger.handlers = [buffers]
+        results = []
+        try:
+            with futures.ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                for has_failures, records in executor.map(
+                    buffers.run_check,
+                    [planned_check.args for planned_check in plan.checks],
+                ):
+                    for record in records:
+                        buffers.pass_on(record)
+                    results.append(has_failures)
+        finally:
+            root_logger.handlers = handlers
+        return results
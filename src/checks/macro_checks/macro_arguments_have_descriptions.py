@@ -1,6 +1,10 @@
 """Check if macro arguments have descriptions."""
 
-from utils.check_abc import STANDARD_MACRO_ARGUMENTS, ManifestCheck
+from utils.check_abc import (
+    STANDARD_MACRO_ARGUMENTS,
+    STANDARD_MACRO_MANIFEST_SECTIONS,
+    ManifestCheck,
+)
 from utils.check_failure_messages import object_missing_attribute_message
 
 
@@ -10,10 +14,14 @@ class MacroArgumentsHaveDescriptions(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
+        manifest_sections: top-level manifest sections used by the check
     """
 
     check_name: str = "macro-arguments-have-descriptions"
     additional_arguments = STANDARD_MACRO_ARGUMENTS
+    resource_types = frozenset({"macro"})
+    manifest_sections = STANDARD_MACRO_MANIFEST_SECTIONS
 
     def perform_check(self) -> None:
         """Execute the check logic."""
@@ -6,7 +6,11 @@ from jinja2.nodes import Expr, Name
 from jinja2.nodes import Macro as JinjaMacro
 from jinja2.parser import Parser
 
-from utils.check_abc import STANDARD_MACRO_ARGUMENTS, ManifestCheck
+from utils.check_abc import (
+    STANDARD_MACRO_ARGUMENTS,
+    STANDARD_MACRO_MANIFEST_SECTIONS,
+    ManifestCheck,
+)
 from utils.check_failure_messages import macro_argument_mismatch_manifest_vs_sql
 from utils.manifest_object.macro import Macro as ManifestMacro
 
@@ -81,6 +85,8 @@ class MacroArgumentsMatchManifestVsSql(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
+        manifest_sections: top-level manifest sections used by the check
         sql_args: Collection of macro argument names from the SQL code
         manifest_args: Collection of macro argument names from the manifest file
     """
@@ -89,6 +95,8 @@ class MacroArgumentsMatchManifestVsSql(ManifestCheck):
     sql_args: set[str] = set()
     check_name: str = "macro-arguments-match-manifest-vs-sql"
     additional_arguments = STANDARD_MACRO_ARGUMENTS
+    resource_types = frozenset({"macro"})
+    manifest_sections = STANDARD_MACRO_MANIFEST_SECTIONS
 
     def perform_check(self) -> None:
         """Execute the check logic."""
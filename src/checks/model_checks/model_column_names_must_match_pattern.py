@@ -17,11 +17,12 @@ class ModelColumnNamesMatchPattern(ManifestCheck):
 
     def perform_check(self) -> None:
         """Execute the check logic."""
-        self.failures = {
-            column.unique_id
-            for column in self.manifest.in_scope_model_columns
-            if not column.name_matches_regex(self.args.name_must_match_pattern)
-        }
+        columns = self.manifest.in_scope_model_column_store
+        self.failures = set(
+            columns.get_failing_unique_ids(
+                columns.names_match(self.args.name_must_match_pattern)
+            )
+        )
 
     @property
     def failure_message(self) -> str:
@@ -17,11 +17,8 @@ class ModelColumnsHaveDescriptions(ManifestCheck):
 
     def perform_check(self) -> None:
         """Execute the check logic."""
-        self.failures = {
-            column.unique_id
-            for column in self.manifest.in_scope_model_columns
-            if not column.description
-        }
+        columns = self.manifest.in_scope_model_column_store
+        self.failures = set(columns.get_failing_unique_ids(columns.has_description))
 
     @property
     def failure_message(self) -> str:
@@ -17,11 +17,10 @@ class ModelColumnsHaveTypes(ManifestCheck):
 
     def perform_check(self) -> None:
         """Execute the check logic."""
-        self.failures: set[str] = {
-            column.unique_id
-            for column in self.manifest.in_scope_model_columns
-            if not column.has_data_type
-        }
+        columns = self.manifest.in_scope_model_column_store
+        self.failures: set[str] = set(
+            columns.get_failing_unique_ids(columns.has_data_type)
+        )
 
     @property
     def failure_message(self) -> str:
@@ -1,27 +1,26 @@
 """Check if model names match a regex pattern."""
 
-from utils.check_abc import STANDARD_MODEL_ARGUMENTS, ManifestCheck
+from utils.check_abc import STANDARD_MODEL_ARGUMENTS, PerObjectCheck
 from utils.check_failure_messages import object_name_does_not_match_pattern
+from utils.manifest_object.node.model.model import ManifestModel
 
 
-class ModelNamesMatchPattern(ManifestCheck):
+class ModelNamesMatchPattern(PerObjectCheck):
     """Check if model names match a regex pattern.
 
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        object_collection: name of the Manifest attribute listing the objects to check
     """
 
     check_name: str = "model-names-match-pattern"
     additional_arguments = STANDARD_MODEL_ARGUMENTS + ["name_must_match_pattern"]
+    object_collection = "in_scope_models"
 
-    def perform_check(self) -> None:
-        """Execute the check logic."""
-        self.failures = {
-            model.unique_id
-            for model in self.manifest.in_scope_models
-            if not model.name_matches_regex(self.args.name_must_match_pattern)
-        }
+    def is_failure(self, manifest_object: ManifestModel) -> bool:
+        """Determine whether a model fails the check."""
+        return not manifest_object.name_matches_regex(self.args.name_must_match_pattern)
 
     @property
     def failure_message(self) -> str:
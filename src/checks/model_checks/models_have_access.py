@@ -1,29 +1,35 @@
 """Check if models have an access level configured."""
 
-from utils.check_abc import STANDARD_MODEL_ARGUMENTS, ManifestCheck
+from typing import Any
+
+from utils.check_abc import STANDARD_MODEL_ARGUMENTS, PerObjectCheck
 from utils.check_failure_messages import object_attribute_value_not_in_set
+from utils.manifest_object.node.model.model import ManifestModel
 
 
-class ModelsHaveAccess(ManifestCheck):
+class ModelsHaveAccess(PerObjectCheck):
     """Check if models have an access level configured.
 
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        object_collection: name of the Manifest attribute listing the objects to check
         failures: dict mapping unique IDs to their current access value
     """
 
     failures: dict[str, str | None]
     check_name: str = "models-have-access"
     additional_arguments = STANDARD_MODEL_ARGUMENTS + ["must_be_accessed_as_one_of"]
+    object_collection = "in_scope_models"
+    has_failure_details = True
+
+    def is_failure(self, manifest_object: ManifestModel) -> bool:
+        """Determine whether a model fails the check."""
+        return manifest_object.access not in self.args.must_be_accessed_as_one_of
 
-    def perform_check(self) -> None:
-        """Execute the check logic."""
-        self.failures = {
-            model.unique_id: model.access
-            for model in self.manifest.in_scope_models
-            if model.access not in set(self.args.must_be_accessed_as_one_of)
-        }
+    def get_failure_details(self, manifest_object: ManifestModel) -> Any:
+        """Details of a model's failure, used in the failure message."""
+        return manifest_object.access
 
     @property
     def failure_message(self) -> str:
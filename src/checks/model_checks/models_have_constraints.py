@@ -1,35 +1,42 @@
 """Check if models have constraints."""
 
-from utils.check_abc import STANDARD_MODEL_ARGUMENTS, ManifestCheck
+from typing import Any
+
+from utils.check_abc import STANDARD_MODEL_ARGUMENTS, PerObjectCheck
 from utils.check_failure_messages import (
     object_missing_values_from_set_message,
 )
+from utils.manifest_object.node.model.model import ManifestModel
 
 
-class ModelsHaveConstraints(ManifestCheck):
+class ModelsHaveConstraints(PerObjectCheck):
     """Check if models have constraints.
 
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        object_collection: name of the Manifest attribute listing the objects to check
     """
 
+    failures: dict[str, set[str]]
     check_name: str = "models-have-constraints"
     additional_arguments = STANDARD_MODEL_ARGUMENTS + [
         "must_have_all_constraints_from",
         "must_have_any_constraint_from",
     ]
+    object_collection = "in_scope_models"
+    has_failure_details = True
+
+    def is_failure(self, manifest_object: ManifestModel) -> bool:
+        """Determine whether a model fails the check."""
+        return not manifest_object.has_required_constraints(
+            must_have_all_constraints_from=self.args.must_have_all_constraints_from,
+            must_have_any_constraint_from=self.args.must_have_any_constraint_from,
+        )
 
-    def perform_check(self) -> None:
-        """Execute the check logic."""
-        self.failures: dict[str, set[str]] = {
-            model.unique_id: {constraint.type for constraint in model.constraints}
-            for model in self.manifest.in_scope_models
-            if not model.has_required_constraints(
-                must_have_all_constraints_from=self.args.must_have_all_constraints_from,
-                must_have_any_constraint_from=self.args.must_have_any_constraint_from,
-            )
-        }
+    def get_failure_details(self, manifest_object: ManifestModel) -> Any:
+        """Details of a model's failure, used in the failure message."""
+        return {constraint.type for constraint in manifest_object.constraints}
 
     @property
     def failure_message(self) -> str:
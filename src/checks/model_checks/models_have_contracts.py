@@ -1,7 +1,8 @@
 """Check if models have contracts enforced."""
 
-from utils.check_abc import STANDARD_MODEL_ARGUMENTS, ManifestCheck
+from utils.check_abc import STANDARD_MODEL_ARGUMENTS, PerObjectCheck
 from utils.check_failure_messages import object_missing_attribute_message
+from utils.manifest_object.node.model.model import ManifestModel
 
 
 def model_has_contract_enforced(model: dict) -> bool:
@@ -19,24 +20,22 @@ def model_has_contract_enforced(model: dict) -> bool:
     return enforced
 
 
-class ModelsHaveContracts(ManifestCheck):
+class ModelsHaveContracts(PerObjectCheck):
     """Check if models have contracts enforced.
 
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        object_collection: name of the Manifest attribute listing the objects to check
     """
 
     check_name: str = "models-have-contracts"
     additional_arguments = STANDARD_MODEL_ARGUMENTS
+    object_collection = "in_scope_models"
 
-    def perform_check(self) -> None:
-        """Execute the check logic."""
-        self.failures = {
-            model.unique_id
-            for model in self.manifest.in_scope_models
-            if not model.has_contract
-        }
+    def is_failure(self, manifest_object: ManifestModel) -> bool:
+        """Determine whether a model fails the check."""
+        return not manifest_object.has_contract
 
     @property
     def failure_message(self) -> str:
@@ -1,36 +1,45 @@
 """Check if models have data tests."""
 
-from utils.check_abc import STANDARD_MODEL_ARGUMENTS, ManifestCheck
+from typing import Any
+
+from utils.check_abc import STANDARD_MODEL_ARGUMENTS, PerObjectCheck
 from utils.check_failure_messages import (
     object_missing_values_from_set_message,
 )
+from utils.manifest_object.node.model.model import ManifestModel
 
 
-class ModelsHaveDataTests(ManifestCheck):
+class ModelsHaveDataTests(PerObjectCheck):
     """Check if models have data tests.
 
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        object_collection: name of the Manifest attribute listing the objects to check
+        depends_on_children: whether verdicts depend on the children of the object
     """
 
+    failures: dict[str, set[str]]
     check_name: str = "models-have-data-tests"
     additional_arguments = STANDARD_MODEL_ARGUMENTS + [
         "must_have_all_data_tests_from",
         "must_have_any_data_test_from",
     ]
+    object_collection = "in_scope_models"
+    has_failure_details = True
+    depends_on_children = True
+
+    def is_failure(self, manifest_object: ManifestModel) -> bool:
+        """Determine whether a model fails the check."""
+        return not manifest_object.has_required_data_tests(
+            manifest=self.manifest,
+            must_have_all_data_tests_from=self.args.must_have_all_data_tests_from,
+            must_have_any_data_test_from=self.args.must_have_any_data_test_from,
+        )
 
-    def perform_check(self) -> None:
-        """Execute the check logic."""
-        self.failures: dict[str, set[str]] = {
-            model.unique_id: model.get_data_tests(self.manifest)
-            for model in self.manifest.in_scope_models
-            if not model.has_required_data_tests(
-                manifest=self.manifest,
-                must_have_all_data_tests_from=self.args.must_have_all_data_tests_from,
-                must_have_any_data_test_from=self.args.must_have_any_data_test_from,
-            )
-        }
+    def get_failure_details(self, manifest_object: ManifestModel) -> Any:
+        """Details of a model's failure, used in the failure message."""
+        return manifest_object.get_data_tests(self.manifest)
 
     @property
     def failure_message(self) -> str:
@@ -1,27 +1,26 @@
 """Check if models have a properties YAML file."""
 
-from utils.check_abc import STANDARD_MODEL_ARGUMENTS, ManifestCheck
+from utils.check_abc import STANDARD_MODEL_ARGUMENTS, PerObjectCheck
 from utils.check_failure_messages import object_missing_attribute_message
+from utils.manifest_object.node.model.model import ManifestModel
 
 
-class ModelsHavePropertiesFile(ManifestCheck):
+class ModelsHavePropertiesFile(PerObjectCheck):
     """Check if models have a properties YAML file.
 
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        object_collection: name of the Manifest attribute listing the objects to check
     """
 
     check_name: str = "models-have-properties-file"
     additional_arguments = STANDARD_MODEL_ARGUMENTS
+    object_collection = "in_scope_models"
 
-    def perform_check(self) -> None:
-        """Execute the check logic."""
-        self.failures = {
-            model.unique_id
-            for model in self.manifest.in_scope_models
-            if not model.patch_path
-        }
+    def is_failure(self, manifest_object: ManifestModel) -> bool:
+        """Determine whether a model fails the check."""
+        return not manifest_object.patch_path
 
     @property
     def failure_message(self) -> str:
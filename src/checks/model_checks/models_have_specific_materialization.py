@@ -1,30 +1,38 @@
 """Check if models are materialized with one of a set of allowed materializations."""
 
-from utils.check_abc import STANDARD_MODEL_ARGUMENTS, ManifestCheck
+from typing import Any
+
+from utils.check_abc import STANDARD_MODEL_ARGUMENTS, PerObjectCheck
 from utils.check_failure_messages import (
     object_attribute_value_not_in_set,
 )
+from utils.manifest_object.node.model.model import ManifestModel
 
 
-class ModelsHaveSpecificMaterialization(ManifestCheck):
+class ModelsHaveSpecificMaterialization(PerObjectCheck):
     """Check if models are materialized with one of a set of allowed materializations.
 
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        object_collection: name of the Manifest attribute listing the objects to check
     """
 
     failures: dict[str, str | None]
     check_name: str = "models-have-specific-materialization"
     additional_arguments = STANDARD_MODEL_ARGUMENTS + ["must_be_materialized_as_one_of"]
+    object_collection = "in_scope_models"
+    has_failure_details = True
+
+    def is_failure(self, manifest_object: ManifestModel) -> bool:
+        """Determine whether a model fails the check."""
+        return manifest_object.materialized not in (
+            self.args.must_be_materialized_as_one_of
+        )
 
-    def perform_check(self) -> None:
-        """Execute the check logic."""
-        self.failures = {
-            model.unique_id: model.materialized
-            for model in self.manifest.in_scope_models
-            if model.materialized not in set(self.args.must_be_materialized_as_one_of)
-        }
+    def get_failure_details(self, manifest_object: ManifestModel) -> Any:
+        """Details of a model's failure, used in the failure message."""
+        return manifest_object.materialized
 
     @property
     def failure_message(self) -> str:
@@ -2,29 +2,42 @@
 
 from typing import Any
 
-from utils.check_abc import STANDARD_MODEL_ARGUMENTS, ManifestCheck
+from utils.check_abc import STANDARD_MODEL_ARGUMENTS, PerObjectCheck
 from utils.check_failure_messages import dictionary_values_mismatch
 from utils.manifest_object.manifest_object import dict_difference
+from utils.manifest_object.node.model.model import ManifestModel
+from utils.result_cache import Verdict
 
 
-class ModelsHaveSpecificMeta(ManifestCheck):
+class ModelsHaveSpecificMeta(PerObjectCheck):
     """Check if models have a specific meta.
 
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        object_collection: name of the Manifest attribute listing the objects to check
     """
 
+    failures: dict[str, dict[str, Any]]
     check_name: str = "models-have-specific-meta"
     additional_arguments = STANDARD_MODEL_ARGUMENTS + ["must_have_specific_meta"]
+    object_collection = "in_scope_models"
+    has_failure_details = True
 
-    def perform_check(self) -> None:
-        """Execute the check logic."""
-        self.failures: dict[str, dict[str, Any]] = {
-            model.unique_id: diff
-            for model in self.manifest.in_scope_models
-            if (diff := dict_difference(model.meta, self.args.must_have_specific_meta))
-        }
+    def is_failure(self, manifest_object: ManifestModel) -> bool:
+        """Determine whether a model fails the check."""
+        return self.get_verdict(manifest_object)[0]
+
+    def get_failure_details(self, manifest_object: ManifestModel) -> Any:
+        """Details of a model's failure, used in the failure message."""
+        return self.get_verdict(manifest_object)[1]
+
+    def get_verdict(self, manifest_object: ManifestModel) -> Verdict:
+        """Judge a model, comparing its meta with the required meta once."""
+        difference = dict_difference(
+            manifest_object.meta, self.args.must_have_specific_meta
+        )
+        return bool(difference), difference or None
 
     @property
     def failure_message(self) -> str:
@@ -1,27 +1,34 @@
 """Check if models have at least one unit test."""
 
-from utils.check_abc import STANDARD_MODEL_ARGUMENTS, ManifestCheck
+from utils.check_abc import (
+    STANDARD_MODEL_ARGUMENTS,
+    UNIT_TEST_MANIFEST_SECTIONS,
+    PerObjectCheck,
+)
 from utils.check_failure_messages import object_missing_attribute_message
+from utils.manifest_object.node.model.model import ManifestModel
 
 
-class ModelsHaveUnitTests(ManifestCheck):
+class ModelsHaveUnitTests(PerObjectCheck):
     """Check if models have at least one unit test.
 
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        object_collection: name of the Manifest attribute listing the objects to check
+        depends_on_children: whether verdicts depend on the children of the object
+        manifest_sections: top-level manifest sections used by the check
     """
 
     check_name: str = "models-have-unit-tests"
     additional_arguments = STANDARD_MODEL_ARGUMENTS
+    manifest_sections = UNIT_TEST_MANIFEST_SECTIONS
+    object_collection = "in_scope_models"
+    depends_on_children = True
 
-    def perform_check(self) -> None:
-        """Execute the check logic."""
-        self.failures: set[str] = {
-            model.unique_id
-            for model in self.manifest.in_scope_models
-            if not model.has_unit_tests(self.manifest)
-        }
+    def is_failure(self, manifest_object: ManifestModel) -> bool:
+        """Determine whether a model fails the check."""
+        return not manifest_object.has_unit_tests(self.manifest)
 
     @property
     def failure_message(self) -> str:
@@ -0,0 +1,436 @@
+"""Registry of every check, readable without importing the checks themselves.
+
+Importing a check module imports its dependencies, such as the artifact parsing
+utilities, and Jinja2 for the macro SQL check. The registry describes each check
+with the metadata needed to parse its arguments, so that a check module is only
+imported when the check runs.
+"""
+
+import importlib
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterator, Mapping
+
+from utils.check_arguments import (
+    STANDARD_MACRO_ARGUMENTS,
+    STANDARD_MODEL_ARGUMENTS,
+    STANDARD_SEED_ARGUMENTS,
+    STANDARD_SNAPSHOT_ARGUMENTS,
+    STANDARD_SOURCE_ARGUMENTS,
+)
+
+if TYPE_CHECKING:
+    from utils.check_abc import Check
+
+
+@dataclass(frozen=True, eq=False)
+class CheckSpec:
+    """Metadata of a check, and where its class is defined.
+
+    Attributes:
+        check_name: name of the check, used as its CLI subcommand and check_id.
+        module_name: name of the module defining the check class.
+        class_name: name of the check class.
+        additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
+    """
+
+    check_name: str
+    module_name: str
+    class_name: str
+    additional_arguments: list[str]
+    resource_types: frozenset[str]
+
+    @cached_property
+    def check_class(self) -> type["Check"]:
+        """The check class, importing its module on first use."""
+        return getattr(importlib.import_module(self.module_name), self.class_name)
+
+
+class CheckRegistry(Mapping[str, type["Check"]]):
+    """Mapping of check names to check classes, importing each class on first use.
+
+    Attributes:
+        specs: dictionary mapping check names to CheckSpec instances.
+    """
+
+    def __init__(self, specs: tuple[CheckSpec, ...]):
+        """Initialise the instance.
+
+        Args:
+            specs: CheckSpec of each check.
+        """
+        self.specs = {spec.check_name: spec for spec in specs}
+
+    def __getitem__(self, check_name: str) -> type["Check"]:
+        """Get a check class, importing it if needed.
+
+        Args:
+            check_name: name of the check.
+        """
+        return self.specs[check_name].check_class
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the check names."""
+        return iter(self.specs)
+
+    def __len__(self) -> int:
+        """Number of checks."""
+        return len(self.specs)
+
+
+CHECK_SPECS: tuple[CheckSpec, ...] = (
+    CheckSpec(
+        check_name="macro-arguments-have-descriptions",
+        module_name="checks.macro_checks.macro_arguments_have_descriptions",
+        class_name="MacroArgumentsHaveDescriptions",
+        additional_arguments=STANDARD_MACRO_ARGUMENTS,
+        resource_types=frozenset({"macro"}),
+    ),
+    CheckSpec(
+        check_name="macro-arguments-have-types",
+        module_name="checks.macro_checks.macro_arguments_have_types",
+        class_name="MacroArgumentsHaveTypes",
+        additional_arguments=STANDARD_MACRO_ARGUMENTS,
+        resource_types=frozenset({"macro"}),
+    ),
+    CheckSpec(
+        check_name="macro-arguments-match-manifest-vs-sql",
+        module_name="checks.macro_checks.macro_arguments_match_manifest_vs_sql",
+        class_name="MacroArgumentsMatchManifestVsSql",
+        additional_arguments=STANDARD_MACRO_ARGUMENTS,
+        resource_types=frozenset({"macro"}),
+    ),
+    CheckSpec(
+        check_name="macro-names-match-pattern",
+        module_name="checks.macro_checks.macro_names_must_match_pattern",
+        class_name="MacroNamesMatchPattern",
+        additional_arguments=STANDARD_MACRO_ARGUMENTS + ["name_must_match_pattern"],
+        resource_types=frozenset({"macro"}),
+    ),
+    CheckSpec(
+        check_name="macros-have-descriptions",
+        module_name="checks.macro_checks.macros_have_descriptions",
+        class_name="MacrosHaveDescriptions",
+        additional_arguments=STANDARD_MACRO_ARGUMENTS,
+        resource_types=frozenset({"macro"}),
+    ),
+    CheckSpec(
+        check_name="model-column-descriptions-are-consistent",
+        module_name="checks.model_checks.model_column_descriptions_are_consistent",
+        class_name="ModelColumnsDescriptionsAreConsistent",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="model-column-names-match-manifest-vs-catalog",
+        module_name="checks.model_checks.model_column_names_match_manifest_vs_catalog",
+        class_name="ModelColumnNamesMatchManifestVsCatalog",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="model-column-names-match-pattern",
+        module_name="checks.model_checks.model_column_names_must_match_pattern",
+        class_name="ModelColumnNamesMatchPattern",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS + ["name_must_match_pattern"],
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="model-column-types-match-manifest-vs-catalog",
+        module_name="checks.model_checks.model_column_types_match_manifest_vs_catalog",
+        class_name="ModelColumnTypesMatchManifestVsCatalog",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="model-columns-have-descriptions",
+        module_name="checks.model_checks.model_columns_have_descriptions",
+        class_name="ModelColumnsHaveDescriptions",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="model-columns-have-types",
+        module_name="checks.model_checks.model_columns_have_types",
+        class_name="ModelColumnsHaveTypes",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="model-names-match-pattern",
+        module_name="checks.model_checks.model_names_must_match_pattern",
+        class_name="ModelNamesMatchPattern",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS + ["name_must_match_pattern"],
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-access",
+        module_name="checks.model_checks.models_have_access",
+        class_name="ModelsHaveAccess",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS + ["must_be_accessed_as_one_of"],
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-columns",
+        module_name="checks.model_checks.models_have_columns",
+        class_name="ModelsHaveColumns",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-constraints",
+        module_name="checks.model_checks.models_have_constraints",
+        class_name="ModelsHaveConstraints",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS
+        + ["must_have_all_constraints_from", "must_have_any_constraint_from"],
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-contracts",
+        module_name="checks.model_checks.models_have_contracts",
+        class_name="ModelsHaveContracts",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-data-tests",
+        module_name="checks.model_checks.models_have_data_tests",
+        class_name="ModelsHaveDataTests",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS
+        + ["must_have_all_data_tests_from", "must_have_any_data_test_from"],
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-descriptions",
+        module_name="checks.model_checks.models_have_descriptions",
+        class_name="ModelsHaveDescriptions",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-properties-file",
+        module_name="checks.model_checks.models_have_properties_file",
+        class_name="ModelsHavePropertiesFile",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-specific-config",
+        module_name="checks.model_checks.models_have_specific_config",
+        class_name="ModelsHaveSpecificConfig",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS + ["must_have_specific_config"],
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-specific-materialization",
+        module_name="checks.model_checks.models_have_specific_materialization",
+        class_name="ModelsHaveSpecificMaterialization",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS
+        + ["must_be_materialized_as_one_of"],
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-specific-meta",
+        module_name="checks.model_checks.models_have_specific_meta",
+        class_name="ModelsHaveSpecificMeta",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS + ["must_have_specific_meta"],
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-tags",
+        module_name="checks.model_checks.models_have_tags",
+        class_name="ModelsHaveTags",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS
+        + ["must_have_all_tags_from", "must_have_any_tag_from"],
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="models-have-unit-tests",
+        module_name="checks.model_checks.models_have_unit_tests",
+        class_name="ModelsHaveUnitTests",
+        additional_arguments=STANDARD_MODEL_ARGUMENTS,
+        resource_types=frozenset({"model"}),
+    ),
+    CheckSpec(
+        check_name="seed-column-names-match-manifest-vs-catalog",
+        module_name="checks.seed_checks.seed_column_names_match_manifest_vs_catalog",
+        class_name="SeedColumnNamesMatchManifestVsCatalog",
+        additional_arguments=STANDARD_SEED_ARGUMENTS,
+        resource_types=frozenset({"seed"}),
+    ),
+    CheckSpec(
+        check_name="seed-column-types-match-manifest-vs-catalog",
+        module_name="checks.seed_checks.seed_column_types_match_manifest_vs_catalog",
+        class_name="SeedColumnTypesMatchManifestVsCatalog",
+        additional_arguments=STANDARD_SEED_ARGUMENTS,
+        resource_types=frozenset({"seed"}),
+    ),
+    CheckSpec(
+        check_name="seed-columns-have-descriptions",
+        module_name="checks.seed_checks.seed_columns_have_descriptions",
+        class_name="SeedColumnsHaveDescriptions",
+        additional_arguments=STANDARD_SEED_ARGUMENTS,
+        resource_types=frozenset({"seed"}),
+    ),
+    CheckSpec(
+        check_name="seed-columns-have-types",
+        module_name="checks.seed_checks.seed_columns_have_types",
+        class_name="SeedColumnsHaveTypes",
+        additional_arguments=STANDARD_SEED_ARGUMENTS,
+        resource_types=frozenset({"seed"}),
+    ),
+    CheckSpec(
+        check_name="seeds-have-columns",
+        module_name="checks.seed_checks.seeds_have_columns",
+        class_name="SeedsHaveColumns",
+        additional_arguments=STANDARD_SEED_ARGUMENTS,
+        resource_types=frozenset({"seed"}),
+    ),
+    CheckSpec(
+        check_name="seeds-have-data-tests",
+        module_name="checks.seed_checks.seeds_have_data_tests",
+        class_name="SeedsHaveDataTests",
+        additional_arguments=STANDARD_SEED_ARGUMENTS
+        + ["must_have_all_data_tests_from", "must_have_any_data_test_from"],
+        resource_types=frozenset({"seed"}),
+    ),
+    CheckSpec(
+        check_name="seeds-have-descriptions",
+        module_name="checks.seed_checks.seeds_have_descriptions",
+        class_name="SeedsHaveDescriptions",
+        additional_arguments=STANDARD_SEED_ARGUMENTS,
+        resource_types=frozenset({"seed"}),
+    ),
+    CheckSpec(
+        check_name="seeds-have-tags",
+        module_name="checks.seed_checks.seeds_have_tags",
+        class_name="SeedsHaveTags",
+        additional_arguments=STANDARD_SEED_ARGUMENTS
+        + ["must_have_all_tags_from", "must_have_any_tag_from"],
+        resource_types=frozenset({"seed"}),
+    ),
+    CheckSpec(
+        check_name="snapshot-columns-have-descriptions",
+        module_name="checks.snapshot_checks.snapshot_columns_have_descriptions",
+        class_name="SnapshotColumnsHaveDescriptions",
+        additional_arguments=STANDARD_SNAPSHOT_ARGUMENTS,
+        resource_types=frozenset({"snapshot"}),
+    ),
+    CheckSpec(
+        check_name="snapshot-columns-have-types",
+        module_name="checks.snapshot_checks.snapshot_columns_have_types",
+        class_name="SnapshotColumnsHaveTypes",
+        additional_arguments=STANDARD_SNAPSHOT_ARGUMENTS,
+        resource_types=frozenset({"snapshot"}),
+    ),
+    CheckSpec(
+        check_name="snapshot-names-match-pattern",
+        module_name="checks.snapshot_checks.snapshot_names_match_pattern",
+        class_name="SnapshotNamesMatchPattern",
+        additional_arguments=STANDARD_SNAPSHOT_ARGUMENTS + ["name_must_match_pattern"],
+        resource_types=frozenset({"snapshot"}),
+    ),
+    CheckSpec(
+        check_name="snapshots-have-columns",
+        module_name="checks.snapshot_checks.snapshots_have_columns",
+        class_name="SnapshotsHaveColumns",
+        additional_arguments=STANDARD_SNAPSHOT_ARGUMENTS,
+        resource_types=frozenset({"snapshot"}),
+    ),
+    CheckSpec(
+        check_name="snapshots-have-data-tests",
+        module_name="checks.snapshot_checks.snapshots_have_data_tests",
+        class_name="SnapshotsHaveDataTests",
+        additional_arguments=STANDARD_SNAPSHOT_ARGUMENTS
+        + ["must_have_all_data_tests_from", "must_have_any_data_test_from"],
+        resource_types=frozenset({"snapshot"}),
+    ),
+    CheckSpec(
+        check_name="snapshots-have-descriptions",
+        module_name="checks.snapshot_checks.snapshots_have_descriptions",
+        class_name="SnapshotsHaveDescriptions",
+        additional_arguments=STANDARD_SNAPSHOT_ARGUMENTS,
+        resource_types=frozenset({"snapshot"}),
+    ),
+    CheckSpec(
+        check_name="snapshots-have-tags",
+        module_name="checks.snapshot_checks.snapshots_have_tags",
+        class_name="SnapshotsHaveTags",
+        additional_arguments=STANDARD_SNAPSHOT_ARGUMENTS
+        + ["must_have_all_tags_from", "must_have_any_tag_from"],
+        resource_types=frozenset({"snapshot"}),
+    ),
+    CheckSpec(
+        check_name="source-column-names-match-manifest-vs-catalog",
+        module_name="checks.source_checks.source_column_names_match_manifest_vs_catalog",
+        class_name="SourceColumnNamesMatchManifestVsCatalog",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS,
+        resource_types=frozenset({"source"}),
+    ),
+    CheckSpec(
+        check_name="source-column-types-match-manifest-vs-catalog",
+        module_name="checks.source_checks.source_column_types_match_manifest_vs_catalog",
+        class_name="SourceColumnTypesMatchManifestVsCatalog",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS,
+        resource_types=frozenset({"source"}),
+    ),
+    CheckSpec(
+        check_name="source-columns-have-descriptions",
+        module_name="checks.source_checks.source_columns_have_descriptions",
+        class_name="SourceColumnsHaveDescriptions",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS,
+        resource_types=frozenset({"source"}),
+    ),
+    CheckSpec(
+        check_name="source-columns-have-types",
+        module_name="checks.source_checks.source_columns_have_types",
+        class_name="SourceColumnsHaveTypes",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS,
+        resource_types=frozenset({"source"}),
+    ),
+    CheckSpec(
+        check_name="sources-have-columns",
+        module_name="checks.source_checks.sources_have_columns",
+        class_name="SourcesHaveColumns",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS,
+        resource_types=frozenset({"source"}),
+    ),
+    CheckSpec(
+        check_name="sources-have-data-tests",
+        module_name="checks.source_checks.sources_have_data_tests",
+        class_name="SourcesHaveDataTests",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS
+        + ["must_have_all_data_tests_from", "must_have_any_data_test_from"],
+        resource_types=frozenset({"source"}),
+    ),
+    CheckSpec(
+        check_name="sources-have-descriptions",
+        module_name="checks.source_checks.sources_have_descriptions",
+        class_name="SourcesHaveDescriptions",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS,
+        resource_types=frozenset({"source"}),
+    ),
+    CheckSpec(
+        check_name="sources-have-freshness",
+        module_name="checks.source_checks.sources_have_freshness",
+        class_name="SourcesHaveFreshness",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS,
+        resource_types=frozenset({"source"}),
+    ),
+    CheckSpec(
+        check_name="sources-have-loader",
+        module_name="checks.source_checks.sources_have_loader",
+        class_name="SourcesHaveLoader",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS,
+        resource_types=frozenset({"source"}),
+    ),
+    CheckSpec(
+        check_name="sources-have-tags",
+        module_name="checks.source_checks.sources_have_tags",
+        class_name="SourcesHaveTags",
+        additional_arguments=STANDARD_SOURCE_ARGUMENTS
+        + ["must_have_all_tags_from", "must_have_any_tag_from"],
+        resource_types=frozenset({"source"}),
+    ),
+)
@@ -19,12 +19,14 @@ class SeedColumnNamesMatchManifestVsCatalog(ManifestVsCatalogComparison):
         catalog_items: set of column names from the catalog
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
     """
 
     manifest_items: set[str] = set()
     catalog_items: set[str] = set()
     check_name: str = "seed-column-names-match-manifest-vs-catalog"
     additional_arguments = STANDARD_SEED_ARGUMENTS
+    resource_types = frozenset({"seed"})
 
     def perform_check(self) -> None:
         """Execute the check logic."""
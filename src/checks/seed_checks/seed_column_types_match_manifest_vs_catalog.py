@@ -14,12 +14,14 @@ class SeedColumnTypesMatchManifestVsCatalog(ManifestVsCatalogComparison):
         catalog_items: dict of column names and types from the catalog
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
     """
 
     manifest_items: dict[str, str | None] = {}
     catalog_items: dict[str, str] = {}
     check_name: str = "seed-column-types-match-manifest-vs-catalog"
     additional_arguments = STANDARD_SEED_ARGUMENTS
+    resource_types = frozenset({"seed"})
 
     def perform_check(self) -> None:
         """Execute the check logic."""
@@ -10,6 +10,7 @@ class SeedsHaveTags(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
     """
 
     check_name: str = "seeds-have-tags"
@@ -17,10 +18,11 @@ class SeedsHaveTags(ManifestCheck):
         "must_have_all_tags_from",
         "must_have_any_tag_from",
     ]
+    resource_types = frozenset({"seed"})
 
     def perform_check(self) -> None:
         """Execute the check logic."""
-        self.failures: dict[str, set[str]] = {
+        self.failures: dict[str, frozenset[str]] = {
             seed.unique_id: seed.tags
             for seed in self.manifest.in_scope_seeds
             if not seed.has_required_tags(
@@ -10,18 +10,17 @@ class SnapshotColumnsHaveDescriptions(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
     """
 
     check_name: str = "snapshot-columns-have-descriptions"
     additional_arguments = STANDARD_SNAPSHOT_ARGUMENTS
+    resource_types = frozenset({"snapshot"})
 
     def perform_check(self) -> None:
         """Execute the check logic."""
-        self.failures = {
-            column.unique_id
-            for column in self.manifest.in_scope_snapshot_columns
-            if not column.description
-        }
+        columns = self.manifest.in_scope_snapshot_column_store
+        self.failures = set(columns.get_failing_unique_ids(columns.has_description))
 
     @property
     def failure_message(self) -> str:
@@ -10,10 +10,12 @@ class SnapshotNamesMatchPattern(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
     """
 
     check_name: str = "snapshot-names-match-pattern"
     additional_arguments = STANDARD_SNAPSHOT_ARGUMENTS + ["name_must_match_pattern"]
+    resource_types = frozenset({"snapshot"})
 
     def perform_check(self) -> None:
         """Execute the check logic."""
@@ -10,10 +10,12 @@ class SnapshotsHaveColumns(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
     """
 
     check_name: str = "snapshots-have-columns"
     additional_arguments = STANDARD_SNAPSHOT_ARGUMENTS
+    resource_types = frozenset({"snapshot"})
 
     def perform_check(self) -> None:
         """Execute the check logic."""
@@ -10,6 +10,7 @@ class SnapshotsHaveDataTests(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
     """
 
     check_name: str = "snapshots-have-data-tests"
@@ -17,6 +18,7 @@ class SnapshotsHaveDataTests(ManifestCheck):
         "must_have_all_data_tests_from",
         "must_have_any_data_test_from",
     ]
+    resource_types = frozenset({"snapshot"})
 
     def perform_check(self) -> None:
         """Execute the check logic."""
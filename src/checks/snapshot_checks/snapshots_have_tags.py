@@ -10,6 +10,7 @@ class SnapshotsHaveTags(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
     """
 
     check_name: str = "snapshots-have-tags"
@@ -17,10 +18,11 @@ class SnapshotsHaveTags(ManifestCheck):
         "must_have_all_tags_from",
         "must_have_any_tag_from",
     ]
+    resource_types = frozenset({"snapshot"})
 
     def perform_check(self) -> None:
         """Execute the check logic."""
-        self.failures: dict[str, set[str]] = {
+        self.failures: dict[str, frozenset[str]] = {
             snapshot.unique_id: snapshot.tags
             for snapshot in self.manifest.in_scope_snapshots
             if not snapshot.has_required_tags(
@@ -2,7 +2,11 @@
 
 from typing import TYPE_CHECKING
 
-from utils.check_abc import STANDARD_SOURCE_ARGUMENTS, ManifestVsCatalogComparison
+from utils.check_abc import (
+    STANDARD_SOURCE_ARGUMENTS,
+    STANDARD_SOURCE_MANIFEST_SECTIONS,
+    ManifestVsCatalogComparison,
+)
 from utils.check_failure_messages import (
     manifest_vs_catalog_column_type_mismatch_message,
 )
@@ -19,12 +23,16 @@ class SourceColumnTypesMatchManifestVsCatalog(ManifestVsCatalogComparison):
         catalog_items: dict of column names and types from the catalog
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
+        manifest_sections: top-level manifest sections used by the check
     """
 
     manifest_items: dict[str, str | None] = {}
     catalog_items: dict[str, str] = {}
     check_name: str = "source-column-types-match-manifest-vs-catalog"
     additional_arguments = STANDARD_SOURCE_ARGUMENTS
+    resource_types = frozenset({"source"})
+    manifest_sections = STANDARD_SOURCE_MANIFEST_SECTIONS
 
     def perform_check(self) -> None:
         """Execute the check logic."""
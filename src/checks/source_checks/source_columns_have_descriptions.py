@@ -1,6 +1,10 @@
 """Check if source columns have descriptions."""
 
-from utils.check_abc import STANDARD_SOURCE_ARGUMENTS, ManifestCheck
+from utils.check_abc import (
+    STANDARD_SOURCE_ARGUMENTS,
+    STANDARD_SOURCE_MANIFEST_SECTIONS,
+    ManifestCheck,
+)
 from utils.check_failure_messages import object_missing_attribute_message
 
 
@@ -10,18 +14,19 @@ class SourceColumnsHaveDescriptions(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
+        manifest_sections: top-level manifest sections used by the check
     """
 
     check_name: str = "source-columns-have-descriptions"
     additional_arguments = STANDARD_SOURCE_ARGUMENTS
+    resource_types = frozenset({"source"})
+    manifest_sections = STANDARD_SOURCE_MANIFEST_SECTIONS
 
     def perform_check(self) -> None:
         """Execute the check logic."""
-        self.failures = {
-            column.unique_id
-            for column in self.manifest.in_scope_source_columns
-            if not column.description
-        }
+        columns = self.manifest.in_scope_source_column_store
+        self.failures = set(columns.get_failing_unique_ids(columns.has_description))
 
     @property
     def failure_message(self) -> str:
@@ -1,6 +1,10 @@
 """Check sources have columns listed in the manifest."""
 
-from utils.check_abc import STANDARD_SOURCE_ARGUMENTS, ManifestCheck
+from utils.check_abc import (
+    STANDARD_SOURCE_ARGUMENTS,
+    STANDARD_SOURCE_MANIFEST_SECTIONS,
+    ManifestCheck,
+)
 from utils.check_failure_messages import object_missing_attribute_message
 
 
@@ -10,10 +14,14 @@ class SourcesHaveColumns(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
+        manifest_sections: top-level manifest sections used by the check
     """
 
     check_name: str = "sources-have-columns"
     additional_arguments = STANDARD_SOURCE_ARGUMENTS
+    resource_types = frozenset({"source"})
+    manifest_sections = STANDARD_SOURCE_MANIFEST_SECTIONS
 
     def perform_check(self) -> None:
         """Execute the check logic."""
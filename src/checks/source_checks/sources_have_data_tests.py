@@ -1,6 +1,10 @@
 """Check sources have data tests."""
 
-from utils.check_abc import STANDARD_SOURCE_ARGUMENTS, ManifestCheck
+from utils.check_abc import (
+    STANDARD_SOURCE_ARGUMENTS,
+    STANDARD_SOURCE_MANIFEST_SECTIONS,
+    ManifestCheck,
+)
 from utils.check_failure_messages import object_missing_values_from_set_message
 
 
@@ -10,6 +14,8 @@ class SourcesHaveDataTests(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
+        manifest_sections: top-level manifest sections used by the check
     """
 
     check_name: str = "sources-have-data-tests"
@@ -17,6 +23,8 @@ class SourcesHaveDataTests(ManifestCheck):
         "must_have_all_data_tests_from",
         "must_have_any_data_test_from",
     ]
+    resource_types = frozenset({"source"})
+    manifest_sections = STANDARD_SOURCE_MANIFEST_SECTIONS
 
     def perform_check(self) -> None:
         """Execute the check logic."""
@@ -1,6 +1,10 @@
 """Check if sources have tags."""
 
-from utils.check_abc import STANDARD_SOURCE_ARGUMENTS, ManifestCheck
+from utils.check_abc import (
+    STANDARD_SOURCE_ARGUMENTS,
+    STANDARD_SOURCE_MANIFEST_SECTIONS,
+    ManifestCheck,
+)
 from utils.check_failure_messages import object_missing_values_from_set_message
 
 
@@ -10,6 +14,8 @@ class SourcesHaveTags(ManifestCheck):
     Attributes:
         check_name: name of the check
         additional_arguments: arguments required in addition to the global arguments
+        resource_types: types of manifest object checked
+        manifest_sections: top-level manifest sections used by the check
     """
 
     check_name: str = "sources-have-tags"
@@ -17,10 +23,12 @@ class SourcesHaveTags(ManifestCheck):
         "must_have_all_tags_from",
         "must_have_any_tag_from",
     ]
+    resource_types = frozenset({"source"})
+    manifest_sections = STANDARD_SOURCE_MANIFEST_SECTIONS
 
     def perform_check(self) -> None:
         """Execute the check logic."""
-        self.failures: dict[str, set[str]] = {
+        self.failures: dict[str, frozenset[str]] = {
             source.unique_id: source.tags
             for source in self.manifest.in_scope_sources
             if not source.has_required_tags(
@@ -0,0 +1,282 @@
+"""Watch mode, which re-runs the checks affected by changes to dbt artifacts."""
+
+import argparse
+import copy
+import logging
+import time
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Sequence
+
+from checks import ALL_CHECKS_MAP
+from checks.daemon import StatKey, get_stat_key
+from checks.entrypoint import configure_entrypoint, count_failures
+from utils.artifact_data import (
+    CATALOG_FILE_NAME,
+    MANIFEST_FILE_NAME,
+    get_artifact_session,
+    load_json_artifact,
+)
+from utils.check_abc import ManifestVsCatalogComparison, get_check_session
+from utils.config import PROJECT_NAME
+from utils.console_formatting import check_status_header
+from utils.manifest_diff import get_modified_unique_ids
+
+DEFAULT_POLL_INTERVAL = 1.0
+OBJECT_SECTION_RESOURCE_TYPES: dict[str, str] = {
+    "sources": "source",
+    "macros": "macro",
+}
+
+
+class CheckWatcher:
+    """Re-run checks when the artifacts or config file they use change.
+
+    A changed file is only acted upon once it has stopped changing between two
+    polls, so files which are still being written are not read.
+
+    Attributes:
+        argv: CLI arguments selecting the checks, as passed to the dbtra command.
+        cli_args: the parsed CLI arguments.
+        all_check_arguments: The arguments passed to the checks.
+        config_path: Path of the config file, if any.
+        stat_keys: modification time and size of each watched file, when acted upon.
+        polled_stat_keys: modification time and size of each watched file, when
+            last polled.
+    """
+
+    def __init__(self, argv: list[str]):
+        """Initialise the instance.
+
+        Args:
+            argv: CLI arguments selecting the checks, as passed to the dbtra command.
+        """
+        self.argv = argv
+        self.stat_keys: dict[Path, StatKey] = {}
+        self.polled_stat_keys: dict[Path, StatKey] = {}
+        self.configure()
+
+    def configure(self) -> None:
+        """Parse the CLI arguments and config file, and start watching their files."""
+        self.cli_args, self.all_check_arguments = configure_entrypoint(self.argv)
+        self.config_path: Path | None = (
+            self.cli_args.config_dir / f".{PROJECT_NAME}.yaml"
+            if self.cli_args.config_dir
+            else None
+        )
+        for path in self.watched_paths:
+            self.stat_keys[path] = self.polled_stat_keys[path] = get_stat_key(path)
+
+    @property
+    def watched_paths(self) -> set[Path]:
+        """Paths of the config file and of the artifacts used by the checks."""
+        paths = {self.config_path} if self.config_path else set()
+        for check_arguments in self.all_check_arguments:
+            paths.add(check_arguments.manifest_dir / MANIFEST_FILE_NAME)
+            paths.add(check_arguments.catalog_dir / CATALOG_FILE_NAME)
+        return paths
+
+    def poll(self) -> set[Path]:
+        """Find the watched files which have changed, and stopped changing.
+
+        Returns:
+            Paths of the files which changed since they were last acted upon.
+        """
+        changed_paths = set()
+        for path in self.watched_paths:
+            stat_key = get_stat_key(path)
+            if stat_key == self.polled_stat_keys.get(path) and stat_key != (
+                self.stat_keys.get(path)
+            ):
+                changed_paths.add(path)
+                self.stat_keys[path] = stat_key
+            self.polled_stat_keys[path] = stat_key
+        return changed_paths
+
+    def run(self, all_check_arguments: Sequence[Namespace], reason: str) -> int:
+        """Run some checks, and log their overall status.
+
+        Args:
+            all_check_arguments: The arguments passed to the checks.
+            reason: why the checks are run, logged before running them.
+
+        Returns:
+            total number of failed checks.
+        """
+        logging.info(f"{reason}: running {len(all_check_arguments)} checks\n")
+        failures = count_failures(
+            all_check_arguments, jobs=getattr(self.cli_args, "jobs", 1)
+        )
+        logging.info(
+            check_status_header(
+                f"{failures}/{len(all_check_arguments)} checks failed"
+                if failures
+                else f"{len(all_check_arguments)}/{len(all_check_arguments)} checks passed",
+                not failures,
+            )
+        )
+        return failures
+
+    def handle_changes(self, changed_paths: set[Path]) -> None:
+        """Re-run the checks affected by some changed files.
+
+        Args:
+            changed_paths: Paths of the changed files.
+        """
+        names = ", ".join(sorted(path.name for path in changed_paths))
+        if self.config_path in changed_paths:
+            self.configure()
+            self.reload_artifacts()
+            self.run(self.all_check_arguments, f"Changed {names}")
+            return
+        previous_data: dict[Path, dict[str, Any]] = {}
+        for check_arguments in self.all_check_arguments:
+            if check_arguments.manifest_dir / MANIFEST_FILE_NAME in changed_paths:
+                # Copy the sections loaded so far, so that diffing never loads
+                # sections of the previous version from the new file.
+                previous_data[check_arguments.manifest_dir] = get_check_session(
+                    check_arguments
+                ).data.copy()
+        self.reload_artifacts()
+        modified_ids: dict[tuple[Path, bool, bool], set[str]] = {}
+        affected_check_arguments = []
+        for check_arguments in self.all_check_arguments:
+            check_class = ALL_CHECKS_MAP[check_arguments.check_id]
+            if issubclass(check_class, ManifestVsCatalogComparison) and (
+                check_arguments.catalog_dir / CATALOG_FILE_NAME in changed_paths
+            ):
+                affected_check_arguments.append(check_arguments)
+            elif check_arguments.manifest_dir in previous_data:
+                affected_arguments = self.restrict_to_modified_objects(
+                    check_arguments,
+                    previous_data[check_arguments.manifest_dir],
+                    modified_ids,
+                )
+                if affected_arguments:
+                    affected_check_arguments.append(affected_arguments)
+        if affected_check_arguments:
+            self.run(affected_check_arguments, f"Changed {names}")
+        else:
+            logging.info(f"Changed {names}: no checks affected\n")
+
+    def restrict_to_modified_objects(
+        self,
+        check_arguments: Namespace,
+        previous_data: dict[str, Any],
+        modified_ids: dict[tuple[Path, bool, bool], set[str]],
+    ) -> Namespace | None:
+        """Restrict a check to the objects modified since the last run.
+
+        The check is restricted by the unique IDs of the objects, so columns
+        are only re-checked if their parent was modified.
+
+        Args:
+            check_arguments: The arguments passed to the check.
+            previous_data: data from the previous version of the manifest.json file.
+            modified_ids: unique IDs of the modified objects, by manifest directory
+                and whether indirect relatives are compared. Filled in as needed,
+                so each manifest is only diffed once per kind of comparison.
+
+        Returns:
+            the arguments of the check, restricted to the modified objects it
+            checks, or None if it checks none of the modified objects.
+        """
+        check_class = ALL_CHECKS_MAP[check_arguments.check_id]
+        session = get_check_session(check_arguments)
+        session.data.load(previous_data.keys() | check_class.manifest_sections)
+        key = (
+            check_arguments.manifest_dir,
+            bool(
+                getattr(check_arguments, "include_indirect_parents", None)
+                or getattr(check_arguments, "exclude_indirect_parents", None)
+            ),
+            bool(
+                getattr(check_arguments, "include_indirect_children", None)
+                or getattr(check_arguments, "exclude_indirect_children", None)
+            ),
+        )
+        if key not in modified_ids:
+            # Only sections loaded before the change can be compared.
+            modified_ids[key] = get_modified_unique_ids(
+                previous_data,
+                {section: session.data.get(section) for section in previous_data},
+                include_indirect_parents=key[1],
+                include_indirect_children=key[2],
+            )
+        affected_ids = {
+            unique_id
+            for unique_id in modified_ids[key]
+            if get_resource_type(session.data, unique_id) in check_class.resource_types
+        }
+        if check_arguments.files:
+            affected_ids &= {
+                unique_id
+                for filepath in check_arguments.files
+                for _, unique_id in session.file_index.get(filepath, [])
+            }
+        if not affected_ids:
+            return None
+        affected_arguments = copy.copy(check_arguments)
+        affected_arguments.include_modified_unique_ids = sorted(affected_ids)
+        return affected_arguments
+
+    @staticmethod
+    def reload_artifacts() -> None:
+        """Forget all parsed artifacts, so they are parsed again when next used."""
+        get_artifact_session.cache_clear()
+        load_json_artifact.cache_clear()
+
+    def watch(self, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """Run every check, then re-run the affected checks whenever files change.
+
+        Args:
+            poll_interval: seconds between checks for changed files.
+        """
+        self.run(self.all_check_arguments, "Started watching")
+        while True:
+            time.sleep(poll_interval)
+            changed_paths = self.poll()
+            if not changed_paths:
+                continue
+            try:
+                self.handle_changes(changed_paths)
+            except Exception as error:
+                logging.error(f"Unable to re-run checks: {error!r}\n")
+
+
+def get_resource_type(data: dict[str, Any], unique_id: str) -> str | None:
+    """Resource type of an object in the manifest.
+
+    Args:
+        data: data from the manifest.json file.
+        unique_id: unique ID of the object.
+    """
+    for section, resource_type in OBJECT_SECTION_RESOURCE_TYPES.items():
+        if unique_id in data.get(section, {}):
+            return resource_type
+    return data.get("nodes", {}).get(unique_id, {}).get("resource_type")
+
+
+def watch_main(argv: list[str]) -> None:
+    """Watch the dbt artifacts and config file, re-running checks when they change.
+
+    Args:
+        argv: CLI arguments following 'watch'.
+    """
+    parser = argparse.ArgumentParser(
+        prog="dbt-review-assistant watch",
+        description="Run checks, then re-run the checks affected by each change "
+        "to the dbt artifacts or the config file. Any other arguments select the "
+        "checks, as for the dbt-review-assistant command.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help="Seconds between checks for changed files. Defaults to 1.",
+    )
+    options, check_argv = parser.parse_known_args(argv)
+    try:
+        CheckWatcher(check_argv).watch(options.poll_interval)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,218 @@
+"""Persistent on-disk cache of parsed dbt artifacts."""
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import IO, Any, Callable
+
+CACHE_DIR_NAME = ".dbtra_cache"
+CACHE_DIR_ENV_VAR = "DBTRA_CACHE_DIR"
+CACHE_FORMAT_VERSION = 4
+CACHE_ENTRY_SUFFIX = ".pickle"
+MAPPED_ENTRY_SUFFIX = ".bin"
+DEFAULT_MAX_CACHE_SIZE = 1024**3
+HASH_CHUNK_SIZE = 1024**2
+
+
+def get_tool_version() -> str:
+    """Installed version of dbt-review-assistant, if known."""
+    # Imported here, as importlib.metadata is slow to import.
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("dbt-review-assistant")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class ArtifactCache:
+    """Directory of pickled snapshots of parsed dbt artifacts.
+
+    Entries are keyed by the artifact's path, size, modification time and content
+    hash, so a changed artifact never matches an existing entry. Writing an entry
+    removes stale entries for the same artifact, then evicts the least recently
+    used entries until the cache fits within its size cap.
+
+    Snapshots are unpickled when loaded, so the cache directory must only be
+    writable by users who can also write the artifacts themselves. Binary
+    entries, saved next to a snapshot, are memory-mapped when loaded rather
+    than read and parsed.
+
+    Only entries with the suffixes of this cache are ever evicted, so other
+    caches can share its directory.
+
+    Attributes:
+        cache_dir: directory where the cache entries are stored.
+        max_size: maximum total size of the cache entries, in bytes.
+        entry_suffixes: suffixes of the entries this cache saves and evicts.
+    """
+
+    entry_suffixes: tuple[str, ...] = (CACHE_ENTRY_SUFFIX, MAPPED_ENTRY_SUFFIX)
+
+    def __init__(self, cache_dir: Path, max_size: int = DEFAULT_MAX_CACHE_SIZE):
+        """Initialise the instance.
+
+        Args:
+            cache_dir: directory where the cache entries are stored.
+            max_size: maximum total size of the cache entries, in bytes.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def get_entry_path(self, artifact_path: Path, variant: str = "") -> Path:
+        """Path of the cache entry for the current state of an artifact.
+
+        Args:
+            artifact_path: Path to the dbt JSON artifact.
+            variant: name of the representation of the parsed artifact. Entries
+                of different variants of the same artifact are kept side by side.
+
+        Returns:
+            Path of the cache entry, which may not exist yet.
+        """
+        stat = artifact_path.stat()
+        artifact_key = hashlib.blake2b(
+            f"{artifact_path.resolve()}:{variant}".encode(), digest_size=8
+        )
+        entry_key = artifact_key.copy()
+        entry_key.update(
+            f"{CACHE_FORMAT_VERSION}:{get_tool_version()}:{sys.version}:"
+            f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+        )
+        with open(artifact_path, "rb") as file_handler:
+            while chunk := file_handler.read(HASH_CHUNK_SIZE):
+                entry_key.update(chunk)
+        return self.cache_dir / (
+            f"{artifact_key.hexdigest()}-{entry_key.hexdigest()}{CACHE_ENTRY_SUFFIX}"
+        )
+
+    def load(self, entry_path: Path) -> Any | None:
+        """Load a snapshot from the cache.
+
+        Args:
+            entry_path: Path of the cache entry.
+
+        Returns:
+            the cached snapshot, or None if the entry is missing or unreadable.
+        """
+        try:
+            with open(entry_path, "rb") as file_handler:
+                snapshot = pickle.load(file_handler)
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            logging.debug(f"Ignoring unreadable cache entry {entry_path}: {error}")
+            return None
+        return snapshot
+
+    def get_mapped_entry_path(self, entry_path: Path) -> Path:
+        """Path of the binary entry saved next to a snapshot.
+
+        Args:
+            entry_path: Path of the snapshot's cache entry.
+
+        Returns:
+            Path of the binary entry, which may not exist yet.
+        """
+        return entry_path.with_suffix(MAPPED_ENTRY_SUFFIX)
+
+    def load_mapped(self, entry_path: Path) -> mmap.mmap | None:
+        """Map a binary entry of the cache into memory, read-only.
+
+        Args:
+            entry_path: Path of the binary cache entry.
+
+        Returns:
+            the mapped entry, or None if the entry is missing or unreadable.
+        """
+        try:
+            with open(entry_path, "rb") as file_handler:
+                buffer = mmap.mmap(file_handler.fileno(), 0, access=mmap.ACCESS_READ)
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            logging.debug(f"Ignoring unreadable cache entry {entry_path}: {error}")
+            return None
+        return buffer
+
+    def save(self, entry_path: Path, snapshot: Any) -> None:
+        """Save a snapshot to the cache, then remove stale and excess entries.
+
+        Failing to write to the cache is not an error, as the cache is only
+        an optimisation.
+
+        Args:
+            entry_path: Path of the cache entry.
+            snapshot: picklable snapshot of the parsed artifact.
+        """
+        self.write(
+            entry_path,
+            lambda file_handler: pickle.dump(
+                snapshot, file_handler, protocol=pickle.HIGHEST_PROTOCOL
+            ),
+        )
+
+    def save_mapped(self, entry_path: Path, content: bytes) -> None:
+        """Save a binary entry to the cache, then remove stale and excess entries.
+
+        Args:
+            entry_path: Path of the binary cache entry.
+            content: content of the entry.
+        """
+        self.write(entry_path, lambda file_handler: file_handler.write(content))
+
+    def write(self, entry_path: Path, write_entry: Callable[[IO[bytes]], Any]) -> None:
+        """Atomically write an entry of the cache, then remove stale and excess entries.
+
+        Failing to write to the cache is not an error, as the cache is only
+        an optimisation.
+
+        Args:
+            entry_path: Path of the cache entry.
+            write_entry: function writing the entry to an open binary file.
+        """
+        temporary_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, "wb") as file_handler:
+                write_entry(file_handler)
+            os.replace(temporary_path, entry_path)
+            self.evict(keep=entry_path)
+        except OSError as error:
+            logging.debug(f"Unable to write cache entry {entry_path}: {error}")
+            temporary_path.unlink(missing_ok=True)
+
+    def evict(self, keep: Path) -> None:
+        """Remove stale entries of the same artifact, and any entries over the size cap.
+
+        Entries for the same state of the artifact, such as a snapshot and the
+        binary entry next to it, are not stale.
+
+        Args:
+            keep: Path of the cache entry which must not be removed.
+        """
+        artifact_key = keep.name.split("-")[0]
+        entries = []
+        for entry_path in self.cache_dir.iterdir():
+            if entry_path == keep or entry_path.suffix not in self.entry_suffixes:
+                continue
+            if (
+                entry_path.stem != keep.stem
+                and entry_path.name.split("-")[0] == artifact_key
+            ):
+                entry_path.unlink(missing_ok=True)
+            else:
+                entries.append((entry_path.stat(), entry_path))
+        total_size = keep.stat().st_size
+        for stat, entry_path in sorted(
+            entries, key=lambda entry: entry[0].st_mtime_ns, reverse=True
+        ):
+            total_size += stat.st_size
+            if total_size > self.max_size:
+                entry_path.unlink(missing_ok=True)
@@ -1,12 +1,35 @@
 """Utilities for fetching dbt artifact data."""
 
+import hashlib
 import json
+import logging
+import pickle
 import warnings
-from functools import cached_property, lru_cache
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Collection
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Hashable,
+    Iterable,
+    Literal,
+    TypeVar,
+    cast,
+)
 
+from utils.artifact_cache import ArtifactCache
 from utils.catalog_object.catalog_table import CatalogTable
+from utils.column_store import ColumnStore
+from utils.lean_manifest import LEAN_FIELDS, LEAN_MANIFEST, project_object
+from utils.lineage_graph import LineageGraph
+from utils.manifest_diff import (
+    DIFFED_SECTIONS,
+    FINGERPRINTED_SECTIONS,
+    LINEAGE_SECTIONS,
+    get_fingerprints,
+    get_state_modified_unique_ids,
+)
 from utils.manifest_object.macro import Macro
 from utils.manifest_object.manifest_object import ManifestColumn, ManifestSource
 from utils.manifest_object.node.generic_test import GenericTest
@@ -14,11 +37,14 @@ from utils.manifest_object.node.model.model import ManifestModel
 from utils.manifest_object.node.node import (
     ManifestAnalysis,
     ManifestFunction,
+    ManifestNode,
     ManifestSeed,
     ManifestSnapshot,
     SingularTest,
 )
 from utils.manifest_object.unit_test import UnitTest
+from utils.reachability import ReachabilityIndex, build_reachability_index
+from utils.streaming_json import JsonReader, decode_object_members, decode_value
 
 if TYPE_CHECKING:
     from utils.manifest_filter_conditions import ManifestFilterConditions
@@ -26,8 +52,24 @@ if TYPE_CHECKING:
 
 MANIFEST_FILE_NAME = "manifest.json"
 CATALOG_FILE_NAME = "catalog.json"
+MAX_MANIFEST_VIEWS = 128
 SUPPORTED_MANIFEST_SCHEMA_VERSION = "https://schemas.getdbt.com/dbt/manifest/v12.json"
 SUPPORTED_CATALOG_SCHEMA_VERSION = "https://schemas.getdbt.com/dbt/catalog/v1.json"
+NODE_PARTITIONS: dict[str, type[ManifestNode]] = {
+    "model": ManifestModel,
+    "generic_test": GenericTest,
+    "singular_test": SingularTest,
+    "snapshot": ManifestSnapshot,
+    "seed": ManifestSeed,
+    "analysis": ManifestAnalysis,
+    "function": ManifestFunction,
+}
+ManifestObjectT = TypeVar("ManifestObjectT")
+MANIFEST_SECTIONS = frozenset(
+    {"metadata", "nodes", "sources", "macros", "unit_tests", "child_map", "parent_map"}
+)
+UNUSED_NODE_FIELDS = ("raw_code", "compiled_code")
+ColumnParent = ManifestModel | ManifestSource | ManifestSeed | ManifestSnapshot
 
 
 class Catalog:
@@ -76,25 +118,153 @@ class Catalog:
         }
 
 
-class Manifest:
-    """Represents the data in the dbt manifest.json file."""
+class ManifestData(dict):
+    """Top-level sections of a manifest.json file, loaded when first used.
+
+    Looking up a section which has not been loaded yet loads it from the file.
+    Several sections can be loaded in a single pass over the file with `load`.
+    Iterating over the instance only yields the sections loaded so far, and
+    not yet unpacked, while `copy` returns every section loaded so far.
+
+    Attributes:
+        manifest_path: Path to the manifest.json file.
+        lean: whether the objects are loaded in their memory-lean representation.
+        loaded_sections: top-level keys of the sections loaded so far, including
+            keys which are not present in the file.
+        packed_sections: dictionary mapping top-level keys to pickled sections,
+            which are unpickled when first looked up.
+    """
+
+    def __init__(self, manifest_path: Path, lean: bool = False):
+        """Initialise the instance.
+
+        Args:
+            manifest_path: Path to the manifest.json file.
+            lean: whether the objects are loaded in their memory-lean
+                representation, keeping only the fields which checks read.
+        """
+        super().__init__()
+        self.manifest_path = manifest_path
+        self.lean = lean
+        self.loaded_sections: set[str] = set()
+        self.packed_sections: dict[str, bytes] = {}
+
+    def load(self, sections: Collection[str]) -> None:
+        """Load any of these sections which have not been loaded yet.
+
+        Args:
+            sections: top-level keys of the sections to load.
+        """
+        missing_sections = frozenset(sections) - self.loaded_sections
+        if not missing_sections:
+            return
+        data = get_json_artifact_data(
+            self.manifest_path, sections=missing_sections, lean=self.lean
+        )
+        self.update(
+            {section: data[section] for section in missing_sections if section in data}
+        )
+        self.loaded_sections |= missing_sections
+
+    def pack(self, sections: Collection[str]) -> None:
+        """Pickle loaded sections, so they are only unpickled when looked up.
+
+        Packing sections which are not always read, before the instance is
+        cached, saves unpickling them whenever the cache entry is loaded.
+
+        Args:
+            sections: top-level keys of the sections to pack.
+        """
+        for section in sections:
+            if section in self.keys():
+                self.packed_sections[section] = pickle.dumps(
+                    self.pop(section), protocol=pickle.HIGHEST_PROTOCOL
+                )
+
+    def unpack(self, section: str) -> None:
+        """Unpickle a section, if it is packed.
+
+        Args:
+            section: top-level key of the section.
+        """
+        packed = self.packed_sections.pop(section, None)
+        if packed is not None:
+            self[section] = pickle.loads(packed)
+
+    def __getitem__(self, section: str) -> Any:
+        """Get a section, loading it if necessary."""
+        self.load((section,))
+        self.unpack(section)
+        return super().__getitem__(section)
+
+    def get(self, section: str, default: Any = None) -> Any:  # type: ignore[override]
+        """Get a section, loading it if necessary."""
+        self.load((section,))
+        self.unpack(section)
+        return super().get(section, default)
+
+    def copy(self) -> dict[str, Any]:  # type: ignore[override]
+        """Copy the sections loaded so far, unpickling any packed sections.
+
+        Returns:
+            a dictionary of every loaded section present in the file.
+        """
+        return {
+            **self,
+            **{
+                section: pickle.loads(packed)
+                for section, packed in self.packed_sections.items()
+            },
+        }
+
+
+class ArtifactSession:
+    """Parsed manifest data shared by every check in a run.
+
+    The unfiltered, typed object dictionaries are built at most once per session.
+    Filtered views of the manifest are cached per set of filter conditions, so
+    checks with identical filters also share their in-scope collections.
+
+    Lazily built attributes only depend on the manifest, so checks running in
+    concurrent threads can share a session: at worst, an attribute first used
+    by several threads at once is built more than once.
+
+    Attributes:
+        manifest_dir: directory where the manifest.json file is located.
+        lean: whether the manifest objects are in their memory-lean representation.
+        data: data from the manifest.json file.
+    """
 
     def __init__(
         self,
         manifest_dir: Path,
-        filter_conditions: "ManifestFilterConditions",
-        filepaths: Collection[Path] | None = None,
+        cache_dir: Path | None = None,
+        lean: bool = False,
     ):
         """Initialise the instance.
 
         Args:
             manifest_dir: directory where the manifest.json file is located.
-            filter_conditions: A ManifestFilterConditions object to filter nodes by.
-            filepaths: Collection of Path objects representing the files to include.
+            cache_dir: directory where parsed manifests are cached between runs.
+                If None, the manifest is always parsed from JSON.
+            lean: whether the manifest objects are loaded in their memory-lean
+                representation, keeping only the fields which checks read.
         """
-        self.data = get_json_artifact_data(manifest_dir / MANIFEST_FILE_NAME)
-        self.filter_conditions = filter_conditions
-        self.filepaths = set(filepaths) if filepaths else None
+        self.manifest_dir = manifest_dir
+        self.lean = lean
+        self._cache: ArtifactCache | None = None
+        self._lineage_entry_path: Path | None = None
+        if cache_dir:
+            self.load_snapshot(ArtifactCache(cache_dir))
+        else:
+            self.data = ManifestData(manifest_dir / MANIFEST_FILE_NAME, lean=lean)
+        self._manifests: dict[Hashable, "Manifest"] = {}
+        self._relatives_of_any: dict[Hashable, frozenset[str]] = {}
+        self._state_modified: dict[Hashable, frozenset[str]] = {}
+        self._baseline_fingerprints: dict[Path, dict[str, str]] = {}
+        self._object_hashes: dict[str, bytes | None] = {}
+        self._column_stores: dict[str, ColumnStore] = {}
+        self._reachability_indexes: dict[str, ReachabilityIndex] = {}
         schema_version = self.data.get("metadata", {}).get("dbt_schema_version")
         if schema_version != SUPPORTED_MANIFEST_SCHEMA_VERSION:
             warnings.warn(
@@ -107,149 +277,167 @@ class Manifest:
                 stacklevel=2,
             )
 
-    @cached_property
-    def nodes(self) -> dict[str, dict[str, Any]]:
-        """All nodes present in the manifest.
+    def load_snapshot(self, cache: ArtifactCache) -> None:
+        """Load the parsed, partitioned and indexed manifest from a cache.
 
-        Returns:
-            a data from the 'nodes' section of the manifest.json file.
-        """
-        return self.data.get("nodes", {})
+        If the cache has no entry for the current manifest.json file, it is
+        parsed from JSON and a new entry is saved.
 
-    @cached_property
-    def models(self) -> dict[str, ManifestModel]:
-        """All models present in the manifest.
+        Args:
+            cache: ArtifactCache instance.
 
-        Returns:
-            a dictionary mapping unique IDs to ManifestModel objects.
+        Raises:
+            FileNotFoundError: If the manifest.json file does not exist
         """
-        return {
-            node_id: ManifestModel(data=node_data)
-            for node_id, node_data in self.nodes.items()
-            if node_data.get("resource_type") == "model"
-        }
+        manifest_path = self.manifest_dir / MANIFEST_FILE_NAME
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Path {manifest_path.absolute()} does not exist.")
+        entry_path = cache.get_entry_path(
+            manifest_path, variant=LEAN_MANIFEST if self.lean else ""
+        )
+        self._cache = cache
+        self._lineage_entry_path = cache.get_mapped_entry_path(entry_path)
+        snapshot = cache.load(entry_path)
+        if snapshot is None:
+            self.data = ManifestData(manifest_path, lean=self.lean)
+            self.data.load(MANIFEST_SECTIONS)
+            self.data.pack(LINEAGE_SECTIONS)
+            snapshot = {
+                "data": self.data,
+                "partitioned_nodes": self.partitioned_nodes,
+                "file_index": self.file_index,
+            }
+            cache.save(entry_path, snapshot)
+        else:
+            self.data = snapshot["data"]
+            self.__dict__["partitioned_nodes"] = snapshot["partitioned_nodes"]
+            self.__dict__["file_index"] = snapshot["file_index"]
+
+    def get_manifest(
+        self,
+        filter_conditions: "ManifestFilterConditions",
+        filepaths: frozenset[Path] | None = None,
+    ) -> "Manifest":
+        """Get the filtered view of the manifest for some filter conditions and files.
 
-    @cached_property
-    def in_scope_models(self) -> list[ManifestModel]:
-        """All models present in the manifest, after filtering.
+        Only the most recently created views are kept, so that a long-running
+        process checking many different sets of files does not keep them all.
+
+        Args:
+            filter_conditions: A ManifestFilterConditions object to filter nodes by.
+            filepaths: frozenset of Path objects representing the files to include.
 
         Returns:
-            List of ManifestModel objects after filtering.
+            a Manifest instance, shared by all callers with equivalent filter
+            conditions and files.
         """
-        return [
-            model
-            for model in self.models.values()
-            if self.filter_conditions.is_manifest_object_in_scope(model, self)
-            and (
-                not self.filepaths
-                or model.is_included_by_original_or_patch_path(self.filepaths)
+        key = (filter_conditions.signature, filepaths)
+        manifest = self._manifests.get(key)
+        if manifest is None:
+            manifest = Manifest(
+                manifest_dir=self.manifest_dir,
+                filter_conditions=filter_conditions,
+                filepaths=filepaths,
+                session=self,
             )
-        ]
+            if len(self._manifests) >= MAX_MANIFEST_VIEWS:
+                del self._manifests[next(iter(self._manifests))]
+            self._manifests[key] = manifest
+        return manifest
 
     @cached_property
-    def in_scope_model_columns(self) -> list[ManifestColumn]:
-        """All model columns present in the manifest, after filtering.
+    def nodes(self) -> dict[str, dict[str, Any]]:
+        """All nodes present in the manifest.
 
         Returns:
-            List of ManifestColumn objects after filtering.
+            a data from the 'nodes' section of the manifest.json file.
         """
-        return [
-            column
-            for model in self.models.values()
-            for column in model.columns
-            if self.filter_conditions.is_manifest_object_in_scope(column, self)
-        ]
+        return self.data.get("nodes", {})
 
-    def get_model(self, model_id: str) -> ManifestModel | None:
-        """Get a model from the manifest by looking up by unique ID.
+    @cached_property
+    def partitioned_nodes(self) -> dict[str, dict[str, ManifestNode]]:
+        """All supported nodes present in the manifest, partitioned by type.
 
-        Args:
-            model_id: unique id of the model
+        The nodes are walked once, and each is bucketed by resource type, with
+        tests split into generic and singular tests.
 
         Returns:
-            A ManifestModel object if found, else None
+            a dictionary mapping each key of NODE_PARTITIONS to a dictionary
+            of unique IDs to node objects.
         """
-        return self.models.get(model_id)
+        partitions: dict[str, dict[str, ManifestNode]] = {
+            partition: {} for partition in NODE_PARTITIONS
+        }
+        for node_id, node_data in self.nodes.items():
+            partition = get_node_partition(node_data)
+            if partition in partitions:
+                partitions[partition][node_id] = NODE_PARTITIONS[partition](
+                    data=node_data
+                )
+        return partitions
+
+    @property
+    def models(self) -> dict[str, ManifestModel]:
+        """All models present in the manifest.
 
-    @cached_property
+        Returns:
+            a dictionary mapping unique IDs to ManifestModel objects.
+        """
+        return cast(dict[str, ManifestModel], self.partitioned_nodes["model"])
+
+    @property
     def generic_tests(self) -> dict[str, GenericTest]:
         """All generic tests present in the manifest.
 
         Returns:
             a dictionary mapping unique IDs to GenericTest objects.
         """
-        return {
-            node_id: GenericTest(data=node_data)
-            for node_id, node_data in self.nodes.items()
-            if node_data.get("resource_type") == "test"
-            and node_data.get("test_metadata")
-        }
+        return cast(dict[str, GenericTest], self.partitioned_nodes["generic_test"])
 
-    @cached_property
+    @property
     def snapshots(self) -> dict[str, ManifestSnapshot]:
         """All snapshots present in the manifest.
 
         Returns:
             a dictionary mapping unique IDs to ManifestSnapshot objects.
         """
-        return {
-            node_id: ManifestSnapshot(data=node_data)
-            for node_id, node_data in self.nodes.items()
-            if node_data.get("resource_type") == "snapshot"
-        }
+        return cast(dict[str, ManifestSnapshot], self.partitioned_nodes["snapshot"])
 
-    @cached_property
+    @property
     def seeds(self) -> dict[str, ManifestSeed]:
         """All seeds present in the manifest.
 
         Returns:
             a dictionary mapping unique IDs to ManifestSeed objects.
         """
-        return {
-            node_id: ManifestSeed(data=node_data)
-            for node_id, node_data in self.nodes.items()
-            if node_data.get("resource_type") == "seed"
-        }
+        return cast(dict[str, ManifestSeed], self.partitioned_nodes["seed"])
 
-    @cached_property
+    @property
     def analyses(self) -> dict[str, ManifestAnalysis]:
         """All analyses present in the manifest.
 
         Returns:
             a dictionary mapping unique IDs to ManifestAnalysis objects.
         """
-        return {
-            node_id: ManifestAnalysis(data=node_data)
-            for node_id, node_data in self.nodes.items()
-            if node_data.get("resource_type") == "analysis"
-        }
+        return cast(dict[str, ManifestAnalysis], self.partitioned_nodes["analysis"])
 
-    @cached_property
+    @property
     def singular_tests(self) -> dict[str, SingularTest]:
         """All singular tests present in the manifest.
 
         Returns:
             a dictionary mapping unique IDs to SingularTest objects.
         """
-        return {
-            node_id: SingularTest(data=node_data)
-            for node_id, node_data in self.nodes.items()
-            if node_data.get("resource_type") == "test"
-            and not node_data.get("test_metadata")
-        }
+        return cast(dict[str, SingularTest], self.partitioned_nodes["singular_test"])
 
-    @cached_property
+    @property
     def functions(self) -> dict[str, ManifestFunction]:
         """All functions present in the manifest.
 
         Returns:
             a dictionary mapping unique IDs to ManifestFunction objects.
         """
-        return {
-            node_id: ManifestFunction(data=node_data)
-            for node_id, node_data in self.nodes.items()
-            if node_data.get("resource_type") == "function"
-        }
+        return cast(dict[str, ManifestFunction], self.partitioned_nodes["function"])
 
     @cached_property
     def sources(self) -> dict[str, ManifestSource]:
@@ -263,6 +451,457 @@ class Manifest:
             for source_id, source_data in self.data.get("sources", {}).items()
         }
 
+    @cached_property
+    def macros(self) -> dict[str, Macro]:
+        """All macros present in the manifest.
+
+        Returns:
+            a dictionary mapping unique IDs to Macro objects.
+        """
+        return {
+            macro_id: Macro(macro_data)
+            for macro_id, macro_data in self.data.get("macros", {}).items()
+        }
+
+    @cached_property
+    def unit_tests(self) -> dict[str, UnitTest]:
+        """All unit tests present in the manifest.
+
+        Returns:
+            a dictionary mapping unique IDs to UnitTest objects.
+        """
+        return {
+            unit_test_id: UnitTest(unit_test_data)
+            for unit_test_id, unit_test_data in self.data.get("unit_tests", {}).items()
+        }
+
+    @cached_property
+    def child_map(self) -> dict[str, list[str]]:
+        """Child map data from the manifest.
+
+        Returns:
+            a dictionary mapping unique IDs to lists of child IDs.
+        """
+        return self.data.get("child_map", {})
+
+    @cached_property
+    def parent_map(self) -> dict[str, list[str]]:
+        """Parent map data from the manifest.
+
+        Returns:
+            a dictionary mapping unique IDs to lists of parent IDs.
+        """
+        return self.data.get("parent_map", {})
+
+    @cached_property
+    def lineage(self) -> LineageGraph:
+        """Integer-encoded graph of the parents and children of each object.
+
+        When parsed manifests are cached, the graph is saved next to the
+        manifest's cache entry, and later sessions map it into memory instead
+        of rebuilding it, or unpickling the parent map and child map.
+        """
+        if self._cache is not None and self._lineage_entry_path is not None:
+            buffer = self._cache.load_mapped(self._lineage_entry_path)
+            if buffer is not None:
+                try:
+                    return LineageGraph(buffer)
+                except ValueError as error:
+                    logging.debug(f"Ignoring unreadable lineage graph: {error}")
+            content = LineageGraph.encode(self.parent_map, self.child_map)
+            self._cache.save_mapped(self._lineage_entry_path, content)
+            return LineageGraph(content)
+        return LineageGraph.from_maps(self.parent_map, self.child_map)
+
+    @cached_property
+    def file_index(self) -> dict[Path, list[tuple[int, str]]]:
+        """Index of the objects defined or patched by each project file.
+
+        Returns:
+            a dictionary mapping project-relative original file paths and patch
+            paths to the position and unique ID of each object, where position is
+            the order of the object within its collection.
+        """
+        file_index: dict[Path, list[tuple[int, str]]] = {}
+        collections: tuple[dict[str, Any], ...] = (
+            self.models,
+            self.sources,
+            self.macros,
+            self.snapshots,
+            self.seeds,
+        )
+        for objects in collections:
+            for position, (unique_id, manifest_object) in enumerate(objects.items()):
+                filepaths = {
+                    manifest_object.original_file_path,
+                    getattr(manifest_object, "patch_path", None),
+                }
+                for filepath in filepaths - {None}:
+                    file_index.setdefault(filepath, []).append((position, unique_id))
+        return file_index
+
+    def get_relatives_of_any(
+        self,
+        unique_ids: frozenset[str],
+        relation: Literal["parents", "children"],
+        include_indirect: bool,
+    ) -> frozenset[str]:
+        """Unique IDs of all relatives of any of these objects.
+
+        Results are cached, so each set of lineage filter values is
+        expanded at most once per session. Relatives are found by traversing
+        the integer-encoded lineage graph.
+
+        Args:
+            unique_ids: Unique IDs of the objects.
+            relation: whether to find the parents or children of the objects.
+            include_indirect: Whether to include indirect relatives.
+
+        Returns:
+            a frozenset of unique IDs of all relatives of any of these objects.
+        """
+        key = (unique_ids, relation, include_indirect)
+        relatives = self._relatives_of_any.get(key)
+        if relatives is None:
+            relatives = self.lineage.get_relatives_of_any(
+                unique_ids, relation, include_indirect
+            )
+            self._relatives_of_any[key] = relatives
+        return relatives
+
+    def get_reachability_index(
+        self, relation: Literal["parents", "children"]
+    ) -> ReachabilityIndex:
+        """Get the reachability index of the parents or children of each object.
+
+        Each index is built at most once per session, and the strategy it uses
+        and the memory it holds are logged.
+
+        Args:
+            relation: whether to index the parents or children of each object.
+
+        Returns:
+            a ReachabilityIndex of the lineage graph.
+        """
+        index = self._reachability_indexes.get(relation)
+        if index is None:
+            index = build_reachability_index(self.lineage, relation)
+            logging.debug(
+                f"Built {index.strategy} reachability index of the {relation} of "
+                f"{len(self.lineage)} objects, holding {index.memory_size} bytes"
+            )
+            self._reachability_indexes[relation] = index
+        return index
+
+    def get_column_store(
+        self, collection: Literal["models", "seeds", "snapshots", "sources"]
+    ) -> ColumnStore:
+        """Get the columnar store of the columns of a collection of objects.
+
+        Each store is built at most once per session.
+
+        Args:
+            collection: name of the attribute holding the objects.
+
+        Returns:
+            a ColumnStore of the columns of every object in the collection.
+        """
+        column_store = self._column_stores.get(collection)
+        if column_store is None:
+            column_store = ColumnStore.from_parents(getattr(self, collection).values())
+            self._column_stores[collection] = column_store
+        return column_store
+
+    def get_object_hash(self, unique_id: str) -> bytes | None:
+        """Digest of the data of a manifest object.
+
+        Digests are memoized, so each object is hashed at most once per session.
+        Objects with equal digests have equal data.
+
+        Args:
+            unique_id: unique ID of the node, source, macro or unit test.
+
+        Returns:
+            the digest, or None if there is no such object in the manifest.
+        """
+        if unique_id in self._object_hashes:
+            return self._object_hashes[unique_id]
+        object_hash = None
+        for section in DIFFED_SECTIONS:
+            object_data = (self.data.get(section) or {}).get(unique_id)
+            if object_data is not None:
+                object_hash = hashlib.blake2b(
+                    pickle.dumps(object_data, protocol=pickle.HIGHEST_PROTOCOL),
+                    digest_size=16,
+                ).digest()
+                break
+        self._object_hashes[unique_id] = object_hash
+        return object_hash
+
+    def get_state_modified(
+        self, state_dir: Path, include_descendants: bool
+    ) -> frozenset[str]:
+        """Unique IDs of the objects and columns modified relative to a baseline.
+
+        Results are cached, and the baseline manifest is fingerprinted at most
+        once per session. Only changes to the fields which checks read, or to
+        the tests of an object, are found.
+
+        Args:
+            state_dir: directory where the baseline manifest.json file is located.
+            include_descendants: whether the direct and indirect children of the
+                modified objects, and their columns, are included.
+
+        Returns:
+            a frozenset of unique IDs of the objects and columns which are new or
+            modified, where the unique ID of a column is the unique ID of its
+            parent followed by the column name.
+        """
+        key = (state_dir, include_descendants)
+        modified = self._state_modified.get(key)
+        if modified is None:
+            modified_ids = get_state_modified_unique_ids(
+                self.get_baseline_fingerprints(state_dir), self.data
+            )
+            if include_descendants:
+                objects = {
+                    unique_id: object_data
+                    for section in DIFFED_SECTIONS
+                    for unique_id, object_data in (self.data.get(section) or {}).items()
+                }
+                for unique_id in self.get_relatives_of_any(
+                    frozenset(modified_ids & objects.keys()),
+                    relation="children",
+                    include_indirect=True,
+                ):
+                    modified_ids.add(unique_id)
+                    modified_ids.update(
+                        f"{unique_id}.{name}"
+                        for name in (objects.get(unique_id, {}).get("columns") or {})
+                    )
+            modified = frozenset(modified_ids)
+            self._state_modified[key] = modified
+        return modified
+
+    def get_baseline_fingerprints(self, state_dir: Path) -> dict[str, str]:
+        """Fingerprints of the objects and columns of a baseline manifest.
+
+        Only the fingerprints of the baseline are kept in memory once they are
+        computed.
+
+        Args:
+            state_dir: directory where the baseline manifest.json file is located.
+
+        Returns:
+            dictionary mapping unique IDs to fingerprints.
+        """
+        fingerprints = self._baseline_fingerprints.get(state_dir)
+        if fingerprints is None:
+            fingerprints = get_fingerprints(
+                get_json_artifact_data(
+                    state_dir / MANIFEST_FILE_NAME,
+                    sections=frozenset(FINGERPRINTED_SECTIONS),
+                    lean=self.lean,
+                )
+            )
+            self._baseline_fingerprints[state_dir] = fingerprints
+        return fingerprints
+
+
+class Manifest:
+    """Represents the data in the dbt manifest.json file.
+
+    Unfiltered object collections are delegated to the underlying ArtifactSession,
+    while in-scope collections are computed for this instance's filter conditions.
+    """
+
+    def __init__(
+        self,
+        manifest_dir: Path,
+        filter_conditions: "ManifestFilterConditions",
+        filepaths: Collection[Path] | None = None,
+        session: ArtifactSession | None = None,
+    ):
+        """Initialise the instance.
+
+        Args:
+            manifest_dir: directory where the manifest.json file is located.
+            filter_conditions: A ManifestFilterConditions object to filter nodes by.
+            filepaths: Collection of Path objects representing the files to include.
+            session: ArtifactSession to share parsed data with. Optional, defaults to
+                a new session for this instance only.
+        """
+        self.session = session or ArtifactSession(manifest_dir=manifest_dir)
+        self.data = self.session.data
+        self.filter_conditions = filter_conditions
+        self.filepaths = set(filepaths) if filepaths else None
+
+    @property
+    def nodes(self) -> dict[str, dict[str, Any]]:
+        """All nodes present in the manifest."""
+        return self.session.nodes
+
+    @property
+    def models(self) -> dict[str, ManifestModel]:
+        """All models present in the manifest."""
+        return self.session.models
+
+    @cached_property
+    def in_scope_models(self) -> list[ManifestModel]:
+        """All models present in the manifest, after filtering.
+
+        Returns:
+            List of ManifestModel objects after filtering.
+        """
+        return [
+            model
+            for model in (
+                self.get_objects_in_files(self.models, self.filepaths)
+                if self.filepaths
+                else self.models.values()
+            )
+            if self.filter_conditions.is_manifest_object_in_scope(model, self)
+        ]
+
+    @cached_property
+    def in_scope_model_columns(self) -> list[ManifestColumn]:
+        """All model columns present in the manifest, after filtering.
+
+        Returns:
+            List of ManifestColumn objects after filtering.
+        """
+        return self.get_in_scope_columns(self.models.values())
+
+    @cached_property
+    def in_scope_model_column_store(self) -> ColumnStore:
+        """All model columns present in the manifest, after filtering, held as arrays.
+
+        Returns:
+            a ColumnStore of the same columns as in_scope_model_columns.
+        """
+        return self.get_in_scope_column_store("models")
+
+    def get_objects_in_files(
+        self, objects: dict[str, ManifestObjectT], filepaths: Collection[Path]
+    ) -> list[ManifestObjectT]:
+        """Objects defined or patched by any of some files.
+
+        Objects are looked up in the session's file index rather than scanned,
+        and are returned in the order of their collection.
+
+        Args:
+            objects: dictionary mapping unique IDs to manifest objects.
+            filepaths: Collection of Path objects representing the files to include.
+
+        Returns:
+            List of the objects whose original file path or patch path is included.
+        """
+        entries = {
+            entry
+            for filepath in filepaths
+            for entry in self.session.file_index.get(filepath, [])
+            if entry[1] in objects
+        }
+        return [objects[unique_id] for _, unique_id in sorted(entries)]
+
+    def get_in_scope_columns(
+        self, parents: Iterable[ColumnParent]
+    ) -> list[ManifestColumn]:
+        """Columns of some manifest objects, after filtering.
+
+        Filter methods which columns inherit from their parent are evaluated
+        once per parent, and only the remaining ones once per column.
+
+        Args:
+            parents: manifest objects which have columns.
+
+        Returns:
+            List of ManifestColumn objects after filtering.
+        """
+        columns: list[ManifestColumn] = []
+        for parent in parents:
+            if not self.filter_conditions.is_column_parent_in_scope(parent, self):
+                continue
+            columns.extend(
+                column
+                for column in parent.columns
+                if self.filter_conditions.is_column_in_scope_given_parent(column, self)
+            )
+        return columns
+
+    def get_in_scope_column_store(
+        self, collection: Literal["models", "seeds", "snapshots", "sources"]
+    ) -> ColumnStore:
+        """Columns of a collection of manifest objects, after filtering, as arrays.
+
+        The columns are selected from the session's store like in
+        get_in_scope_columns, but column objects are only built when a filter
+        method applies to the columns themselves.
+
+        Args:
+            collection: name of the attribute holding the objects.
+
+        Returns:
+            a ColumnStore of the in-scope columns.
+        """
+        filter_conditions = self.filter_conditions
+        return self.session.get_column_store(collection).select(
+            lambda parent: filter_conditions.is_column_parent_in_scope(parent, self),
+            (
+                lambda column: filter_conditions.is_column_in_scope_given_parent(
+                    column, self
+                )
+            )
+            if filter_conditions.filters_columns
+            else None,
+        )
+
+    def get_model(self, model_id: str) -> ManifestModel | None:
+        """Get a model from the manifest by looking up by unique ID.
+
+        Args:
+            model_id: unique id of the model
+
+        Returns:
+            A ManifestModel object if found, else None
+        """
+        return self.models.get(model_id)
+
+    @property
+    def generic_tests(self) -> dict[str, GenericTest]:
+        """All generic tests present in the manifest."""
+        return self.session.generic_tests
+
+    @property
+    def snapshots(self) -> dict[str, ManifestSnapshot]:
+        """All snapshots present in the manifest."""
+        return self.session.snapshots
+
+    @property
+    def seeds(self) -> dict[str, ManifestSeed]:
+        """All seeds present in the manifest."""
+        return self.session.seeds
+
+    @property
+    def analyses(self) -> dict[str, ManifestAnalysis]:
+        """All analyses present in the manifest."""
+        return self.session.analyses
+
+    @property
+    def singular_tests(self) -> dict[str, SingularTest]:
+        """All singular tests present in the manifest."""
+        return self.session.singular_tests
+
+    @property
+    def functions(self) -> dict[str, ManifestFunction]:
+        """All functions present in the manifest."""
+        return self.session.functions
+
+    @property
+    def sources(self) -> dict[str, ManifestSource]:
+        """All sources present in the manifest."""
+        return self.session.sources
+
     @cached_property
     def in_scope_sources(self) -> list[ManifestSource]:
         """All sources present in the manifest, after filtering.
@@ -272,12 +911,12 @@ class Manifest:
         """
         return [
             source
-            for source in self.sources.values()
-            if self.filter_conditions.is_manifest_object_in_scope(source, self)
-            and (
-                not self.filepaths
-                or source.is_included_by_original_or_patch_path(self.filepaths)
+            for source in (
+                self.get_objects_in_files(self.sources, self.filepaths)
+                if self.filepaths
+                else self.sources.values()
             )
+            if self.filter_conditions.is_manifest_object_in_scope(source, self)
         ]
 
     @cached_property
@@ -287,24 +926,21 @@ class Manifest:
         Returns:
             List of ManifestColumn objects after filtering.
         """
-        return [
-            column
-            for source in self.sources.values()
-            for column in source.columns
-            if self.filter_conditions.is_manifest_object_in_scope(column, self)
-        ]
+        return self.get_in_scope_columns(self.sources.values())
 
     @cached_property
-    def macros(self) -> dict[str, Macro]:
-        """All macros present in the manifest.
+    def in_scope_source_column_store(self) -> ColumnStore:
+        """All source columns present in the manifest, after filtering, held as arrays.
 
         Returns:
-            a dictionary mapping unique IDs to Macro objects.
+            a ColumnStore of the same columns as in_scope_source_columns.
         """
-        return {
-            macro_id: Macro(macro_data)
-            for macro_id, macro_data in self.data.get("macros", {}).items()
-        }
+        return self.get_in_scope_column_store("sources")
+
+    @property
+    def macros(self) -> dict[str, Macro]:
+        """All macros present in the manifest."""
+        return self.session.macros
 
     @cached_property
     def in_scope_macros(self) -> list[Macro]:
@@ -315,12 +951,12 @@ class Manifest:
         """
         return [
             macro
-            for macro in self.macros.values()
-            if self.filter_conditions.is_manifest_object_in_scope(macro, self)
-            and (
-                not self.filepaths
-                or macro.is_included_by_original_or_patch_path(self.filepaths)
+            for macro in (
+                self.get_objects_in_files(self.macros, self.filepaths)
+                if self.filepaths
+                else self.macros.values()
             )
+            if self.filter_conditions.is_manifest_object_in_scope(macro, self)
         ]
 
     @cached_property
@@ -330,12 +966,16 @@ class Manifest:
         Returns:
             List of ManifestColumn objects after filtering.
         """
-        return [
-            column
-            for snapshot in self.snapshots.values()
-            for column in snapshot.columns
-            if self.filter_conditions.is_manifest_object_in_scope(column, self)
-        ]
+        return self.get_in_scope_columns(self.snapshots.values())
+
+    @cached_property
+    def in_scope_snapshot_column_store(self) -> ColumnStore:
+        """All snapshot columns present in the manifest, after filtering, held as arrays.
+
+        Returns:
+            a ColumnStore of the same columns as in_scope_snapshot_columns.
+        """
+        return self.get_in_scope_column_store("snapshots")
 
     @cached_property
     def in_scope_snapshots(self) -> list[ManifestSnapshot]:
@@ -346,12 +986,12 @@ class Manifest:
         """
         return [
             snapshot
-            for snapshot in self.snapshots.values()
-            if self.filter_conditions.is_manifest_object_in_scope(snapshot, self)
-            and (
-                not self.filepaths
-                or snapshot.is_included_by_original_or_patch_path(self.filepaths)
+            for snapshot in (
+                self.get_objects_in_files(self.snapshots, self.filepaths)
+                if self.filepaths
+                else self.snapshots.values()
             )
+            if self.filter_conditions.is_manifest_object_in_scope(snapshot, self)
         ]
 
     @cached_property
@@ -368,12 +1008,12 @@ class Manifest:
         )
         return [
             seed
-            for seed in self.seeds.values()
-            if self.filter_conditions.is_manifest_object_in_scope(seed, self)
-            and (
-                not seed_filepaths
-                or seed.is_included_by_original_or_patch_path(seed_filepaths)
+            for seed in (
+                self.get_objects_in_files(self.seeds, seed_filepaths)
+                if seed_filepaths
+                else self.seeds.values()
             )
+            if self.filter_conditions.is_manifest_object_in_scope(seed, self)
         ]
 
     @cached_property
@@ -383,50 +1023,148 @@ class Manifest:
         Returns:
             List of ManifestColumn objects after filtering.
         """
-        return [
-            column
-            for seed in self.seeds.values()
-            for column in seed.columns
-            if self.filter_conditions.is_manifest_object_in_scope(column, self)
-        ]
+        return self.get_in_scope_columns(self.seeds.values())
 
     @cached_property
-    def unit_tests(self) -> dict[str, UnitTest]:
-        """All unit tests present in the manifest.
+    def in_scope_seed_column_store(self) -> ColumnStore:
+        """All seed columns present in the manifest, after filtering, held as arrays.
 
         Returns:
-            a dictionary mapping unique IDs to UnitTest objects.
+            a ColumnStore of the same columns as in_scope_seed_columns.
         """
-        return {
-            unit_test_id: UnitTest(unit_test_data)
-            for unit_test_id, unit_test_data in self.data.get("unit_tests", {}).items()
-        }
+        return self.get_in_scope_column_store("seeds")
 
-    @cached_property
+    @property
+    def unit_tests(self) -> dict[str, UnitTest]:
+        """All unit tests present in the manifest."""
+        return self.session.unit_tests
+
+    @property
     def child_map(self) -> dict[str, list[str]]:
-        """Child map data from the manifest.
+        """Child map data from the manifest."""
+        return self.session.child_map
+
+    @property
+    def parent_map(self) -> dict[str, list[str]]:
+        """Parent map data from the manifest."""
+        return self.session.parent_map
+
+    @property
+    def lineage(self) -> LineageGraph:
+        """Integer-encoded graph of the parents and children of each object."""
+        return self.session.lineage
+
+    def get_reachability_index(
+        self, relation: Literal["parents", "children"]
+    ) -> ReachabilityIndex:
+        """Get the reachability index of the parents or children of each object.
+
+        Args:
+            relation: whether to index the parents or children of each object.
 
         Returns:
-            a dictionary mapping unique IDs to lists of child IDs.
+            a ReachabilityIndex of the lineage graph.
         """
-        return self.data.get("child_map", {})
+        return self.session.get_reachability_index(relation)
 
-    @cached_property
-    def parent_map(self) -> dict[str, list[str]]:
-        """Parent map data from the manifest.
+    @property
+    def candidate_count(self) -> int:
+        """Estimated number of objects each filter method is applied to.
+
+        When filepaths are given, only the objects defined or patched by those
+        files can be in scope. Otherwise, it is the number of objects in the
+        lineage graph.
+        """
+        if self.filepaths:
+            return len(
+                {
+                    unique_id
+                    for filepath in self.filepaths
+                    for _, unique_id in self.session.file_index.get(filepath, [])
+                }
+            )
+        return len(self.lineage)
+
+    @property
+    def indexes_lineage(self) -> bool:
+        """Whether indirect lineage filters use the lineage reachability index.
+
+        Building the index covers the whole lineage graph, which only pays off
+        when objects are not restricted to some files. Otherwise, the lineage of
+        each candidate object is traversed instead.
+        """
+        return not self.filepaths
+
+    def get_relatives_of_any(
+        self,
+        unique_ids: frozenset[str],
+        relation: Literal["parents", "children"],
+        include_indirect: bool,
+    ) -> frozenset[str]:
+        """Unique IDs of all relatives of any of these objects.
+
+        Args:
+            unique_ids: Unique IDs of the objects.
+            relation: whether to find the parents or children of the objects.
+            include_indirect: Whether to include indirect relatives.
 
         Returns:
-            a dictionary mapping unique IDs to lists of parent IDs.
+            a frozenset of unique IDs of all relatives of any of these objects.
         """
-        return self.data.get("parent_map", {})
+        return self.session.get_relatives_of_any(
+            unique_ids, relation=relation, include_indirect=include_indirect
+        )
 
+    def get_state_modified(
+        self, state_dir: Path, include_descendants: bool
+    ) -> frozenset[str]:
+        """Unique IDs of the objects and columns modified relative to a baseline.
 
-@lru_cache
-def get_json_artifact_data(artifact_path: Path) -> dict:
+        Args:
+            state_dir: directory where the baseline manifest.json file is located.
+            include_descendants: whether the direct and indirect children of the
+                modified objects, and their columns, are included.
+
+        Returns:
+            a frozenset of unique IDs of the objects and columns which are new or
+            modified.
+        """
+        return self.session.get_state_modified(
+            state_dir, include_descendants=include_descendants
+        )
+
+
+def get_node_partition(node_data: dict[str, Any]) -> str | None:
+    """Get the partition a manifest node belongs to.
+
+    Args:
+        node_data: data for the node from the manifest file.
+
+    Returns:
+        the node's resource type, or 'generic_test'/'singular_test' for tests.
+    """
+    resource_type = node_data.get("resource_type")
+    if resource_type == "test":
+        return "generic_test" if node_data.get("test_metadata") else "singular_test"
+    return resource_type
+
+
+def get_json_artifact_data(
+    artifact_path: Path, sections: frozenset[str] | None = None, lean: bool = False
+) -> dict:
     """Load data from a dbt JSON artifact.
 
+    When sections are given, the artifact is read one chunk at a time, all
+    other top-level sections are discarded as soon as they have been scanned,
+    and node fields which no check uses are dropped. These partial loads are
+    not cached, as the ManifestData they are loaded into holds them.
+
     Args:
         artifact_path: Path to the dbt JSON artifact
+        sections: top-level keys of the sections to load. If None, all are loaded.
+        lean: whether each object of the sections is projected to its
+            memory-lean representation as soon as it is decoded.
+            Only applies when sections are given.
 
     Returns:
         dbt artifact data as a dictionary
@@ -436,6 +1174,116 @@ def get_json_artifact_data(artifact_path: Path) -> dict:
     """
     if not artifact_path.exists():
         raise FileNotFoundError(f"Path {artifact_path.absolute()} does not exist.")
+    if sections is None:
+        return load_json_artifact(artifact_path)
+    with open(artifact_path, "r") as file_handler:
+        return decode_object_members(
+            JsonReader(file_handler),
+            keys=sections,
+            value_decoder=decode_lean_section if lean else decode_section,
+        )
+
+
+@lru_cache
+def load_json_artifact(artifact_path: Path) -> dict:
+    """Load all data from a dbt JSON artifact, cached for later loads.
+
+    Args:
+        artifact_path: Path to the dbt JSON artifact
+
+    Returns:
+        dbt artifact data as a dictionary
+    """
     with open(artifact_path, "r") as file_handler:
-        data = json.load(file_handler)
-    return data
+        return json.load(file_handler)
+
+
+def decode_section(key: str, reader: JsonReader) -> Any:
+    """Decode a top-level section of the manifest.json file.
+
+    Sections which are objects are decoded one member at a time, and node
+    fields which no check uses are discarded as soon as each node is decoded.
+
+    Args:
+        key: top-level key of the section.
+        reader: reader of the manifest.json file, at the start of the section.
+
+    Returns:
+        the decoded section.
+    """
+    if reader.peek() != "{":
+        return decode_value(key, reader)
+    return decode_object_members(
+        reader, value_decoder=decode_node if key == "nodes" else decode_value
+    )
+
+
+def decode_node(unique_id: str, reader: JsonReader) -> dict[str, Any]:
+    """Decode a node of the manifest, without the fields which no check uses.
+
+    Args:
+        unique_id: unique ID of the node.
+        reader: reader of the manifest.json file, at the start of the node.
+
+    Returns:
+        the decoded node.
+    """
+    node_data = decode_value(unique_id, reader)
+    for field in UNUSED_NODE_FIELDS:
+        node_data.pop(field, None)
+    return node_data
+
+
+def decode_lean_section(key: str, reader: JsonReader) -> Any:
+    """Decode a top-level section of the manifest.json file, lean.
+
+    The objects of the nodes, sources, macros and unit tests sections are
+    decoded one at a time, and each is projected to its memory-lean
+    representation straight away, so that the full data of at most one object
+    is held at any time.
+
+    Args:
+        key: top-level key of the section.
+        reader: reader of the manifest.json file, at the start of the section.
+
+    Returns:
+        the decoded section.
+    """
+    if key not in LEAN_FIELDS or reader.peek() != "{":
+        return decode_section(key, reader)
+    return decode_object_members(reader, value_decoder=partial(decode_lean_object, key))
+
+
+def decode_lean_object(
+    section: str, unique_id: str, reader: JsonReader
+) -> dict[str, Any]:
+    """Decode an object of a manifest section, and project it to its lean copy.
+
+    Args:
+        section: top-level key of the section the object belongs to.
+        unique_id: unique ID of the object.
+        reader: reader of the manifest.json file, at the start of the object.
+
+    Returns:
+        the lean copy of the object.
+    """
+    return project_object(section, decode_value(unique_id, reader))
+
+
+@lru_cache
+def get_artifact_session(
+    manifest_dir: Path,
+    cache_dir: Path | None = None,
+    lean: bool = False,
+) -> ArtifactSession:
+    """Get the artifact session shared by all checks using the same artifacts.
+
+    Args:
+        manifest_dir: directory where the manifest.json file is located.
+        cache_dir: directory where parsed manifests are cached between runs.
+        lean: whether the manifest objects are in their memory-lean representation.
+
+    Returns:
+        an ArtifactSession instance, created on first use.
+    """
+    return ArtifactSession(manifest_dir=manifest_dir, cache_dir=cache_dir, lean=lean)
@@ -3,93 +3,99 @@
 import logging
 from abc import ABC, abstractmethod
 from argparse import Namespace
-from typing import Collection
+from functools import cached_property
+from typing import Any, Collection, Hashable, Iterable, Sequence
 
-from utils.artifact_data import Catalog, Manifest
+from utils.artifact_data import (
+    ArtifactSession,
+    Catalog,
+    Manifest,
+    get_artifact_session,
+)
+
+# Re-exported, as the check modules import the standard arguments from here.
+from utils.check_arguments import (
+    STANDARD_MACRO_ARGUMENTS as STANDARD_MACRO_ARGUMENTS,
+)
+from utils.check_arguments import (
+    STANDARD_MODEL_ARGUMENTS as STANDARD_MODEL_ARGUMENTS,
+)
+from utils.check_arguments import (
+    STANDARD_NON_MODEL_ARGUMENTS as STANDARD_NON_MODEL_ARGUMENTS,
+)
+from utils.check_arguments import (
+    STANDARD_SEED_ARGUMENTS as STANDARD_SEED_ARGUMENTS,
+)
+from utils.check_arguments import (
+    STANDARD_SNAPSHOT_ARGUMENTS as STANDARD_SNAPSHOT_ARGUMENTS,
+)
+from utils.check_arguments import (
+    STANDARD_SOURCE_ARGUMENTS as STANDARD_SOURCE_ARGUMENTS,
+)
 from utils.console_formatting import (
     ConsoleEmphasis,
     check_status_header,
     colour_message,
 )
+from utils.lean_manifest import LEAN_MANIFEST
 from utils.manifest_filter_conditions import ManifestFilterConditions
+from utils.result_cache import CheckResults, ResultCache, Verdict
+
+STANDARD_MANIFEST_SECTIONS: frozenset[str] = frozenset(
+    {"metadata", "nodes", "child_map", "parent_map"}
+)
+STANDARD_MACRO_MANIFEST_SECTIONS: frozenset[str] = frozenset(
+    {"metadata", "macros", "child_map", "parent_map"}
+)
+STANDARD_SOURCE_MANIFEST_SECTIONS = STANDARD_MANIFEST_SECTIONS | {"sources"}
+UNIT_TEST_MANIFEST_SECTIONS = STANDARD_MANIFEST_SECTIONS | {"unit_tests"}
 
-STANDARD_MODEL_ARGUMENTS: list[str] = [
-    "include_materializations",
-    "include_tags",
-    "include_packages",
-    "include_node_paths",
-    "include_name_patterns",
-    "include_direct_parents",
-    "include_indirect_parents",
-    "include_direct_children",
-    "include_indirect_children",
-    "include_unique_ids",
-    "exclude_materializations",
-    "exclude_tags",
-    "exclude_packages",
-    "exclude_node_paths",
-    "exclude_name_patterns",
-    "exclude_direct_parents",
-    "exclude_indirect_parents",
-    "exclude_direct_children",
-    "exclude_indirect_children",
-    "exclude_unique_ids",
-]
-
-STANDARD_MACRO_ARGUMENTS: list[str] = [
-    "include_tags",
-    "include_packages",
-    "include_node_paths",
-    "include_name_patterns",
-    "include_unique_ids",
-    "exclude_tags",
-    "exclude_packages",
-    "exclude_node_paths",
-    "exclude_name_patterns",
-    "exclude_unique_ids",
-]
-
-STANDARD_NON_MODEL_ARGUMENTS: list[str] = [
-    "include_tags",
-    "include_packages",
-    "include_node_paths",
-    "include_name_patterns",
-    "include_direct_parents",
-    "include_indirect_parents",
-    "include_direct_children",
-    "include_indirect_children",
-    "include_unique_ids",
-    "exclude_tags",
-    "exclude_packages",
-    "exclude_node_paths",
-    "exclude_name_patterns",
-    "exclude_direct_parents",
-    "exclude_indirect_parents",
-    "exclude_direct_children",
-    "exclude_indirect_children",
-    "exclude_unique_ids",
-]
-
-STANDARD_SEED_ARGUMENTS = STANDARD_NON_MODEL_ARGUMENTS
-STANDARD_SNAPSHOT_ARGUMENTS = STANDARD_NON_MODEL_ARGUMENTS
-STANDARD_SOURCE_ARGUMENTS = STANDARD_NON_MODEL_ARGUMENTS
+
+def get_check_session(args: Namespace) -> ArtifactSession:
+    """Get the artifact session for a check's arguments.
+
+    Args:
+        args: check arguments
+
+    Returns:
+        the ArtifactSession shared by all checks using the same artifacts.
+    """
+    return get_artifact_session(
+        manifest_dir=args.manifest_dir,
+        cache_dir=getattr(args, "cache_dir", None),
+        lean=getattr(args, "manifest_representation", None) == LEAN_MANIFEST,
+    )
 
 
 class Check(ABC):
     """Abstract base class for generic checks.
 
+    Sections of the manifest which a check does not declare are still loaded
+    when first used, but declaring them lets every section a check needs be
+    loaded in a single pass over the manifest.json file.
+
     Attributes:
         args: check arguments
+        manifest_sections: top-level manifest sections used by the check
+        resource_types: types of manifest object checked
     """
 
     check_name: str
     additional_arguments: list[str]
+    manifest_sections: frozenset[str] = STANDARD_MANIFEST_SECTIONS
+    resource_types: frozenset[str] = frozenset({"model"})
+
+    def __init__(self, args: Namespace, run: bool = True) -> None:
+        """Initialise and call the instance.
 
-    def __init__(self, args: Namespace) -> None:
-        """Initialise and call the instance."""
+        Args:
+            args: check arguments
+            run: whether to run the check straight away. Optional, defaults to True.
+        """
         self.args: Namespace = args
         self.filter_conditions = ManifestFilterConditions(self.args)
-        self()
+        if run:
+            self()
 
     @abstractmethod
     def perform_check(self) -> None:
@@ -114,6 +120,12 @@ class Check(ABC):
         Raises:
              SystemExit with the result of the check
         """
+        self.log_start()
+        self.perform_check()
+        self.log_result()
+
+    def log_start(self) -> None:
+        """Log the name and filter conditions of the check."""
         logging.info(
             f"""{
                 colour_message(
@@ -122,7 +134,9 @@ class Check(ABC):
                 )
             }\n\n{self.filter_conditions.summary}\n"""
         )
-        self.perform_check()
+
+    def log_result(self) -> None:
+        """Log the result of the check, once it has been performed."""
         if self.has_failures:
             logging.error(
                 f"{check_status_header(f'{self.check_name}: FAIL', False)}\n\n{self.failure_message}\n\n{80 * '_'}\n"
@@ -132,13 +146,19 @@ class Check(ABC):
                 f"{check_status_header(f'{self.check_name}: PASS', True)}\n\n{80 * '_'}\n"
             )
 
-    @property
+    @cached_property
     def manifest(self) -> Manifest:
-        """Manifest instance to check against."""
-        return Manifest(
-            manifest_dir=self.args.manifest_dir,
-            filter_conditions=self.filter_conditions,
-            filepaths=getattr(self.args, "files", None),
+        """Manifest instance to check against.
+
+        The instance is shared with any other check using the same artifacts,
+        filter conditions and files. It is resolved once per check, rather than
+        once per object judged.
+        """
+        session = get_check_session(self.args)
+        session.data.load(self.manifest_sections)
+        filepaths = getattr(self.args, "files", None)
+        return session.get_manifest(
+            self.filter_conditions, frozenset(filepaths) if filepaths else None
         )
 
 
@@ -157,6 +177,129 @@ class ManifestCheck(Check, ABC):
         return bool(self.failures)
 
 
+class PerObjectCheck(ManifestCheck, ABC):
+    """Abstract base class for manifest checks which judge each object on its own.
+
+    As every object is judged independently, checks of this kind which share
+    the same objects can be performed together, in a single pass over them.
+
+    When a result cache directory is given, verdicts are reused for objects
+    whose data, and the data of the inputs the check reads, are unchanged.
+
+    Attributes:
+        object_collection: name of the Manifest attribute listing the objects to check
+        has_failure_details: whether failures map unique IDs to failure details,
+            rather than being a set of unique IDs
+        depends_on_children: whether verdicts depend on the children of the
+            object, such as its data tests or unit tests, as well as the object
+    """
+
+    object_collection: str
+    has_failure_details: bool = False
+    depends_on_children: bool = False
+
+    @abstractmethod
+    def is_failure(self, manifest_object: Any) -> bool:
+        """Determine whether an object fails the check."""
+        ...
+
+    def get_failure_details(self, manifest_object: Any) -> Any:
+        """Details of an object's failure, used in the failure message."""
+        return None
+
+    @cached_property
+    def results(self) -> CheckResults | None:
+        """Cached verdicts of the check, or None if results are not cached."""
+        result_cache_dir = getattr(self.args, "result_cache_dir", None)
+        if result_cache_dir is None:
+            return None
+        return ResultCache(result_cache_dir).get_results(self.args)
+
+    def get_result_key(self, manifest_object: Any) -> Hashable | None:
+        """Key of the data which the verdict on an object depends on.
+
+        Args:
+            manifest_object: manifest object to judge.
+
+        Returns:
+            a hashable key, or None if the verdict cannot be cached.
+        """
+        session = get_check_session(self.args)
+        unique_id = manifest_object.unique_id
+        object_hash = session.get_object_hash(unique_id)
+        if object_hash is None:
+            return None
+        if not self.depends_on_children:
+            return object_hash
+        return object_hash, tuple(
+            (child_id, session.get_object_hash(child_id))
+            for child_id in session.child_map.get(unique_id, [])
+        )
+
+    def judge(self, manifest_object: Any) -> Verdict:
+        """Judge an object, reusing its cached verdict if there is one.
+
+        Args:
+            manifest_object: manifest object to judge.
+
+        Returns:
+            whether the object fails the check, and the details of its failure.
+        """
+        results = self.results
+        key = self.get_result_key(manifest_object) if results is not None else None
+        if results is not None and key is not None:
+            cached_verdict = results.get(key)
+            if cached_verdict is not None:
+                return cached_verdict
+        verdict = self.get_verdict(manifest_object)
+        if results is not None and key is not None:
+            results.put(key, verdict)
+        return verdict
+
+    def get_verdict(self, manifest_object: Any) -> Verdict:
+        """Judge an object, without the result cache.
+
+        Checks whose failure details are a by-product of judging the object
+        override this, so the details are not computed twice.
+
+        Args:
+            manifest_object: manifest object to judge.
+
+        Returns:
+            whether the object fails the check, and the details of its failure.
+        """
+        failed = self.is_failure(manifest_object)
+        return (
+            failed,
+            self.get_failure_details(manifest_object)
+            if failed and self.has_failure_details
+            else None,
+        )
+
+    def perform_check(self) -> None:
+        """Execute the check logic."""
+        perform_fused_checks([self])
+
+    def record_failures(self, failures: Iterable[tuple[Any, Any]]) -> None:
+        """Record the objects which failed the check, and save their verdicts.
+
+        Args:
+            failures: manifest objects which failed the check, with the details
+                of their failures.
+        """
+        if self.has_failure_details:
+            self.failures = {
+                manifest_object.unique_id: details
+                for manifest_object, details in failures
+            }
+        else:
+            self.failures = {
+                manifest_object.unique_id for manifest_object, _ in failures
+            }
+        if self.results is not None:
+            self.results.save()
+
+
 class ManifestVsCatalogComparison(Check, ABC):
     """Abstract base class for manifest vs. catalog comparison checks.
 
@@ -177,3 +320,49 @@ class ManifestVsCatalogComparison(Check, ABC):
     def catalog(self) -> Catalog:
         """Catalog instance to check against."""
         return Catalog(catalog_dir=self.args.catalog_dir)
+
+
+def perform_fused_checks(checks: Sequence[PerObjectCheck]) -> None:
+    """Perform several checks of the same objects in a single pass over them.
+
+    Args:
+        checks: PerObjectCheck instances sharing their manifest and object collection.
+    """
+    failures: dict[PerObjectCheck, list[tuple[Any, Any]]] = {
+        check: [] for check in checks
+    }
+    for manifest_object in getattr(checks[0].manifest, checks[0].object_collection):
+        for check in checks:
+            failed, details = check.judge(manifest_object)
+            if failed:
+                failures[check].append((manifest_object, details))
+    for check in checks:
+        check.record_failures(failures[check])
+
+
+def run_checks(checks: Sequence[Check]) -> None:
+    """Run checks which have not been run yet, fusing those that can be fused.
+
+    PerObjectCheck instances using the same filtered manifest and object collection
+    are performed together in one pass over the objects. Every check then
+    logs its start and result in the given order, as if run one by one.
+
+    Args:
+        checks: Check instances, created without running them.
+    """
+    fusion_groups: dict[tuple[Manifest, str], list[PerObjectCheck]] = {}
+    for check in checks:
+        if isinstance(check, PerObjectCheck):
+            fusion_groups.setdefault(
+                (check.manifest, check.object_collection), []
+            ).append(check)
+    fused_checks: set[Check] = set()
+    for group in fusion_groups.values():
+        if len(group) > 1:
+            perform_fused_checks(group)
+            fused_checks.update(group)
+    for check in checks:
+        check.log_start()
+        if check not in fused_checks:
+            check.perform_check()
+        check.log_result()
@@ -0,0 +1,66 @@
+"""Names of the filter arguments supported by each type of check.
+
+Only standard library modules are imported here, so that the check registry can
+read the arguments of every check without importing the checks themselves.
+"""
+
+STANDARD_MODEL_ARGUMENTS: list[str] = [
+    "include_materializations",
+    "include_tags",
+    "include_packages",
+    "include_node_paths",
+    "include_name_patterns",
+    "include_direct_parents",
+    "include_indirect_parents",
+    "include_direct_children",
+    "include_indirect_children",
+    "include_unique_ids",
+    "exclude_materializations",
+    "exclude_tags",
+    "exclude_packages",
+    "exclude_node_paths",
+    "exclude_name_patterns",
+    "exclude_direct_parents",
+    "exclude_indirect_parents",
+    "exclude_direct_children",
+    "exclude_indirect_children",
+    "exclude_unique_ids",
+]
+
+STANDARD_MACRO_ARGUMENTS: list[str] = [
+    "include_tags",
+    "include_packages",
+    "include_node_paths",
+    "include_name_patterns",
+    "include_unique_ids",
+    "exclude_tags",
+    "exclude_packages",
+    "exclude_node_paths",
+    "exclude_name_patterns",
+    "exclude_unique_ids",
+]
+
+STANDARD_NON_MODEL_ARGUMENTS: list[str] = [
+    "include_tags",
+    "include_packages",
+    "include_node_paths",
+    "include_name_patterns",
+    "include_direct_parents",
+    "include_indirect_parents",
+    "include_direct_children",
+    "include_indirect_children",
+    "include_unique_ids",
+    "exclude_tags",
+    "exclude_packages",
+    "exclude_node_paths",
+    "exclude_name_patterns",
+    "exclude_direct_parents",
+    "exclude_indirect_parents",
+    "exclude_direct_children",
+    "exclude_indirect_children",
+    "exclude_unique_ids",
+]
+
+STANDARD_SEED_ARGUMENTS = STANDARD_NON_MODEL_ARGUMENTS
+STANDARD_SNAPSHOT_ARGUMENTS = STANDARD_NON_MODEL_ARGUMENTS
+STANDARD_SOURCE_ARGUMENTS = STANDARD_NON_MODEL_ARGUMENTS
@@ -1,17 +1,30 @@
 """Methods for compiling formatted failure console messages."""
 
-from typing import Any, Collection
+from typing import TYPE_CHECKING, Any, Collection, Mapping
 
-from prettytable import HRuleStyle, PrettyTable
+if TYPE_CHECKING:
+    from prettytable import PrettyTable
 
 PRETTY_TABLE_KWARGS: dict[str, Any] = {
     "max_table_width": 80,
-    "hrules": HRuleStyle.ALL,
     "min_width": 28,
     "border": True,
 }
 
 
+def new_table() -> "PrettyTable":
+    """Create an empty table for a failure message.
+
+    prettytable is imported here, so that it is only imported once a check fails.
+
+    Returns:
+        PrettyTable instance with horizontal rules between all rows.
+    """
+    from prettytable import HRuleStyle, PrettyTable
+
+    return PrettyTable(hrules=HRuleStyle.ALL, **PRETTY_TABLE_KWARGS)
+
+
 def macro_argument_mismatch_manifest_vs_sql(
     sql_args: Collection[str], manifest_args: Collection[str]
 ) -> str:
@@ -26,7 +39,7 @@ def macro_argument_mismatch_manifest_vs_sql(
     """
     sql_args_set: set[str] = set(sql_args)
     manifest_args_set: set[str] = set(manifest_args)
-    table = PrettyTable(**PRETTY_TABLE_KWARGS)
+    table = new_table()
     table.field_names = ["SQL code macro arguments", "Manifest macro arguments"]
     for arg in sorted(sql_args_set - manifest_args_set):
         table.add_row([arg, "MISSING"])
@@ -52,7 +65,7 @@ def manifest_vs_catalog_column_name_mismatch_message(
     """
     manifest_columns_set: set[str] = set(manifest_columns)
     catalog_columns_set: set[str] = set(catalog_columns)
-    table = PrettyTable(**PRETTY_TABLE_KWARGS)
+    table = new_table()
     table.field_names = ["Catalog columns", "Manifest columns"]
     for arg in sorted(catalog_columns_set - manifest_columns_set):
         table.add_row([arg, "MISSING"])
@@ -76,7 +89,7 @@ def manifest_vs_catalog_column_type_mismatch_message(
     Returns:
         A string summarising the check failures
     """
-    table = PrettyTable(**PRETTY_TABLE_KWARGS)
+    table = new_table()
     table.field_names = ["Catalog columns", "Manifest columns"]
     all_keys = set(manifest_columns.keys()).union(set(catalog_columns.keys()))
     for key in sorted(all_keys):
@@ -143,7 +156,7 @@ def inconsistent_column_descriptions_message(
     Returns:
         string summarising the check failures
     """
-    table = PrettyTable(**PRETTY_TABLE_KWARGS)
+    table = new_table()
     table.field_names = ["Unique ID", "Descriptions"]
     for column_name, column_instances in sorted(
         descriptions.items(), key=lambda x: x[0]
@@ -159,7 +172,7 @@ def inconsistent_column_descriptions_message(
 
 
 def object_missing_values_from_set_message(
-    objects: dict[str, set[str]],
+    objects: Mapping[str, Collection[str]],
     object_type: str,
     attribute_type: str,
     must_have_all_from: set[str] | None = None,
@@ -177,7 +190,7 @@ def object_missing_values_from_set_message(
     Returns:
         string summarising the check failures
     """
-    table = PrettyTable(**PRETTY_TABLE_KWARGS)
+    table = new_table()
     field_names = [
         object_type.capitalize(),
     ]
@@ -238,7 +251,7 @@ def object_attribute_value_not_in_set(
         attribute_type: Type of attribute being checked.
         allowed_values: set of allowed values.
     """
-    table = PrettyTable(**PRETTY_TABLE_KWARGS)
+    table = new_table()
     table.field_names = [object_type, "Allowed", "Actual"]
     for object_name, object_attribute_value in sorted(
         objects.items(), key=lambda x: x[0]
@@ -265,7 +278,7 @@ def dictionary_values_mismatch(
         dict_name: name of the dictionary being compared.
         differences: dictionary summarising the differences by object and key.
     """
-    table = PrettyTable(**PRETTY_TABLE_KWARGS)
+    table = new_table()
     table.field_names = [object_type, "Required", "Actual"]
     for object_name, difference in sorted(differences.items(), key=lambda x: x[0]):
         table.add_row(
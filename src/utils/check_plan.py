@@ -0,0 +1,164 @@
+"""Plans of configured checks, and executors which run them."""
+
+from abc import ABC, abstractmethod
+from argparse import Namespace
+from dataclasses import dataclass
+from typing import Hashable, Iterable, Mapping
+
+from utils.check_abc import Check, run_checks
+from utils.manifest_filter_conditions import ManifestFilterConditions
+
+
+@dataclass(frozen=True)
+class PlannedCheck:
+    """A configured check which has not been run yet.
+
+    Attributes:
+        check_class: Check subclass implementing the check.
+        args: check arguments.
+        filter_signature: signature of the check's filter conditions. Checks of
+            the same artifacts with equal signatures check the same objects.
+    """
+
+    check_class: type[Check]
+    args: Namespace
+    filter_signature: Hashable
+
+    @classmethod
+    def from_args(
+        cls, args: Namespace, checks_map: Mapping[str, type[Check]]
+    ) -> "PlannedCheck":
+        """Plan a check from its arguments.
+
+        Args:
+            args: check arguments.
+            checks_map: Check subclasses, by check ID.
+        """
+        return cls(
+            check_class=checks_map[args.check_id],
+            args=args,
+            filter_signature=ManifestFilterConditions(args).signature,
+        )
+
+    @property
+    def check_id(self) -> str:
+        """ID of the check."""
+        return self.args.check_id
+
+    @property
+    def manifest_sections(self) -> frozenset[str]:
+        """Top-level manifest sections used by the check."""
+        return self.check_class.manifest_sections
+
+    @property
+    def resource_types(self) -> frozenset[str]:
+        """Types of manifest object checked."""
+        return self.check_class.resource_types
+
+    def create_check(self) -> Check:
+        """Create the check, without running it."""
+        return self.check_class(self.args, run=False)
+
+
+@dataclass(frozen=True)
+class CheckPlan:
+    """Ordered checks to run, which can be inspected before running them.
+
+    Attributes:
+        checks: planned checks, in the order their results are reported.
+    """
+
+    checks: tuple[PlannedCheck, ...]
+
+    @classmethod
+    def build(
+        cls,
+        all_check_arguments: Iterable[Namespace],
+        checks_map: Mapping[str, type[Check]],
+    ) -> "CheckPlan":
+        """Plan the configured checks.
+
+        Args:
+            all_check_arguments: The arguments passed to the checks.
+            checks_map: Check subclasses, by check ID.
+        """
+        return cls(
+            tuple(
+                PlannedCheck.from_args(check_arguments, checks_map)
+                for check_arguments in all_check_arguments
+            )
+        )
+
+    def __len__(self) -> int:
+        """Number of planned checks."""
+        return len(self.checks)
+
+    @property
+    def manifest_sections(self) -> frozenset[str]:
+        """Top-level manifest sections used by any of the checks."""
+        return frozenset().union(
+            *(planned_check.manifest_sections for planned_check in self.checks)
+        )
+
+    @property
+    def resource_types(self) -> frozenset[str]:
+        """Types of manifest object checked by any of the checks."""
+        return frozenset().union(
+            *(planned_check.resource_types for planned_check in self.checks)
+        )
+
+    @property
+    def filter_groups(self) -> dict[Hashable, list[PlannedCheck]]:
+        """Planned checks grouped by filter signature, in order of first use."""
+        groups: dict[Hashable, list[PlannedCheck]] = {}
+        for planned_check in self.checks:
+            groups.setdefault(planned_check.filter_signature, []).append(planned_check)
+        return groups
+
+    def execute(self, executor: "CheckExecutor") -> list[bool]:
+        """Run the planned checks.
+
+        Args:
+            executor: CheckExecutor which runs the checks.
+
+        Returns:
+            whether each check has failures, in the order of the plan.
+        """
+        return executor.execute(self)
+
+
+class CheckExecutor(ABC):
+    """Abstract base class for ways of running a check plan."""
+
+    @abstractmethod
+    def execute(self, plan: CheckPlan) -> list[bool]:
+        """Run the planned checks, logging their results in the order of the plan.
+
+        Args:
+            plan: CheckPlan to run.
+
+        Returns:
+            whether each check has failures, in the order of the plan.
+        """
+        ...
+
+
+class SequentialExecutor(CheckExecutor):
+    """Run the planned checks one after another in this process.
+
+    Checks which judge the same objects one at a time are performed together
+    in a single pass over the objects.
+    """
+
+    def execute(self, plan: CheckPlan) -> list[bool]:
+        """Run the planned checks, logging their results in the order of the plan.
+
+        Args:
+            plan: CheckPlan to run.
+
+        Returns:
+            whether each check has failures, in the order of the plan.
+        """
+        checks = [planned_check.create_check() for planned_check in plan.checks]
+        run_checks(checks)
+        return [check.has_failures for check in checks]
@@ -0,0 +1,253 @@
+"""Columnar store of the columns of manifest objects, for column-level checks."""
+
+import importlib
+import re
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Sequence
+
+if TYPE_CHECKING:
+    from utils.artifact_data import ColumnParent
+    from utils.manifest_object.manifest_object import ManifestColumn
+
+# A list, or a NumPy array when NumPy is installed.
+Array = Any
+
+
+@lru_cache(maxsize=None)
+def get_numpy() -> Any:
+    """NumPy, if it is installed, or None.
+
+    NumPy is optional, and only imported once a column store is first built,
+    as it is slow to import.
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+class ColumnStore:
+    """Columns of a collection of manifest objects, held as parallel arrays.
+
+    The attributes of the columns which checks test are held in one array
+    each, rather than one object per column, so that checks test all columns
+    at once with mask operations. Names are held as codes into the list of
+    distinct names, so that name patterns are searched for once per distinct
+    name. The arrays are NumPy arrays when NumPy is installed, and lists
+    otherwise.
+
+    Attributes:
+        parents: manifest objects the columns belong to.
+        distinct_names: distinct names of the columns.
+        parent_indices: position in parents of the parent of each column.
+        name_codes: position in distinct_names of the name of each column.
+        has_data_type: whether each column has a data type.
+        has_description: whether each column has a non-empty description.
+    """
+
+    def __init__(
+        self,
+        parents: Sequence["ColumnParent"],
+        distinct_names: Sequence[str],
+        parent_indices: Array,
+        name_codes: Array,
+        has_data_type: Array,
+        has_description: Array,
+    ):
+        """Initialise the instance.
+
+        Args:
+            parents: manifest objects the columns belong to.
+            distinct_names: distinct names of the columns.
+            parent_indices: position in parents of the parent of each column,
+                in the order of the parents.
+            name_codes: position in distinct_names of the name of each column.
+            has_data_type: whether each column has a data type.
+            has_description: whether each column has a non-empty description.
+        """
+        self.parents = parents
+        self.distinct_names = distinct_names
+        self.parent_indices = parent_indices
+        self.name_codes = name_codes
+        self.has_data_type = has_data_type
+        self.has_description = has_description
+
+    @classmethod
+    def from_parents(cls, parents: Iterable["ColumnParent"]) -> "ColumnStore":
+        """Build the store of the columns of some manifest objects.
+
+        Columns are read straight from the manifest data, in the same order as
+        the columns attribute of their parent, without building column objects.
+
+        Args:
+            parents: manifest objects which have columns.
+        """
+        parents = tuple(parents)
+        name_positions: dict[str, int] = {}
+        parent_indices: list[int] = []
+        name_codes: list[int] = []
+        has_data_type: list[bool] = []
+        has_description: list[bool] = []
+        for parent_index, parent in enumerate(parents):
+            for column_data in (parent.data.get("columns") or {}).values():
+                parent_indices.append(parent_index)
+                name_codes.append(
+                    name_positions.setdefault(column_data["name"], len(name_positions))
+                )
+                has_data_type.append(column_data.get("data_type") is not None)
+                has_description.append(bool(column_data.get("description")))
+        distinct_names = list(name_positions)
+        numpy = get_numpy()
+        if numpy is None:
+            return cls(
+                parents,
+                distinct_names,
+                parent_indices,
+                name_codes,
+                has_data_type,
+                has_description,
+            )
+        return cls(
+            parents,
+            distinct_names,
+            numpy.array(parent_indices, dtype=numpy.intp),
+            numpy.array(name_codes, dtype=numpy.intp),
+            numpy.array(has_data_type, dtype=bool),
+            numpy.array(has_description, dtype=bool),
+        )
+
+    @property
+    def uses_numpy(self) -> bool:
+        """Whether the arrays are NumPy arrays."""
+        return not isinstance(self.parent_indices, list)
+
+    @property
+    def names(self) -> list[str]:
+        """Name of each column."""
+        return [self.distinct_names[code] for code in self.name_codes]
+
+    def __len__(self) -> int:
+        """Number of columns in the store."""
+        return len(self.parent_indices)
+
+    def take(self, indices: Array) -> "ColumnStore":
+        """Store of some of the columns.
+
+        Args:
+            indices: positions of the columns to keep, in ascending order.
+        """
+        if self.uses_numpy:
+            indices = get_numpy().asarray(indices, dtype=int)
+            return ColumnStore(
+                self.parents,
+                self.distinct_names,
+                self.parent_indices[indices],
+                self.name_codes[indices],
+                self.has_data_type[indices],
+                self.has_description[indices],
+            )
+        return ColumnStore(
+            self.parents,
+            self.distinct_names,
+            [self.parent_indices[index] for index in indices],
+            [self.name_codes[index] for index in indices],
+            [self.has_data_type[index] for index in indices],
+            [self.has_description[index] for index in indices],
+        )
+
+    def select(
+        self,
+        is_parent_selected: Callable[["ColumnParent"], bool],
+        is_column_selected: Callable[["ManifestColumn"], bool] | None = None,
+    ) -> "ColumnStore":
+        """Store of the columns selected by their parent, and by themselves.
+
+        Columns are matched to their column objects by position within their
+        parent, so this only applies to stores built with from_parents.
+
+        Args:
+            is_parent_selected: function judging whether the columns of a
+                parent are selected, called once per parent.
+            is_column_selected: function judging whether a column of a selected
+                parent is selected, given its column object. If None, every
+                column of a selected parent is selected, and no column objects
+                are built.
+        """
+        selected_parents = [is_parent_selected(parent) for parent in self.parents]
+        if self.uses_numpy:
+            numpy = get_numpy()
+            if is_column_selected is None:
+                return self.take(
+                    numpy.flatnonzero(
+                        numpy.array(selected_parents, dtype=bool)[self.parent_indices]
+                    )
+                )
+            column_counts = numpy.bincount(
+                self.parent_indices, minlength=len(self.parents)
+            ).tolist()
+        else:
+            column_counts = [0] * len(self.parents)
+            for parent_index in self.parent_indices:
+                column_counts[parent_index] += 1
+        indices: list[int] = []
+        for parent, selected, stop, count in zip(
+            self.parents,
+            selected_parents,
+            accumulate(column_counts),
+            column_counts,
+        ):
+            if not selected:
+                continue
+            if is_column_selected is None:
+                indices.extend(range(stop - count, stop))
+            else:
+                indices.extend(
+                    index
+                    for index, column in zip(range(stop - count, stop), parent.columns)
+                    if is_column_selected(column)
+                )
+        return self.take(indices)
+
+    def names_match(self, regex_pattern: str) -> Array:
+        """Whether the name of each column matches a regex pattern.
+
+        The pattern is searched for once per distinct name, and the results
+        are then mapped to every column.
+
+        Args:
+            regex_pattern: the regex pattern to search for in the column names.
+        """
+        pattern = re.compile(regex_pattern)
+        matches = [bool(pattern.search(name)) for name in self.distinct_names]
+        if self.uses_numpy:
+            return get_numpy().array(matches, dtype=bool)[self.name_codes]
+        return [matches[code] for code in self.name_codes]
+
+    def get_failing_unique_ids(self, passing: Array) -> list[str]:
+        """Unique IDs of the columns which do not pass a check.
+
+        Args:
+            passing: whether each column passes the check.
+
+        Returns:
+            list of the unique IDs of the failing columns, where the unique ID
+            of a column is the unique ID of its parent followed by its name.
+        """
+        if self.uses_numpy:
+            failing = get_numpy().flatnonzero(~passing)
+            parent_indices = self.parent_indices[failing].tolist()
+            name_codes = self.name_codes[failing].tolist()
+        else:
+            parent_indices = [
+                parent_index
+                for parent_index, passed in zip(self.parent_indices, passing)
+                if not passed
+            ]
+            name_codes = [
+                code for code, passed in zip(self.name_codes, passing) if not passed
+            ]
+        return [
+            f"{self.parents[parent_index].unique_id}.{self.distinct_names[code]}"
+            for parent_index, code in zip(parent_indices, name_codes)
+        ]
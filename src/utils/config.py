@@ -3,15 +3,12 @@
 import logging
 from argparse import Namespace
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable, Type
-
-import yaml
-from jsonschema import validate
+from typing import TYPE_CHECKING, Any, Iterable
 
 from checks.argparser import parse_cli_entrypoint_args
 
 if TYPE_CHECKING:
-    from utils.check_abc import Check
+    from checks.registry import CheckSpec
 
 CONFIG_YAML_SCHEMA = """
 type: object
@@ -58,6 +55,10 @@ def load_config(config_dir: Path) -> dict[str, Any]:
     file_path = config_dir / f".{PROJECT_NAME}.yaml"
     if not file_path.is_file():
         raise FileNotFoundError(f"{file_path} not found.")
+    # Imported here, as they are slow to import and only needed with a config file.
+    import yaml
+    from jsonschema import validate
+
     with open(file_path) as f:
         loader = yaml.SafeLoader
         config_data = yaml.load(f, Loader=loader)
@@ -68,7 +69,7 @@ def load_config(config_dir: Path) -> dict[str, Any]:
 def configure_checks(
     config_data: dict | None,
     cli_args: Namespace,
-    allowed_checks: Iterable[Type["Check"]],
+    allowed_checks: Iterable["CheckSpec"],
 ) -> list[Namespace]:
     """Configure checks using CLI arguments or the config file data, if found.
 
@@ -76,7 +77,8 @@ def configure_checks(
         config_data: Optional, configuration data from the config file.
             Defaults to None
         cli_args: CLI arguments from the main entrypoint command
-        allowed_checks: Collection of Check objects which can be selected from
+        allowed_checks: Collection of CheckSpec instances of the checks which can be
+            selected from
 
     Returns:
         list of check arguments to be run
@@ -0,0 +1,129 @@
+"""Thin client which runs checks in a `dbtra serve` daemon, when one is running.
+
+Only standard library modules are imported here, so that starting the client
+costs as little as possible. Without a daemon, the checks run in-process.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from utils.run_cache import RunCache, RunRecord
+
+SOCKET_PATH_ENV_VAR = "DBTRA_SOCKET"
+
+
+def get_socket_path(cwd: Path) -> Path:
+    """Path of the Unix socket of the daemon serving a working directory.
+
+    Args:
+        cwd: working directory of the daemon and its clients.
+
+    Returns:
+        the path set by the DBTRA_SOCKET environment variable, if any, otherwise
+        a path in the user's runtime directory, unique to the user and cwd.
+    """
+    configured_path = os.environ.get(SOCKET_PATH_ENV_VAR)
+    if configured_path:
+        return Path(configured_path)
+    user_id = getattr(os, "getuid", lambda: "")()
+    digest = hashlib.blake2b(f"{user_id}:{cwd}".encode(), digest_size=8).hexdigest()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(runtime_dir) / f"dbtra-{digest}.sock"
+
+
+def request_run(argv: list[str], cwd: Path, socket_path: Path) -> dict[str, Any] | None:
+    """Ask the daemon to run the checks selected by some CLI arguments.
+
+    Args:
+        argv: CLI arguments, as they would be passed to the dbtra command.
+        cwd: working directory the arguments are relative to.
+        socket_path: Path of the daemon's Unix socket.
+
+    Returns:
+        the daemon's response, with the run's exit code and output, or None if
+        no daemon owned by the current user could run the checks.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        if socket_path.stat().st_uid != os.getuid():
+            return None
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+            client.sendall(json.dumps({"argv": argv, "cwd": str(cwd)}).encode() + b"\n")
+            with client.makefile("rb") as response_file:
+                response = json.loads(response_file.readline())
+    except (OSError, ValueError):
+        return None
+    return response if "exit_code" in response else None
+
+
+def record_response(
+    response: dict[str, Any],
+    run_cache: RunCache,
+    entry_path: Path,
+    started_at_ns: int,
+) -> None:
+    """Record a run answered by the daemon in the run cache.
+
+    As with runs in-process, runs which did not get as far as running the
+    checks, or which read files modified just before they started, are not
+    recorded.
+
+    Args:
+        response: the daemon's response.
+        run_cache: RunCache to record the run in.
+        entry_path: Path of the run's cache entry.
+        started_at_ns: time the run was requested, in nanoseconds since the epoch.
+    """
+    dependencies = response.get("dependencies")
+    if dependencies is None:
+        return
+    record = RunRecord(
+        dependencies=dependencies,
+        exit_code=response["exit_code"],
+        output=response["stderr"],
+        stdout=response["stdout"],
+    )
+    if not record.is_racy(started_at_ns):
+        run_cache.save(entry_path, record)
+
+
+def main() -> None:
+    """Entrypoint for the client CLI.
+
+    Takes the same arguments as the dbtra command. Runs recorded in the run
+    cache are replayed before trying the daemon, and runs answered by the
+    daemon are recorded.
+
+    Raises:
+        SystemExit: with the overall status of all checks
+    """
+    argv = sys.argv[1:]
+    cwd = Path.cwd()
+    started_at_ns = time.time_ns()
+    run_cache = RunCache.from_environment()
+    if run_cache is not None:
+        entry_path = run_cache.get_entry_path(argv, cwd)
+        record = run_cache.load(entry_path)
+        if record is not None:
+            record.replay()
+    response = request_run(argv, cwd, get_socket_path(cwd))
+    if response is None:
+        # Only imported without a daemon, as importing the checks is slow.
+        from checks.entrypoint import entrypoint
+
+        entrypoint(argv)
+        return
+    if run_cache is not None:
+        record_response(response, run_cache, entry_path, started_at_ns)
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    raise SystemExit(response["exit_code"])
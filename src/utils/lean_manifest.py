@@ -0,0 +1,124 @@
+"""Memory-lean representation of the objects in a dbt manifest.
+
+The lean representation keeps only the fields of each object which the
+manifest objects and checks read, and interns strings which repeat across many
+objects, such as package names, materializations, tags and data types, so that
+a single copy of each is kept.
+"""
+
+import sys
+from typing import Any
+
+FULL_MANIFEST = "full"
+LEAN_MANIFEST = "lean"
+MANIFEST_REPRESENTATIONS: tuple[str, ...] = (FULL_MANIFEST, LEAN_MANIFEST)
+COMMON_FIELDS: tuple[str, ...] = (
+    "unique_id",
+    "name",
+    "resource_type",
+    "package_name",
+    "original_file_path",
+    "patch_path",
+    "description",
+    "meta",
+    "tags",
+    "config",
+)
+LEAN_FIELDS: dict[str, tuple[str, ...]] = {
+    "nodes": COMMON_FIELDS
+    + ("checksum", "columns", "constraints", "access", "test_metadata"),
+    "sources": COMMON_FIELDS + ("columns", "loader", "loaded_at_field", "freshness"),
+    "macros": COMMON_FIELDS + ("macro_sql", "arguments"),
+    "unit_tests": COMMON_FIELDS + ("original_filepath",),
+}
+LEAN_COLUMN_FIELDS: tuple[str, ...] = (
+    "name",
+    "description",
+    "data_type",
+    "constraints",
+)
+INTERNED_FIELDS = ("resource_type", "package_name", "patch_path", "access")
+INTERNED_CONFIG_FIELDS = ("materialized", "access", "on_schema_change")
+
+
+def intern_strings(values: list[Any]) -> list[Any]:
+    """Intern the strings of a list, such as a list of tags.
+
+    Args:
+        values: decoded JSON list.
+
+    Returns:
+        a new list, where each string is the interned copy.
+    """
+    return [sys.intern(value) if isinstance(value, str) else value for value in values]
+
+
+def intern_fields(data: dict[str, Any], fields: tuple[str, ...]) -> None:
+    """Intern the string values of some fields of a dictionary, in place.
+
+    Args:
+        data: decoded JSON object.
+        fields: names of the fields to intern.
+    """
+    for field in fields:
+        value = data.get(field)
+        if isinstance(value, str):
+            data[field] = sys.intern(value)
+
+
+def project_column(column_data: dict[str, Any]) -> dict[str, Any]:
+    """Lean copy of the data of a column.
+
+    Args:
+        column_data: data for the column from the manifest file.
+
+    Returns:
+        a dictionary with only the fields in LEAN_COLUMN_FIELDS.
+    """
+    projected = {
+        field: column_data[field]
+        for field in LEAN_COLUMN_FIELDS
+        if field in column_data
+    }
+    intern_fields(projected, ("data_type",))
+    return projected
+
+
+def project_object(section: str, object_data: dict[str, Any]) -> dict[str, Any]:
+    """Lean copy of the data of a node, source, macro or unit test.
+
+    Fields missing from the original data are not added, so that checks
+    distinguish missing and empty fields as they do on the full data. Fields
+    are kept in a fixed order, and the keys of the lean copies are shared.
+
+    Args:
+        section: top-level manifest section the object belongs to.
+        object_data: data for the object from the manifest file.
+
+    Returns:
+        a dictionary with only the fields in LEAN_FIELDS for the section.
+    """
+    projected = {
+        field: object_data[field]
+        for field in LEAN_FIELDS[section]
+        if field in object_data
+    }
+    intern_fields(projected, INTERNED_FIELDS)
+    if isinstance(projected.get("tags"), list):
+        projected["tags"] = intern_strings(projected["tags"])
+    config = projected.get("config")
+    if isinstance(config, dict):
+        config = {sys.intern(key): value for key, value in config.items()}
+        intern_fields(config, INTERNED_CONFIG_FIELDS)
+        if isinstance(config.get("tags"), list):
+            config["tags"] = intern_strings(config["tags"])
+        projected["config"] = config
+    if isinstance(projected.get("columns"), dict):
+        projected["columns"] = {
+            sys.intern(name): project_column(column_data)
+            for name, column_data in projected["columns"].items()
+        }
+    test_metadata = projected.get("test_metadata")
+    if test_metadata:
+        projected["test_metadata"] = {"name": test_metadata.get("name")}
+    return projected
@@ -0,0 +1,217 @@
+"""Integer-encoded lineage graph of a manifest, in compressed sparse row form."""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from functools import cached_property
+from itertools import compress
+from typing import TYPE_CHECKING, Iterable, Literal, Mapping
+
+if TYPE_CHECKING:
+    from mmap import mmap
+
+LINEAGE_GRAPH_MAGIC = b"DBTRALG" + sys.byteorder[0].encode()
+LINEAGE_GRAPH_HEADER = struct.Struct("=8sqqqq")
+IN_PARENT_MAP = 1
+IN_CHILD_MAP = 2
+
+
+class LineageGraph:
+    """Parents and children of every object, as integer compressed sparse rows.
+
+    Each unique ID is assigned a dense integer, its position in sorted order.
+    The relatives of the object at position i are the targets between offsets
+    i and i + 1. All arrays are held in one buffer, which can be written to a
+    file and mapped back into memory, so loading a graph builds no dictionary.
+
+    Attributes:
+        buffer: buffer holding the graph.
+        offsets: dictionary mapping each relation to the offsets of the
+            relatives of each object.
+        targets: dictionary mapping each relation to the positions of the
+            relatives of every object.
+        flags: whether each object is a key of the parent map and child map.
+        encoded_unique_ids: UTF-8 encoded unique IDs in sorted order, each
+            followed by a null byte.
+    """
+
+    def __init__(self, buffer: "bytes | mmap"):
+        """Initialise the instance from a buffer built by encode.
+
+        Args:
+            buffer: buffer holding the graph, such as a memory-mapped file.
+
+        Raises:
+            ValueError: If the buffer does not hold a graph of this version,
+                built on a machine with the same byte order.
+        """
+        self.buffer = buffer
+        view = memoryview(buffer)
+        if len(view) < LINEAGE_GRAPH_HEADER.size:
+            raise ValueError("Truncated lineage graph")
+        magic, node_count, parent_count, child_count, names_size = (
+            LINEAGE_GRAPH_HEADER.unpack_from(view)
+        )
+        if magic != LINEAGE_GRAPH_MAGIC:
+            raise ValueError("Unsupported lineage graph")
+        position = LINEAGE_GRAPH_HEADER.size
+        arrays = []
+        for size in (node_count + 1, parent_count, node_count + 1, child_count):
+            end = position + size * 8
+            arrays.append(view[position:end].cast("q"))
+            position = end
+        if len(view) != position + node_count + names_size:
+            raise ValueError("Truncated lineage graph")
+        self.offsets: dict[str, memoryview] = {
+            "parents": arrays[0],
+            "children": arrays[2],
+        }
+        self.targets: dict[str, memoryview] = {
+            "parents": arrays[1],
+            "children": arrays[3],
+        }
+        self.flags = view[position : position + node_count]
+        self.encoded_unique_ids = view[position + node_count :]
+
+    @classmethod
+    def from_maps(
+        cls,
+        parent_map: Mapping[str, list[str]],
+        child_map: Mapping[str, list[str]],
+    ) -> "LineageGraph":
+        """Build the graph of a manifest's parent map and child map.
+
+        Args:
+            parent_map: dictionary mapping unique IDs to lists of parent IDs.
+            child_map: dictionary mapping unique IDs to lists of child IDs.
+        """
+        return cls(cls.encode(parent_map, child_map))
+
+    @staticmethod
+    def encode(
+        parent_map: Mapping[str, list[str]],
+        child_map: Mapping[str, list[str]],
+    ) -> bytes:
+        """Encode a manifest's parent map and child map as a graph buffer.
+
+        Args:
+            parent_map: dictionary mapping unique IDs to lists of parent IDs.
+            child_map: dictionary mapping unique IDs to lists of child IDs.
+
+        Returns:
+            the buffer of the graph, which may be written to a file.
+        """
+        unique_ids = sorted(
+            {
+                unique_id
+                for relation_map in (parent_map, child_map)
+                for key, relatives in relation_map.items()
+                for unique_id in (key, *relatives)
+            }
+        )
+        positions = {unique_id: index for index, unique_id in enumerate(unique_ids)}
+        arrays: list[array[int]] = []
+        for relation_map in (parent_map, child_map):
+            offsets = array("q", [0])
+            targets = array("q")
+            for unique_id in unique_ids:
+                targets.extend(
+                    positions[relative] for relative in relation_map.get(unique_id, ())
+                )
+                offsets.append(len(targets))
+            arrays.extend((offsets, targets))
+        flags = bytes(
+            (IN_PARENT_MAP if unique_id in parent_map else 0)
+            | (IN_CHILD_MAP if unique_id in child_map else 0)
+            for unique_id in unique_ids
+        )
+        encoded_unique_ids = "".join(
+            f"{unique_id}\0" for unique_id in unique_ids
+        ).encode()
+        header = LINEAGE_GRAPH_HEADER.pack(
+            LINEAGE_GRAPH_MAGIC,
+            len(unique_ids),
+            len(arrays[1]),
+            len(arrays[3]),
+            len(encoded_unique_ids),
+        )
+        return b"".join(
+            [header, *(item.tobytes() for item in arrays), flags, encoded_unique_ids]
+        )
+
+    def __len__(self) -> int:
+        """Number of objects in the graph."""
+        return len(self.flags)
+
+    @cached_property
+    def unique_ids(self) -> list[str]:
+        """Unique IDs of the objects, in sorted order.
+
+        They are decoded together the first time an object is looked up.
+        """
+        return str(self.encoded_unique_ids, "utf-8").split("\0")[:-1]
+
+    def get_index(self, unique_id: str) -> int | None:
+        """Position of an object in the graph, found by binary search.
+
+        Args:
+            unique_id: unique ID of the object.
+
+        Returns:
+            the position of the object, or None if it is not in the graph.
+        """
+        unique_ids = self.unique_ids
+        index = bisect_left(unique_ids, unique_id)
+        if index < len(unique_ids) and unique_ids[index] == unique_id:
+            return index
+        return None
+
+    def has_relation_map_entry(
+        self, unique_id: str, relation: Literal["parents", "children"]
+    ) -> bool:
+        """Whether an object is a key of the parent map or child map.
+
+        Args:
+            unique_id: unique ID of the object.
+            relation: whether the parent map or child map is looked up.
+        """
+        index = self.get_index(unique_id)
+        flag = IN_PARENT_MAP if relation == "parents" else IN_CHILD_MAP
+        return index is not None and bool(self.flags[index] & flag)
+
+    def get_relatives_of_any(
+        self,
+        unique_ids: Iterable[str],
+        relation: Literal["parents", "children"],
+        include_indirect: bool,
+    ) -> frozenset[str]:
+        """Unique IDs of all relatives of any of these objects.
+
+        The traversal only handles integers, marking visited objects in a
+        bytearray, which is decoded into unique IDs once it is done.
+
+        Args:
+            unique_ids: Unique IDs of the objects.
+            relation: whether to find the parents or children of the objects.
+            include_indirect: Whether to include indirect relatives.
+
+        Returns:
+            a frozenset of unique IDs of all relatives of any of these objects.
+        """
+        offsets = self.offsets[relation]
+        targets = self.targets[relation]
+        visited = bytearray(len(self))
+        stack: list[int] = []
+        for index in map(self.get_index, unique_ids):
+            if index is not None:
+                stack.extend(targets[offsets[index] : offsets[index + 1]])
+        if not include_indirect:
+            for index in stack:
+                visited[index] = 1
+        while stack:
+            index = stack.pop()
+            if not visited[index]:
+                visited[index] = 1
+                stack.extend(targets[offsets[index] : offsets[index + 1]])
+        return frozenset(compress(self.unique_ids, visited))
@@ -0,0 +1,174 @@
+"""Differences between two versions of the same dbt manifest."""
+
+import hashlib
+import json
+from typing import Any, Iterable, Mapping
+
+from utils.lean_manifest import project_column, project_object
+
+DIFFED_SECTIONS: tuple[str, ...] = ("nodes", "sources", "macros", "unit_tests")
+LINEAGE_SECTIONS: tuple[str, ...] = ("parent_map", "child_map")
+TEST_RESOURCE_TYPES: frozenset[str] = frozenset({"test", "unit_test"})
+FINGERPRINTED_SECTIONS: tuple[str, ...] = DIFFED_SECTIONS + ("parent_map",)
+
+
+def get_changed_ids(old: Mapping[str, Any], new: Mapping[str, Any]) -> set[str]:
+    """Keys of the entries which are new, or differ between two mappings.
+
+    Args:
+        old: previous mapping.
+        new: current mapping.
+    """
+    return {key for key, value in new.items() if old.get(key) != value}
+
+
+def get_relatives(
+    unique_ids: Iterable[str], relation_map: Mapping[str, list[str]]
+) -> set[str]:
+    """Unique IDs of the direct and indirect relatives of some objects.
+
+    Args:
+        unique_ids: unique IDs of the objects.
+        relation_map: parent_map or child_map of the manifest.
+    """
+    relatives: set[str] = set()
+    pending = list(unique_ids)
+    while pending:
+        for relative_id in relation_map.get(pending.pop(), []):
+            if relative_id not in relatives:
+                relatives.add(relative_id)
+                pending.append(relative_id)
+    return relatives
+
+
+def get_modified_unique_ids(
+    old_data: Mapping[str, Any],
+    new_data: Mapping[str, Any],
+    include_indirect_parents: bool = False,
+    include_indirect_children: bool = False,
+) -> set[str]:
+    """Unique IDs of the objects whose checks may give a different result.
+
+    An object is modified if it is new, if its own data changed, if its direct
+    parents or children changed, or if one of the tests or unit tests of the
+    object changed. Objects which were removed are not included.
+
+    Args:
+        old_data: data from the previous version of the manifest.json file.
+        new_data: data from the current version of the manifest.json file.
+        include_indirect_parents: whether objects whose indirect parents may
+            have changed are also modified. Optional, defaults to False.
+        include_indirect_children: whether objects whose indirect children may
+            have changed are also modified. Optional, defaults to False.
+
+    Returns:
+        set of unique IDs of the objects in the current version.
+    """
+    modified: set[str] = set()
+    for section in DIFFED_SECTIONS:
+        old_objects = old_data.get(section) or {}
+        new_objects = new_data.get(section) or {}
+        for unique_id in get_changed_ids(old_objects, new_objects):
+            modified.add(unique_id)
+            if new_objects[unique_id].get("resource_type") in TEST_RESOURCE_TYPES:
+                modified.update(new_data.get("parent_map", {}).get(unique_id, []))
+    lineage_changes: dict[str, set[str]] = {
+        section: get_changed_ids(
+            old_data.get(section) or {}, new_data.get(section) or {}
+        )
+        for section in LINEAGE_SECTIONS
+    }
+    for changed_ids in lineage_changes.values():
+        modified.update(changed_ids)
+    if include_indirect_parents:
+        modified.update(
+            get_relatives(lineage_changes["parent_map"], new_data.get("child_map", {}))
+        )
+    if include_indirect_children:
+        modified.update(
+            get_relatives(lineage_changes["child_map"], new_data.get("parent_map", {}))
+        )
+    all_objects = {
+        unique_id
+        for section in DIFFED_SECTIONS
+        for unique_id in new_data.get(section) or {}
+    }
+    return modified & all_objects
+
+
+def get_fingerprint(data: Any) -> str:
+    """Digest of some JSON data, such as the fields of a manifest object.
+
+    Args:
+        data: data to digest.
+
+    Returns:
+        a hexadecimal digest, equal for equal data.
+    """
+    encoded = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def get_fingerprints(data: Mapping[str, Any]) -> dict[str, str]:
+    """Fingerprints of the objects and columns in a manifest.
+
+    Each object is fingerprinted by its memory-lean representation, which keeps
+    the fields that manifest objects and checks read. The fingerprint of an
+    object also covers those of its data tests and unit tests, so adding,
+    changing or removing a test modifies the objects it tests.
+
+    Args:
+        data: data from the manifest.json file, with the sections in
+            FINGERPRINTED_SECTIONS.
+
+    Returns:
+        dictionary mapping unique IDs to fingerprints, where the unique ID of a
+        column is the unique ID of its parent followed by the column name.
+    """
+    fingerprints: dict[str, str] = {}
+    test_ids: list[str] = []
+    for section in DIFFED_SECTIONS:
+        for unique_id, object_data in (data.get(section) or {}).items():
+            fingerprints[unique_id] = get_fingerprint(
+                project_object(section, object_data)
+            )
+            for name, column_data in (object_data.get("columns") or {}).items():
+                fingerprints[f"{unique_id}.{name}"] = get_fingerprint(
+                    project_column(column_data)
+                )
+            if section == "unit_tests" or (
+                object_data.get("resource_type") in TEST_RESOURCE_TYPES
+            ):
+                test_ids.append(unique_id)
+    test_fingerprints: dict[str, list[str]] = {}
+    parent_map = data.get("parent_map") or {}
+    for test_id in test_ids:
+        for parent_id in parent_map.get(test_id, []):
+            test_fingerprints.setdefault(parent_id, []).append(fingerprints[test_id])
+    for unique_id, fingerprints_of_tests in test_fingerprints.items():
+        if unique_id in fingerprints:
+            fingerprints[unique_id] = get_fingerprint(
+                [fingerprints[unique_id], sorted(fingerprints_of_tests)]
+            )
+    return fingerprints
+
+
+def get_state_modified_unique_ids(
+    baseline_fingerprints: Mapping[str, str], data: Mapping[str, Any]
+) -> set[str]:
+    """Unique IDs of the objects and columns which are new or modified.
+
+    Args:
+        baseline_fingerprints: fingerprints of the baseline manifest, as returned
+            by get_fingerprints.
+        data: data from the current manifest.json file.
+
+    Returns:
+        set of unique IDs of the objects and columns whose fingerprint differs
+        from the baseline, or which are not in the baseline.
+    """
+    return {
+        unique_id
+        for unique_id, fingerprint in get_fingerprints(data).items()
+        if baseline_fingerprints.get(unique_id) != fingerprint
+    }
@@ -3,21 +3,32 @@
 from abc import ABC, abstractmethod
 from argparse import Namespace
 from dataclasses import InitVar, dataclass, field
+from functools import cached_property, partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Collection, Optional
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Literal,
+    Optional,
+    cast,
+)
 
 from utils.console_formatting import ConsoleEmphasis, colour_message
-from utils.get_relatives import (
-    get_all_children,
-    get_all_parents,
-    get_direct_children,
-    get_direct_parents,
-)
+from utils.get_relatives import get_direct_children, get_direct_parents
+from utils.manifest_object.manifest_object import ManifestColumn
 
 if TYPE_CHECKING:
     from utils.artifact_data import Manifest
     from utils.manifest_object.manifest_object import ManifestObject
 
+STATE_MODIFIED = "modified"
+STATE_MODIFIED_AND_DESCENDANTS = "modified+"
+STATE_SELECTORS: tuple[str, ...] = (STATE_MODIFIED, STATE_MODIFIED_AND_DESCENDANTS)
+
 
 @dataclass(eq=True)
 class ManifestFilterMethod(ABC):
@@ -26,11 +37,16 @@ class ManifestFilterMethod(ABC):
     Attributes:
         include_values: set of values which indicate an object should be included.
         exclude_values: set of values which indicate an object should be excluded.
+        cost: relative cost of applying this filter method to one object.
+        applies_to_columns: whether columns are filtered by their own attributes,
+            rather than those of their parent.
     """
 
     args: InitVar[Namespace | None] = None
     include_values: set[Any] | None = None
     exclude_values: set[Any] | None = None
+    cost: ClassVar[int] = 0
+    applies_to_columns: ClassVar[bool] = False
 
     def __post_init__(
         self,
@@ -61,7 +77,7 @@ class ManifestFilterMethod(ABC):
         self,
         manifest_object: "ManifestObject",
         manifest: Optional["Manifest"] = None,
-    ) -> bool:
+    ) -> Optional[bool]:
         """Whether the object is in scope for the current check.
 
         Args:
@@ -69,10 +85,9 @@ class ManifestFilterMethod(ABC):
             manifest: Manifest instance
 
         Returns:
-            True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
+            True if the object is in scope, False if it is not, or None if this
+            filter method does not apply to the object, which is then not
+            filtered by it.
         """
         ...
 
@@ -103,6 +118,33 @@ class ManifestFilterMethod(ABC):
             return set(values)
         raise TypeError(f"{values} is not a Collection")
 
+    @property
+    def is_active(self) -> bool:
+        """Whether this filter method can put any objects out of scope."""
+        return self.include_values is not None or bool(self.exclude_values)
+
+    def applies_to(self, object_type: type["ManifestObject"]) -> bool:
+        """Whether this filter method can be applied to objects of a type.
+
+        Objects of other types are filtered by their parent, if they have one.
+
+        Args:
+            object_type: subclass of ManifestObject.
+
+        Returns:
+            True if the filter method can be applied to objects of this type.
+        """
+        return self.applies_to_columns or not issubclass(object_type, ManifestColumn)
+
+    @cached_property
+    def signature(self) -> tuple[str, frozenset | None, frozenset | None]:
+        """Hashable representation of this filter method and its values."""
+        return (
+            self.arg_name_suffix,
+            frozenset(self.include_values) if self.include_values is not None else None,
+            frozenset(self.exclude_values) if self.exclude_values is not None else None,
+        )
+
     @property
     def includes_summary(self) -> str:
         """String summary of included values."""
@@ -133,6 +175,19 @@ class MaterializationFilterMethod(ManifestFilterMethod):
     include_values: set[str] | None = None
     exclude_values: set[str] | None = None
 
+    cost = 1
+
+    def applies_to(self, object_type: type["ManifestObject"]) -> bool:
+        """Whether this filter method can be applied to objects of a type.
+
+        Args:
+            object_type: subclass of ManifestObject.
+
+        Returns:
+            True if objects of this type have a materialization.
+        """
+        return hasattr(object_type, "materialized") and super().applies_to(object_type)
+
     @property
     def arg_name_suffix(self) -> str:
         """Suffix of this filter method's CLI argument names."""
@@ -140,7 +195,7 @@ class MaterializationFilterMethod(ManifestFilterMethod):
 
     def is_manifest_object_in_scope(
         self, manifest_object: "ManifestObject", manifest: Optional["Manifest"] = None
-    ) -> bool:
+    ) -> Optional[bool]:
         """Whether the object is in scope for the current check.
 
         Args:
@@ -148,16 +203,12 @@ class MaterializationFilterMethod(ManifestFilterMethod):
             manifest: Manifest instance
 
         Returns:
-            True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
+            True if the object is in scope, False if it is not, or None if this
+            filter method does not apply to the object.
         """
         materialized = getattr(manifest_object, "materialized", None)
         if materialized is None:
-            raise NotImplementedError(
-                f"{manifest_object} cannot be filtered by materialization."
-            )
+            return None
         excluded = (
             self.exclude_values is not None and materialized in self.exclude_values
         )
@@ -176,6 +227,19 @@ class TagFilterMethod(ManifestFilterMethod):
     include_values: set[str] | None = None
     exclude_values: set[str] | None = None
 
+    cost = 2
+
+    def applies_to(self, object_type: type["ManifestObject"]) -> bool:
+        """Whether this filter method can be applied to objects of a type.
+
+        Args:
+            object_type: subclass of ManifestObject.
+
+        Returns:
+            True if objects of this type have tags.
+        """
+        return hasattr(object_type, "tags") and super().applies_to(object_type)
+
     @property
     def arg_name_suffix(self) -> str:
         """Suffix of this filter method's CLI argument names."""
@@ -183,7 +247,7 @@ class TagFilterMethod(ManifestFilterMethod):
 
     def is_manifest_object_in_scope(
         self, manifest_object: "ManifestObject", manifest: Optional["Manifest"] = None
-    ) -> bool:
+    ) -> Optional[bool]:
         """Whether the object is in scope for the current check.
 
         Args:
@@ -191,14 +255,12 @@ class TagFilterMethod(ManifestFilterMethod):
             manifest: Manifest instance.
 
         Returns:
-            True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
+            True if the object is in scope, False if it is not, or None if this
+            filter method does not apply to the object.
         """
         tags = getattr(manifest_object, "tags", None)
         if tags is None:
-            raise NotImplementedError(f"{manifest_object} cannot be filtered by tags.")
+            return None
         excluded = self.exclude_values is not None and bool(
             tags.intersection(self.exclude_values)
         )
@@ -219,6 +281,9 @@ class NamePatternFilterMethod(ManifestFilterMethod):
     include_values: set[str] | None = None
     exclude_values: set[str] | None = None
 
+    cost = 3
+    applies_to_columns = True
+
     @property
     def arg_name_suffix(self) -> str:
         """Suffix of this filter method's CLI argument names."""
@@ -235,9 +300,6 @@ class NamePatternFilterMethod(ManifestFilterMethod):
 
         Returns:
             True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
         """
         excluded = self.exclude_values is not None and any(
             manifest_object.name_matches_regex(pattern)
@@ -261,6 +323,9 @@ class UniqueIdFilterMethod(ManifestFilterMethod):
     include_values: set[str] | None = None
     exclude_values: set[str] | None = None
 
+    cost = 0
+    applies_to_columns = True
+
     @property
     def arg_name_suffix(self) -> str:
         """Suffix of this filter method's CLI argument names."""
@@ -277,9 +342,6 @@ class UniqueIdFilterMethod(ManifestFilterMethod):
 
         Returns:
             True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
         """
         excluded = self.exclude_values is not None and (
             manifest_object.unique_id in self.exclude_values
@@ -290,21 +352,24 @@ class UniqueIdFilterMethod(ManifestFilterMethod):
         return included and not excluded
 
 
-class PackageFilterMethod(ManifestFilterMethod):
-    """Method for filtering by package name.
+class ModifiedObjectFilterMethod(ManifestFilterMethod):
+    """Method for filtering by the objects modified since the last watched run.
+
+    It has no CLI argument: watch mode sets the unique IDs of the objects to
+    re-check, and columns are filtered by their parent.
 
     Attributes:
-        include_values: set of package names to include.
-        exclude_values: set of package names to exclude.
+        include_values: set of unique IDs of the modified objects to include.
     """
 
     include_values: set[str] | None = None
-    exclude_values: set[str] | None = None
+
+    cost = 0
 
     @property
     def arg_name_suffix(self) -> str:
-        """Suffix of this filter method's CLI argument names."""
-        return "packages"
+        """Suffix of this filter method's internal argument names."""
+        return "modified_unique_ids"
 
     def is_manifest_object_in_scope(
         self, manifest_object: "ManifestObject", manifest: Optional["Manifest"] = None
@@ -317,38 +382,61 @@ class PackageFilterMethod(ManifestFilterMethod):
 
         Returns:
             True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
         """
-        if manifest_object.package_name is None:
-            raise NotImplementedError()
-        excluded = (
-            self.exclude_values is not None
-            and manifest_object.package_name in self.exclude_values
+        return self.include_values is None or (
+            manifest_object.unique_id in self.include_values
         )
-        included = (
-            self.include_values is None
-            or manifest_object.package_name in self.include_values
+
+    @property
+    def includes_summary(self) -> str:
+        """String summary of included values."""
+        return (
+            f"modified since the last run: {len(self.include_values)} objects"
+            if self.include_values is not None
+            else ""
         )
-        return included and not excluded
 
 
-class ResourceTypeFilterMethod(ManifestFilterMethod):
-    """Method for filtering by resource type.
+class StateFilterMethod(ManifestFilterMethod):
+    """Method for filtering by modifications relative to a baseline manifest.
+
+    Objects and columns are compared with the baseline by fingerprints of the
+    fields which checks depend on, so only new or modified ones are included.
 
     Attributes:
-        include_values: set of resource types to include.
-        exclude_values: set of resource types to exclude.
+        include_values: set holding the directory of the baseline manifest.json
+            file and whether the descendants of modified objects are included.
     """
 
-    include_values: set[str] | None = None
-    exclude_values: set[str] | None = None
+    include_values: set[tuple[Path, bool]] | None = None
+
+    cost = 1
+    applies_to_columns = True
 
     @property
     def arg_name_suffix(self) -> str:
         """Suffix of this filter method's CLI argument names."""
-        return "resource_types"
+        return "state"
+
+    def get_values_from_args(
+        self,
+        args: Namespace | None,
+        prefix: str,
+    ) -> set[Any] | None:
+        """Parse the baseline directory and state selector from CLI args.
+
+        Args:
+            args: CLI args Namespace instance.
+            prefix: prefix of the argument name.
+
+        Returns:
+            A set of included values or None.
+        """
+        state_dir = getattr(args, "state", None)
+        if prefix != "include" or state_dir is None:
+            return None
+        selector = getattr(args, "state_selector", None) or STATE_MODIFIED
+        return {(Path(state_dir), selector == STATE_MODIFIED_AND_DESCENDANTS)}
 
     def is_manifest_object_in_scope(
         self, manifest_object: "ManifestObject", manifest: Optional["Manifest"] = None
@@ -363,40 +451,49 @@ class ResourceTypeFilterMethod(ManifestFilterMethod):
             True if the object is in scope, False otherwise.
 
         Raises:
-            NotImplementedError: if the object does not support this filter method.
+            ValueError: if manifest is None.
         """
-        if manifest_object.resource_type is None:
-            raise NotImplementedError()
-        excluded = (
-            self.exclude_values is not None
-            and manifest_object.resource_type in self.exclude_values
+        if manifest is None:
+            raise ValueError("manifest cannot be None")
+        return all(
+            manifest_object.unique_id
+            in manifest.get_state_modified(
+                state_dir, include_descendants=include_descendants
+            )
+            for state_dir, include_descendants in self.include_values or ()
         )
-        included = (
-            self.include_values is None
-            or manifest_object.resource_type in self.include_values
+
+    @property
+    def includes_summary(self) -> str:
+        """String summary of included values."""
+        return "".join(
+            f"modified{' and descendants' if include_descendants else ''} "
+            f"relative to: {state_dir.as_posix()}"
+            for state_dir, include_descendants in sorted(self.include_values or ())
         )
-        return included and not excluded
 
 
-class DirectParentsFilterMethod(ManifestFilterMethod):
-    """Method for filtering by direct parents.
+class PackageFilterMethod(ManifestFilterMethod):
+    """Method for filtering by package name.
 
     Attributes:
-        include_values: set of direct parents to include.
-        exclude_values: set of direct parents to exclude.
+        include_values: set of package names to include.
+        exclude_values: set of package names to exclude.
     """
 
     include_values: set[str] | None = None
     exclude_values: set[str] | None = None
 
+    cost = 1
+
     @property
     def arg_name_suffix(self) -> str:
         """Suffix of this filter method's CLI argument names."""
-        return "direct_parents"
+        return "packages"
 
     def is_manifest_object_in_scope(
         self, manifest_object: "ManifestObject", manifest: Optional["Manifest"] = None
-    ) -> bool:
+    ) -> Optional[bool]:
         """Whether the object is in scope for the current check.
 
         Args:
@@ -404,50 +501,43 @@ class DirectParentsFilterMethod(ManifestFilterMethod):
             manifest: Manifest instance.
 
         Returns:
-            True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
-            ValueError: if manifest is None.
+            True if the object is in scope, False if it is not, or None if this
+            filter method does not apply to the object.
         """
-        if manifest is None:
-            raise ValueError("manifest cannot be None")
-        if manifest.parent_map.get(manifest_object.unique_id) is None:
-            raise NotImplementedError()
-        excluded = self.exclude_values is not None and bool(
-            get_direct_parents(
-                manifest_object.unique_id, manifest=manifest
-            ).intersection(self.exclude_values)
+        if manifest_object.package_name is None:
+            return None
+        excluded = (
+            self.exclude_values is not None
+            and manifest_object.package_name in self.exclude_values
         )
-        included = self.include_values is None or (
-            bool(
-                get_direct_parents(
-                    manifest_object.unique_id, manifest=manifest
-                ).intersection(self.include_values)
-            )
+        included = (
+            self.include_values is None
+            or manifest_object.package_name in self.include_values
         )
         return included and not excluded
 
 
-class IndirectParentsFilterMethod(ManifestFilterMethod):
-    """Method for filtering by indirect parents.
+class ResourceTypeFilterMethod(ManifestFilterMethod):
+    """Method for filtering by resource type.
 
     Attributes:
-        include_values: set of indirect parents to include.
-        exclude_values: set of indirect parents to exclude.
+        include_values: set of resource types to include.
+        exclude_values: set of resource types to exclude.
     """
 
     include_values: set[str] | None = None
     exclude_values: set[str] | None = None
 
+    cost = 1
+
     @property
     def arg_name_suffix(self) -> str:
         """Suffix of this filter method's CLI argument names."""
-        return "indirect_parents"
+        return "resource_types"
 
     def is_manifest_object_in_scope(
         self, manifest_object: "ManifestObject", manifest: Optional["Manifest"] = None
-    ) -> bool:
+    ) -> Optional[bool]:
         """Whether the object is in scope for the current check.
 
         Args:
@@ -455,54 +545,48 @@ class IndirectParentsFilterMethod(ManifestFilterMethod):
             manifest: Manifest instance.
 
         Returns:
-            True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
-            ValueError: if manifest is None.
+            True if the object is in scope, False if it is not, or None if this
+            filter method does not apply to the object.
         """
-        if manifest is None:
-            raise ValueError("manifest cannot be None")
-        if manifest.parent_map.get(manifest_object.unique_id) is None:
-            raise NotImplementedError()
-        excluded = self.exclude_values is not None and bool(
-            get_all_parents(
-                manifest_object.unique_id,
-                manifest=manifest,
-                include_indirect=True,
-            ).intersection(self.exclude_values)
+        if manifest_object.resource_type is None:
+            return None
+        excluded = (
+            self.exclude_values is not None
+            and manifest_object.resource_type in self.exclude_values
         )
-        included = self.include_values is None or (
-            bool(
-                get_all_parents(
-                    manifest_object.unique_id,
-                    manifest=manifest,
-                    include_indirect=True,
-                ).intersection(self.include_values)
-            )
+        included = (
+            self.include_values is None
+            or manifest_object.resource_type in self.include_values
         )
         return included and not excluded
 
 
-class DirectChildrenFilterMethod(ManifestFilterMethod):
-    """Method for filtering by direct children.
+class LineageFilterMethod(ManifestFilterMethod, ABC):
+    """Abstract base class for methods for filtering by parents or children.
+
+    When there are no more include/exclude values than candidate objects, the
+    values are expanded once per manifest into the set of objects they are
+    related to, and each object is filtered by a membership test. Otherwise,
+    each object is tested against the values: indirect relatives with the
+    manifest's reachability index, or by traversing the object's lineage when
+    the manifest is restricted to a few files, and direct relatives by looking
+    them up.
 
     Attributes:
-        include_values: set of direct children to include.
-        exclude_values: set of direct children to exclude.
+        include_values: set of related unique IDs to include.
+        exclude_values: set of related unique IDs to exclude.
+        relation: which relatives of each object are compared with the values.
+        include_indirect: whether indirect relatives are compared with the values.
     """
 
     include_values: set[str] | None = None
     exclude_values: set[str] | None = None
-
-    @property
-    def arg_name_suffix(self) -> str:
-        """Suffix of this filter method's CLI argument names."""
-        return "direct_children"
+    relation: ClassVar[Literal["parents", "children"]]
+    include_indirect: ClassVar[bool]
 
     def is_manifest_object_in_scope(
         self, manifest_object: "ManifestObject", manifest: Optional["Manifest"] = None
-    ) -> bool:
+    ) -> Optional[bool]:
         """Whether the object is in scope for the current check.
 
         Args:
@@ -510,84 +594,172 @@ class DirectChildrenFilterMethod(ManifestFilterMethod):
             manifest: Manifest instance.
 
         Returns:
-            True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
+            True if the object is in scope, False if it is not, or None if this
+            filter method does not apply to the object.
             ValueError: if manifest is None.
         """
         if manifest is None:
             raise ValueError("manifest cannot be None")
-        if manifest.child_map.get(manifest_object.unique_id) is None:
-            raise NotImplementedError()
-        excluded = self.exclude_values is not None and bool(
-            get_direct_children(
-                manifest_object.unique_id, manifest=manifest
-            ).intersection(self.exclude_values)
-        )
-        included = self.include_values is None or (
-            bool(
-                get_direct_children(
-                    manifest_object.unique_id, manifest=manifest
-                ).intersection(self.include_values)
+        if not manifest.lineage.has_relation_map_entry(
+            manifest_object.unique_id, self.relation
+        ):
+            return None
+        _, include_values, exclude_values = self.signature
+        if include_values is None and exclude_values is None:
+            return True
+        value_count = len(include_values or ()) + len(exclude_values or ())
+        if value_count <= manifest.candidate_count:
+            excluded = exclude_values is not None and (
+                manifest_object.unique_id
+                in self.get_expanded_values(exclude_values, manifest)
             )
-        )
+            included = include_values is None or (
+                manifest_object.unique_id
+                in self.get_expanded_values(include_values, manifest)
+            )
+        else:
+            has_relative_in = self.get_relative_test(
+                manifest_object.unique_id, manifest
+            )
+            excluded = exclude_values is not None and has_relative_in(exclude_values)
+            included = include_values is None or has_relative_in(include_values)
         return included and not excluded
 
+    def get_relative_test(
+        self, unique_id: str, manifest: "Manifest"
+    ) -> Callable[[frozenset[str]], bool]:
+        """Function testing whether any of some values is a relative of an object.
 
-class IndirectChildrenFilterMethod(ManifestFilterMethod):
-    """Method for filtering by indirect children.
+        Indirect relatives are tested with a bit test, or a pruned search, in the
+        manifest's reachability index, unless the manifest does not index its
+        lineage. Otherwise, the relatives are looked up or traversed once, and
+        compared with each set of values.
+
+        Args:
+            unique_id: unique ID of the object.
+            manifest: Manifest instance.
+
+        Returns:
+            a function taking a frozenset of unique IDs, and returning whether
+            any of them is a relative of the object.
+        """
+        relatives: AbstractSet[str]
+        if not self.include_indirect:
+            relatives = self.get_relatives(unique_id, manifest)
+        elif manifest.indexes_lineage:
+            return partial(
+                manifest.get_reachability_index(self.relation).has_relative_in,
+                unique_id,
+            )
+        else:
+            relatives = manifest.get_relatives_of_any(
+                frozenset({unique_id}), relation=self.relation, include_indirect=True
+            )
+        return lambda values: not relatives.isdisjoint(values)
+
+    def get_expanded_values(
+        self, values: frozenset[str], manifest: "Manifest"
+    ) -> frozenset[str]:
+        """Expand values into the set of objects which have them as relatives.
+
+        Args:
+            values: frozenset of unique IDs to expand.
+            manifest: Manifest instance.
+
+        Returns:
+            frozenset of unique IDs of all objects related to any of the values.
+        """
+        return manifest.get_relatives_of_any(
+            values,
+            relation="children" if self.relation == "parents" else "parents",
+            include_indirect=self.include_indirect,
+        )
+
+    def get_relatives(self, unique_id: str, manifest: "Manifest") -> set[str]:
+        """Unique IDs of the direct relatives of an object.
+
+        Args:
+            unique_id: unique ID of the object.
+            manifest: Manifest instance.
+
+        Returns:
+            set of unique IDs of the object's direct parents or children.
+        """
+        if self.relation == "parents":
+            return get_direct_parents(unique_id, manifest=manifest)
+        return get_direct_children(unique_id, manifest=manifest)
+
+
+class DirectParentsFilterMethod(LineageFilterMethod):
+    """Method for filtering by direct parents.
 
     Attributes:
-        include_values: set of indirect children to include.
-        exclude_values: set of indirect children to exclude.
+        include_values: set of direct parents to include.
+        exclude_values: set of direct parents to exclude.
     """
 
-    include_values: set[str] | None = None
-    exclude_values: set[str] | None = None
+    relation = "parents"
+    include_indirect = False
+    cost = 4
 
     @property
     def arg_name_suffix(self) -> str:
         """Suffix of this filter method's CLI argument names."""
-        return "indirect_children"
+        return "direct_parents"
 
-    def is_manifest_object_in_scope(
-        self, manifest_object: "ManifestObject", manifest: Optional["Manifest"] = None
-    ) -> bool:
-        """Whether the object is in scope for the current check.
 
-        Args:
-            manifest_object: ManifestObject instance.
-            manifest: Manifest instance.
+class IndirectParentsFilterMethod(LineageFilterMethod):
+    """Method for filtering by indirect parents.
 
-        Returns:
-            True if the object is in scope, False otherwise.
+    Attributes:
+        include_values: set of indirect parents to include.
+        exclude_values: set of indirect parents to exclude.
+    """
+
+    relation = "parents"
+    include_indirect = True
+    cost = 5
+
+    @property
+    def arg_name_suffix(self) -> str:
+        """Suffix of this filter method's CLI argument names."""
+        return "indirect_parents"
 
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
-            ValueError: if manifest is None.
-        """
-        if manifest is None:
-            raise ValueError("manifest cannot be None")
-        if manifest.child_map.get(manifest_object.unique_id) is None:
-            raise NotImplementedError()
-        excluded = self.exclude_values is not None and bool(
-            get_all_children(
-                manifest_object.unique_id,
-                manifest=manifest,
-                include_indirect=True,
-            ).intersection(self.exclude_values)
-        )
-        included = self.include_values is None or (
-            bool(
-                get_all_children(
-                    manifest_object.unique_id,
-                    manifest=manifest,
-                    include_indirect=True,
-                ).intersection(self.include_values)
-            )
-        )
-        return included and not excluded
+
+class DirectChildrenFilterMethod(LineageFilterMethod):
+    """Method for filtering by direct children.
+
+    Attributes:
+        include_values: set of direct children to include.
+        exclude_values: set of direct children to exclude.
+    """
+
+    relation = "children"
+    include_indirect = False
+    cost = 4
+
+    @property
+    def arg_name_suffix(self) -> str:
+        """Suffix of this filter method's CLI argument names."""
+        return "direct_children"
+
+
+class IndirectChildrenFilterMethod(LineageFilterMethod):
+    """Method for filtering by indirect children.
+
+    Attributes:
+        include_values: set of indirect children to include.
+        exclude_values: set of indirect children to exclude.
+    """
+
+    relation = "children"
+    include_indirect = True
+    cost = 5
+
+    @property
+    def arg_name_suffix(self) -> str:
+        """Suffix of this filter method's CLI argument names."""
+        return "indirect_children"
 
 
 class PathFilterMethod(ManifestFilterMethod):
@@ -601,6 +773,8 @@ class PathFilterMethod(ManifestFilterMethod):
     include_values: set[Path] | None = None
     exclude_values: set[Path] | None = None
 
+    cost = 3
+
     @property
     def arg_name_suffix(self) -> str:
         """Suffix of this filter method's CLI argument names."""
@@ -608,7 +782,7 @@ class PathFilterMethod(ManifestFilterMethod):
 
     def is_manifest_object_in_scope(
         self, manifest_object: "ManifestObject", manifest: Optional["Manifest"] = None
-    ) -> bool:
+    ) -> Optional[bool]:
         """Whether the object is in scope for the current check.
 
         Args:
@@ -616,13 +790,11 @@ class PathFilterMethod(ManifestFilterMethod):
             manifest: Manifest instance.
 
         Returns:
-            True if the object is in scope, False otherwise.
-
-        Raises:
-            NotImplementedError: if the object does not support this filter method.
+            True if the object is in scope, False if it is not, or None if this
+            filter method does not apply to the object.
         """
         if not manifest_object.data.get("original_file_path"):
-            raise NotImplementedError()
+            return None
         excluded = self.exclude_values is not None and any(
             Path(manifest_object.data["original_file_path"]).is_relative_to(path)
             for path in self.exclude_values
@@ -652,46 +824,27 @@ class PathFilterMethod(ManifestFilterMethod):
         )
 
 
-def try_filter_method(
-    filter_method: ManifestFilterMethod,
-    manifest_object: "ManifestObject",
-    manifest: Optional["Manifest"],
-) -> bool:
-    """Try applying a filter method on a manifest object.
-
-    If the object does not implement this method, try applying
-    the method to its parent instead.
-
-    Args:
-        filter_method: FilterMethod instance.
-        manifest_object: ManifestObject instance.
-        manifest: Manifest instance.
-
-    Returns:
-        True if the filter method passes.
-    """
-    try:
-        return filter_method.is_manifest_object_in_scope(manifest_object, manifest)
-    except NotImplementedError:
-        if getattr(manifest_object, "parent", False):
-            return try_filter_method(
-                filter_method,
-                getattr(manifest_object, "parent"),
-                manifest,
-            )
-        return True
-
-
 @dataclass(eq=True, frozen=True)
 class ManifestFilterConditions:
     """Conditions to filter manifest objects by.
 
+    On creation, the filter methods are compiled into a plan: filter methods
+    without any include/exclude values are dropped, and the rest are ordered
+    from cheapest to most expensive so that objects are ruled out as early as
+    possible. Which filter methods apply to each type of object is resolved
+    once per type.
+
     Attributes:
         filter_methods: tuple of ManifestObjectFilter instances
+        plan: tuple of active ManifestObjectFilter instances, cheapest first
     """
 
     args: InitVar[Namespace | None] = None
     filter_methods: tuple[ManifestFilterMethod, ...] = field(init=False)
+    plan: tuple[ManifestFilterMethod, ...] = field(init=False, compare=False)
+    _type_plans: dict[type, dict[int, bool]] = field(
+        init=False, compare=False, repr=False, default_factory=dict
+    )
 
     def __post_init__(self, args: Namespace | None) -> None:
         """Initialize the instance.
@@ -714,8 +867,50 @@ class ManifestFilterConditions:
                 DirectChildrenFilterMethod(args),
                 IndirectChildrenFilterMethod(args),
                 UniqueIdFilterMethod(args),
+                ModifiedObjectFilterMethod(args),
+                StateFilterMethod(args),
             ),
         )
+        object.__setattr__(
+            self,
+            "plan",
+            tuple(
+                sorted(
+                    (
+                        filter_method
+                        for filter_method in self.filter_methods
+                        if filter_method.is_active
+                    ),
+                    key=lambda filter_method: filter_method.cost,
+                )
+            ),
+        )
+
+    def get_type_plan(self, object_type: type["ManifestObject"]) -> dict[int, bool]:
+        """Get the plan steps which apply to objects of a type.
+
+        Args:
+            object_type: subclass of ManifestObject.
+
+        Returns:
+            dictionary mapping positions in the plan to whether the filter method
+            is applied to the object's parent instead of the object itself.
+        """
+        type_plan = self._type_plans.get(object_type)
+        if type_plan is None:
+            type_plan = {}
+            for position, filter_method in enumerate(self.plan):
+                if filter_method.applies_to(object_type):
+                    type_plan[position] = False
+                elif issubclass(object_type, ManifestColumn):
+                    type_plan[position] = True
+            self._type_plans[object_type] = type_plan
+        return type_plan
+
+    @property
+    def filters_columns(self) -> bool:
+        """Whether any active filter method applies to columns themselves."""
+        return not all(self.get_type_plan(ManifestColumn).values())
 
     def is_manifest_object_in_scope(
         self,
@@ -728,15 +923,104 @@ class ManifestFilterConditions:
             manifest_object: ManifestObject instance.
             manifest: Manifest instance.
         """
-        for filter_method in self.filter_methods:
-            if not try_filter_method(
-                filter_method,
-                manifest_object,
-                manifest,
+        for position, use_parent in self.get_type_plan(type(manifest_object)).items():
+            if not self.is_in_scope_by(
+                position, manifest_object, manifest, use_parent=use_parent
+            ):
+                return False
+        return True
+
+    def is_column_parent_in_scope(
+        self,
+        parent: "ManifestObject",
+        manifest: Optional["Manifest"],
+    ) -> bool:
+        """Whether the parent of some columns puts them in scope.
+
+        Only the filter methods which columns inherit from their parent are
+        applied, so the verdict holds for every column of the parent.
+
+        Args:
+            parent: ManifestObject instance which has columns.
+            manifest: Manifest instance.
+        """
+        parent_plan = self.get_type_plan(type(parent))
+        for position, use_parent in self.get_type_plan(ManifestColumn).items():
+            if (
+                use_parent
+                and position in parent_plan
+                and not self.is_in_scope_by(
+                    position, parent, manifest, use_parent=parent_plan[position]
+                )
+            ):
+                return False
+        return True
+
+    def is_column_in_scope_given_parent(
+        self,
+        column: ManifestColumn,
+        manifest: Optional["Manifest"],
+    ) -> bool:
+        """Whether a column of an in-scope parent is in scope.
+
+        Only the filter methods which apply to the column itself are applied.
+
+        Args:
+            column: ManifestColumn instance.
+            manifest: Manifest instance.
+        """
+        for position, use_parent in self.get_type_plan(type(column)).items():
+            if not use_parent and not self.is_in_scope_by(
+                position, column, manifest, use_parent=False
             ):
                 return False
         return True
 
+    def is_in_scope_by(
+        self,
+        position: int,
+        manifest_object: "ManifestObject",
+        manifest: Optional["Manifest"],
+        use_parent: bool,
+    ) -> bool:
+        """Whether the object is in scope by one step of the plan.
+
+        An object which the filter method does not apply to is filtered by its
+        parent instead, if it has one, and is otherwise in scope.
+
+        Args:
+            position: position of the filter method in the plan.
+            manifest_object: ManifestObject instance.
+            manifest: Manifest instance.
+            use_parent: whether to apply the filter method to the object's parent.
+
+        Returns:
+            True if the object is in scope by this filter method.
+        """
+        if not use_parent:
+            in_scope = self.plan[position].is_manifest_object_in_scope(
+                manifest_object, manifest
+            )
+            if in_scope is not None:
+                return in_scope
+            if getattr(manifest_object, "parent", None) is None:
+                return True
+        parent = cast("ManifestObject", getattr(manifest_object, "parent"))
+        parent_use_parent = self.get_type_plan(type(parent)).get(position)
+        if parent_use_parent is None:
+            return True
+        return self.is_in_scope_by(
+            position, parent, manifest, use_parent=parent_use_parent
+        )
+
+    @property
+    def signature(self) -> tuple[tuple[str, frozenset | None, frozenset | None], ...]:
+        """Hashable representation of all the filter conditions.
+
+        Filter conditions with equal signatures select the same manifest objects.
+        """
+        return tuple(filter_method.signature for filter_method in self.filter_methods)
+
     @property
     def summary(self) -> str:
         """Summarise all the filter conditions in a block of text."""
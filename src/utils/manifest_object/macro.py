@@ -3,7 +3,11 @@
 from dataclasses import dataclass
 from typing import Any
 
-from utils.manifest_object.manifest_object import HasPatchPathMixin, ManifestObject
+from utils.manifest_object.manifest_object import (
+    HasPatchPathMixin,
+    ManifestObject,
+    cached_slot_property,
+)
 
 
 @dataclass(frozen=True, eq=True)
@@ -35,17 +39,19 @@ class MacroArgument:
 class Macro(ManifestObject, HasPatchPathMixin):
     """Represents a macro in the manifest."""
 
-    @property
-    def arguments(self) -> list[MacroArgument]:
+    __slots__ = ("_arguments", "_patch_path")
+
+    @cached_slot_property
+    def arguments(self) -> tuple[MacroArgument, ...]:
         """The macro's arguments.
 
         Returns:
-            List of MacroArgument instances.
+            tuple of MacroArgument instances.
         """
-        return [
+        return tuple(
             MacroArgument(data=argument_data)
             for argument_data in self.data.get("arguments", [])
-        ]
+        )
 
     @property
     def macro_sql(self) -> str:
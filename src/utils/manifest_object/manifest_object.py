@@ -2,19 +2,82 @@
 
 import re
 from abc import ABC
-from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Collection, Protocol, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Generic,
+    Hashable,
+    Protocol,
+    TypeVar,
+    cast,
+    overload,
+)
 
 from utils.manifest_object.node.model.constraint import Constraint
 
 if TYPE_CHECKING:
     from utils.artifact_data import Manifest
 
+T = TypeVar("T")
+
+
+class cached_slot_property(Generic[T]):
+    """Property computed once per instance, for classes with __slots__.
+
+    Works like functools.cached_property, which needs an instance __dict__, but
+    keeps the value in the slot named after the property with a leading
+    underscore, which the class must declare.
+
+    Attributes:
+        function: function computing the value from the instance.
+        slot_name: name of the slot keeping the value.
+    """
+
+    def __init__(self, function: Callable[[Any], T]):
+        """Initialise the instance.
+
+        Args:
+            function: function computing the value from the instance.
+        """
+        self.function = function
+        self.slot_name = f"_{function.__name__}"
+        self.__doc__ = function.__doc__
+
+    @overload
+    def __get__(
+        self, instance: None, owner: type | None = None
+    ) -> "cached_slot_property[T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> T: ...
+
+    def __get__(
+        self, instance: object | None, owner: type | None = None
+    ) -> "T | cached_slot_property[T]":
+        """Get the value, computing it on first access.
+
+        Args:
+            instance: instance the property is accessed on, or None on the class.
+            owner: class the property is accessed on.
+        """
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot_name)
+        except AttributeError:
+            value = self.function(instance)
+            setattr(instance, self.slot_name, value)
+            return value
+
 
 class HasName(Protocol):
     """Protocol for objects implementing the name property."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """The name of the object."""
@@ -24,6 +87,8 @@ class HasName(Protocol):
 class HasNameMixin(ABC):
     """Mixin for objects with name property."""
 
+    __slots__ = ()
+
     def name_matches_regex(self, regex_pattern: str) -> bool:
         """Whether the object name matches a given regex pattern.
 
@@ -38,15 +103,58 @@ class HasNameMixin(ABC):
         return bool(pattern.search(name))
 
 
-@dataclass
 class ManifestObject(HasNameMixin, ABC):
     """Abstract base class representing objects in the manifest file.
 
+    Objects are compact: they have no instance __dict__, and the attributes
+    derived from their data are computed once, then kept in slots. As only one
+    base class of a type may declare slots, mixins declare empty __slots__, and
+    each class declares the slots of the properties it caches itself. Objects
+    are equal, and hash, by their type and unique ID, so equality does not
+    compare the underlying data.
+
     Attributes:
         data: data for the object from the manifest file.
     """
 
-    data: dict
+    __slots__ = ("data", "_original_file_path")
+
+    def __init__(self, data: dict):
+        """Initialise the instance.
+
+        Args:
+            data: data for the object from the manifest file.
+        """
+        self.data = data
+
+    def __repr__(self) -> str:
+        """Representation of the object, by unique ID."""
+        return f"{type(self).__name__}(unique_id={self.data.get('unique_id')!r})"
+
+    @property
+    def identity_key(self) -> Hashable:
+        """Key identifying the object, or None if its data has no unique ID."""
+        return self.data.get("unique_id")
+
+    def __eq__(self, other: object) -> bool:
+        """Whether another object has the same type and unique ID.
+
+        Objects without a unique ID are compared by their data instead.
+
+        Args:
+            other: object to compare with.
+        """
+        if type(other) is not type(self):
+            return NotImplemented
+        other_object = cast(ManifestObject, other)
+        identity_key = self.identity_key
+        if identity_key is None:
+            return self.data == other_object.data
+        return identity_key == other_object.identity_key
+
+    def __hash__(self) -> int:
+        """Hash of the key identifying the object."""
+        return hash(self.identity_key)
 
     @property
     def description(self) -> str | None:
@@ -73,7 +181,7 @@ class ManifestObject(HasNameMixin, ABC):
         """The name of the object."""
         return self.data["name"]
 
-    @property
+    @cached_slot_property
     def original_file_path(self) -> Path | None:
         """The original filepath of the object."""
         filepath = self.data.get("original_file_path")
@@ -107,12 +215,16 @@ class ManifestObject(HasNameMixin, ABC):
 class HasData(Protocol):
     """Protocol for objects that have the data attribute."""
 
+    __slots__ = ()
+
     data: dict[str, Any]
 
 
 class HasPackageName(Protocol):
     """Protocol for objects that have the data attribute."""
 
+    __slots__ = ()
+
     @property
     def package_name(self) -> str | None:
         """The package name of the object."""
@@ -122,6 +234,8 @@ class HasPackageName(Protocol):
 class ConfigurableMixin(ABC):
     """Mixin for objects which can have config in the manifest."""
 
+    __slots__ = ()
+
     @property
     def config(self) -> dict[str, Any]:
         """The config from the manifest."""
@@ -143,7 +257,9 @@ class ConfigurableMixin(ABC):
 class HasPatchPathMixin(ABC, HasPackageName):
     """Mixin for objects which have the patch_path property."""
 
-    @property
+    __slots__ = ()
+
+    @cached_slot_property
     def patch_path(self) -> Path | None:
         """The patch path from the manifest.
 
@@ -160,12 +276,14 @@ class HasPatchPathMixin(ABC, HasPackageName):
 class TaggableMixin(ConfigurableMixin):
     """Mixin for objects which can be tagged."""
 
-    @property
-    def tags(self) -> set[str]:
+    __slots__ = ()
+
+    @cached_slot_property
+    def tags(self) -> frozenset[str]:
         """All associated tags from the manifest."""
-        config_tags = set(self.config.get("tags", []))
-        manifest_tags = set(cast(HasData, self).data.get("tags", []))
-        return config_tags.union(manifest_tags)
+        return frozenset(self.config.get("tags", [])).union(
+            cast(HasData, self).data.get("tags", [])
+        )
 
     def has_required_tags(
         self,
@@ -178,15 +296,15 @@ class TaggableMixin(ConfigurableMixin):
             must_have_all_tags_from: Collection of tags that the object must have. Optional, defaults to None
             must_have_any_tag_from: Collection of tags of which object must at least one. Optional, defaults to None
         """
-        has_required_tags = bool(self.tags)
+        tags = self.tags
+        has_required_tags = bool(tags)
         if must_have_all_tags_from is None and must_have_any_tag_from is None:
             return has_required_tags
         if must_have_all_tags_from is not None:
-            has_required_tags = bool(set(must_have_all_tags_from).issubset(self.tags))
+            has_required_tags = tags.issuperset(must_have_all_tags_from)
         if must_have_any_tag_from is not None:
             has_required_tags = (
-                bool(set(must_have_any_tag_from).intersection(self.tags))
-                and has_required_tags
+                not tags.isdisjoint(must_have_any_tag_from) and has_required_tags
             )
         return has_required_tags
 
@@ -194,13 +312,14 @@ class TaggableMixin(ConfigurableMixin):
 class HasUniqueId(Protocol):
     """Protocol for objects that have the unique_id property."""
 
+    __slots__ = ()
+
     @property
     def unique_id(self) -> str:
         """The unique id of the object."""
         ...
 
 
-@dataclass(eq=True)
 class ManifestColumn(ManifestObject, HasNameMixin):
     """Represents a column in the manifest file.
 
@@ -209,16 +328,38 @@ class ManifestColumn(ManifestObject, HasNameMixin):
         parent: HasUniqueId instance the column belongs to.
     """
 
-    data: dict
-    parent: "HasUniqueId"
+    __slots__ = ("parent", "_unique_id", "_constraints")
+
+    def __init__(self, data: dict, parent: "HasUniqueId"):
+        """Initialise the instance.
+
+        Args:
+            data: data for the column from the manifest file.
+            parent: HasUniqueId instance the column belongs to.
+        """
+        super().__init__(data)
+        self.parent = parent
+
+    def __repr__(self) -> str:
+        """Representation of the column, by parent and name."""
+        return (
+            f"{type(self).__name__}(parent={self.parent!r}, "
+            f"name={self.data.get('name')!r})"
+        )
+
+    @property
+    def identity_key(self) -> Hashable:
+        """Key identifying the column, or None if its data has no name."""
+        name = self.data.get("name")
+        return None if name is None else (self.parent, name)
 
     @property
     def name(self) -> str:
         """The name of the column."""
         return self.data["name"]
 
-    @property
-    def unique_id(self) -> str:
+    @cached_slot_property
+    def unique_id(self) -> str:  # type: ignore[override]
         """The unique ID of the column."""
         return f"{self.parent.unique_id}.{self.name}"
 
@@ -242,7 +383,7 @@ class ManifestColumn(ManifestObject, HasNameMixin):
         """Whether the object has a description."""
         return self.description is not None
 
-    @property
+    @cached_slot_property
     def constraints(self) -> tuple[Constraint, ...]:
         """Constraints for the column.
 
@@ -258,6 +399,8 @@ class ManifestColumn(ManifestObject, HasNameMixin):
 class DataTestableMixin(ABC):
     """Mixin for objects which can have data tests in the manifest."""
 
+    __slots__ = ()
+
     def get_data_tests(self, manifest: "Manifest") -> set[str]:
         """Get associated data tests for this object.
 
@@ -322,18 +465,20 @@ class DataTestableMixin(ABC):
 class HasColumnsMixin(ABC, HasUniqueId):
     """Mixin for objects which can have columns."""
 
-    @property
-    def columns(self) -> list[ManifestColumn]:
+    __slots__ = ()
+
+    @cached_slot_property
+    def columns(self) -> tuple[ManifestColumn, ...]:
         """Columns associated with this object.
 
         Returns:
-            List of ManifestColumn objects.
+            tuple of ManifestColumn objects.
         """
         data = cast(HasData, self).data
-        return [
+        return tuple(
             ManifestColumn(column_data, parent=self)
             for column_data in data.get("columns", {}).values()
-        ]
+        )
 
 
 class ManifestSource(
@@ -341,6 +486,8 @@ class ManifestSource(
 ):
     """Represents a manifest source object."""
 
+    __slots__ = ("_tags", "_patch_path", "_columns")
+
     @property
     def loader(self) -> str | None:
         """The tool or process that loads data into this source."""
@@ -6,6 +6,8 @@ from utils.manifest_object.node.node import ManifestNode
 class GenericTest(ManifestNode):
     """Represents a manifest generic test object."""
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         """The name of the generic test.
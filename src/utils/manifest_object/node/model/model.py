@@ -2,7 +2,11 @@
 
 from typing import TYPE_CHECKING, Collection
 
-from utils.manifest_object.manifest_object import DataTestableMixin, HasColumnsMixin
+from utils.manifest_object.manifest_object import (
+    DataTestableMixin,
+    HasColumnsMixin,
+    cached_slot_property,
+)
 from utils.manifest_object.node.model.constraint import Constraint
 from utils.manifest_object.node.model.contract import Contract
 from utils.manifest_object.node.node import ManifestNode
@@ -14,7 +18,9 @@ if TYPE_CHECKING:
 class ManifestModel(ManifestNode, DataTestableMixin, HasColumnsMixin):
     """Represents a model from the manifest file."""
 
-    @property
+    __slots__ = ("_columns", "_constraints")
+
+    @cached_slot_property
     def constraints(self) -> tuple[Constraint, ...]:
         """The model's constraints.
 
@@ -14,46 +14,46 @@ from utils.manifest_object.manifest_object import (
 class ManifestNode(TaggableMixin, ManifestObject, HasPatchPathMixin, ABC):
     """Represents a node from the manifest file."""
 
-    pass
+    __slots__ = ("_tags", "_patch_path")
 
 
 class ManifestAnalysis(ManifestNode):
     """Represents an analysis from the manifest file."""
 
-    pass
+    __slots__ = ()
 
 
 class ManifestFunction(ManifestNode):
     """Represents a function from the manifest file."""
 
-    pass
+    __slots__ = ()
 
 
 class ManifestHookNode(ManifestNode):
     """Represents a hook from the manifest file."""
 
-    pass
+    __slots__ = ()
 
 
 class ManifestSeed(ManifestNode, DataTestableMixin, HasColumnsMixin):
     """Represents a seed from the manifest file."""
 
-    pass
+    __slots__ = ("_columns",)
 
 
 class SingularTest(ManifestNode):
     """Represents a singular test from the manifest file."""
 
-    pass
+    __slots__ = ()
 
 
 class ManifestSnapshot(ManifestNode, DataTestableMixin, HasColumnsMixin):
     """Represents a snapshot from the manifest file."""
 
-    pass
+    __slots__ = ("_columns",)
 
 
 class ManifestSqlOperation(ManifestNode):
     """Represents a sql operation from the manifest file."""
 
-    pass
+    __slots__ = ()
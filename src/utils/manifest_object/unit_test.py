@@ -10,6 +10,8 @@ from utils.manifest_object.manifest_object import (
 class UnitTest(ManifestObject, TaggableMixin, HasPatchPathMixin):
     """Represents unit tests from the manifest file."""
 
+    __slots__ = ("_tags", "_patch_path")
+
     @property
     def original_filepath(self) -> str:
         """The original filepath of the unit test."""
@@ -0,0 +1,405 @@
+"""Reachability indexes over the lineage graph, answering whether objects are related.
+
+Graphs of up to a configurable number of objects are indexed by the transitive
+closure of each object, held as a bitset, so a query is a bit test. Larger
+graphs, whose closures would take too much memory, are indexed by interval
+labels, which rule out most unrelated pairs without a traversal.
+"""
+
+import os
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from typing import ClassVar, Collection, Literal
+
+from utils.lineage_graph import LineageGraph
+
+MAX_CLOSURE_NODES_ENV_VAR = "DBTRA_MAX_CLOSURE_NODES"
+DEFAULT_MAX_CLOSURE_NODES = 10_000
+
+
+def get_max_closure_nodes() -> int:
+    """Largest number of objects indexed by their transitive closures.
+
+    Returns:
+        the value of the DBTRA_MAX_CLOSURE_NODES environment variable, if set,
+        otherwise DEFAULT_MAX_CLOSURE_NODES.
+    """
+    return int(os.environ.get(MAX_CLOSURE_NODES_ENV_VAR) or DEFAULT_MAX_CLOSURE_NODES)
+
+
+class ReachabilityIndex(ABC):
+    """Abstract base class for indexes of the relatives of each object.
+
+    Attributes:
+        graph: LineageGraph the index is built on.
+        relation: whether the index holds the parents or children of each object.
+    """
+
+    strategy: ClassVar[str]
+
+    def __init__(self, graph: LineageGraph, relation: Literal["parents", "children"]):
+        """Initialise the instance.
+
+        Args:
+            graph: LineageGraph to index.
+            relation: whether to index the parents or children of each object.
+        """
+        self.graph = graph
+        self.relation = relation
+
+    @property
+    @abstractmethod
+    def memory_size(self) -> int:
+        """Memory held by the index, in bytes, excluding the graph itself."""
+        ...
+
+    def has_relative_in(self, unique_id: str, values: Collection[str]) -> bool:
+        """Whether any of the values is a direct or indirect relative of an object.
+
+        Args:
+            unique_id: unique ID of the object.
+            values: unique IDs of the possible relatives.
+
+        Returns:
+            True if any of the values is a relative of the object, False otherwise.
+        """
+        index = self.graph.get_index(unique_id)
+        if index is None:
+            return False
+        return self.has_relative_at(index, values)
+
+    @abstractmethod
+    def has_relative_at(self, index: int, values: Collection[str]) -> bool:
+        """Whether any of the values is a direct or indirect relative of an object.
+
+        Args:
+            index: position of the object in the graph.
+            values: unique IDs of the possible relatives.
+
+        Returns:
+            True if any of the values is a relative of the object, False otherwise.
+        """
+        ...
+
+
+class ClosureReachabilityIndex(ReachabilityIndex):
+    """Index of the transitive closure of each object, held as a bitset.
+
+    Closures are built in reverse topological order, each one from the closures
+    of the object's direct relatives, and held as Python integers, bit i being
+    set if the object at position i is a relative. Sets of values are turned
+    into bitsets once, so a query is a single bitwise AND. The memory held is
+    quadratic in the number of objects in the worst case.
+
+    Attributes:
+        graph: LineageGraph the index is built on.
+        relation: whether the index holds the parents or children of each object.
+        closures: bitset of the direct and indirect relatives of each object.
+    """
+
+    strategy = "closure"
+
+    def __init__(self, graph: LineageGraph, relation: Literal["parents", "children"]):
+        """Initialise the instance, building the closure of every object.
+
+        Args:
+            graph: LineageGraph to index.
+            relation: whether to index the parents or children of each object.
+        """
+        super().__init__(graph, relation)
+        self.closures = self.build_closures()
+        self._masks: dict[frozenset[str], int] = {}
+
+    def build_closures(self) -> list[int]:
+        """Build the closure of every object, in one post-order traversal.
+
+        Each closure is built once the closures of all the object's relatives
+        are built. Relatives on a cycle contribute their closure so far.
+        """
+        offsets = self.graph.offsets[self.relation]
+        targets = self.graph.targets[self.relation]
+        closures = [0] * len(self.graph)
+        # 0: not visited, 1: relatives being expanded, 2: closure built.
+        states = bytearray(len(self.graph))
+        for root in range(len(self.graph)):
+            if states[root]:
+                continue
+            stack = [root]
+            while stack:
+                index = stack[-1]
+                relatives = targets[offsets[index] : offsets[index + 1]]
+                if not states[index]:
+                    states[index] = 1
+                    stack.extend(
+                        relative for relative in relatives if not states[relative]
+                    )
+                    continue
+                stack.pop()
+                if states[index] == 1:
+                    closure = 0
+                    for relative in relatives:
+                        closure |= closures[relative] | 1 << relative
+                    closures[index] = closure
+                    states[index] = 2
+        return closures
+
+    @property
+    def memory_size(self) -> int:
+        """Memory held by the closures, in bytes."""
+        return sys.getsizeof(self.closures) + sum(map(sys.getsizeof, self.closures))
+
+    def get_mask(self, values: Collection[str]) -> int:
+        """Bitset of the positions of some objects, built once per set of values.
+
+        Args:
+            values: unique IDs of the objects.
+        """
+        key = frozenset(values)
+        mask = self._masks.get(key)
+        if mask is None:
+            bits = bytearray((len(self.graph) + 7) // 8)
+            for index in map(self.graph.get_index, key):
+                if index is not None:
+                    bits[index >> 3] |= 1 << (index & 7)
+            mask = int.from_bytes(bits, "little")
+            self._masks[key] = mask
+        return mask
+
+    def has_relative_at(self, index: int, values: Collection[str]) -> bool:
+        """Whether any of the values is a direct or indirect relative of an object.
+
+        Args:
+            index: position of the object in the graph.
+            values: unique IDs of the possible relatives.
+
+        Returns:
+            True if any of the values is a relative of the object, False otherwise.
+        """
+        return bool(self.closures[index] & self.get_mask(values))
+
+
+class ValueSearch:
+    """State of the searches of an interval index for a set of values.
+
+    Attributes:
+        positions: positions of the values in the graph.
+        bounds: highest lowest rank and lowest rank of the values, per traversal.
+        related: positions of the objects found to have a value as a relative.
+        unrelated: positions of the objects found to have no value as a relative.
+    """
+
+    def __init__(self, positions: set[int], bounds: list[tuple[int, int]]):
+        """Initialise the instance.
+
+        Args:
+            positions: positions of the values in the graph.
+            bounds: highest lowest rank and lowest rank of the values, per
+                traversal.
+        """
+        self.positions = positions
+        self.bounds = bounds
+        self.related: set[int] = set()
+        self.unrelated: set[int] = set()
+
+
+class IntervalReachabilityIndex(ReachabilityIndex):
+    """Index of interval labels of each object, from depth-first traversals.
+
+    Each traversal labels an object with its post-order rank and the lowest
+    rank among its relatives. An object can only be a relative of another if
+    its labels are nested within the other's in every traversal, so most
+    unrelated pairs are ruled out by comparing labels with the bounds of the
+    values' labels. Otherwise, the relatives are searched, skipping any whose
+    labels rule them out. The objects which searches find to be related or
+    unrelated to a set of values are memoized, so later searches for the same
+    values stop as soon as they reach one. The memory held is linear in the
+    number of objects.
+
+    Attributes:
+        graph: LineageGraph the index is built on.
+        relation: whether the index holds the parents or children of each object.
+        labels: lowest rank and post-order rank of each object, per traversal.
+    """
+
+    strategy = "interval"
+
+    def __init__(self, graph: LineageGraph, relation: Literal["parents", "children"]):
+        """Initialise the instance, labelling every object.
+
+        Args:
+            graph: LineageGraph to index.
+            relation: whether to index the parents or children of each object.
+        """
+        super().__init__(graph, relation)
+        self.labels = [
+            self.build_labels(reverse=False),
+            self.build_labels(reverse=True),
+        ]
+        self._searches: dict[frozenset[str], ValueSearch] = {}
+
+    def build_labels(self, reverse: bool) -> tuple[array, array]:
+        """Label every object in one post-order traversal.
+
+        Args:
+            reverse: whether objects and their relatives are visited in reverse
+                order, so that the traversals label the objects differently.
+
+        Returns:
+            the lowest rank among each object and its relatives, and the
+            post-order rank of each object.
+        """
+        offsets = self.graph.offsets[self.relation]
+        targets = self.graph.targets[self.relation]
+        node_count = len(self.graph)
+        lows = array("q", range(node_count))
+        ranks = array("q", bytes(8 * node_count))
+        states = bytearray(node_count)
+        rank = 0
+        roots = range(node_count - 1, -1, -1) if reverse else range(node_count)
+        for root in roots:
+            if states[root]:
+                continue
+            stack = [root]
+            while stack:
+                index = stack[-1]
+                relatives = targets[offsets[index] : offsets[index + 1]].tolist()
+                if not states[index]:
+                    states[index] = 1
+                    if not reverse:
+                        relatives.reverse()
+                    stack.extend(
+                        relative for relative in relatives if not states[relative]
+                    )
+                    continue
+                stack.pop()
+                if states[index] == 1:
+                    ranks[index] = rank
+                    lows[index] = min(
+                        [rank, *(lows[relative] for relative in relatives)]
+                    )
+                    rank += 1
+                    states[index] = 2
+        return lows, ranks
+
+    @property
+    def memory_size(self) -> int:
+        """Memory held by the labels, in bytes."""
+        return sum(
+            sys.getsizeof(labels) for traversal in self.labels for labels in traversal
+        )
+
+    def get_search(self, values: Collection[str]) -> "ValueSearch":
+        """State of the searches for a set of values, built once per set of values.
+
+        Args:
+            values: unique IDs of the possible relatives.
+        """
+        key = frozenset(values)
+        search = self._searches.get(key)
+        if search is None:
+            positions = {
+                position
+                for position in map(self.graph.get_index, key)
+                if position is not None
+            }
+            bounds = [
+                (
+                    max((lows[position] for position in positions), default=-1),
+                    min(
+                        (ranks[position] for position in positions),
+                        default=len(self.graph),
+                    ),
+                )
+                for lows, ranks in self.labels
+            ]
+            search = ValueSearch(positions, bounds)
+            self._searches[key] = search
+        return search
+
+    def may_have_relative_in(self, index: int, search: "ValueSearch") -> bool:
+        """Whether the labels of an object allow any of the values to be its relative.
+
+        An object can only have a value as a relative if, in every traversal,
+        its lowest rank is at most the value's, and its rank at least the value's.
+
+        Args:
+            index: position of the object in the graph.
+            search: state of the searches for the values.
+        """
+        for (lows, ranks), (highest_low, lowest_rank) in zip(
+            self.labels, search.bounds
+        ):
+            if lows[index] > highest_low or ranks[index] < lowest_rank:
+                return False
+        return True
+
+    def has_relative_at(self, index: int, values: Collection[str]) -> bool:
+        """Whether any of the values is a direct or indirect relative of an object.
+
+        Args:
+            index: position of the object in the graph.
+            values: unique IDs of the possible relatives.
+
+        Returns:
+            True if any of the values is a relative of the object, False otherwise.
+        """
+        search = self.get_search(values)
+        related, unrelated = search.related, search.unrelated
+        if index in related:
+            return True
+        if index in unrelated or not self.may_have_relative_in(index, search):
+            return False
+        offsets = self.graph.offsets[self.relation]
+        targets = self.graph.targets[self.relation]
+        # Object each searched object was reached from.
+        reached_from: dict[int, int] = {}
+        stack = [
+            (relative, index)
+            for relative in targets[offsets[index] : offsets[index + 1]].tolist()
+        ]
+        while stack:
+            current, previous = stack.pop()
+            if current in search.positions or current in related:
+                # Every object on the path to the value has it as a relative.
+                while previous != index:
+                    related.add(previous)
+                    previous = reached_from[previous]
+                related.add(index)
+                return True
+            if current in reached_from or current in unrelated:
+                continue
+            reached_from[current] = previous
+            if self.may_have_relative_in(current, search):
+                stack.extend(
+                    (relative, current)
+                    for relative in targets[offsets[current] : offsets[current + 1]]
+                )
+        # None of the objects searched has any of the values as a relative.
+        unrelated.update(reached_from)
+        unrelated.add(index)
+        return False
+
+
+def build_reachability_index(
+    graph: LineageGraph,
+    relation: Literal["parents", "children"],
+    max_closure_nodes: int | None = None,
+) -> ReachabilityIndex:
+    """Build the reachability index suited to the size of a graph.
+
+    Args:
+        graph: LineageGraph to index.
+        relation: whether to index the parents or children of each object.
+        max_closure_nodes: largest number of objects indexed by their transitive
+            closures. If None, it is read with get_max_closure_nodes.
+
+    Returns:
+        a ClosureReachabilityIndex if the graph has at most max_closure_nodes
+        objects, otherwise an IntervalReachabilityIndex.
+    """
+    if max_closure_nodes is None:
+        max_closure_nodes = get_max_closure_nodes()
+    if len(graph) <= max_closure_nodes:
+        return ClosureReachabilityIndex(graph, relation)
+    return IntervalReachabilityIndex(graph, relation)
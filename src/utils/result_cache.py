@@ -0,0 +1,164 @@
+"""Persistent on-disk cache of the verdicts of checks on each manifest object."""
+
+import hashlib
+import json
+import sys
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Hashable
+
+from utils.artifact_cache import ArtifactCache, get_tool_version
+
+RESULT_CACHE_FORMAT_VERSION = 1
+RESULT_CACHE_ENTRY_SUFFIX = ".results"
+DEFAULT_MAX_RESULT_CACHE_SIZE = 256 * 1024**2
+MAX_IDLE_RUNS = 8
+SCOPE_ARGUMENTS = frozenset(
+    {
+        "check_id",
+        "files",
+        "project_dir",
+        "manifest_dir",
+        "catalog_dir",
+        "cache_dir",
+        "result_cache_dir",
+        "config_dir",
+        "state",
+        "state_selector",
+        "jobs",
+        "manifest_representation",
+    }
+)
+
+Verdict = tuple[bool, Any]
+
+
+def get_check_key(args: Namespace) -> str:
+    """Key of the arguments of a check which can change its verdicts.
+
+    Arguments which only select the objects to check, such as filters and
+    files, are ignored, so checks selecting different objects share verdicts.
+
+    Args:
+        args: check arguments.
+
+    Returns:
+        a hexadecimal digest, also covering the versions of the cache format,
+        of dbt-review-assistant and of Python.
+    """
+    arguments = {
+        name: value
+        for name, value in vars(args).items()
+        if name not in SCOPE_ARGUMENTS and not name.startswith(("include_", "exclude_"))
+    }
+    encoded = json.dumps(
+        [
+            RESULT_CACHE_FORMAT_VERSION,
+            get_tool_version(),
+            sys.version,
+            args.check_id,
+            arguments,
+        ],
+        sort_keys=True,
+        default=str,
+    ).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class CheckResults:
+    """Cached verdicts of one check configuration, by object key.
+
+    Each entry records the run which last used it, so that entries of objects
+    which have not been checked for several runs are dropped when saving.
+
+    Attributes:
+        cache: ResultCache the verdicts are saved in.
+        entry_path: Path of the cache entry.
+        run: number of the current run of this check configuration.
+        entries: dictionary mapping object keys to the number of the run which
+            last used them, and the verdict.
+    """
+
+    def __init__(self, cache: "ResultCache", entry_path: Path):
+        """Initialise the instance, loading any previously saved verdicts.
+
+        Args:
+            cache: ResultCache the verdicts are saved in.
+            entry_path: Path of the cache entry.
+        """
+        self.cache = cache
+        self.entry_path = entry_path
+        snapshot = cache.load(entry_path) or {"run": 0, "entries": {}}
+        self.run: int = snapshot["run"] + 1
+        self.entries: dict[Hashable, tuple[int, Verdict]] = snapshot["entries"]
+
+    def get(self, key: Hashable) -> Verdict | None:
+        """Get the cached verdict for an object key, if any.
+
+        Args:
+            key: key of the object and the inputs the check reads.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        verdict = entry[1]
+        self.entries[key] = (self.run, verdict)
+        return verdict
+
+    def put(self, key: Hashable, verdict: Verdict) -> None:
+        """Cache the verdict for an object key.
+
+        Args:
+            key: key of the object and the inputs the check reads.
+            verdict: whether the object fails the check, and the failure details.
+        """
+        self.entries[key] = (self.run, verdict)
+
+    def save(self) -> None:
+        """Save the verdicts used recently, dropping any others."""
+        self.cache.save(
+            self.entry_path,
+            {
+                "run": self.run,
+                "entries": {
+                    key: entry
+                    for key, entry in self.entries.items()
+                    if self.run - entry[0] < MAX_IDLE_RUNS
+                },
+            },
+        )
+
+
+class ResultCache(ArtifactCache):
+    """Directory of the cached verdicts of checks, one entry per check configuration.
+
+    Once an entry is saved, the least recently used entries are evicted until
+    the cache fits within its size cap. Entries have their own suffix, so the
+    cache can share a directory with an ArtifactCache without either evicting
+    the other's entries.
+
+    Attributes:
+        cache_dir: directory where the cache entries are stored.
+        max_size: maximum total size of the cache entries, in bytes.
+    """
+
+    entry_suffixes = (RESULT_CACHE_ENTRY_SUFFIX,)
+
+    def __init__(self, cache_dir: Path, max_size: int = DEFAULT_MAX_RESULT_CACHE_SIZE):
+        """Initialise the instance.
+
+        Args:
+            cache_dir: directory where the cache entries are stored.
+            max_size: maximum total size of the cache entries, in bytes.
+        """
+        super().__init__(cache_dir, max_size=max_size)
+
+    def get_results(self, args: Namespace) -> CheckResults:
+        """Load the cached verdicts of a check configuration.
+
+        Args:
+            args: check arguments.
+        """
+        return CheckResults(
+            self, self.cache_dir / f"{get_check_key(args)}{RESULT_CACHE_ENTRY_SUFFIX}"
+        )
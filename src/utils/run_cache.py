@@ -0,0 +1,190 @@
+"""Persistent cache of whole runs, replaying identical invocations.
+
+A run is keyed by its CLI arguments, working directory and the versions of
+dbt-review-assistant and Python. Each entry records the files the run read, with
+their stat keys, so a hit only costs a small file read and a stat of each of
+those files: no arguments are parsed and no artifacts are loaded. As with git's
+index, runs reading files modified shortly before they started are not
+recorded, since a later change within the file system's timestamp granularity
+could go unnoticed.
+
+Only standard library modules are imported here, so that looking up a run costs
+as little as possible.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+RUN_CACHE_DIR_ENV_VAR = "DBTRA_RUN_CACHE_DIR"
+RUN_CACHE_FORMAT_VERSION = 1
+MAX_RUN_CACHE_ENTRIES = 256
+RACY_WINDOW_NS = 2 * 10**9
+RUN_CACHE_ENTRY_SUFFIX = ".json"
+
+FileKey = tuple[int, int, int, int] | None
+
+
+def get_file_key(path: Path) -> FileKey:
+    """Identity of the current content of a file, or None if it does not exist.
+
+    Besides the size and modification time, the inode and status change time
+    are included, as the latter cannot be set back when a file is rewritten.
+
+    Args:
+        path: Path to the file.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns
+
+
+@dataclass
+class RunRecord:
+    """Outcome of a run, and the files it depends on.
+
+    Attributes:
+        dependencies: dictionary mapping the paths of the files the run read to
+            their file keys at the start of the run.
+        exit_code: argument of the SystemExit raised by the run.
+        output: text the run logged and wrote to stderr.
+        stdout: text the run wrote to stdout.
+    """
+
+    dependencies: dict[str, FileKey]
+    exit_code: int | str | None
+    output: str
+    stdout: str = ""
+
+    @property
+    def is_current(self) -> bool:
+        """Whether none of the files the run read have changed since."""
+        return all(
+            get_file_key(Path(path)) == (tuple(key) if key else None)
+            for path, key in self.dependencies.items()
+        )
+
+    def is_racy(self, started_at_ns: int) -> bool:
+        """Whether a file the run read was modified too shortly before it started.
+
+        Args:
+            started_at_ns: time the run started, in nanoseconds since the epoch.
+        """
+        return any(
+            key is not None and key[2] >= started_at_ns - RACY_WINDOW_NS
+            for key in self.dependencies.values()
+        )
+
+    def replay(self) -> None:
+        """Write the output of the run again, and exit with the same status.
+
+        Raises:
+            SystemExit: with the status of the run
+        """
+        sys.stdout.write(self.stdout)
+        sys.stderr.write(self.output)
+        raise SystemExit(self.exit_code)
+
+
+class RunCache:
+    """Directory of recorded runs, one JSON entry per distinct invocation.
+
+    Replayed entries are touched, and once an entry is saved the least recently
+    used entries beyond MAX_RUN_CACHE_ENTRIES are removed.
+
+    Attributes:
+        cache_dir: directory where the cache entries are stored.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """Initialise the instance.
+
+        Args:
+            cache_dir: directory where the cache entries are stored.
+        """
+        self.cache_dir = cache_dir
+
+    @classmethod
+    def from_environment(cls) -> "RunCache | None":
+        """The run cache configured by the DBTRA_RUN_CACHE_DIR environment variable.
+
+        Returns:
+            None unless the environment variable is set.
+        """
+        cache_dir = os.environ.get(RUN_CACHE_DIR_ENV_VAR)
+        return cls(Path(cache_dir)) if cache_dir else None
+
+    def get_entry_path(self, argv: list[str], cwd: Path) -> Path:
+        """Path of the cache entry of an invocation.
+
+        Args:
+            argv: CLI arguments.
+            cwd: working directory the arguments are relative to.
+
+        Returns:
+            Path of the cache entry, which may not exist yet.
+        """
+        # Imported here, as looking up the installed version is not free.
+        from utils.artifact_cache import get_tool_version
+
+        encoded = json.dumps(
+            [RUN_CACHE_FORMAT_VERSION, get_tool_version(), sys.version, str(cwd), argv]
+        ).encode()
+        return self.cache_dir / (
+            f"{hashlib.blake2b(encoded, digest_size=16).hexdigest()}"
+            f"{RUN_CACHE_ENTRY_SUFFIX}"
+        )
+
+    def load(self, entry_path: Path) -> RunRecord | None:
+        """Load a recorded run, if none of the files it read have changed.
+
+        Args:
+            entry_path: Path of the cache entry.
+        """
+        try:
+            record = RunRecord(**json.loads(entry_path.read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not record.is_current:
+            return None
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return record
+
+    def save(self, entry_path: Path, record: RunRecord) -> None:
+        """Save a recorded run, then evict the least recently used entries.
+
+        Failing to write the cache never fails the run.
+
+        Args:
+            entry_path: Path of the cache entry.
+            record: RunRecord to save.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as file_handler:
+                json.dump(vars(record), file_handler)
+            os.replace(file_handler.name, entry_path)
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Remove the least recently used entries beyond MAX_RUN_CACHE_ENTRIES."""
+        entries = sorted(
+            self.cache_dir.glob(f"*{RUN_CACHE_ENTRY_SUFFIX}"),
+            key=lambda entry: entry.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for entry in entries[MAX_RUN_CACHE_ENTRIES:]:
+            entry.unlink(missing_ok=True)
@@ -0,0 +1,261 @@
+"""Incremental decoding of selected members of large JSON objects."""
+
+import json
+import re
+from typing import IO, Any, Callable, Collection
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+DECODER = json.JSONDecoder()
+CHUNK_SIZE = 1 << 20
+NUMBER_CHARACTERS = frozenset("0123456789+-.eE")
+
+ValueDecoder = Callable[[str, "JsonReader"], Any]
+
+
+def skip_whitespace(text: str, index: int) -> int:
+    """Index of the first non-whitespace character at or after an index.
+
+    Args:
+        text: JSON document.
+        index: index to start from.
+    """
+    match = WHITESPACE.match(text, index)
+    return match.end() if match else index
+
+
+def decode_string(text: str, index: int) -> tuple[str, int]:
+    """Decode the JSON string starting at an index.
+
+    Args:
+        text: JSON document.
+        index: index of the opening quote of the string.
+
+    Returns:
+        the decoded string, and the index after the closing quote.
+    """
+    return json.decoder.scanstring(text, index + 1)  # type: ignore[attr-defined]
+
+
+class JsonReader:
+    """Reader of a JSON document from a text file, one chunk at a time.
+
+    Only the part of the document which has been read but not decoded yet is
+    held, so the document is never held in full.
+
+    Attributes:
+        file_handler: text file the document is read from.
+        chunk_size: least number of characters read from the file at a time.
+        text: part of the document which has been read, from the last chunk
+            boundary before the next character to decode.
+        index: index within text of the next character to decode.
+        at_end: whether the file has been read to its end.
+    """
+
+    def __init__(self, file_handler: IO[str], chunk_size: int = CHUNK_SIZE):
+        """Initialise the instance.
+
+        Args:
+            file_handler: text file the document is read from.
+            chunk_size: least number of characters read from the file at a time.
+        """
+        self.file_handler = file_handler
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.index = 0
+        self.at_end = False
+
+    def read_chunk(self) -> bool:
+        """Read the next chunk, discarding the part of the text already decoded.
+
+        A chunk is at least as long as the text which is still to be decoded,
+        so a value spanning many chunks is only decoded again a logarithmic
+        number of times.
+
+        Returns:
+            whether any characters were read.
+        """
+        if self.at_end:
+            return False
+        chunk = self.file_handler.read(
+            max(self.chunk_size, len(self.text) - self.index)
+        )
+        self.text = self.text[self.index :] + chunk
+        self.index = 0
+        self.at_end = not chunk
+        return not self.at_end
+
+    def peek(self) -> str:
+        """Skip whitespace, and get the next character.
+
+        Returns:
+            the next character, or an empty string at the end of the document.
+        """
+        self.index = skip_whitespace(self.text, self.index)
+        while self.index == len(self.text) and self.read_chunk():
+            self.index = skip_whitespace(self.text, self.index)
+        return self.text[self.index : self.index + 1]
+
+    def expect(self, character: str, message: str) -> None:
+        """Skip past the next character, which must be a given one.
+
+        Args:
+            character: expected character.
+            message: message of the error raised if it is another character.
+
+        Raises:
+            json.JSONDecodeError: if the next character is another character.
+        """
+        if self.peek() != character:
+            raise json.JSONDecodeError(message, self.text, self.index)
+        self.index += 1
+
+    def at_close(self, closing: str) -> bool:
+        """Skip past the delimiter after a member or element of a container.
+
+        Args:
+            closing: closing character of the container.
+
+        Returns:
+            whether the delimiter closes the container.
+
+        Raises:
+            json.JSONDecodeError: if the delimiter is neither a comma nor closing.
+        """
+        if self.peek() == closing:
+            self.index += 1
+            return True
+        self.expect(",", "Expecting ',' delimiter")
+        return False
+
+    def decode(self, decoder: Callable[[str, int], tuple[Any, int]]) -> Any:
+        """Decode the next value, reading chunks until the value is complete.
+
+        Args:
+            decoder: function which decodes the value starting at an index of
+                a text, and returns it with the index after its end.
+
+        Returns:
+            the decoded value.
+
+        Raises:
+            json.JSONDecodeError: if the document is not valid JSON.
+        """
+        self.peek()
+        while True:
+            try:
+                value, index = decoder(self.text, self.index)
+            except json.JSONDecodeError:
+                if self.read_chunk():
+                    continue
+                raise
+            # A number may go on in the next chunk, so it is only complete
+            # once a character which cannot be part of it is read after it.
+            complete = (
+                index < len(self.text) and self.text[index] not in NUMBER_CHARACTERS
+            )
+            if complete or not self.read_chunk():
+                self.index = index
+                return value
+
+
+def decode_value(key: str, reader: JsonReader) -> Any:
+    """Decode a JSON value in full.
+
+    Args:
+        key: key of the object member holding the value.
+        reader: reader of the JSON document, at the start of the value.
+
+    Returns:
+        the decoded value.
+    """
+    return reader.decode(DECODER.raw_decode)
+
+
+def decode_key(reader: JsonReader) -> str:
+    """Decode the key of an object member, and skip past its ':' delimiter.
+
+    Args:
+        reader: reader of the JSON document, at the start of the member.
+
+    Returns:
+        the decoded key.
+
+    Raises:
+        json.JSONDecodeError: if the member does not start with a key.
+    """
+    if reader.peek() != '"':
+        raise json.JSONDecodeError("Expecting property name", reader.text, reader.index)
+    key = reader.decode(decode_string)
+    reader.expect(":", "Expecting ':' delimiter")
+    return key
+
+
+def skip_value(reader: JsonReader) -> None:
+    """Scan past a JSON value without decoding it.
+
+    Objects and arrays are scanned one member or element at a time, so that
+    a large value does not have to be read in full before it is skipped.
+
+    Args:
+        reader: reader of the JSON document, at the start of the value.
+
+    Raises:
+        json.JSONDecodeError: if the value is not valid JSON.
+    """
+    opening = reader.peek()
+    if opening not in ("{", "["):
+        reader.decode(DECODER.raw_decode)
+        return
+    closing = "}" if opening == "{" else "]"
+    reader.index += 1
+    if reader.peek() == closing:
+        reader.index += 1
+        return
+    while True:
+        if opening == "{":
+            decode_key(reader)
+        skip_value(reader)
+        if reader.at_close(closing):
+            return
+
+
+def decode_object_members(
+    reader: JsonReader,
+    keys: Collection[str] | None = None,
+    value_decoder: ValueDecoder = decode_value,
+) -> dict[str, Any]:
+    """Decode selected members of the JSON object at the reader's position.
+
+    Members which are not selected are discarded as soon as they have been
+    scanned, so they are never retained alongside the selected members, and
+    scanning stops as soon as every selected member has been found.
+
+    Args:
+        reader: reader of the JSON document, at the start of the object.
+        keys: keys of the members to decode. If None, all members are decoded.
+        value_decoder: function which decodes a member's value, given its key
+            and the reader at the start of the value.
+
+    Returns:
+        dictionary of the decoded members.
+
+    Raises:
+        json.JSONDecodeError: if the document is not a valid JSON object.
+    """
+    reader.expect("{", "Expecting '{'")
+    members: dict[str, Any] = {}
+    remaining = set(keys) if keys is not None else None
+    if reader.peek() == "}":
+        reader.index += 1
+        return members
+    while remaining is None or remaining:
+        key = decode_key(reader)
+        if remaining is None or key in remaining:
+            members[key] = value_decoder(key, reader)
+            if remaining is not None:
+                remaining.discard(key)
+        else:
+            skip_value(reader)
+        if reader.at_close("}"):
+            return members
+    return members
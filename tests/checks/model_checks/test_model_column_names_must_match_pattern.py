@@ -8,6 +8,7 @@ from checks.model_checks.model_column_names_must_match_pattern import (
     ModelColumnNamesMatchPattern,
 )
 from utils.check_abc import STANDARD_MODEL_ARGUMENTS
+from utils.column_store import ColumnStore
 from utils.manifest_object.node.model.model import ManifestModel
 
 
@@ -75,13 +76,13 @@ def test_model_column_names_match_pattern_perform_checks(
             ModelColumnNamesMatchPattern, "manifest", new_callable=PropertyMock
         ) as mock_manifest,
     ):
-        columns = [
-            column
-            for model_data in models
-            for column in ManifestModel(model_data).columns
-        ]
-        mock_in_scope_columns = PropertyMock(return_value=columns)
-        type(mock_manifest.return_value).in_scope_model_columns = mock_in_scope_columns
+        column_store = ColumnStore.from_parents(
+            ManifestModel(model_data) for model_data in models
+        )
+        mock_in_scope_columns = PropertyMock(return_value=column_store)
+        type(
+            mock_manifest.return_value
+        ).in_scope_model_column_store = mock_in_scope_columns
         instance = ModelColumnNamesMatchPattern(Namespace())
         instance.args.name_must_match_pattern = pattern
         instance.perform_check()
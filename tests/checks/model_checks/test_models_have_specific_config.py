@@ -6,6 +6,7 @@ import pytest
 
 from checks.model_checks.models_have_specific_config import ModelsHaveSpecificConfig
 from utils.check_abc import STANDARD_MODEL_ARGUMENTS
+from utils.manifest_object.manifest_object import dict_difference
 from utils.manifest_object.node.model.model import ManifestModel
 
 
@@ -90,3 +91,26 @@ def test_models_have_specific_config_failure_message():
             dict_name="config",
         )
         assert result is mock_dictionary_values_mismatch.return_value
+
+
+def test_models_have_specific_config_compares_each_model_once():
+    models = [
+        ManifestModel({"unique_id": "test_model", "config": {"a": 1}}),
+        ManifestModel({"unique_id": "another_model", "config": {"a": 2}}),
+    ]
+    with (
+        patch.object(ModelsHaveSpecificConfig, "__call__"),
+        patch.object(
+            ModelsHaveSpecificConfig, "manifest", Mock(in_scope_models=models)
+        ),
+        patch(
+            "checks.model_checks.models_have_specific_config.dict_difference",
+            wraps=dict_difference,
+        ) as mock_dict_difference,
+    ):
+        instance = ModelsHaveSpecificConfig(
+            Namespace(must_have_specific_config={"a": 1})
+        )
+        instance.perform_check()
+    assert instance.failures == {"another_model": {"a": {"left": 2, "right": 1}}}
+    assert mock_dict_difference.call_count == len(models)
@@ -6,6 +6,7 @@ import pytest
 
 from checks.model_checks.models_have_specific_meta import ModelsHaveSpecificMeta
 from utils.check_abc import STANDARD_MODEL_ARGUMENTS
+from utils.manifest_object.manifest_object import dict_difference
 from utils.manifest_object.node.model.model import ManifestModel
 
 
@@ -90,3 +91,22 @@ def test_models_have_specific_meta_failure_message():
             dict_name="meta",
         )
         assert result is mock_dictionary_values_mismatch.return_value
+
+
+def test_models_have_specific_meta_compares_each_model_once():
+    models = [
+        ManifestModel({"unique_id": "test_model", "meta": {"a": 1}}),
+        ManifestModel({"unique_id": "another_model", "meta": {"a": 2}}),
+    ]
+    with (
+        patch.object(ModelsHaveSpecificMeta, "__call__"),
+        patch.object(ModelsHaveSpecificMeta, "manifest", Mock(in_scope_models=models)),
+        patch(
+            "checks.model_checks.models_have_specific_meta.dict_difference",
+            wraps=dict_difference,
+        ) as mock_dict_difference,
+    ):
+        instance = ModelsHaveSpecificMeta(Namespace(must_have_specific_meta={"a": 1}))
+        instance.perform_check()
+    assert instance.failures == {"another_model": {"a": {"left": 2, "right": 1}}}
+    assert mock_dict_difference.call_count == len(models)
@@ -8,6 +8,7 @@ from checks.seed_checks.seed_columns_have_descriptions import (
     SeedColumnsHaveDescriptions,
 )
 from utils.check_abc import STANDARD_SEED_ARGUMENTS
+from utils.column_store import ColumnStore
 from utils.manifest_object.node.node import ManifestSeed
 
 
@@ -67,13 +68,13 @@ def test_seed_columns_have_descriptions_perform_checks(
             SeedColumnsHaveDescriptions, "manifest", new_callable=PropertyMock
         ) as mock_manifest,
     ):
-        columns = [
-            column for seed_data in seeds for column in ManifestSeed(seed_data).columns
-        ]
-        mock_in_scope_seed_columns = PropertyMock(return_value=columns)
+        column_store = ColumnStore.from_parents(
+            ManifestSeed(seed_data) for seed_data in seeds
+        )
+        mock_in_scope_seed_columns = PropertyMock(return_value=column_store)
         type(
             mock_manifest.return_value
-        ).in_scope_seed_columns = mock_in_scope_seed_columns
+        ).in_scope_seed_column_store = mock_in_scope_seed_columns
         instance = SeedColumnsHaveDescriptions(Namespace())
         instance.perform_check()
         assert instance.check_name == "seed-columns-have-descriptions"
@@ -6,7 +6,7 @@ import pytest
 
 from checks.snapshot_checks.snapshot_columns_have_types import SnapshotColumnsHaveTypes
 from utils.check_abc import STANDARD_SNAPSHOT_ARGUMENTS
-from utils.manifest_object.manifest_object import ManifestColumn
+from utils.column_store import ColumnStore
 from utils.manifest_object.node.node import ManifestSnapshot
 
 
@@ -15,38 +15,36 @@ from utils.manifest_object.node.node import ManifestSnapshot
         "two columns, both pass",
         "two columns, one fails",
     ],
-    argnames=["columns", "expected_failures"],
+    argnames=["snapshots", "expected_failures"],
     argvalues=[
         (
             [
-                ManifestColumn(
-                    {"name": "col_1", "data_type": "varchar"},
-                    ManifestSnapshot({"unique_id": "test_snapshot"}),
-                ),
-                ManifestColumn(
-                    {"name": "col_2", "data_type": "int"},
-                    ManifestSnapshot({"unique_id": "test_snapshot"}),
-                ),
+                {
+                    "unique_id": "test_snapshot",
+                    "columns": {
+                        "col_1": {"name": "col_1", "data_type": "varchar"},
+                        "col_2": {"name": "col_2", "data_type": "int"},
+                    },
+                }
             ],
             set(),
         ),
         (
             [
-                ManifestColumn(
-                    {"name": "col_1", "data_type": "varchar"},
-                    ManifestSnapshot({"unique_id": "test_snapshot"}),
-                ),
-                ManifestColumn(
-                    {"name": "col_2"},
-                    ManifestSnapshot({"unique_id": "test_snapshot"}),
-                ),
+                {
+                    "unique_id": "test_snapshot",
+                    "columns": {
+                        "col_1": {"name": "col_1", "data_type": "varchar"},
+                        "col_2": {"name": "col_2"},
+                    },
+                }
             ],
             {"test_snapshot.col_2"},
         ),
     ],
 )
 def test_snapshot_columns_have_types_perform_checks(
-    columns: Iterable[ManifestColumn],
+    snapshots: Iterable[dict],
     expected_failures: set[str],
 ):
     with (
@@ -55,10 +53,13 @@ def test_snapshot_columns_have_types_perform_checks(
             SnapshotColumnsHaveTypes, "manifest", new_callable=PropertyMock
         ) as mock_manifest,
     ):
-        mock_in_scope_columns = PropertyMock(return_value=columns)
+        column_store = ColumnStore.from_parents(
+            ManifestSnapshot(snapshot_data) for snapshot_data in snapshots
+        )
+        mock_in_scope_columns = PropertyMock(return_value=column_store)
         type(
             mock_manifest.return_value
-        ).in_scope_snapshot_columns = mock_in_scope_columns
+        ).in_scope_snapshot_column_store = mock_in_scope_columns
         instance = SnapshotColumnsHaveTypes(Namespace())
         instance.perform_check()
         assert instance.check_name == "snapshot-columns-have-types"
@@ -8,6 +8,7 @@ from checks.source_checks.source_columns_have_descriptions import (
     SourceColumnsHaveDescriptions,
 )
 from utils.check_abc import STANDARD_SOURCE_ARGUMENTS
+from utils.column_store import ColumnStore
 from utils.manifest_object.manifest_object import ManifestSource
 
 
@@ -68,15 +69,13 @@ def test_source_columns_have_descriptions_perform_checks(
             SourceColumnsHaveDescriptions, "manifest", new_callable=PropertyMock
         ) as mock_manifest,
     ):
-        columns = [
-            column
-            for source_data in sources
-            for column in ManifestSource(source_data).columns
-        ]
-        mock_in_scope_source_columns = PropertyMock(return_value=columns)
+        column_store = ColumnStore.from_parents(
+            ManifestSource(source_data) for source_data in sources
+        )
+        mock_in_scope_source_columns = PropertyMock(return_value=column_store)
         type(
             mock_manifest.return_value
-        ).in_scope_source_columns = mock_in_scope_source_columns
+        ).in_scope_source_column_store = mock_in_scope_source_columns
         instance = SourceColumnsHaveDescriptions(Namespace())
         instance.perform_check()
         assert instance.check_name == "source-columns-have-descriptions"
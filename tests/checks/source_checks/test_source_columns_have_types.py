@@ -6,6 +6,7 @@ import pytest
 
 from checks.source_checks.source_columns_have_types import SourceColumnsHaveTypes
 from utils.check_abc import STANDARD_SOURCE_ARGUMENTS
+from utils.column_store import ColumnStore
 from utils.manifest_object.manifest_object import ManifestSource
 
 
@@ -66,15 +67,13 @@ def test_source_columns_have_types_perform_checks(
             SourceColumnsHaveTypes, "manifest", new_callable=PropertyMock
         ) as mock_manifest,
     ):
-        columns = [
-            column
-            for source_data in sources
-            for column in ManifestSource(source_data).columns
-        ]
-        mock_in_scope_source_columns = PropertyMock(return_value=columns)
+        column_store = ColumnStore.from_parents(
+            ManifestSource(source_data) for source_data in sources
+        )
+        mock_in_scope_source_columns = PropertyMock(return_value=column_store)
         type(
             mock_manifest.return_value
-        ).in_scope_source_columns = mock_in_scope_source_columns
+        ).in_scope_source_column_store = mock_in_scope_source_columns
         instance = SourceColumnsHaveTypes(Namespace())
         instance.perform_check()
         assert instance.check_name == "source-columns-have-types"
@@ -0,0 +1,10 @@
+import pytest
+
+from utils.artifact_data import get_artifact_session
+
+
+@pytest.fixture(autouse=True)
+def clear_artifact_sessions():
+    get_artifact_session.cache_clear()
+    yield
+    get_artifact_session.cache_clear()
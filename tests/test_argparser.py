@@ -7,8 +7,14 @@ from unittest.mock import patch
 import pytest
 from _pytest.raises import RaisesExc
 
-from checks import ALL_CHECKS
-from checks.argparser import CliArgument, parse_cli_entrypoint_args
+from checks import ALL_CHECKS, ALL_CHECKS_MAP
+from checks.argparser import (
+    CliArgument,
+    get_all_checks_parser,
+    get_check_parser,
+    get_entrypoint_parser,
+    parse_cli_entrypoint_args,
+)
 from utils.check_abc import (
     STANDARD_MACRO_ARGUMENTS,
     STANDARD_MODEL_ARGUMENTS,
@@ -18,7 +24,10 @@ from utils.check_abc import (
 DEFAULTS = {
     arg: None
     for arg in set(
-        STANDARD_MODEL_ARGUMENTS + STANDARD_MACRO_ARGUMENTS + STANDARD_SOURCE_ARGUMENTS
+        STANDARD_MODEL_ARGUMENTS
+        + STANDARD_MACRO_ARGUMENTS
+        + STANDARD_SOURCE_ARGUMENTS
+        + ["result_cache_dir", "state", "state_selector", "manifest_representation"]
     )
 }
 
@@ -46,6 +55,7 @@ DEFAULTS = {
             Namespace(
                 project_dir=Path.cwd(),
                 manifest_dir=Path.cwd() / "target",
+                cache_dir=Path.cwd() / "target" / ".dbtra_cache",
                 catalog_dir=Path.cwd() / "target",
                 config_dir=Path("path/to/project"),
                 files=None,
@@ -61,6 +71,7 @@ DEFAULTS = {
             Namespace(
                 project_dir=Path.cwd(),
                 manifest_dir=Path.cwd() / "target",
+                cache_dir=Path.cwd() / "target" / ".dbtra_cache",
                 catalog_dir=Path.cwd() / "target",
                 config_dir=None,
                 files=None,
@@ -80,6 +91,7 @@ DEFAULTS = {
             Namespace(
                 project_dir=Path.cwd(),
                 manifest_dir=Path.cwd() / "target",
+                cache_dir=Path.cwd() / "target" / ".dbtra_cache",
                 catalog_dir=Path.cwd() / "target",
                 must_have_all_constraints_from=["primary_key"],
                 must_have_any_constraint_from=None,
@@ -106,6 +118,40 @@ def test_parse_cli_entrypoint_args(
         mock_print_help.assert_called_with(sys.stderr)
 
 
+@pytest.mark.parametrize(
+    ids=[
+        "default",
+        "cache dir",
+        "no cache dir",
+        "empty cache dir",
+        "environment variable",
+        "empty environment variable",
+        "cache dir over environment variable",
+    ],
+    argnames=["arguments", "environment", "expected_cache_dir"],
+    argvalues=[
+        ([], {}, Path("target/.dbtra_cache")),
+        (["--cache-dir", "cache"], {}, Path("cache")),
+        (["--no-cache-dir"], {}, None),
+        (["--cache-dir", ""], {}, None),
+        ([], {"DBTRA_CACHE_DIR": "cache"}, Path("cache")),
+        ([], {"DBTRA_CACHE_DIR": ""}, None),
+        (["--cache-dir", "cache"], {"DBTRA_CACHE_DIR": ""}, Path("cache")),
+    ],
+)
+def test_parse_cli_entrypoint_args_cache_dir(
+    arguments: list[str],
+    environment: dict[str, str],
+    expected_cache_dir: Path | None,
+):
+    with patch.dict("os.environ", environment, clear=True):
+        args = parse_cli_entrypoint_args(
+            ["models-have-descriptions", "--manifest-dir", "target", *arguments],
+            ALL_CHECKS,
+        )
+    assert args.cache_dir == expected_cache_dir
+
+
 @pytest.mark.parametrize(
     argnames=["name", "expected_cli_arg_name"],
     ids=["One word", "Two words"],
@@ -121,3 +167,37 @@ def test_cli_argument_cli_name(name: str, expected_cli_arg_name: str):
         type=str,
     )
     assert arg.cli_name == expected_cli_arg_name
+
+
+@pytest.mark.parametrize(
+    ids=[check.check_name for check in ALL_CHECKS] + ["all-checks"],
+    argnames=["argv"],
+    argvalues=[
+        ([check.check_name, "--config-dir", "a", "--files", "b.sql"],)
+        for check in ALL_CHECKS
+    ]
+    + [(["all-checks", "-j", "2", "b.sql"],)],
+)
+def test_subcommand_parsers_match_entrypoint_parser(argv: list[str]):
+    assert get_entrypoint_parser(ALL_CHECKS).parse_args(argv) == (
+        get_all_checks_parser()
+        if argv[0] == "all-checks"
+        else get_check_parser(ALL_CHECKS_MAP.specs[argv[0]])
+    ).parse_args(argv[1:])
+
+
+def test_parse_cli_entrypoint_args_builds_only_the_selected_parser():
+    get_entrypoint_parser.cache_clear()
+    get_check_parser.cache_clear()
+    parse_cli_entrypoint_args(["models-have-tags"], ALL_CHECKS)
+    parse_cli_entrypoint_args(["models-have-tags", "-c", "a"], ALL_CHECKS)
+    assert get_entrypoint_parser.cache_info().currsize == 0
+    assert get_check_parser.cache_info() == get_check_parser.cache_info()._replace(
+        hits=1, misses=1, currsize=1
+    )
+
+
+def test_parse_cli_entrypoint_args_unknown_subcommand(capsys):
+    with pytest.raises(SystemExit, match=r"^2$"):
+        parse_cli_entrypoint_args(["not-a-check"], ALL_CHECKS)
+    assert "invalid choice: 'not-a-check'" in capsys.readouterr().err
@@ -0,0 +1,168 @@
+import logging
+import os
+import socket
+import stat
+import tempfile
+import threading
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from checks.daemon import ArtifactWatcher, CheckServer, ConfigCache
+from checks.entrypoint import entrypoint
+from utils.config import PROJECT_NAME
+from utils.daemon_client import request_run
+
+
+@pytest.fixture
+def server():
+    # Unix socket paths are limited to about 100 characters, so avoid tmp_path.
+    with tempfile.TemporaryDirectory() as directory:
+        with CheckServer(Path(directory) / "dbtra.sock") as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            yield server
+            server.shutdown()
+            thread.join()
+        assert not server.socket_path.exists()
+
+
+def fake_run_all_checks(all_check_arguments, jobs):
+    logging.info("running checks")
+    raise SystemExit("1/1 checks failed")
+
+
+def test_check_server_round_trip(server: CheckServer, caplog):
+    caplog.set_level(logging.INFO)
+    with (
+        patch(
+            "checks.daemon.configure_entrypoint",
+            return_value=(Namespace(jobs=1), []),
+        ) as mock_configure_entrypoint,
+        patch("checks.daemon.run_all_checks", side_effect=fake_run_all_checks),
+    ):
+        response = request_run(
+            ["all-checks", "-c", "."], Path.cwd(), server.socket_path
+        )
+    assert response is not None
+    assert response["exit_code"] == 1
+    assert "running checks\n" in response["stderr"]
+    assert response["stderr"].endswith("1/1 checks failed\n")
+    assert mock_configure_entrypoint.call_args.args == (["all-checks", "-c", "."],)
+    assert request_run(["all-checks"], Path("/elsewhere"), server.socket_path) is None
+
+
+def test_check_server_socket_is_private():
+    umask = os.umask(0o022)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            with CheckServer(Path(directory) / "dbtra.sock") as server:
+                socket_mode = stat.S_IMODE(server.socket_path.stat().st_mode)
+                assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(umask)
+    assert socket_mode & 0o077 == 0
+
+
+def test_check_server_does_not_replace_running_daemon(server: CheckServer):
+    with pytest.raises(FileExistsError, match="already listening"):
+        CheckServer(server.socket_path)
+    assert server.socket_path.exists()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(server.socket_path))
+
+
+def test_check_server_replaces_stale_socket():
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = Path(directory) / "dbtra.sock"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+            stale_socket.bind(str(socket_path))
+        assert socket_path.exists()
+        with CheckServer(socket_path) as server:
+            assert server.is_bound
+        assert not socket_path.exists()
+
+
+@pytest.mark.parametrize(
+    ids=["passed", "usage error", "failed", "crashed"],
+    argnames=[
+        "side_effect",
+        "expected_exit_code",
+        "expected_stderr",
+        "expected_dependencies",
+    ],
+    argvalues=[
+        (SystemExit(0), 0, "", {}),
+        (SystemExit(2), 2, "", {}),
+        (SystemExit("1/1 checks failed"), 1, "1/1 checks failed\n", {}),
+        (
+            FileNotFoundError("manifest.json"),
+            1,
+            "FileNotFoundError: manifest.json\n",
+            None,
+        ),
+    ],
+)
+def test_check_server_run_request(
+    server: CheckServer,
+    side_effect,
+    expected_exit_code,
+    expected_stderr,
+    expected_dependencies,
+):
+    with (
+        patch(
+            "checks.daemon.configure_entrypoint",
+            return_value=(Namespace(jobs=1), []),
+        ),
+        patch("checks.daemon.run_all_checks", side_effect=side_effect),
+    ):
+        response = server.run_request({"argv": [], "cwd": str(Path.cwd())})
+    assert response["exit_code"] == expected_exit_code
+    assert response["stderr"].endswith(expected_stderr)
+    assert response["dependencies"] == expected_dependencies
+
+
+def test_check_server_run_request_usage_error(server: CheckServer):
+    with patch("checks.daemon.configure_entrypoint", side_effect=SystemExit(2)):
+        response = server.run_request({"argv": [], "cwd": str(Path.cwd())})
+    assert response["exit_code"] == 2
+    assert response["dependencies"] is None
+
+
+def test_artifact_watcher_refresh(tmp_path: Path):
+    (tmp_path / "manifest.json").write_text("{}")
+    all_check_arguments = [Namespace(manifest_dir=tmp_path, catalog_dir=tmp_path)]
+    watcher = ArtifactWatcher()
+    with (
+        patch("checks.daemon.get_artifact_session") as mock_get_artifact_session,
+        patch("checks.daemon.load_json_artifact") as mock_load_json_artifact,
+    ):
+        assert watcher.refresh(all_check_arguments) is False
+        assert watcher.refresh(all_check_arguments) is False
+        mock_get_artifact_session.cache_clear.assert_not_called()
+        (tmp_path / "catalog.json").write_text("{}")
+        assert watcher.refresh(all_check_arguments) is True
+        (tmp_path / "manifest.json").write_text('{"nodes": {}}')
+        assert watcher.refresh(all_check_arguments) is True
+    assert mock_get_artifact_session.cache_clear.call_count == 2
+    assert mock_load_json_artifact.cache_clear.call_count == 2
+
+
+def test_config_cache_load(tmp_path: Path):
+    config_path = tmp_path / f".{PROJECT_NAME}.yaml"
+    config_path.write_text("per_check_arguments: []")
+    cache = ConfigCache()
+    with patch("checks.daemon.load_config", side_effect=[{"a": 1}, {"b": 2}]):
+        assert cache.load(tmp_path) == {"a": 1}
+        assert cache.load(tmp_path) == {"a": 1}
+        config_path.write_text("per_check_arguments: [] ")
+        assert cache.load(tmp_path) == {"b": 2}
+
+
+def test_entrypoint_serve():
+    with patch("checks.daemon.serve_main") as mock_serve_main:
+        entrypoint(["serve", "--socket", "dbtra.sock"])
+    mock_serve_main.assert_called_once_with(["--socket", "dbtra.sock"])
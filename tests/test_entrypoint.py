@@ -1,6 +1,9 @@
 import logging
+import os
 import re
 import sys
+import time
+import warnings
 from argparse import Namespace
 from pathlib import Path
 from unittest.mock import patch
@@ -9,21 +12,33 @@ import pytest
 
 from checks import ModelsHaveColumns, ModelsHaveDescriptions
 from checks.entrypoint import (
+    ProcessPoolExecutor,
+    ThreadLogBuffers,
+    ThreadPoolExecutor,
     convert_to_paths_relative_to_project_dir,
     count_failures,
     entrypoint,
+    get_executor,
+    is_gil_enabled,
+    preload_artifacts,
+    run_check_buffering_logs,
 )
 from utils.check_abc import (
     STANDARD_MACRO_ARGUMENTS,
     STANDARD_MODEL_ARGUMENTS,
     STANDARD_SOURCE_ARGUMENTS,
 )
+from utils.check_plan import CheckPlan, SequentialExecutor
 from utils.console_formatting import check_status_header
+from utils.run_cache import RUN_CACHE_DIR_ENV_VAR
 
 DEFAULTS = {
     arg: None
     for arg in set(
-        STANDARD_MODEL_ARGUMENTS + STANDARD_MACRO_ARGUMENTS + STANDARD_SOURCE_ARGUMENTS
+        STANDARD_MODEL_ARGUMENTS
+        + STANDARD_MACRO_ARGUMENTS
+        + STANDARD_SOURCE_ARGUMENTS
+        + ["result_cache_dir", "state", "state_selector", "manifest_representation"]
     )
 }
 
@@ -86,6 +101,7 @@ DEFAULTS = {
                 Namespace(
                     project_dir=Path.cwd() / "path/to/project/",
                     manifest_dir=Path.cwd() / "path/to/project/target/",
+                    cache_dir=Path.cwd() / "path/to/project/target/" / ".dbtra_cache",
                     catalog_dir=Path.cwd() / "path/to/project/target/",
                     config_dir=None,
                     files=[Path("test.sql"), Path("test.yml")],
@@ -95,6 +111,7 @@ DEFAULTS = {
                 Namespace(
                     project_dir=Path.cwd() / "path/to/project/",
                     manifest_dir=Path.cwd() / "path/to/project/target/",
+                    cache_dir=Path.cwd() / "path/to/project/target/" / ".dbtra_cache",
                     catalog_dir=Path.cwd() / "path/to/project/target/",
                     config_dir=None,
                     files=[Path("test.sql"), Path("test.yml")],
@@ -137,6 +154,7 @@ DEFAULTS = {
                 Namespace(
                     project_dir=Path.cwd() / "path/to/project/",
                     manifest_dir=Path.cwd() / "path/to/project/target/",
+                    cache_dir=Path.cwd() / "path/to/project/target/" / ".dbtra_cache",
                     catalog_dir=Path.cwd() / "path/to/project/target/",
                     config_dir=None,
                     files=[Path("test.sql"), Path("test.yml")],
@@ -146,6 +164,7 @@ DEFAULTS = {
                 Namespace(
                     project_dir=Path.cwd() / "path/to/project/",
                     manifest_dir=Path.cwd() / "path/to/project/target/",
+                    cache_dir=Path.cwd() / "path/to/project/target/" / ".dbtra_cache",
                     catalog_dir=Path.cwd() / "path/to/project/target/",
                     config_dir=None,
                     files=[Path("test.sql"), Path("test.yml")],
@@ -188,6 +207,7 @@ DEFAULTS = {
                 Namespace(
                     project_dir=Path.cwd() / "path/to/project/",
                     manifest_dir=Path.cwd() / "path/to/project/target/",
+                    cache_dir=Path.cwd() / "path/to/project/target/" / ".dbtra_cache",
                     catalog_dir=Path.cwd() / "path/to/project/target/",
                     config_dir=None,
                     files=[Path("test.sql"), Path("test.yml")],
@@ -197,6 +217,7 @@ DEFAULTS = {
                 Namespace(
                     project_dir=Path.cwd() / "path/to/project/",
                     manifest_dir=Path.cwd() / "path/to/project/target/",
+                    cache_dir=Path.cwd() / "path/to/project/target/" / ".dbtra_cache",
                     catalog_dir=Path.cwd() / "path/to/project/target/",
                     config_dir=None,
                     files=[Path("test.sql"), Path("test.yml")],
@@ -238,6 +259,7 @@ DEFAULTS = {
                 Namespace(
                     project_dir=Path.cwd() / "path/to/project/",
                     manifest_dir=Path.cwd() / "path/to/project/target/",
+                    cache_dir=Path.cwd() / "path/to/project/target/" / ".dbtra_cache",
                     catalog_dir=Path.cwd() / "path/to/project/target/",
                     config_dir=None,
                     files=[Path("test.sql"), Path("test.yml")],
@@ -277,6 +299,7 @@ DEFAULTS = {
                 Namespace(
                     project_dir=Path.cwd() / "path/to/project/",
                     manifest_dir=Path.cwd() / "path/to/project/target/",
+                    cache_dir=Path.cwd() / "path/to/project/target/" / ".dbtra_cache",
                     catalog_dir=Path.cwd() / "path/to/project/target/",
                     config_dir=None,
                     files=[Path("test.sql"), Path("test.yml")],
@@ -313,7 +336,80 @@ def test_entrypoint(
     if expected_info_msg:
         mock_info.assert_called_with(expected_info_msg)
     if expected_check_arguments:
-        mock_count_failures.assert_called_with(expected_check_arguments)
+        mock_count_failures.assert_called_with(expected_check_arguments, jobs=1)
+
+
+def test_entrypoint_replays_recorded_runs(monkeypatch, tmp_path: Path, capsys):
+    monkeypatch.setenv(RUN_CACHE_DIR_ENV_VAR, str(tmp_path / "runs"))
+    manifest_path = tmp_path / "target" / "manifest.json"
+    manifest_path.parent.mkdir()
+    argv = ["models-have-descriptions", "--project-dir", str(tmp_path)]
+
+    def count_failures(all_check_arguments, jobs):
+        logging.error("models-have-descriptions failed")
+        return 1
+
+    with patch(
+        "checks.entrypoint.count_failures", side_effect=count_failures
+    ) as mock_count_failures:
+        for manifest_text, expected_call_count in (("{}", 1), (None, 1), ("[]", 2)):
+            if manifest_text is not None:
+                manifest_path.write_text(manifest_text)
+                modified_at = time.time() - 10
+                os.utime(manifest_path, (modified_at, modified_at))
+            with pytest.raises(SystemExit) as exc_info:
+                entrypoint(argv)
+            assert exc_info.value.code == check_status_header(
+                "1/1 checks failed", False
+            )
+            assert mock_count_failures.call_count == expected_call_count
+            if manifest_text is None:
+                assert capsys.readouterr().err == "models-have-descriptions failed\n"
+
+
+def test_entrypoint_replays_identical_output(monkeypatch, tmp_path: Path, capsys):
+    monkeypatch.setenv(RUN_CACHE_DIR_ENV_VAR, str(tmp_path / "runs"))
+    manifest_path = tmp_path / "target" / "manifest.json"
+    manifest_path.parent.mkdir()
+    manifest_path.write_text("{}")
+    modified_at = time.time() - 10
+    os.utime(manifest_path, (modified_at, modified_at))
+    argv = ["models-have-descriptions", "--project-dir", str(tmp_path)]
+
+    def count_failures(all_check_arguments, jobs):
+        logging.error("models-have-descriptions failed")
+        warnings.warn("The config file does not match its schema")
+        print("printed to stdout")
+        return 1
+
+    def show_warning(message, category, filename, lineno, file=None, line=None):
+        sys.stderr.write(
+            warnings.formatwarning(message, category, filename, lineno, line)
+        )
+
+    root_logger = logging.getLogger()
+    handler = logging.StreamHandler(sys.stderr)
+    root_logger.addHandler(handler)
+    outputs = []
+    try:
+        with (
+            warnings.catch_warnings(),
+            patch.object(warnings, "showwarning", show_warning),
+            patch(
+                "checks.entrypoint.count_failures", side_effect=count_failures
+            ) as mock_count_failures,
+        ):
+            warnings.simplefilter("always")
+            for _ in range(2):
+                with pytest.raises(SystemExit):
+                    entrypoint(argv)
+                outputs.append(capsys.readouterr())
+    finally:
+        root_logger.removeHandler(handler)
+    mock_count_failures.assert_called_once()
+    assert "The config file does not match its schema" in outputs[0].err
+    assert outputs[0].out == "printed to stdout\n"
+    assert outputs[1] == outputs[0]
 
 
 def test_convert_to_paths_relative_to_project_dir():
@@ -347,8 +443,137 @@ def test_count_failures():
         ) as mock_init_1,
         patch.object(ModelsHaveColumns, "failures", True),
         patch.object(ModelsHaveColumns, "__init__", return_value=None) as mock_init_2,
+        patch("utils.check_plan.run_checks") as mock_run_checks,
     ):
         actual = count_failures(all_arguments)
         assert actual == 1
-        mock_init_1.assert_called_with(all_arguments[0])
-        mock_init_2.assert_called_with(all_arguments[1])
+        mock_init_1.assert_called_with(all_arguments[0], run=False)
+        mock_init_2.assert_called_with(all_arguments[1], run=False)
+        assert [type(check) for check in mock_run_checks.call_args.args[0]] == [
+            ModelsHaveDescriptions,
+            ModelsHaveColumns,
+        ]
+
+
+class FakeCheck:
+    """Check stand-in which logs its id and fails if its id says so."""
+
+    manifest_sections = frozenset({"nodes"})
+    resource_types = frozenset({"model"})
+
+    def __init__(self, args: Namespace, run: bool = True):
+        self.args = args
+        if run:
+            self.log_start()
+            self.perform_check()
+            self.log_result()
+
+    def log_start(self):
+        logging.info(f"running {self.args.check_id}")
+
+    def perform_check(self):
+        self.has_failures = self.args.check_id.startswith("fail")
+
+    def log_result(self):
+        pass
+
+
+FAKE_CHECKS_MAP = {
+    check_id: FakeCheck for check_id in ("pass-1", "fail-1", "pass-2", "fail-2")
+}
+
+
+def test_run_check_buffering_logs(caplog):
+    with (
+        caplog.at_level(logging.INFO),
+        patch("checks.entrypoint.ALL_CHECKS_MAP", FAKE_CHECKS_MAP),
+    ):
+        has_failures, records = run_check_buffering_logs(Namespace(check_id="fail-1"))
+    assert has_failures is True
+    assert [record.getMessage() for record in records] == ["running fail-1"]
+    assert caplog.records == []
+
+
+@pytest.mark.parametrize(
+    argnames=["jobs", "gil_enabled"],
+    argvalues=[(1, True), (2, True), (4, True), (2, False), (4, False)],
+)
+def test_count_failures_in_parallel(caplog, jobs: int, gil_enabled: bool):
+    all_arguments = [Namespace(check_id=check_id) for check_id in FAKE_CHECKS_MAP] * 3
+    with (
+        caplog.at_level(logging.INFO),
+        patch("checks.entrypoint.ALL_CHECKS_MAP", FAKE_CHECKS_MAP),
+        patch("checks.entrypoint.is_gil_enabled", return_value=gil_enabled),
+        patch("checks.entrypoint.preload_artifacts") as mock_preload_artifacts,
+    ):
+        assert count_failures(all_arguments, jobs=jobs) == 6
+    assert caplog.messages == [
+        f"running {arguments.check_id}" for arguments in all_arguments
+    ]
+    if jobs > 1:
+        mock_preload_artifacts.assert_called_once()
+        assert [
+            planned_check.args
+            for planned_check in mock_preload_artifacts.call_args.args[0].checks
+        ] == all_arguments
+
+
+def test_thread_log_buffers_passes_on_records_outside_checks(caplog):
+    caplog.set_level(logging.INFO)
+    buffers = ThreadLogBuffers([caplog.handler])
+    buffers.handle(
+        logging.makeLogRecord({"msg": "outside a check", "levelno": logging.INFO})
+    )
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers
+    root_logger.handlers = [buffers]
+    try:
+        with patch("checks.entrypoint.ALL_CHECKS_MAP", FAKE_CHECKS_MAP):
+            has_failures, records = buffers.run_check(Namespace(check_id="fail-1"))
+    finally:
+        root_logger.handlers = handlers
+    assert has_failures is True
+    assert [record.getMessage() for record in records] == ["running fail-1"]
+    assert caplog.messages == ["outside a check"]
+
+
+def test_preload_artifacts():
+    all_arguments = [Namespace(check_id="pass-1"), Namespace(check_id="fail-1")]
+    with (
+        patch("checks.entrypoint.ALL_CHECKS_MAP", FAKE_CHECKS_MAP),
+        patch("checks.entrypoint.get_check_session") as mock_get_check_session,
+    ):
+        mock_get_check_session.return_value.data.loaded_sections = {"nodes"}
+        preload_artifacts(CheckPlan.build(all_arguments, FAKE_CHECKS_MAP))
+    mock_get_check_session.return_value.data.load.assert_called_with(
+        frozenset({"nodes"})
+    )
+    assert mock_get_check_session.call_count == 2
+
+
+@pytest.mark.parametrize(
+    argnames=["sys_is_gil_enabled", "expected_return"],
+    argvalues=[(None, True), (lambda: True, True), (lambda: False, False)],
+)
+def test_is_gil_enabled(sys_is_gil_enabled, expected_return: bool):
+    with patch.object(sys, "_is_gil_enabled", sys_is_gil_enabled, create=True):
+        assert is_gil_enabled() is expected_return
+
+
+@pytest.mark.parametrize(
+    argnames=["jobs", "check_count", "gil_enabled", "expected_type"],
+    argvalues=[
+        (1, 4, True, SequentialExecutor),
+        (4, 1, True, SequentialExecutor),
+        (4, 4, True, ProcessPoolExecutor),
+        (4, 4, False, ThreadPoolExecutor),
+    ],
+)
+def test_get_executor(jobs: int, check_count: int, gil_enabled: bool, expected_type):
+    plan = CheckPlan.build(
+        [Namespace(check_id="pass-1")] * check_count, FAKE_CHECKS_MAP
+    )
+    with patch("checks.entrypoint.is_gil_enabled", return_value=gil_enabled):
+        executor = get_executor(plan, jobs)
+    assert type(executor) is expected_type
+    assert getattr(executor, "jobs", jobs) == jobs
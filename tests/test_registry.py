@@ -0,0 +1,96 @@
+import json
+import os
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+
+import checks
+from checks import ALL_CHECKS, ALL_CHECKS_MAP, ModelsHaveTags
+from checks.model_checks.models_have_tags import (
+    ModelsHaveTags as ImportedModelsHaveTags,
+)
+from checks.registry import CheckRegistry, CheckSpec
+
+# Modules which must not be imported before a check runs, or fails.
+IMPORT_BUDGET_EXCLUDED_MODULES = (
+    "importlib.metadata",
+    "jinja2",
+    "jsonschema",
+    "multiprocessing",
+    "prettytable",
+    "yaml",
+)
+
+
+def get_imported_modules(statement: str) -> set[str]:
+    completed_process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import json, sys; {statement}; print(json.dumps(list(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    return set(json.loads(completed_process.stdout))
+
+
+@pytest.mark.parametrize(
+    ids=[spec.check_name for spec in ALL_CHECKS],
+    argnames=["spec"],
+    argvalues=[(spec,) for spec in ALL_CHECKS],
+)
+def test_check_spec_matches_check_class(spec: CheckSpec):
+    check_class = spec.check_class
+    assert check_class.__name__ == spec.class_name
+    assert check_class.check_name == spec.check_name
+    assert check_class.additional_arguments == spec.additional_arguments
+    assert check_class.resource_types == spec.resource_types
+
+
+def test_check_specs_cover_every_check_module():
+    check_modules = {
+        module.name
+        for module in pkgutil.walk_packages(checks.__path__, prefix="checks.")
+        if not module.ispkg and module.name.count(".") == 2
+    }
+    assert {spec.module_name for spec in ALL_CHECKS} == check_modules
+    assert len(ALL_CHECKS_MAP) == len(ALL_CHECKS)
+
+
+def test_check_registry():
+    registry = CheckRegistry(ALL_CHECKS)
+    assert registry["models-have-tags"] is ImportedModelsHaveTags
+    assert list(registry)[0] == ALL_CHECKS[0].check_name
+    with pytest.raises(KeyError):
+        registry["not-a-check"]
+
+
+def test_check_classes_are_package_attributes():
+    assert ModelsHaveTags is ImportedModelsHaveTags
+    assert "ModelsHaveTags" in dir(checks)
+    with pytest.raises(AttributeError):
+        checks.NotACheck
+
+
+def test_entrypoint_import_budget():
+    imported_modules = get_imported_modules("import checks.entrypoint")
+    assert not {
+        module
+        for module in imported_modules
+        if module.startswith(IMPORT_BUDGET_EXCLUDED_MODULES)
+        or (module.startswith("checks.") and module.count(".") == 2)
+    }
+
+
+def test_check_imports_only_its_module():
+    imported_modules = get_imported_modules(
+        "from checks import ALL_CHECKS_MAP; ALL_CHECKS_MAP['models-have-tags']"
+    )
+    assert "checks.model_checks.models_have_tags" in imported_modules
+    assert "checks.model_checks.models_have_columns" not in imported_modules
+    assert "prettytable" not in imported_modules
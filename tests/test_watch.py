@@ -0,0 +1,244 @@
+import json
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from checks import ALL_CHECKS_MAP
+from checks.entrypoint import entrypoint
+from checks.watch import CheckWatcher
+from utils.artifact_data import SUPPORTED_MANIFEST_SCHEMA_VERSION
+from utils.config import PROJECT_NAME
+
+
+def write_manifest(manifest_dir: Path, descriptions: dict[str, str]) -> None:
+    nodes = {
+        f"model.pkg.{name}": {
+            "unique_id": f"model.pkg.{name}",
+            "resource_type": "model",
+            "package_name": "pkg",
+            "original_file_path": f"models/{name}.sql",
+            "patch_path": "pkg://models/schema.yml" if name != "c" else None,
+            "description": description,
+        }
+        for name, description in descriptions.items()
+    }
+    manifest_data = {
+        "metadata": {"dbt_schema_version": SUPPORTED_MANIFEST_SCHEMA_VERSION},
+        "nodes": nodes,
+        "parent_map": {unique_id: [] for unique_id in nodes},
+        "child_map": {unique_id: [] for unique_id in nodes},
+    }
+    (manifest_dir / "manifest.json").write_text(json.dumps(manifest_data))
+
+
+@pytest.fixture
+def watcher(tmp_path: Path):
+    write_manifest(tmp_path, {"a": "", "b": "", "c": ""})
+    (tmp_path / f".{PROJECT_NAME}.yaml").write_text("per_check_arguments: []")
+    all_check_arguments = [
+        Namespace(
+            check_id=check_id,
+            manifest_dir=tmp_path,
+            catalog_dir=tmp_path,
+            files=[],
+        )
+        for check_id in (
+            "models-have-descriptions",
+            "macros-have-descriptions",
+            "model-column-names-match-manifest-vs-catalog",
+        )
+    ]
+    with patch(
+        "checks.watch.configure_entrypoint",
+        return_value=(Namespace(config_dir=tmp_path, jobs=1), all_check_arguments),
+    ):
+        yield CheckWatcher([])
+
+
+def test_check_watcher_watched_paths(watcher: CheckWatcher, tmp_path: Path):
+    assert watcher.watched_paths == {
+        tmp_path / f".{PROJECT_NAME}.yaml",
+        tmp_path / "manifest.json",
+        tmp_path / "catalog.json",
+    }
+
+
+def test_check_watcher_poll(watcher: CheckWatcher, tmp_path: Path):
+    assert watcher.poll() == set()
+    (tmp_path / "catalog.json").write_text("{}")
+    assert watcher.poll() == set()
+    assert watcher.poll() == {tmp_path / "catalog.json"}
+    assert watcher.poll() == set()
+
+
+@pytest.mark.parametrize(
+    ids=["changed object", "changed object in shared file", "unchanged", "removed"],
+    argnames=["descriptions", "expected_unique_ids"],
+    argvalues=[
+        ({"a": "", "b": "", "c": "C"}, ["model.pkg.c"]),
+        ({"a": "A", "b": "", "c": ""}, ["model.pkg.a"]),
+        ({"a": "", "b": "", "c": ""}, None),
+        ({"a": "", "b": ""}, None),
+    ],
+)
+def test_check_watcher_handle_manifest_changes(
+    watcher: CheckWatcher, tmp_path: Path, descriptions, expected_unique_ids
+):
+    watcher.run(watcher.all_check_arguments[:1], "Started watching")
+    with patch("checks.watch.count_failures", return_value=0) as mock_count_failures:
+        write_manifest(tmp_path, descriptions)
+        watcher.handle_changes({tmp_path / "manifest.json"})
+    assert mock_count_failures.call_count == (1 if expected_unique_ids else 0)
+    if expected_unique_ids:
+        rerun_arguments = mock_count_failures.call_args.args[0]
+        assert [arguments.check_id for arguments in rerun_arguments] == [
+            "models-have-descriptions",
+            "model-column-names-match-manifest-vs-catalog",
+        ]
+        assert all(
+            arguments.include_modified_unique_ids == expected_unique_ids
+            for arguments in rerun_arguments
+        )
+    assert not any(
+        hasattr(arguments, "include_modified_unique_ids")
+        for arguments in watcher.all_check_arguments
+    )
+
+
+def test_check_watcher_handle_catalog_changes(watcher: CheckWatcher, tmp_path: Path):
+    with patch("checks.watch.count_failures", return_value=0) as mock_count_failures:
+        watcher.handle_changes({tmp_path / "catalog.json"})
+    assert mock_count_failures.call_args.args[0] == [watcher.all_check_arguments[2]]
+
+
+def test_check_watcher_handle_config_changes(watcher: CheckWatcher, tmp_path: Path):
+    with (
+        patch(
+            "checks.watch.configure_entrypoint",
+            return_value=(watcher.cli_args, watcher.all_check_arguments[:1]),
+        ) as mock_configure_entrypoint,
+        patch("checks.watch.count_failures", return_value=1) as mock_count_failures,
+    ):
+        watcher.handle_changes({tmp_path / f".{PROJECT_NAME}.yaml"})
+    mock_configure_entrypoint.assert_called_once_with([])
+    assert len(watcher.all_check_arguments) == 1
+    assert mock_count_failures.call_args.args[0] == watcher.all_check_arguments
+
+
+def test_entrypoint_watch():
+    with patch("checks.watch.watch_main") as mock_watch_main:
+        entrypoint(["watch", "--poll-interval", "0.5"])
+    mock_watch_main.assert_called_once_with(["--poll-interval", "0.5"])
+
+
+def test_check_watcher_handle_test_changes_with_cache(tmp_path: Path):
+    def write_tested_manifest(test_checksum: str) -> None:
+        manifest_data = {
+            "metadata": {"dbt_schema_version": SUPPORTED_MANIFEST_SCHEMA_VERSION},
+            "nodes": {
+                "model.pkg.a": {
+                    "unique_id": "model.pkg.a",
+                    "name": "a",
+                    "resource_type": "model",
+                    "package_name": "pkg",
+                    "original_file_path": "models/a.sql",
+                },
+                "test.pkg.not_null_a_id": {
+                    "unique_id": "test.pkg.not_null_a_id",
+                    "name": "not_null_a_id",
+                    "resource_type": "test",
+                    "package_name": "pkg",
+                    "original_file_path": "models/schema.yml",
+                    "checksum": {"name": "sha256", "checksum": test_checksum},
+                },
+            },
+            "parent_map": {
+                "model.pkg.a": [],
+                "test.pkg.not_null_a_id": ["model.pkg.a"],
+            },
+            "child_map": {
+                "model.pkg.a": ["test.pkg.not_null_a_id"],
+                "test.pkg.not_null_a_id": [],
+            },
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest_data))
+
+    write_tested_manifest("1")
+    (tmp_path / f".{PROJECT_NAME}.yaml").write_text("per_check_arguments: []")
+    check_arguments = Namespace(
+        check_id="models-have-data-tests",
+        manifest_dir=tmp_path,
+        catalog_dir=tmp_path,
+        cache_dir=tmp_path / "cache",
+        files=[],
+        must_have_all_data_tests_from=None,
+        must_have_any_data_test_from=None,
+    )
+    with patch(
+        "checks.watch.configure_entrypoint",
+        return_value=(Namespace(config_dir=tmp_path, jobs=1), [check_arguments]),
+    ):
+        watcher = CheckWatcher([])
+    watcher.run(watcher.all_check_arguments, "Started watching")
+    with patch("checks.watch.count_failures", return_value=0) as mock_count_failures:
+        write_tested_manifest("2")
+        watcher.handle_changes({tmp_path / "manifest.json"})
+    assert mock_count_failures.call_count == 1
+    rerun_arguments = mock_count_failures.call_args.args[0]
+    assert [arguments.include_modified_unique_ids for arguments in rerun_arguments] == [
+        ["model.pkg.a"]
+    ]
+
+
+def test_check_watcher_rechecks_only_columns_of_modified_models(tmp_path: Path):
+    def write_columns_manifest(descriptions: dict[str, str]) -> None:
+        nodes = {
+            f"model.pkg.{name}": {
+                "unique_id": f"model.pkg.{name}",
+                "name": name,
+                "resource_type": "model",
+                "package_name": "pkg",
+                "original_file_path": f"models/{name}.sql",
+                "patch_path": "pkg://models/schema.yml",
+                "description": description,
+                "columns": {"id": {"name": "id", "description": ""}},
+            }
+            for name, description in descriptions.items()
+        }
+        manifest_data = {
+            "metadata": {"dbt_schema_version": SUPPORTED_MANIFEST_SCHEMA_VERSION},
+            "nodes": nodes,
+            "parent_map": {unique_id: [] for unique_id in nodes},
+            "child_map": {unique_id: [] for unique_id in nodes},
+        }
+        (tmp_path / "manifest.json").write_text(json.dumps(manifest_data))
+
+    write_columns_manifest({"a": "", "b": ""})
+    (tmp_path / f".{PROJECT_NAME}.yaml").write_text("per_check_arguments: []")
+    check_arguments = Namespace(
+        check_id="model-columns-have-descriptions",
+        manifest_dir=tmp_path,
+        catalog_dir=tmp_path,
+        files=[],
+    )
+    with patch(
+        "checks.watch.configure_entrypoint",
+        return_value=(Namespace(config_dir=tmp_path, jobs=1), [check_arguments]),
+    ):
+        watcher = CheckWatcher([])
+    watcher.run(watcher.all_check_arguments, "Started watching")
+    failing_columns = []
+
+    def count_failures(all_check_arguments, jobs):
+        for arguments in all_check_arguments:
+            check = ALL_CHECKS_MAP[arguments.check_id](arguments, run=False)
+            check.perform_check()
+            failing_columns.extend(sorted(check.failures))
+        return 0
+
+    with patch("checks.watch.count_failures", side_effect=count_failures):
+        write_columns_manifest({"a": "A", "b": ""})
+        watcher.handle_changes({tmp_path / "manifest.json"})
+    assert failing_columns == ["model.pkg.a.id"]
@@ -1,8 +1,10 @@
+import pickle
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from utils.manifest_object.macro import Macro
 from utils.manifest_object.manifest_object import (
     ConfigurableMixin,
     DataTestableMixin,
@@ -11,12 +13,18 @@ from utils.manifest_object.manifest_object import (
     ManifestColumn,
     ManifestObject,
     ManifestSource,
+    cached_slot_property,
     dict_difference,
 )
 from utils.manifest_object.node.generic_test import GenericTest
 from utils.manifest_object.node.model.constraint import Constraint
 from utils.manifest_object.node.model.model import ManifestModel
-from utils.manifest_object.node.node import SingularTest
+from utils.manifest_object.node.node import (
+    ManifestSeed,
+    ManifestSnapshot,
+    SingularTest,
+)
+from utils.manifest_object.unit_test import UnitTest
 
 
 class ConcreteManifestObject(ManifestObject, HasPatchPathMixin):
@@ -39,6 +47,95 @@ def test_manifest_object_description(description, expected):
     assert instance.description == expected
 
 
+@pytest.mark.parametrize(
+    ids=["same unique_id", "different unique_id", "no unique_id", "other type"],
+    argnames=["left", "right", "expected_equal"],
+    argvalues=[
+        (
+            ManifestModel({"unique_id": "model.a", "description": "old"}),
+            ManifestModel({"unique_id": "model.a", "description": "new"}),
+            True,
+        ),
+        (
+            ManifestModel({"unique_id": "model.a"}),
+            ManifestModel({"unique_id": "model.b"}),
+            False,
+        ),
+        (ManifestModel({"name": "a"}), ManifestModel({"name": "b"}), False),
+        (
+            ManifestModel({"unique_id": "test.a"}),
+            GenericTest({"unique_id": "test.a"}),
+            False,
+        ),
+    ],
+)
+def test_manifest_object_equality(left, right, expected_equal):
+    assert (left == right) == expected_equal
+    if expected_equal:
+        assert hash(left) == hash(right)
+
+
+def test_manifest_object_has_no_instance_dict():
+    model = ManifestModel({"unique_id": "model.a", "columns": {"id": {"name": "id"}}})
+    assert not hasattr(model, "__dict__")
+    assert not hasattr(model.columns[0], "__dict__")
+
+
+@pytest.mark.parametrize(
+    "manifest_object_type",
+    [
+        GenericTest,
+        Macro,
+        ManifestColumn,
+        ManifestModel,
+        ManifestSeed,
+        ManifestSnapshot,
+        ManifestSource,
+        SingularTest,
+        UnitTest,
+    ],
+)
+def test_manifest_object_declares_only_the_cache_slots_it_uses(manifest_object_type):
+    cache_slots = {
+        slot
+        for cls in manifest_object_type.__mro__
+        for slot in cls.__dict__.get("__slots__", ())
+        if slot.startswith("_")
+    }
+    cached_slot_properties = {
+        f"_{name}"
+        for cls in manifest_object_type.__mro__
+        for name, value in vars(cls).items()
+        if isinstance(value, cached_slot_property)
+    }
+    assert cache_slots == cached_slot_properties
+
+
+def test_manifest_object_derived_attributes_are_computed_once():
+    model = ManifestModel(
+        {"unique_id": "model.a", "tags": ["a"], "columns": {"id": {"name": "id"}}}
+    )
+    with patch(
+        "utils.manifest_object.manifest_object.ManifestColumn", wraps=ManifestColumn
+    ) as mock_manifest_column:
+        assert model.columns is model.columns
+    mock_manifest_column.assert_called_once()
+    assert model.tags is model.tags
+    assert model.columns[0].unique_id == "model.a.id"
+
+
+def test_manifest_object_pickles_with_derived_attributes():
+    model = ManifestModel(
+        {"unique_id": "model.a", "tags": ["a"], "columns": {"id": {"name": "id"}}}
+    )
+    model.columns
+    unpickled_model = pickle.loads(pickle.dumps(model))
+    assert unpickled_model == model
+    assert unpickled_model.data == model.data
+    assert unpickled_model.columns[0].parent is unpickled_model
+    assert unpickled_model.tags == {"a"}
+
+
 def test_manifest_object_unique_id():
     instance = ConcreteManifestObject(
         data={"unique_id": "test_model"},
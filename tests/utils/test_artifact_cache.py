@@ -0,0 +1,114 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from utils.artifact_cache import ArtifactCache
+
+
+@pytest.fixture
+def artifact_path(tmp_path: Path) -> Path:
+    path = tmp_path / "target" / "manifest.json"
+    path.parent.mkdir()
+    path.write_text('{"nodes": {}}')
+    return path
+
+
+def test_artifact_cache_round_trip(tmp_path: Path, artifact_path: Path):
+    cache = ArtifactCache(tmp_path / "cache")
+    entry_path = cache.get_entry_path(artifact_path)
+    assert cache.load(entry_path) is None
+    cache.save(entry_path, {"data": {"nodes": {}}})
+    assert cache.load(cache.get_entry_path(artifact_path)) == {"data": {"nodes": {}}}
+
+
+@pytest.mark.parametrize(
+    ids=["content", "modification time"],
+    argnames=["content", "mtime_ns"],
+    argvalues=[
+        ('{"nodes": {"a": {}}}', None),
+        ('{"nodes": {}}', 1_000_000_000),
+    ],
+)
+def test_artifact_cache_entry_path_changes_with_artifact(
+    tmp_path: Path,
+    artifact_path: Path,
+    content: str,
+    mtime_ns: int | None,
+):
+    cache = ArtifactCache(tmp_path / "cache")
+    entry_path = cache.get_entry_path(artifact_path)
+    artifact_path.write_text(content)
+    if mtime_ns:
+        os.utime(artifact_path, ns=(mtime_ns, mtime_ns))
+    assert cache.get_entry_path(artifact_path) != entry_path
+
+
+def test_artifact_cache_variants_are_kept_side_by_side(
+    tmp_path: Path, artifact_path: Path
+):
+    cache = ArtifactCache(tmp_path / "cache")
+    entry_path = cache.get_entry_path(artifact_path)
+    lean_entry_path = cache.get_entry_path(artifact_path, variant="lean")
+    assert lean_entry_path != entry_path
+    cache.save(entry_path, "full")
+    cache.save(lean_entry_path, "lean")
+    assert cache.load(entry_path) == "full"
+    assert cache.load(lean_entry_path) == "lean"
+
+
+def test_artifact_cache_save_removes_stale_entries(tmp_path: Path, artifact_path: Path):
+    cache = ArtifactCache(tmp_path / "cache")
+    stale_entry_path = cache.get_entry_path(artifact_path)
+    cache.save(stale_entry_path, "stale")
+    artifact_path.write_text('{"nodes": {"a": {}}}')
+    entry_path = cache.get_entry_path(artifact_path)
+    cache.save(entry_path, "fresh")
+    assert list(cache.cache_dir.iterdir()) == [entry_path]
+
+
+def test_artifact_cache_save_evicts_least_recently_used(tmp_path: Path):
+    cache = ArtifactCache(tmp_path / "cache", max_size=2_500)
+    entry_paths = []
+    for index in range(3):
+        artifact_path = tmp_path / f"manifest_{index}.json"
+        artifact_path.write_text("{}")
+        entry_path = cache.get_entry_path(artifact_path)
+        cache.save(entry_path, b"x" * 1_000)
+        os.utime(entry_path, ns=(index, index))
+        entry_paths.append(entry_path)
+    assert sorted(cache.cache_dir.iterdir()) == sorted(entry_paths[1:])
+
+
+def test_artifact_cache_load_ignores_unreadable_entry(
+    tmp_path: Path, artifact_path: Path
+):
+    cache = ArtifactCache(tmp_path / "cache")
+    entry_path = cache.get_entry_path(artifact_path)
+    cache.cache_dir.mkdir()
+    entry_path.write_bytes(b"not a pickle")
+    assert cache.load(entry_path) is None
+
+
+def test_artifact_cache_mapped_entry_round_trip(tmp_path: Path, artifact_path: Path):
+    cache = ArtifactCache(tmp_path / "cache")
+    entry_path = cache.get_entry_path(artifact_path)
+    mapped_entry_path = cache.get_mapped_entry_path(entry_path)
+    assert cache.load_mapped(mapped_entry_path) is None
+    cache.save(entry_path, "snapshot")
+    cache.save_mapped(mapped_entry_path, b"graph")
+    assert cache.load(entry_path) == "snapshot"
+    assert cache.load_mapped(mapped_entry_path)[:] == b"graph"
+
+
+def test_artifact_cache_save_removes_stale_mapped_entries(
+    tmp_path: Path, artifact_path: Path
+):
+    cache = ArtifactCache(tmp_path / "cache")
+    stale_entry_path = cache.get_entry_path(artifact_path)
+    cache.save(stale_entry_path, "stale")
+    cache.save_mapped(cache.get_mapped_entry_path(stale_entry_path), b"stale")
+    artifact_path.write_text('{"nodes": {"a": {}}}')
+    entry_path = cache.get_entry_path(artifact_path)
+    cache.save(entry_path, "fresh")
+    assert list(cache.cache_dir.iterdir()) == [entry_path]
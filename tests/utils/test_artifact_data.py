@@ -1,4 +1,6 @@
+import copy
 import json
+import pickle
 from argparse import Namespace
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
@@ -9,13 +11,20 @@ import pytest
 from utils.artifact_data import (
     CATALOG_FILE_NAME,
     MANIFEST_FILE_NAME,
+    MANIFEST_SECTIONS,
     SUPPORTED_CATALOG_SCHEMA_VERSION,
     SUPPORTED_MANIFEST_SCHEMA_VERSION,
+    ArtifactSession,
     Catalog,
     Manifest,
+    ManifestData,
+    get_artifact_session,
     get_json_artifact_data,
+    get_node_partition,
+    load_json_artifact,
 )
 from utils.catalog_object.catalog_table import CatalogTable
+from utils.manifest_diff import get_fingerprints
 from utils.manifest_filter_conditions import ManifestFilterConditions
 from utils.manifest_object.macro import Macro
 from utils.manifest_object.manifest_object import ManifestColumn, ManifestSource
@@ -66,6 +75,98 @@ def test_get_json_artifact_data(
         assert result == contents
 
 
+def test_get_json_artifact_data_sections(tmp_path: Path):
+    artifact_path = tmp_path / "manifest.json"
+    artifact_path.write_text(
+        json.dumps(
+            {
+                "metadata": {"dbt_schema_version": SUPPORTED_MANIFEST_SCHEMA_VERSION},
+                "nodes": {
+                    "model.a": {
+                        "name": "a",
+                        "raw_code": "select 1",
+                        "compiled_code": "select 1",
+                    }
+                },
+                "docs": {"doc.a": {"block_contents": "docs"}},
+                "parent_map": {"model.a": []},
+            }
+        )
+    )
+    assert get_json_artifact_data(
+        artifact_path, sections=frozenset({"nodes", "parent_map"})
+    ) == {"nodes": {"model.a": {"name": "a"}}, "parent_map": {"model.a": []}}
+    sections = frozenset({"nodes"})
+    assert get_json_artifact_data(
+        artifact_path, sections=sections
+    ) is not get_json_artifact_data(artifact_path, sections=sections)
+
+
+def test_get_json_artifact_data_lean(tmp_path: Path):
+    artifact_path = tmp_path / "manifest.json"
+    artifact_path.write_text(
+        json.dumps(
+            {
+                "nodes": {
+                    "model.a": {
+                        "name": "a",
+                        "fqn": ["pkg", "a"],
+                        "depends_on": {"macros": [], "nodes": []},
+                        "columns": {"id": {"name": "id", "quote": None}},
+                    }
+                },
+                "parent_map": {"model.a": []},
+            }
+        )
+    )
+    assert get_json_artifact_data(
+        artifact_path, sections=frozenset({"nodes", "parent_map"}), lean=True
+    ) == {
+        "nodes": {"model.a": {"name": "a", "columns": {"id": {"name": "id"}}}},
+        "parent_map": {"model.a": []},
+    }
+
+
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_manifest_data_loads_missing_sections(mock_get_json_artifact_data):
+    mock_get_json_artifact_data.side_effect = lambda path, sections, lean: {
+        section: {"section": section} for section in sections if section != "exposures"
+    }
+    data = ManifestData(Path("test/manifest.json"))
+    data.load({"nodes", "parent_map"})
+    data.load({"nodes"})
+    assert data["nodes"] == {"section": "nodes"}
+    assert data.get("exposures", {}) == {}
+    assert data.get("exposures", {}) == {}
+    assert data.get("macros") == {"section": "macros"}
+    assert [
+        call.kwargs["sections"] for call in mock_get_json_artifact_data.mock_calls
+    ] == [
+        frozenset({"nodes", "parent_map"}),
+        frozenset({"exposures"}),
+        frozenset({"macros"}),
+    ]
+    assert data.loaded_sections == {"nodes", "parent_map", "exposures", "macros"}
+
+
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_manifest_data_packed_sections(mock_get_json_artifact_data):
+    mock_get_json_artifact_data.return_value = {"child_map": {"a": ["b"]}}
+    data = ManifestData(Path("test/manifest.json"))
+    data.load({"child_map", "parent_map"})
+    data.pack({"child_map", "parent_map"})
+    assert "child_map" not in data.keys()
+    assert set(data.packed_sections) == {"child_map"}
+    data = pickle.loads(pickle.dumps(data))
+    assert data.copy() == {"child_map": {"a": ["b"]}}
+    assert data.packed_sections.keys() == {"child_map"}
+    data.load({"child_map"})
+    assert data.get("child_map") == {"a": ["b"]}
+    assert data.get("parent_map") is None
+    assert data.packed_sections == {}
+    mock_get_json_artifact_data.assert_called_once()
+
+
 @patch("utils.artifact_data.get_json_artifact_data")
 def test_manifest_init(mock_get_json_artifact_data):
     mock_data = {"metadata": {"dbt_schema_version": SUPPORTED_MANIFEST_SCHEMA_VERSION}}
@@ -73,9 +174,308 @@ def test_manifest_init(mock_get_json_artifact_data):
     path = Path("test")
     filters = ManifestFilterConditions()
     instance = Manifest(manifest_dir=path, filter_conditions=filters)
-    mock_get_json_artifact_data.assert_called_with(path / MANIFEST_FILE_NAME)
+    mock_get_json_artifact_data.assert_called_with(
+        path / MANIFEST_FILE_NAME, sections=frozenset({"metadata"}), lean=False
+    )
     assert instance.filter_conditions is filters
-    assert instance.data is mock_data
+    assert instance.data == mock_data
+
+
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_manifest_init_with_session(mock_get_json_artifact_data):
+    mock_get_json_artifact_data.return_value = {
+        "metadata": {"dbt_schema_version": SUPPORTED_MANIFEST_SCHEMA_VERSION},
+        "nodes": {"test_model": {"resource_type": "model"}},
+    }
+    session = ArtifactSession(manifest_dir=Path("test"))
+    instance = Manifest(
+        manifest_dir=Path("test"),
+        filter_conditions=ManifestFilterConditions(),
+        session=session,
+    )
+    mock_get_json_artifact_data.assert_called_once()
+    assert instance.session is session
+    assert instance.data is session.data
+    assert instance.models is session.models
+
+
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_artifact_session_get_manifest(mock_get_json_artifact_data):
+    mock_get_json_artifact_data.return_value = {
+        "metadata": {"dbt_schema_version": SUPPORTED_MANIFEST_SCHEMA_VERSION}
+    }
+    filepaths = frozenset({Path("models/test_model.sql")})
+    session = ArtifactSession(manifest_dir=Path("test"))
+    manifest = session.get_manifest(
+        ManifestFilterConditions(Namespace(include_packages=["test_package"])),
+        filepaths,
+    )
+    assert manifest.session is session
+    assert manifest.filepaths == set(filepaths)
+    assert (
+        session.get_manifest(
+            ManifestFilterConditions(Namespace(include_packages=["test_package"])),
+            filepaths,
+        )
+        is manifest
+    )
+    assert (
+        session.get_manifest(
+            ManifestFilterConditions(Namespace(include_packages=["test_package"]))
+        )
+        is not manifest
+    )
+    assert (
+        session.get_manifest(
+            ManifestFilterConditions(Namespace(include_packages=["another_package"]))
+        )
+        is not manifest
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["unique_ids", "relation", "include_indirect", "expected"],
+    ids=[
+        "direct children",
+        "indirect children",
+        "direct parents",
+        "indirect parents",
+    ],
+    argvalues=[
+        (frozenset({"source"}), "children", False, {"base_model"}),
+        (
+            frozenset({"source"}),
+            "children",
+            True,
+            {"base_model", "test_model", "another_model"},
+        ),
+        (frozenset({"test_model", "another_model"}), "parents", False, {"base_model"}),
+        (
+            frozenset({"test_model", "another_model"}),
+            "parents",
+            True,
+            {"base_model", "source"},
+        ),
+    ],
+)
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_artifact_session_get_relatives_of_any(
+    mock_get_json_artifact_data,
+    unique_ids: frozenset[str],
+    relation: str,
+    include_indirect: bool,
+    expected: set[str],
+):
+    mock_get_json_artifact_data.return_value = {
+        "child_map": {
+            "source": ["base_model"],
+            "base_model": ["test_model", "another_model"],
+        },
+        "parent_map": {
+            "test_model": ["base_model"],
+            "another_model": ["base_model"],
+            "base_model": ["source"],
+        },
+    }
+    session = ArtifactSession(manifest_dir=Path("test"))
+    result = session.get_relatives_of_any(
+        unique_ids, relation=relation, include_indirect=include_indirect
+    )
+    assert result == expected
+    assert (
+        session.get_relatives_of_any(
+            unique_ids, relation=relation, include_indirect=include_indirect
+        )
+        is result
+    )
+
+
+FILE_INDEX_MANIFEST_DATA = {
+    "nodes": {
+        "model.pkg.orders": {
+            "unique_id": "model.pkg.orders",
+            "resource_type": "model",
+            "package_name": "pkg",
+            "original_file_path": "models/orders.sql",
+            "patch_path": "pkg://models/schema.yml",
+        },
+        "model.pkg.customers": {
+            "unique_id": "model.pkg.customers",
+            "resource_type": "model",
+            "package_name": "pkg",
+            "original_file_path": "models/customers.sql",
+            "patch_path": "pkg://models/schema.yml",
+        },
+        "model.pkg.payments": {
+            "unique_id": "model.pkg.payments",
+            "resource_type": "model",
+            "package_name": "pkg",
+            "original_file_path": "models/payments.sql",
+        },
+    },
+    "sources": {
+        "source.pkg.raw.orders": {
+            "unique_id": "source.pkg.raw.orders",
+            "resource_type": "source",
+            "package_name": "pkg",
+            "original_file_path": "models/schema.yml",
+        },
+    },
+}
+
+
+@pytest.mark.parametrize(
+    argnames=["filepaths", "expected_return"],
+    ids=["no filepaths", "one object", "objects patched by a file", "unknown file"],
+    argvalues=[
+        (None, 4),
+        ([Path("models/orders.sql")], 1),
+        ([Path("models/schema.yml"), Path("models/orders.sql")], 3),
+        ([Path("models/unknown.sql")], 0),
+    ],
+)
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_manifest_candidate_count(
+    mock_get_json_artifact_data,
+    filepaths: list[Path] | None,
+    expected_return: int,
+):
+    mock_get_json_artifact_data.return_value = {
+        **FILE_INDEX_MANIFEST_DATA,
+        "parent_map": {
+            unique_id: []
+            for collection in ("nodes", "sources")
+            for unique_id in FILE_INDEX_MANIFEST_DATA[collection]
+        },
+    }
+    instance = Manifest(
+        manifest_dir=Path("test"),
+        filter_conditions=ManifestFilterConditions(),
+        filepaths=filepaths,
+    )
+    assert instance.candidate_count == expected_return
+    assert instance.indexes_lineage == (filepaths is None)
+
+
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_artifact_session_file_index(mock_get_json_artifact_data):
+    mock_get_json_artifact_data.return_value = FILE_INDEX_MANIFEST_DATA
+    session = ArtifactSession(manifest_dir=Path("test"))
+    assert session.file_index == {
+        Path("models/orders.sql"): [(0, "model.pkg.orders")],
+        Path("models/customers.sql"): [(1, "model.pkg.customers")],
+        Path("models/payments.sql"): [(2, "model.pkg.payments")],
+        Path("models/schema.yml"): [
+            (0, "model.pkg.orders"),
+            (1, "model.pkg.customers"),
+            (0, "source.pkg.raw.orders"),
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    ids=["one file", "patch path", "keeps collection order", "unknown file"],
+    argnames=["filepaths", "expected_return"],
+    argvalues=[
+        ([Path("models/payments.sql")], ["model.pkg.payments"]),
+        ([Path("models/schema.yml")], ["model.pkg.orders", "model.pkg.customers"]),
+        (
+            [Path("models/payments.sql"), Path("models/orders.sql")],
+            ["model.pkg.orders", "model.pkg.payments"],
+        ),
+        ([Path("models/unknown.sql")], []),
+    ],
+)
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_manifest_get_objects_in_files(
+    mock_get_json_artifact_data,
+    filepaths: list[Path],
+    expected_return: list[str],
+):
+    mock_get_json_artifact_data.return_value = FILE_INDEX_MANIFEST_DATA
+    instance = Manifest(
+        manifest_dir=Path("test"), filter_conditions=ManifestFilterConditions()
+    )
+    assert [
+        model.unique_id
+        for model in instance.get_objects_in_files(instance.models, filepaths)
+    ] == expected_return
+
+
+def test_artifact_session_loads_snapshot_from_cache(tmp_path: Path):
+    (tmp_path / "manifest.json").write_text(json.dumps(FILE_INDEX_MANIFEST_DATA))
+    session = ArtifactSession(manifest_dir=tmp_path, cache_dir=tmp_path / "cache")
+    with patch("utils.artifact_data.get_json_artifact_data") as mock_load:
+        cached_session = ArtifactSession(
+            manifest_dir=tmp_path, cache_dir=tmp_path / "cache"
+        )
+    mock_load.assert_not_called()
+    assert cached_session.data == session.data
+    assert "partitioned_nodes" in cached_session.__dict__
+    assert cached_session.models == session.models
+    assert cached_session.file_index == session.file_index
+
+
+def test_artifact_session_maps_lineage_graph_from_cache(tmp_path: Path):
+    manifest_data = {
+        "child_map": {"source": ["model"], "model": []},
+        "parent_map": {"model": ["source"], "source": []},
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest_data))
+    session = ArtifactSession(manifest_dir=tmp_path, cache_dir=tmp_path / "cache")
+    assert session.get_relatives_of_any(
+        frozenset({"source"}), relation="children", include_indirect=True
+    ) == {"model"}
+    assert len(list((tmp_path / "cache").glob("*.bin"))) == 1
+    with patch("utils.artifact_data.LineageGraph.encode") as mock_encode:
+        cached_session = ArtifactSession(
+            manifest_dir=tmp_path, cache_dir=tmp_path / "cache"
+        )
+        assert cached_session.get_relatives_of_any(
+            frozenset({"model"}), relation="parents", include_indirect=False
+        ) == {"source"}
+        assert (
+            Manifest(
+                manifest_dir=tmp_path,
+                filter_conditions=ManifestFilterConditions(),
+                session=cached_session,
+            ).candidate_count
+            == 2
+        )
+    mock_encode.assert_not_called()
+    assert set(cached_session.data.packed_sections) == {"child_map", "parent_map"}
+
+
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_artifact_session_get_reachability_index(mock_get_json_artifact_data, caplog):
+    mock_get_json_artifact_data.return_value = {
+        "child_map": {"source": ["model"], "model": []},
+        "parent_map": {"model": ["source"], "source": []},
+    }
+    session = ArtifactSession(manifest_dir=Path("test"))
+    with caplog.at_level("DEBUG"):
+        index = session.get_reachability_index("parents")
+    assert session.get_reachability_index("parents") is index
+    assert index.has_relative_in("model", frozenset({"source"}))
+    assert f"holding {index.memory_size} bytes" in caplog.text
+
+
+def test_artifact_session_cache_missing_manifest(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        ArtifactSession(manifest_dir=tmp_path, cache_dir=tmp_path / "cache")
+
+
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_get_artifact_session(mock_get_json_artifact_data):
+    mock_get_json_artifact_data.return_value = {
+        "metadata": {"dbt_schema_version": SUPPORTED_MANIFEST_SCHEMA_VERSION}
+    }
+    session = get_artifact_session(manifest_dir=Path("test"))
+    assert get_artifact_session(manifest_dir=Path("test")) is session
+    assert get_artifact_session(manifest_dir=Path("another_test")) is not session
+    mock_get_json_artifact_data.assert_any_call(
+        Path("test") / MANIFEST_FILE_NAME, sections=frozenset({"metadata"}), lean=False
+    )
 
 
 @patch("utils.artifact_data.get_json_artifact_data")
@@ -275,6 +675,84 @@ def test_manifest_in_scope_model_columns(mock_get_json_artifact_data):
     assert list(instance.in_scope_model_columns) == expected_columns
 
 
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_manifest_in_scope_model_columns_evaluates_parent_once(
+    mock_get_json_artifact_data,
+):
+    filters = ManifestFilterConditions(
+        Namespace(include_packages=["test_package"], exclude_name_patterns=["^_"])
+    )
+    columns = {name: {"name": name} for name in ("id", "_loaded_at", "amount")}
+    mock_get_json_artifact_data.return_value = {
+        "nodes": {
+            model_id: {
+                "unique_id": model_id,
+                "resource_type": "model",
+                "package_name": package_name,
+                "columns": columns,
+            }
+            for model_id, package_name in (
+                ("test_model", "test_package"),
+                ("_another_model", "test_package"),
+                ("one_more_model", "another_package"),
+            )
+        },
+        "sources": {},
+    }
+    instance = Manifest(manifest_dir=Path("test"), filter_conditions=filters)
+    with patch.object(
+        ManifestFilterConditions,
+        "is_column_parent_in_scope",
+        autospec=True,
+        side_effect=ManifestFilterConditions.is_column_parent_in_scope,
+    ) as mock_is_column_parent_in_scope:
+        in_scope_columns = instance.in_scope_model_columns
+    assert mock_is_column_parent_in_scope.call_count == 3
+    assert [column.unique_id for column in in_scope_columns] == [
+        "test_model.id",
+        "test_model.amount",
+        "_another_model.id",
+        "_another_model.amount",
+    ]
+
+
+@pytest.mark.parametrize(
+    ids=["parent filters", "parent and column filters", "no filters"],
+    argnames=["args"],
+    argvalues=[
+        (Namespace(include_packages=["test_package"]),),
+        (Namespace(include_packages=["test_package"], exclude_name_patterns=["^_"]),),
+        (Namespace(),),
+    ],
+)
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_manifest_in_scope_model_column_store(mock_get_json_artifact_data, args):
+    columns = {name: {"name": name} for name in ("id", "_loaded_at", "amount")}
+    mock_get_json_artifact_data.return_value = {
+        "nodes": {
+            model_id: {
+                "unique_id": model_id,
+                "resource_type": "model",
+                "package_name": package_name,
+                "columns": columns,
+            }
+            for model_id, package_name in (
+                ("test_model", "test_package"),
+                ("_another_model", "test_package"),
+                ("one_more_model", "another_package"),
+            )
+        },
+        "sources": {},
+    }
+    instance = Manifest(
+        manifest_dir=Path("test"), filter_conditions=ManifestFilterConditions(args)
+    )
+    column_store = instance.in_scope_model_column_store
+    assert column_store.get_failing_unique_ids(column_store.has_description) == [
+        column.unique_id for column in instance.in_scope_model_columns
+    ]
+
+
 @patch("utils.artifact_data.get_json_artifact_data")
 def test_manifest_in_scope_source_columns(mock_get_json_artifact_data):
     filters = ManifestFilterConditions(Namespace(include_packages=["test_package"]))
@@ -413,6 +891,55 @@ def test_manifest_get_model(mock_get_json_artifact_data, model_id, expected_retu
         assert result is None
 
 
+@pytest.mark.parametrize(
+    argnames=["node_data", "expected_return"],
+    ids=["model", "generic test", "singular test", "no resource type"],
+    argvalues=[
+        ({"resource_type": "model"}, "model"),
+        (
+            {"resource_type": "test", "test_metadata": {"name": "not_null"}},
+            "generic_test",
+        ),
+        ({"resource_type": "test"}, "singular_test"),
+        ({}, None),
+    ],
+)
+def test_get_node_partition(node_data: dict, expected_return: str | None):
+    assert get_node_partition(node_data) == expected_return
+
+
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_artifact_session_partitioned_nodes(mock_get_json_artifact_data):
+    mock_get_json_artifact_data.return_value = {
+        "nodes": {
+            "test_model": {"resource_type": "model"},
+            "test_test": {"resource_type": "test", "test_metadata": {"name": "test"}},
+            "singular_test": {"resource_type": "test"},
+            "test_seed": {"resource_type": "seed"},
+            "test_operation": {"resource_type": "operation"},
+        },
+    }
+    session = ArtifactSession(manifest_dir=Path("test"))
+    result = session.partitioned_nodes
+    assert result == {
+        "model": {"test_model": ManifestModel({"resource_type": "model"})},
+        "generic_test": {
+            "test_test": GenericTest(
+                {"resource_type": "test", "test_metadata": {"name": "test"}}
+            )
+        },
+        "singular_test": {"singular_test": SingularTest({"resource_type": "test"})},
+        "snapshot": {},
+        "seed": {"test_seed": ManifestSeed({"resource_type": "seed"})},
+        "analysis": {},
+        "function": {},
+    }
+    assert session.models is result["model"]
+    assert session.generic_tests is result["generic_test"]
+    assert session.singular_tests is result["singular_test"]
+    assert session.seeds is result["seed"]
+
+
 @patch("utils.artifact_data.get_json_artifact_data")
 def test_manifest_generic_tests(mock_get_json_artifact_data):
     filters = ManifestFilterConditions()
@@ -1170,3 +1697,104 @@ def test_manifest_in_scope_snapshots(mock_get_json_artifact_data):
     path = Path("test")
     instance = Manifest(manifest_dir=path, filter_conditions=filters)
     assert list(instance.in_scope_snapshots) == expected_snapshots
+
+
+def write_state_manifest(manifest_dir: Path, descriptions: dict[str, str]) -> None:
+    manifest_dir.mkdir(exist_ok=True)
+    nodes = {
+        f"model.pkg.{name}": {
+            "unique_id": f"model.pkg.{name}",
+            "resource_type": "model",
+            "package_name": "pkg",
+            "description": description,
+            "columns": {"id": {"name": "id", "description": ""}},
+        }
+        for name, description in descriptions.items()
+    }
+    manifest_data = {
+        "metadata": {"dbt_schema_version": SUPPORTED_MANIFEST_SCHEMA_VERSION},
+        "nodes": nodes,
+        "parent_map": {
+            "model.pkg.a": [],
+            "model.pkg.b": ["model.pkg.a"],
+            "model.pkg.c": ["model.pkg.b"],
+        },
+        "child_map": {
+            "model.pkg.a": ["model.pkg.b"],
+            "model.pkg.b": ["model.pkg.c"],
+            "model.pkg.c": [],
+        },
+    }
+    (manifest_dir / MANIFEST_FILE_NAME).write_text(json.dumps(manifest_data))
+
+
+@pytest.mark.parametrize(
+    ids=["modified", "modified and descendants"],
+    argnames=["state_selector", "expected_models"],
+    argvalues=[
+        ("modified", ["model.pkg.b"]),
+        ("modified+", ["model.pkg.b", "model.pkg.c"]),
+    ],
+)
+def test_manifest_in_scope_models_by_state(
+    tmp_path: Path, state_selector, expected_models
+):
+    write_state_manifest(tmp_path / "state", {"a": "", "b": "", "c": ""})
+    write_state_manifest(tmp_path / "target", {"a": "", "b": "B", "c": ""})
+    session = ArtifactSession(manifest_dir=tmp_path / "target")
+    filter_conditions = ManifestFilterConditions(
+        Namespace(state=tmp_path / "state", state_selector=state_selector)
+    )
+    manifest = session.get_manifest(filter_conditions)
+    assert [model.unique_id for model in manifest.in_scope_models] == expected_models
+    assert [column.unique_id for column in manifest.in_scope_model_columns] == [
+        f"{unique_id}.id" for unique_id in expected_models[1:]
+    ]
+    with patch("utils.artifact_data.get_json_artifact_data") as mock_load:
+        session.get_state_modified(tmp_path / "state", state_selector == "modified+")
+    mock_load.assert_not_called()
+
+
+def test_artifact_session_get_state_modified_keeps_only_fingerprints(
+    tmp_path: Path,
+):
+    write_state_manifest(tmp_path / "state", {"a": "", "b": "", "c": ""})
+    write_state_manifest(tmp_path / "target", {"a": "", "b": "B", "c": ""})
+    session = ArtifactSession(manifest_dir=tmp_path / "target")
+    session.data.load(MANIFEST_SECTIONS)
+    cached_artifacts = load_json_artifact.cache_info().currsize
+    with patch(
+        "utils.artifact_data.get_fingerprints", side_effect=get_fingerprints
+    ) as mock_get_fingerprints:
+        assert session.get_state_modified(
+            tmp_path / "state", include_descendants=False
+        ) <= session.get_state_modified(tmp_path / "state", include_descendants=True)
+    mock_get_fingerprints.assert_called_once()
+    assert load_json_artifact.cache_info().currsize == cached_artifacts
+
+
+def test_lean_artifact_session_matches_full_session(tmp_path: Path):
+    write_state_manifest(tmp_path / "state", {"a": "", "b": "", "c": ""})
+    write_state_manifest(tmp_path / "target", {"a": "", "b": "B", "c": ""})
+    session = ArtifactSession(manifest_dir=tmp_path / "target")
+    lean_session = ArtifactSession(
+        manifest_dir=tmp_path / "target", cache_dir=tmp_path / "cache", lean=True
+    )
+    assert lean_session.models == session.models
+    assert lean_session.file_index == session.file_index
+    assert lean_session.get_state_modified(
+        tmp_path / "state", include_descendants=True
+    ) == session.get_state_modified(tmp_path / "state", include_descendants=True)
+
+
+@patch("utils.artifact_data.get_json_artifact_data")
+def test_artifact_session_get_object_hash(mock_get_json_artifact_data):
+    mock_get_json_artifact_data.return_value = copy.deepcopy(FILE_INDEX_MANIFEST_DATA)
+    session = ArtifactSession(manifest_dir=Path("test"))
+    orders_hash = session.get_object_hash("model.pkg.orders")
+    assert orders_hash is not None
+    assert orders_hash != session.get_object_hash("model.pkg.customers")
+    assert session.get_object_hash("source.pkg.raw.orders") is not None
+    assert session.get_object_hash("model.pkg.unknown") is None
+    session.data["nodes"]["model.pkg.orders"] = {}
+    assert session.get_object_hash("model.pkg.orders") == orders_hash
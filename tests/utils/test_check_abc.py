@@ -5,7 +5,14 @@ from unittest.mock import Mock, call, patch
 
 import pytest
 
-from utils.check_abc import Check, ManifestCheck, ManifestVsCatalogComparison
+from utils.check_abc import (
+    Check,
+    ManifestCheck,
+    ManifestVsCatalogComparison,
+    PerObjectCheck,
+    perform_fused_checks,
+    run_checks,
+)
 from utils.console_formatting import (
     ConsoleEmphasis,
     check_status_header,
@@ -18,10 +25,12 @@ from utils.manifest_filter_conditions import (
     IndirectParentsFilterMethod,
     ManifestFilterConditions,
     MaterializationFilterMethod,
+    ModifiedObjectFilterMethod,
     NamePatternFilterMethod,
     PackageFilterMethod,
     PathFilterMethod,
     ResourceTypeFilterMethod,
+    StateFilterMethod,
     TagFilterMethod,
     UniqueIdFilterMethod,
 )
@@ -156,6 +165,8 @@ def test_check_filter_conditions():
                 include_values={"test_model"},
                 exclude_values={"another_model"},
             ),
+            ModifiedObjectFilterMethod(),
+            StateFilterMethod(),
         )
 
 
@@ -272,19 +283,23 @@ def test_check_manifest():
         manifest_dir=Path("test/path/"),
         files=[Path("test/model.sql"), Path("test/schema.yml")],
     )
-    mock_manifest_instance = Mock()
+    mock_session = Mock()
     with (
         patch.object(Check, "__call__"),
         patch(
-            "utils.check_abc.Manifest", return_value=mock_manifest_instance
-        ) as mock_manifest,
+            "utils.check_abc.get_artifact_session", return_value=mock_session
+        ) as mock_get_artifact_session,
     ):
         instance = ConcreteCheck(mock_args)
-        assert instance.manifest is mock_manifest_instance
-        mock_manifest.assert_called_with(
+        assert instance.manifest is mock_session.get_manifest.return_value
+        assert instance.manifest is mock_session.get_manifest.return_value
+        mock_get_artifact_session.assert_called_once_with(
             manifest_dir=mock_args.manifest_dir,
-            filter_conditions=instance.filter_conditions,
-            filepaths=mock_args.files,
+            cache_dir=None,
+            lean=False,
+        )
+        mock_session.get_manifest.assert_called_once_with(
+            instance.filter_conditions, frozenset(mock_args.files)
         )
 
 
@@ -316,19 +331,22 @@ def test_manifest_vs_catalog_comparison_check_manifest():
         manifest_dir=Path("test/path/"),
         files=[Path("test/model.sql"), Path("test/schema.yml")],
     )
-    mock_manifest_instance = Mock()
+    mock_session = Mock()
     with (
         patch.object(Check, "__call__"),
         patch(
-            "utils.check_abc.Manifest", return_value=mock_manifest_instance
-        ) as mock_manifest,
+            "utils.check_abc.get_artifact_session", return_value=mock_session
+        ) as mock_get_artifact_session,
     ):
         instance = ConcreteManifestVsCatalogComparison(mock_args)
-        assert instance.manifest is mock_manifest_instance
-        mock_manifest.assert_called_with(
+        assert instance.manifest is mock_session.get_manifest.return_value
+        mock_get_artifact_session.assert_called_with(
             manifest_dir=mock_args.manifest_dir,
-            filter_conditions=instance.filter_conditions,
-            filepaths=mock_args.files,
+            cache_dir=None,
+            lean=False,
+        )
+        mock_session.get_manifest.assert_called_with(
+            instance.filter_conditions, frozenset(mock_args.files)
         )
 
 
@@ -392,3 +410,151 @@ def test_manifest_vs_catalog_comparison_has_failures(
         instance.manifest_items = manifest_items
         instance.catalog_items = catalog_items
         assert instance.has_failures is expected_return
+
+
+class ConcretePerObjectCheck(PerObjectCheck):
+    check_name: str = "test-per-object-check"
+    additional_arguments = ADDITIONAL_ARGUMENTS
+    object_collection = "in_scope_models"
+    manifest = None  # type: ignore[assignment]
+
+    def __init__(self, failing_ids: set[str], has_failure_details: bool = False):
+        self.args = Namespace()
+        self.failing_ids = failing_ids
+        self.has_failure_details = has_failure_details
+        self.judged: list[str] = []
+
+    def is_failure(self, manifest_object) -> bool:
+        self.judged.append(manifest_object.unique_id)
+        return manifest_object.unique_id in self.failing_ids
+
+    def get_failure_details(self, manifest_object):
+        return manifest_object.unique_id.upper()
+
+    @property
+    def failure_message(self) -> str:
+        return ""
+
+
+class CountingObjects:
+    def __init__(self, unique_ids: list[str]):
+        self.objects = [Mock(unique_id=unique_id) for unique_id in unique_ids]
+        self.iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return iter(self.objects)
+
+
+@pytest.mark.parametrize(
+    ids=["set of failures", "failure details"],
+    argnames=["has_failure_details", "expected_failures"],
+    argvalues=[
+        (False, {"model.a"}),
+        (True, {"model.a": "MODEL.A"}),
+    ],
+)
+def test_per_object_check_perform_check(has_failure_details, expected_failures):
+    instance = ConcretePerObjectCheck({"model.a"}, has_failure_details)
+    instance.manifest = Mock(in_scope_models=CountingObjects(["model.a", "model.b"]))
+    instance.perform_check()
+    assert instance.failures == expected_failures
+
+
+def test_perform_fused_checks_makes_a_single_pass():
+    objects = CountingObjects(["model.a", "model.b", "model.c"])
+    manifest = Mock(in_scope_models=objects)
+    checks = [
+        ConcretePerObjectCheck({"model.a"}),
+        ConcretePerObjectCheck({"model.b", "model.c"}, has_failure_details=True),
+    ]
+    for check in checks:
+        check.manifest = manifest
+    perform_fused_checks(checks)
+    assert objects.iterations == 1
+    assert checks[0].failures == {"model.a"}
+    assert checks[1].failures == {"model.b": "MODEL.B", "model.c": "MODEL.C"}
+
+
+@pytest.mark.parametrize(
+    ids=["unchanged", "changed object", "changed child", "other child"],
+    argnames=["depends_on_children", "object_hashes", "expected_judged"],
+    argvalues=[
+        (True, {"model.a": b"1", "test.a": b"2"}, []),
+        (True, {"model.a": b"3", "test.a": b"2"}, ["model.a"]),
+        (True, {"model.a": b"1", "test.a": b"3"}, ["model.a"]),
+        (False, {"model.a": b"1", "test.a": b"3"}, []),
+    ],
+)
+def test_per_object_check_reuses_cached_verdicts(
+    tmp_path: Path, depends_on_children, object_hashes, expected_judged
+):
+    session = Mock(child_map={"model.a": ["test.a"]})
+    session.get_object_hash.side_effect = {"model.a": b"1", "test.a": b"2"}.get
+    with patch("utils.check_abc.get_check_session", return_value=session):
+        instance = ConcretePerObjectCheck({"model.a"}, has_failure_details=True)
+        instance.args = Namespace(check_id="test", result_cache_dir=tmp_path)
+        instance.depends_on_children = depends_on_children
+        instance.manifest = Mock(in_scope_models=CountingObjects(["model.a"]))
+        instance.perform_check()
+        session.get_object_hash.side_effect = object_hashes.get
+        cached_instance = ConcretePerObjectCheck(set(), has_failure_details=True)
+        cached_instance.args = instance.args
+        cached_instance.depends_on_children = depends_on_children
+        cached_instance.manifest = instance.manifest
+        cached_instance.perform_check()
+    assert cached_instance.judged == expected_judged
+    assert cached_instance.failures == (
+        {} if expected_judged else {"model.a": "MODEL.A"}
+    )
+
+
+def test_run_checks():
+    shared_manifest = Mock(in_scope_models=CountingObjects(["model.a", "model.b"]))
+    other_manifest = Mock(in_scope_models=CountingObjects(["model.a"]))
+    fused_checks = [
+        ConcretePerObjectCheck({"model.a"}),
+        ConcretePerObjectCheck(set()),
+    ]
+    lone_check = ConcretePerObjectCheck({"model.a"})
+    for check in fused_checks:
+        check.manifest = shared_manifest
+    lone_check.manifest = other_manifest
+    other_check = Mock(spec=Check)
+    checks = [fused_checks[0], other_check, lone_check, fused_checks[1]]
+    events = []
+    with (
+        patch.object(
+            ConcretePerObjectCheck,
+            "log_start",
+            autospec=True,
+            side_effect=lambda check: events.append(("start", check)),
+        ),
+        patch.object(
+            ConcretePerObjectCheck,
+            "log_result",
+            autospec=True,
+            side_effect=lambda check: events.append(("result", check)),
+        ),
+    ):
+        run_checks(checks)
+    assert shared_manifest.in_scope_models.iterations == 1
+    assert other_manifest.in_scope_models.iterations == 1
+    other_check.perform_check.assert_called_once()
+    assert [
+        fused_checks[0].failures,
+        lone_check.failures,
+        fused_checks[1].failures,
+    ] == [
+        {"model.a"},
+        {"model.a"},
+        set(),
+    ]
+    assert events == [
+        ("start", fused_checks[0]),
+        ("result", fused_checks[0]),
+        ("start", lone_check),
+        ("result", lone_check),
+        ("start", fused_checks[1]),
+        ("result", fused_checks[1]),
+    ]
@@ -0,0 +1,73 @@
+from argparse import Namespace
+from unittest.mock import patch
+
+from checks import (
+    MacrosHaveDescriptions,
+    ModelsHaveColumns,
+    ModelsHaveDescriptions,
+    SourcesHaveDescriptions,
+)
+from utils.check_abc import (
+    STANDARD_MACRO_MANIFEST_SECTIONS,
+    STANDARD_SOURCE_MANIFEST_SECTIONS,
+)
+from utils.check_plan import CheckPlan, SequentialExecutor
+
+CHECKS_MAP = {
+    check_class.check_name: check_class
+    for check_class in (
+        MacrosHaveDescriptions,
+        ModelsHaveColumns,
+        ModelsHaveDescriptions,
+        SourcesHaveDescriptions,
+    )
+}
+
+
+def test_check_plan_build():
+    all_arguments = [
+        Namespace(check_id="models-have-descriptions", include_tags=["a"]),
+        Namespace(check_id="macros-have-descriptions"),
+        Namespace(check_id="models-have-columns", include_tags=["a"]),
+        Namespace(check_id="sources-have-descriptions"),
+    ]
+    with patch.object(ModelsHaveDescriptions, "__call__") as mock_call:
+        plan = CheckPlan.build(all_arguments, CHECKS_MAP)
+    mock_call.assert_not_called()
+    assert len(plan) == 4
+    assert [planned_check.check_id for planned_check in plan.checks] == [
+        arguments.check_id for arguments in all_arguments
+    ]
+    assert plan.checks[1].check_class is MacrosHaveDescriptions
+    assert plan.resource_types == {"model", "macro", "source"}
+    assert (
+        plan.manifest_sections
+        == STANDARD_MACRO_MANIFEST_SECTIONS | STANDARD_SOURCE_MANIFEST_SECTIONS
+    )
+    assert [
+        [planned_check.check_id for planned_check in group]
+        for group in plan.filter_groups.values()
+    ] == [
+        ["models-have-descriptions", "models-have-columns"],
+        ["macros-have-descriptions", "sources-have-descriptions"],
+    ]
+
+
+def test_sequential_executor():
+    all_arguments = [
+        Namespace(check_id="models-have-descriptions"),
+        Namespace(check_id="models-have-columns"),
+    ]
+    plan = CheckPlan.build(all_arguments, CHECKS_MAP)
+    with (
+        patch.object(ModelsHaveDescriptions, "failures", {"model.a"}),
+        patch.object(ModelsHaveColumns, "failures", set()),
+        patch("utils.check_plan.run_checks") as mock_run_checks,
+    ):
+        assert plan.execute(SequentialExecutor()) == [True, False]
+    checks = mock_run_checks.call_args.args[0]
+    assert [type(check) for check in checks] == [
+        ModelsHaveDescriptions,
+        ModelsHaveColumns,
+    ]
+    assert [check.args for check in checks] == all_arguments
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import pytest
+
+from utils.column_store import ColumnStore
+from utils.manifest_object.node.model.model import ManifestModel
+
+MODELS = [
+    ManifestModel(
+        {
+            "unique_id": "model.pkg.a",
+            "columns": {
+                "id": {"name": "id", "data_type": "integer", "description": "Key"},
+                "Name": {"name": "Name", "description": ""},
+            },
+        }
+    ),
+    ManifestModel({"unique_id": "model.pkg.b"}),
+    ManifestModel(
+        {
+            "unique_id": "model.pkg.c",
+            "columns": {"id": {"name": "id", "data_type": None}},
+        }
+    ),
+]
+
+
+@pytest.fixture(params=["lists", "numpy"])
+def backend(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        yield
+    else:
+        with patch("utils.column_store.get_numpy", return_value=None):
+            yield
+
+
+def test_column_store_from_parents(backend):
+    store = ColumnStore.from_parents(MODELS)
+    assert len(store) == 3
+    assert list(store.parent_indices) == [0, 0, 2]
+    assert list(store.names) == ["id", "Name", "id"]
+    assert store.get_failing_unique_ids(store.has_description) == [
+        "model.pkg.a.Name",
+        "model.pkg.c.id",
+    ]
+    assert store.get_failing_unique_ids(store.has_data_type) == [
+        "model.pkg.a.Name",
+        "model.pkg.c.id",
+    ]
+
+
+def test_column_store_names_match(backend):
+    store = ColumnStore.from_parents(MODELS)
+    assert store.get_failing_unique_ids(store.names_match("^[a-z]+$")) == [
+        "model.pkg.a.Name"
+    ]
+
+
+@pytest.mark.parametrize(
+    ids=["by parent", "by parent and column"],
+    argnames=["is_column_selected", "expected_unique_ids"],
+    argvalues=[
+        (None, ["model.pkg.c.id"]),
+        (lambda column: column.name != "id", []),
+    ],
+)
+def test_column_store_select(backend, is_column_selected, expected_unique_ids):
+    store = ColumnStore.from_parents(MODELS).select(
+        lambda parent: parent.unique_id != "model.pkg.a", is_column_selected
+    )
+    assert store.get_failing_unique_ids(store.has_description) == expected_unique_ids
+
+
+def test_column_store_select_columns_by_position(backend):
+    store = ColumnStore.from_parents(MODELS).select(
+        lambda parent: True, lambda column: column.name == "Name"
+    )
+    assert store.get_failing_unique_ids(store.has_data_type) == ["model.pkg.a.Name"]
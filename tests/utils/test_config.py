@@ -19,7 +19,10 @@ from utils.config import PROJECT_NAME, configure_checks, load_config
 DEFAULTS = {
     arg: None
     for arg in set(
-        STANDARD_MODEL_ARGUMENTS + STANDARD_MACRO_ARGUMENTS + STANDARD_SOURCE_ARGUMENTS
+        STANDARD_MODEL_ARGUMENTS
+        + STANDARD_MACRO_ARGUMENTS
+        + STANDARD_SOURCE_ARGUMENTS
+        + ["result_cache_dir", "state", "state_selector", "manifest_representation"]
     )
 }
 
@@ -181,6 +184,9 @@ def test_load_config(
                 Namespace(
                     project_dir=Path.cwd() / Path("path/to/project"),
                     manifest_dir=Path.cwd() / Path("path/to/project/target"),
+                    cache_dir=Path.cwd()
+                    / Path("path/to/project/target")
+                    / ".dbtra_cache",
                     catalog_dir=Path.cwd() / Path("path/to/project/target"),
                     config_dir=None,
                     files=None,
@@ -228,6 +234,9 @@ def test_load_config(
                 Namespace(
                     project_dir=Path.cwd() / Path("path/to/project"),
                     manifest_dir=Path.cwd() / Path("path/to/project/target"),
+                    cache_dir=Path.cwd()
+                    / Path("path/to/project/target")
+                    / ".dbtra_cache",
                     catalog_dir=Path.cwd() / Path("path/to/project/target"),
                     config_dir=None,
                     files=[Path("test.sql"), Path("test.yml")],
@@ -240,6 +249,9 @@ def test_load_config(
                 Namespace(
                     project_dir=Path.cwd() / Path("path/to/project"),
                     manifest_dir=Path.cwd() / Path("path/to/project/target"),
+                    cache_dir=Path.cwd()
+                    / Path("path/to/project/target")
+                    / ".dbtra_cache",
                     catalog_dir=Path.cwd() / Path("path/to/project/target"),
                     must_have_all_constraints_from=["primary_key"],
                     must_have_any_constraint_from=None,
@@ -0,0 +1,172 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from utils.daemon_client import (
+    SOCKET_PATH_ENV_VAR,
+    get_socket_path,
+    main,
+    request_run,
+)
+from utils.run_cache import (
+    RUN_CACHE_DIR_ENV_VAR,
+    RunCache,
+    RunRecord,
+    get_file_key,
+)
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to about 100 characters, so avoid tmp_path.
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory) / "dbtra.sock"
+
+
+def test_get_socket_path(monkeypatch):
+    monkeypatch.delenv(SOCKET_PATH_ENV_VAR, raising=False)
+    socket_path = get_socket_path(Path("/project"))
+    assert socket_path == get_socket_path(Path("/project"))
+    assert socket_path != get_socket_path(Path("/another_project"))
+    assert socket_path.suffix == ".sock"
+    monkeypatch.setenv(SOCKET_PATH_ENV_VAR, "/run/dbtra.sock")
+    assert get_socket_path(Path("/project")) == Path("/run/dbtra.sock")
+
+
+def serve_one_response(
+    socket_path: Path, response: dict
+) -> tuple[threading.Thread, list[dict]]:
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen(1)
+    requests = []
+
+    def respond():
+        with server, server.accept()[0] as connection:
+            with connection.makefile("rb") as request_file:
+                requests.append(json.loads(request_file.readline()))
+                connection.sendall(json.dumps(response).encode() + b"\n")
+
+    thread = threading.Thread(target=respond)
+    thread.start()
+    return thread, requests
+
+
+@pytest.mark.parametrize(
+    ids=["run", "refused"],
+    argnames=["response", "expected_return"],
+    argvalues=[
+        (
+            {"exit_code": 1, "stdout": "", "stderr": "1/1 checks failed"},
+            {"exit_code": 1, "stdout": "", "stderr": "1/1 checks failed"},
+        ),
+        ({"error": "The daemon serves another directory"}, None),
+    ],
+)
+def test_request_run(socket_path: Path, response: dict, expected_return):
+    thread, requests = serve_one_response(socket_path, response)
+    assert request_run(["all-checks"], Path("/project"), socket_path) == (
+        expected_return
+    )
+    thread.join()
+    assert requests == [{"argv": ["all-checks"], "cwd": "/project"}]
+
+
+def test_request_run_without_daemon(socket_path: Path):
+    assert request_run(["all-checks"], Path("/project"), socket_path) is None
+
+
+def test_main_prints_daemon_response(capsys):
+    with (
+        patch.object(sys, "argv", ["dbtra-client", "all-checks"]),
+        patch(
+            "utils.daemon_client.request_run",
+            return_value={"exit_code": 1, "stdout": "out", "stderr": "err"},
+        ) as mock_request_run,
+        pytest.raises(SystemExit) as exit_info,
+    ):
+        main()
+    assert exit_info.value.code == 1
+    assert capsys.readouterr() == ("out", "err")
+    assert mock_request_run.call_args.args[:2] == (["all-checks"], Path.cwd())
+
+
+def test_main_runs_checks_without_daemon():
+    with (
+        patch.object(sys, "argv", ["dbtra-client", "all-checks"]),
+        patch("utils.daemon_client.request_run", return_value=None),
+        patch("checks.entrypoint.entrypoint") as mock_entrypoint,
+    ):
+        main()
+    mock_entrypoint.assert_called_once_with(["all-checks"])
+
+
+def test_main_replays_recorded_runs(monkeypatch, tmp_path: Path, capsys):
+    monkeypatch.setenv(RUN_CACHE_DIR_ENV_VAR, str(tmp_path))
+    run_cache = RunCache(tmp_path)
+    run_cache.save(
+        run_cache.get_entry_path(["all-checks"], Path.cwd()),
+        RunRecord(dependencies={}, exit_code=0, output="1/1 checks passed\n"),
+    )
+    with (
+        patch.object(sys, "argv", ["dbtra-client", "all-checks"]),
+        patch("utils.daemon_client.request_run") as mock_request_run,
+        pytest.raises(SystemExit) as exit_info,
+    ):
+        main()
+    assert exit_info.value.code == 0
+    assert capsys.readouterr().err == "1/1 checks passed\n"
+    mock_request_run.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ids=["recorded", "checks not run", "output on stdout", "racy"],
+    argnames=["checks_run", "stdout", "modified_after_start", "expected_recorded"],
+    argvalues=[
+        (True, "", False, True),
+        (False, "", False, False),
+        (True, "out", False, True),
+        (True, "", True, False),
+    ],
+)
+def test_main_records_daemon_response(
+    monkeypatch,
+    tmp_path: Path,
+    checks_run: bool,
+    stdout: str,
+    modified_after_start: bool,
+    expected_recorded: bool,
+):
+    monkeypatch.setenv(RUN_CACHE_DIR_ENV_VAR, str(tmp_path / "runs"))
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{}")
+    if not modified_after_start:
+        os.utime(manifest_path, ns=(0, 0))
+    response = {
+        "exit_code": 1,
+        "stdout": stdout,
+        "stderr": "1/1 checks failed\n",
+        "dependencies": (
+            {str(manifest_path): get_file_key(manifest_path)} if checks_run else None
+        ),
+    }
+    with (
+        patch.object(sys, "argv", ["dbtra-client", "all-checks"]),
+        patch("utils.daemon_client.request_run", return_value=response),
+        pytest.raises(SystemExit),
+    ):
+        main()
+    run_cache = RunCache(tmp_path / "runs")
+    record = run_cache.load(run_cache.get_entry_path(["all-checks"], Path.cwd()))
+    assert (record is not None) is expected_recorded
+    if record is not None:
+        assert record.exit_code == 1
+        assert record.output == "1/1 checks failed\n"
+        assert record.stdout == stdout
@@ -0,0 +1,75 @@
+import pytest
+
+from utils.lean_manifest import project_object
+
+MODEL_DATA = {
+    "unique_id": "model.pkg.a",
+    "name": "a",
+    "resource_type": "model",
+    "package_name": "pkg",
+    "original_file_path": "models/a.sql",
+    "raw_code": "select 1",
+    "fqn": ["pkg", "a"],
+    "depends_on": {"macros": ["macro.dbt.is_incremental"], "nodes": []},
+    "docs": {"show": True},
+    "tags": ["nightly"],
+    "config": {"materialized": "table", "tags": ["hourly"], "post-hook": []},
+    "columns": {
+        "id": {"name": "id", "data_type": "integer", "quote": None, "meta": {}},
+    },
+}
+
+
+def test_project_object_keeps_fields_checks_read():
+    assert project_object("nodes", MODEL_DATA) == {
+        "unique_id": "model.pkg.a",
+        "name": "a",
+        "resource_type": "model",
+        "package_name": "pkg",
+        "original_file_path": "models/a.sql",
+        "tags": ["nightly"],
+        "config": {"materialized": "table", "tags": ["hourly"], "post-hook": []},
+        "columns": {"id": {"name": "id", "data_type": "integer"}},
+    }
+
+
+def test_project_object_interns_repeated_strings():
+    other_data = {
+        **MODEL_DATA,
+        "package_name": "".join(["p", "kg"]),
+        "config": {"materialized": "".join(["tab", "le"])},
+    }
+    projected = project_object("nodes", MODEL_DATA)
+    other_projected = project_object("nodes", other_data)
+    assert other_projected["package_name"] is projected["package_name"]
+    assert (
+        other_projected["config"]["materialized"] is projected["config"]["materialized"]
+    )
+
+
+@pytest.mark.parametrize(
+    ids=["generic test", "singular test"],
+    argnames=["test_metadata", "expected_test_metadata"],
+    argvalues=[
+        ({"name": "unique", "kwargs": {"column_name": "id"}}, {"name": "unique"}),
+        ({}, {}),
+    ],
+)
+def test_project_object_test_metadata(test_metadata, expected_test_metadata):
+    projected = project_object(
+        "nodes", {"resource_type": "test", "test_metadata": test_metadata}
+    )
+    assert projected["test_metadata"] == expected_test_metadata
+
+
+def test_project_object_macro():
+    assert project_object(
+        "macros",
+        {
+            "name": "m",
+            "macro_sql": "{% macro m() %}{% endmacro %}",
+            "arguments": [],
+            "depends_on": {"macros": []},
+            "supported_languages": None,
+        },
+    ) == {"name": "m", "macro_sql": "{% macro m() %}{% endmacro %}", "arguments": []}
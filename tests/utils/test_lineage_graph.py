@@ -0,0 +1,140 @@
+import mmap
+import random
+
+import pytest
+
+from utils.lineage_graph import LINEAGE_GRAPH_HEADER, LineageGraph
+from utils.manifest_diff import get_relatives
+
+PARENT_MAP = {
+    "source.a": [],
+    "model.b": ["source.a"],
+    "model.c": ["model.b"],
+    "model.d": ["model.b", "model.c"],
+    "model.é": ["model.d"],
+}
+CHILD_MAP = {
+    "source.a": ["model.b"],
+    "model.b": ["model.c", "model.d"],
+    "model.c": ["model.d"],
+    "model.d": ["model.é"],
+    "model.é": [],
+}
+
+
+@pytest.fixture
+def graph() -> LineageGraph:
+    return LineageGraph.from_maps(PARENT_MAP, CHILD_MAP)
+
+
+def test_lineage_graph_encodes_unique_ids_in_sorted_order(graph: LineageGraph):
+    assert len(graph) == 5
+    assert graph.unique_ids == sorted(PARENT_MAP)
+    assert graph.get_index("model.é") == 3
+    assert graph.get_index("model.z") is None
+
+
+@pytest.mark.parametrize(
+    argnames=["unique_ids", "relation", "include_indirect", "expected"],
+    ids=[
+        "direct children",
+        "indirect children",
+        "direct parents",
+        "indirect parents",
+        "several objects",
+        "no relatives",
+        "unknown object",
+    ],
+    argvalues=[
+        (["model.b"], "children", False, {"model.c", "model.d"}),
+        (["model.b"], "children", True, {"model.c", "model.d", "model.é"}),
+        (["model.d"], "parents", False, {"model.b", "model.c"}),
+        (["model.d"], "parents", True, {"model.b", "model.c", "source.a"}),
+        (
+            ["model.c", "model.é"],
+            "parents",
+            True,
+            {"model.b", "model.c", "model.d", "source.a"},
+        ),
+        (["source.a"], "parents", True, set()),
+        (["model.z"], "children", True, set()),
+    ],
+)
+def test_lineage_graph_get_relatives_of_any(
+    graph: LineageGraph,
+    unique_ids: list[str],
+    relation: str,
+    include_indirect: bool,
+    expected: set[str],
+):
+    assert (
+        graph.get_relatives_of_any(unique_ids, relation, include_indirect) == expected
+    )
+
+
+def test_lineage_graph_matches_relation_map_traversal():
+    generator = random.Random(0)
+    unique_ids = [f"model.m{index}" for index in range(200)]
+    parent_map: dict[str, list[str]] = {unique_id: [] for unique_id in unique_ids}
+    child_map: dict[str, list[str]] = {unique_id: [] for unique_id in unique_ids}
+    for index, unique_id in enumerate(unique_ids[1:], start=1):
+        for parent_id in generator.sample(unique_ids[:index], min(index, 3)):
+            parent_map[unique_id].append(parent_id)
+            child_map[parent_id].append(unique_id)
+    graph = LineageGraph.from_maps(parent_map, child_map)
+    for relation_map, relation in ((parent_map, "parents"), (child_map, "children")):
+        for sample in (unique_ids[:1], unique_ids[50:55], unique_ids[::40]):
+            assert graph.get_relatives_of_any(
+                sample,
+                relation,
+                include_indirect=True,
+            ) == get_relatives(sample, relation_map)
+
+
+@pytest.mark.parametrize(
+    argnames=["unique_id", "relation", "expected"],
+    ids=["key of the parent map", "key of the child map", "only a relative"],
+    argvalues=[
+        ("model.b", "parents", True),
+        ("model.b", "children", True),
+        ("model.b", "children", False),
+    ],
+)
+def test_lineage_graph_has_relation_map_entry(
+    unique_id: str, relation: str, expected: bool
+):
+    child_map = CHILD_MAP if expected else {"source.a": ["model.b"]}
+    graph = LineageGraph.from_maps(PARENT_MAP, child_map)
+    assert graph.has_relation_map_entry(unique_id, relation) is expected
+
+
+def test_lineage_graph_round_trips_through_file(tmp_path, graph: LineageGraph):
+    path = tmp_path / "lineage.bin"
+    path.write_bytes(LineageGraph.encode(PARENT_MAP, CHILD_MAP))
+    with open(path, "rb") as file_handler:
+        loaded = LineageGraph(
+            mmap.mmap(file_handler.fileno(), 0, access=mmap.ACCESS_READ)
+        )
+    assert loaded.get_relatives_of_any(
+        ["source.a"], "children", True
+    ) == graph.get_relatives_of_any(["source.a"], "children", True)
+
+
+@pytest.mark.parametrize(
+    argnames=["content"],
+    ids=["empty", "wrong magic", "truncated"],
+    argvalues=[
+        (b"",),
+        (b"x" * LINEAGE_GRAPH_HEADER.size,),
+        (LineageGraph.encode(PARENT_MAP, CHILD_MAP)[:-1],),
+    ],
+)
+def test_lineage_graph_rejects_invalid_buffer(content: bytes):
+    with pytest.raises(ValueError):
+        LineageGraph(content)
+
+
+def test_lineage_graph_empty_maps():
+    graph = LineageGraph.from_maps({}, {})
+    assert len(graph) == 0
+    assert graph.get_relatives_of_any(["model.a"], "children", True) == frozenset()
@@ -0,0 +1,319 @@
+import pytest
+
+from utils.manifest_diff import (
+    get_changed_ids,
+    get_fingerprints,
+    get_modified_unique_ids,
+    get_state_modified_unique_ids,
+)
+
+OLD_DATA = {
+    "nodes": {
+        "model.pkg.a": {"resource_type": "model", "description": ""},
+        "model.pkg.b": {"resource_type": "model", "description": ""},
+        "model.pkg.c": {"resource_type": "model", "description": ""},
+        "test.pkg.not_null_b": {"resource_type": "test", "description": ""},
+    },
+    "parent_map": {
+        "model.pkg.a": [],
+        "model.pkg.b": ["model.pkg.a"],
+        "model.pkg.c": ["model.pkg.b"],
+        "test.pkg.not_null_b": ["model.pkg.b"],
+    },
+    "child_map": {
+        "model.pkg.a": ["model.pkg.b"],
+        "model.pkg.b": ["model.pkg.c", "test.pkg.not_null_b"],
+        "model.pkg.c": [],
+        "test.pkg.not_null_b": [],
+    },
+}
+
+
+def with_changes(**changes):
+    data = {section: dict(objects) for section, objects in OLD_DATA.items()}
+    for section, objects in changes.items():
+        data[section].update(objects)
+    return data
+
+
+def test_get_changed_ids():
+    assert get_changed_ids({"a": 1, "b": 2}, {"a": 1, "b": 3, "c": 4}) == {"b", "c"}
+
+
+@pytest.mark.parametrize(
+    ids=[
+        "unchanged",
+        "changed node",
+        "new node",
+        "removed node",
+        "changed test",
+        "changed lineage",
+        "indirect children",
+        "indirect parents",
+    ],
+    argnames=["new_data", "kwargs", "expected_return"],
+    argvalues=[
+        (OLD_DATA, {}, set()),
+        (
+            with_changes(
+                nodes={"model.pkg.a": {"resource_type": "model", "description": "A"}}
+            ),
+            {},
+            {"model.pkg.a"},
+        ),
+        (
+            with_changes(nodes={"model.pkg.d": {"resource_type": "model"}}),
+            {},
+            {"model.pkg.d"},
+        ),
+        (
+            {
+                **OLD_DATA,
+                "nodes": {
+                    unique_id: node
+                    for unique_id, node in OLD_DATA["nodes"].items()
+                    if unique_id != "model.pkg.c"
+                },
+            },
+            {},
+            set(),
+        ),
+        (
+            with_changes(
+                nodes={
+                    "test.pkg.not_null_b": {"resource_type": "test", "description": "T"}
+                }
+            ),
+            {},
+            {"test.pkg.not_null_b", "model.pkg.b"},
+        ),
+        (
+            with_changes(
+                parent_map={"model.pkg.c": ["model.pkg.a"]},
+                child_map={
+                    "model.pkg.a": ["model.pkg.b", "model.pkg.c"],
+                    "model.pkg.b": ["test.pkg.not_null_b"],
+                },
+            ),
+            {},
+            {"model.pkg.a", "model.pkg.b", "model.pkg.c"},
+        ),
+        (
+            with_changes(child_map={"model.pkg.b": ["model.pkg.c"]}),
+            {"include_indirect_children": True},
+            {"model.pkg.a", "model.pkg.b"},
+        ),
+        (
+            with_changes(parent_map={"model.pkg.b": []}),
+            {"include_indirect_parents": True},
+            {"model.pkg.b", "model.pkg.c", "test.pkg.not_null_b"},
+        ),
+    ],
+)
+def test_get_modified_unique_ids(new_data, kwargs, expected_return):
+    assert get_modified_unique_ids(OLD_DATA, new_data, **kwargs) == expected_return
+
+
+BASELINE_DATA = {
+    "nodes": {
+        "model.pkg.a": {
+            "checksum": {"name": "sha256", "checksum": "1"},
+            "description": "",
+            "columns": {"id": {"name": "id", "description": ""}},
+            "compiled_path": "target/a.sql",
+        },
+    },
+    "macros": {"macro.pkg.m": {"macro_sql": "{% macro m() %}{% endmacro %}"}},
+}
+
+
+def test_get_fingerprints():
+    fingerprints = get_fingerprints(BASELINE_DATA)
+    assert fingerprints.keys() == {"model.pkg.a", "model.pkg.a.id", "macro.pkg.m"}
+    assert fingerprints == get_fingerprints(BASELINE_DATA)
+
+
+@pytest.mark.parametrize(
+    ids=["unchanged", "unused field", "column", "checksum", "new macro", "removed"],
+    argnames=["nodes", "macros", "expected_return"],
+    argvalues=[
+        (BASELINE_DATA["nodes"], BASELINE_DATA["macros"], set()),
+        (
+            {
+                "model.pkg.a": {
+                    **BASELINE_DATA["nodes"]["model.pkg.a"],
+                    "compiled_path": "target/b.sql",
+                }
+            },
+            BASELINE_DATA["macros"],
+            set(),
+        ),
+        (
+            {
+                "model.pkg.a": {
+                    **BASELINE_DATA["nodes"]["model.pkg.a"],
+                    "columns": {"id": {"name": "id", "description": "ID"}},
+                }
+            },
+            BASELINE_DATA["macros"],
+            {"model.pkg.a", "model.pkg.a.id"},
+        ),
+        (
+            {
+                "model.pkg.a": {
+                    **BASELINE_DATA["nodes"]["model.pkg.a"],
+                    "checksum": {"name": "sha256", "checksum": "2"},
+                }
+            },
+            BASELINE_DATA["macros"],
+            {"model.pkg.a"},
+        ),
+        (
+            BASELINE_DATA["nodes"],
+            {**BASELINE_DATA["macros"], "macro.pkg.n": {"macro_sql": ""}},
+            {"macro.pkg.n"},
+        ),
+        ({}, {}, set()),
+    ],
+)
+def test_get_state_modified_unique_ids(nodes, macros, expected_return):
+    assert (
+        get_state_modified_unique_ids(
+            get_fingerprints(BASELINE_DATA), {"nodes": nodes, "macros": macros}
+        )
+        == expected_return
+    )
+
+
+TESTED_BASELINE_DATA = {
+    "nodes": {
+        "model.pkg.a": {"resource_type": "model", "tags": ["daily"]},
+        "model.pkg.b": {"resource_type": "model"},
+        "test.pkg.not_null_a": {
+            "resource_type": "test",
+            "test_metadata": {"name": "not_null"},
+        },
+    },
+    "sources": {
+        "source.pkg.raw.a": {
+            "resource_type": "source",
+            "loader": "fivetran",
+            "loaded_at_field": "_loaded_at",
+            "freshness": {"warn_after": {"count": 1, "period": "day"}},
+            "tags": ["raw"],
+        },
+    },
+    "unit_tests": {
+        "unit_test.pkg.b.test_b": {"resource_type": "unit_test", "name": "test_b"},
+    },
+    "parent_map": {
+        "model.pkg.a": ["source.pkg.raw.a"],
+        "model.pkg.b": ["model.pkg.a"],
+        "test.pkg.not_null_a": ["model.pkg.a"],
+        "unit_test.pkg.b.test_b": ["model.pkg.b"],
+    },
+}
+
+
+def with_object_changes(section: str, unique_id: str, object_data: dict | None):
+    objects = dict(TESTED_BASELINE_DATA[section])
+    parent_map = dict(TESTED_BASELINE_DATA["parent_map"])
+    if object_data is None:
+        del objects[unique_id]
+        del parent_map[unique_id]
+    else:
+        objects[unique_id] = {**objects.get(unique_id, {}), **object_data}
+    return {**TESTED_BASELINE_DATA, section: objects, "parent_map": parent_map}
+
+
+@pytest.mark.parametrize(
+    ids=[
+        "source loader",
+        "source loaded at field",
+        "source freshness",
+        "source tags",
+        "model tags",
+        "data test added",
+        "data test changed",
+        "data test removed",
+        "unit test added",
+        "unit test changed",
+        "unit test removed",
+    ],
+    argnames=["data", "expected_return"],
+    argvalues=[
+        (
+            with_object_changes("sources", "source.pkg.raw.a", {"loader": None}),
+            {"source.pkg.raw.a"},
+        ),
+        (
+            with_object_changes(
+                "sources", "source.pkg.raw.a", {"loaded_at_field": None}
+            ),
+            {"source.pkg.raw.a"},
+        ),
+        (
+            with_object_changes("sources", "source.pkg.raw.a", {"freshness": None}),
+            {"source.pkg.raw.a"},
+        ),
+        (
+            with_object_changes("sources", "source.pkg.raw.a", {"tags": []}),
+            {"source.pkg.raw.a"},
+        ),
+        (
+            with_object_changes("nodes", "model.pkg.a", {"tags": []}),
+            {"model.pkg.a"},
+        ),
+        (
+            {
+                **with_object_changes(
+                    "nodes", "test.pkg.unique_b", {"resource_type": "test"}
+                ),
+                "parent_map": {
+                    **TESTED_BASELINE_DATA["parent_map"],
+                    "test.pkg.unique_b": ["model.pkg.b"],
+                },
+            },
+            {"test.pkg.unique_b", "model.pkg.b"},
+        ),
+        (
+            with_object_changes(
+                "nodes", "test.pkg.not_null_a", {"test_metadata": {"name": "unique"}}
+            ),
+            {"test.pkg.not_null_a", "model.pkg.a"},
+        ),
+        (
+            with_object_changes("nodes", "test.pkg.not_null_a", None),
+            {"model.pkg.a"},
+        ),
+        (
+            {
+                **with_object_changes(
+                    "unit_tests", "unit_test.pkg.a.test_a", {"name": "test_a"}
+                ),
+                "parent_map": {
+                    **TESTED_BASELINE_DATA["parent_map"],
+                    "unit_test.pkg.a.test_a": ["model.pkg.a"],
+                },
+            },
+            {"unit_test.pkg.a.test_a", "model.pkg.a"},
+        ),
+        (
+            with_object_changes(
+                "unit_tests", "unit_test.pkg.b.test_b", {"description": "new"}
+            ),
+            {"unit_test.pkg.b.test_b", "model.pkg.b"},
+        ),
+        (
+            with_object_changes("unit_tests", "unit_test.pkg.b.test_b", None),
+            {"model.pkg.b"},
+        ),
+    ],
+)
+def test_get_state_modified_unique_ids_of_fields_and_tests_checks_read(
+    data, expected_return
+):
+    assert (
+        get_state_modified_unique_ids(get_fingerprints(TESTED_BASELINE_DATA), data)
+        == expected_return
+    )
@@ -2,13 +2,14 @@ from argparse import Namespace
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
 from typing import Optional, Type
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, PropertyMock, call, patch
 
 import pytest
 from _pytest.raises import RaisesExc
 
 from utils.artifact_data import Manifest
 from utils.console_formatting import ConsoleEmphasis, colour_message
+from utils.lineage_graph import LineageGraph
 from utils.manifest_filter_conditions import (
     DirectChildrenFilterMethod,
     DirectParentsFilterMethod,
@@ -17,14 +18,16 @@ from utils.manifest_filter_conditions import (
     ManifestFilterConditions,
     ManifestFilterMethod,
     MaterializationFilterMethod,
+    ModifiedObjectFilterMethod,
     NamePatternFilterMethod,
     PackageFilterMethod,
     PathFilterMethod,
     ResourceTypeFilterMethod,
+    StateFilterMethod,
     TagFilterMethod,
     UniqueIdFilterMethod,
-    try_filter_method,
 )
+from utils.manifest_object.macro import Macro
 from utils.manifest_object.manifest_object import (
     HasPatchPathMixin,
     ManifestColumn,
@@ -43,49 +46,52 @@ class ConcreteManifestObject(ManifestObject, HasPatchPathMixin):
         "Included column",
         "Excluded model",
         "Excluded column",
+        "Not applicable",
     ],
-    argnames=["filter_method", "manifest_object", "manifest", "expected_return"],
+    argnames=["args", "manifest_object", "expected_return"],
     argvalues=[
         (
-            PathFilterMethod(Namespace(include_node_paths=[Path("test")])),
+            Namespace(include_node_paths=[Path("test")]),
             ManifestModel({"original_file_path": "test"}),
-            Mock(),
             True,
         ),
         (
-            PathFilterMethod(Namespace(include_node_paths=[Path("test")])),
+            Namespace(include_node_paths=[Path("test")]),
             ManifestColumn(
                 {"name": "column_1"},
                 parent=ManifestModel({"original_file_path": "test"}),
             ),
-            Mock(),
             True,
         ),
         (
-            PathFilterMethod(Namespace(exclude_node_paths=[Path("test")])),
+            Namespace(exclude_node_paths=[Path("test")]),
             ManifestModel({"unique_id": "test_model", "original_file_path": "test"}),
-            Mock(),
             False,
         ),
         (
-            PathFilterMethod(Namespace(exclude_node_paths=[Path("test")])),
+            Namespace(exclude_node_paths=[Path("test")]),
             ManifestColumn(
                 {"name": "column_1"},
                 parent=ManifestModel({"original_file_path": "test"}),
             ),
-            Mock(),
             False,
         ),
+        (
+            Namespace(exclude_node_paths=[Path("test")]),
+            ManifestModel({"unique_id": "test_model"}),
+            True,
+        ),
     ],
 )
-def test_try_filter_method(
-    filter_method: ManifestFilterMethod,
+def test_manifest_filter_conditions_is_in_scope_by(
+    args: Namespace,
     manifest_object: ManifestObject,
-    manifest: Manifest,
     expected_return: bool,
 ):
+    instance = ManifestFilterConditions(args)
     assert (
-        try_filter_method(filter_method, manifest_object, manifest) is expected_return
+        instance.is_in_scope_by(0, manifest_object, Mock(), use_parent=False)
+        is expected_return
     )
 
 
@@ -120,6 +126,8 @@ def test_try_filter_method(
                 "exclude_direct_children": ["one_more_model"],
                 "exclude_indirect_children": ["yet_another_model"],
                 "exclude_unique_ids": ["another_model"],
+                "state": Path("prod/target"),
+                "state_selector": "modified+",
             },
             (
                 MaterializationFilterMethod(
@@ -194,6 +202,10 @@ def test_try_filter_method(
                         exclude_unique_ids={"another_model"},
                     )
                 ),
+                ModifiedObjectFilterMethod(Namespace()),
+                StateFilterMethod(
+                    Namespace(state=Path("prod/target"), state_selector="modified+")
+                ),
             ),
         ),
         (
@@ -286,6 +298,8 @@ def test_try_filter_method(
                         exclude_unique_id=None,
                     )
                 ),
+                ModifiedObjectFilterMethod(Namespace()),
+                StateFilterMethod(Namespace(state=None)),
             ),
         ),
         (
@@ -357,6 +371,8 @@ def test_try_filter_method(
                         exclude_unique_id={"another_model"},
                     )
                 ),
+                ModifiedObjectFilterMethod(Namespace()),
+                StateFilterMethod(Namespace(state=None)),
             ),
         ),
     ],
@@ -615,6 +631,88 @@ def test_unique_id_filter_method_is_manifest_object_in_scope(
     assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
 
 
+@pytest.mark.parametrize(
+    ids=["not watching", "modified", "not modified"],
+    argnames=["args", "expected_return", "expected_summary"],
+    argvalues=[
+        (Namespace(), True, ""),
+        (
+            Namespace(include_modified_unique_ids=["test_model"]),
+            True,
+            "modified since the last run: 1 objects",
+        ),
+        (
+            Namespace(include_modified_unique_ids=["another_model"]),
+            False,
+            "modified since the last run: 1 objects",
+        ),
+    ],
+)
+def test_modified_object_filter_method(
+    args: Namespace, expected_return: bool, expected_summary: str
+):
+    instance = ModifiedObjectFilterMethod(args)
+    manifest_object = ConcreteManifestObject({"unique_id": "test_model"})
+    assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
+    assert instance.includes_summary == expected_summary
+    assert not instance.applies_to(ManifestColumn)
+
+
+@pytest.mark.parametrize(
+    ids=["no state", "modified", "default selector", "modified and descendants"],
+    argnames=["args", "expected_include_values", "expected_summary"],
+    argvalues=[
+        (Namespace(state=None, state_selector="modified"), None, ""),
+        (
+            Namespace(state=Path("prod"), state_selector="modified"),
+            {(Path("prod"), False)},
+            "modified relative to: prod",
+        ),
+        (
+            Namespace(state=Path("prod")),
+            {(Path("prod"), False)},
+            "modified relative to: prod",
+        ),
+        (
+            Namespace(state=Path("prod"), state_selector="modified+"),
+            {(Path("prod"), True)},
+            "modified and descendants relative to: prod",
+        ),
+    ],
+)
+def test_state_filter_method_post_init(args, expected_include_values, expected_summary):
+    instance = StateFilterMethod(args)
+    assert instance.include_values == expected_include_values
+    assert instance.exclude_values is None
+    assert instance.includes_summary == expected_summary
+
+
+@pytest.mark.parametrize(
+    ids=["modified", "unmodified"],
+    argnames=["unique_id", "expected_return"],
+    argvalues=[("test_model", True), ("another_model", False)],
+)
+def test_state_filter_method_is_manifest_object_in_scope(unique_id, expected_return):
+    manifest = Mock()
+    manifest.get_state_modified.return_value = frozenset({"test_model"})
+    instance = StateFilterMethod(
+        Namespace(state=Path("prod"), state_selector="modified+")
+    )
+    assert (
+        instance.is_manifest_object_in_scope(
+            ConcreteManifestObject({"unique_id": unique_id}), manifest
+        )
+        is expected_return
+    )
+    manifest.get_state_modified.assert_called_once_with(
+        Path("prod"), include_descendants=True
+    )
+    with pytest.raises(ValueError):
+        instance.is_manifest_object_in_scope(
+            ConcreteManifestObject({"unique_id": unique_id})
+        )
+
+
 @pytest.mark.parametrize(
     argnames=[
         "data",
@@ -712,7 +810,6 @@ def test_manifest_object_filter_method_post_init(
         "include_packages",
         "exclude_packages",
         "expected_return",
-        "expected_raise",
     ],
     ids=[
         "Explicitly included",
@@ -733,7 +830,6 @@ def test_manifest_object_filter_method_post_init(
             ["test_dbt_package"],
             None,
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -743,7 +839,6 @@ def test_manifest_object_filter_method_post_init(
             ["test_dbt_package"],
             None,
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -753,7 +848,6 @@ def test_manifest_object_filter_method_post_init(
             None,
             ["test_dbt_package"],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -763,7 +857,6 @@ def test_manifest_object_filter_method_post_init(
             None,
             ["test_dbt_package"],
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -773,7 +866,6 @@ def test_manifest_object_filter_method_post_init(
             ["test_dbt_package"],
             ["different_dbt_package"],
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -783,7 +875,6 @@ def test_manifest_object_filter_method_post_init(
             ["different_dbt_package"],
             ["test_dbt_package"],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -793,7 +884,6 @@ def test_manifest_object_filter_method_post_init(
             ["test_dbt_package"],
             ["test_dbt_package"],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -801,8 +891,7 @@ def test_manifest_object_filter_method_post_init(
             },
             ["test_dbt_package"],
             ["test_dbt_package"],
-            False,
-            pytest.raises(NotImplementedError),
+            None,
         ),
     ],
 )
@@ -811,7 +900,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
     include_packages: list[str],
     exclude_packages: list[str],
     expected_return: bool,
-    expected_raise: does_not_raise | RaisesExc[BaseException],
 ):
     manifest_object = ConcreteManifestObject(data)
     instance = PackageFilterMethod(
@@ -820,8 +908,7 @@ def test_package_filter_method_is_manifest_object_in_scope(
             exclude_packages=exclude_packages,
         )
     )
-    with expected_raise:
-        assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
+    assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
 
 
 @pytest.mark.parametrize(
@@ -830,7 +917,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
         "include_paths",
         "exclude_paths",
         "expected_return",
-        "expected_raise",
     ],
     ids=[
         "Explicitly included",
@@ -852,7 +938,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
             [Path("test/model/")],
             None,
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -862,7 +947,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
             [Path("test/model/subdir/")],
             None,
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -872,7 +956,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
             None,
             [Path("test/model/")],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -882,7 +965,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
             None,
             [Path("test/model/subdir/")],
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -892,7 +974,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
             [Path("test/model/")],
             [Path("test/model/subdir/")],
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -902,7 +983,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
             [Path("test/model/subdir/")],
             [Path("test/model/")],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -912,7 +992,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
             [Path("test/model/")],
             [Path("test/model")],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -922,7 +1001,6 @@ def test_package_filter_method_is_manifest_object_in_scope(
             [Path("test/model/path.sql")],
             None,
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -930,8 +1008,7 @@ def test_package_filter_method_is_manifest_object_in_scope(
             },
             [Path("test/model/")],
             None,
-            True,
-            pytest.raises(NotImplementedError),
+            None,
         ),
     ],
 )
@@ -940,7 +1017,6 @@ def test_path_filter_method_is_manifest_object_in_scope(
     include_paths: list[Path],
     exclude_paths: list[Path],
     expected_return: bool,
-    expected_raise: does_not_raise | RaisesExc[BaseException],
 ):
     manifest_object = ConcreteManifestObject(data)
     instance = PathFilterMethod(
@@ -949,8 +1025,7 @@ def test_path_filter_method_is_manifest_object_in_scope(
             exclude_node_paths=exclude_paths,
         )
     )
-    with expected_raise:
-        assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
+    assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
 
 
 @pytest.mark.parametrize(
@@ -1058,7 +1133,6 @@ def test_resource_type_filter_method_is_manifest_object_in_scope(
         "include_materializations",
         "exclude_materializations",
         "expected_return",
-        "expected_raise",
     ],
     ids=[
         "Explicitly included",
@@ -1081,7 +1155,6 @@ def test_resource_type_filter_method_is_manifest_object_in_scope(
             ["view"],
             None,
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -1093,7 +1166,6 @@ def test_resource_type_filter_method_is_manifest_object_in_scope(
             ["table"],
             None,
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -1105,7 +1177,6 @@ def test_resource_type_filter_method_is_manifest_object_in_scope(
             None,
             ["view"],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -1117,7 +1188,6 @@ def test_resource_type_filter_method_is_manifest_object_in_scope(
             None,
             ["table"],
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -1129,7 +1199,6 @@ def test_resource_type_filter_method_is_manifest_object_in_scope(
             ["view"],
             ["table"],
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -1141,7 +1210,6 @@ def test_resource_type_filter_method_is_manifest_object_in_scope(
             ["view"],
             ["table"],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -1153,7 +1221,6 @@ def test_resource_type_filter_method_is_manifest_object_in_scope(
             ["view"],
             ["view"],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -1164,8 +1231,7 @@ def test_resource_type_filter_method_is_manifest_object_in_scope(
             ManifestObject,
             ["view"],
             None,
-            True,
-            pytest.raises(NotImplementedError),
+            None,
         ),
     ],
 )
@@ -1175,7 +1241,6 @@ def test_manifest_object_filter_nodes_by_materialization_type(
     include_materializations: list[str],
     exclude_materializations: list[str],
     expected_return: bool,
-    expected_raise: does_not_raise | RaisesExc[BaseException],
 ):
     manifest_object = object_type(data)
     instance = MaterializationFilterMethod(
@@ -1184,8 +1249,7 @@ def test_manifest_object_filter_nodes_by_materialization_type(
             exclude_materializations=exclude_materializations,
         )
     )
-    with expected_raise:
-        assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
+    assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
 
 
 @pytest.mark.parametrize(
@@ -1195,7 +1259,6 @@ def test_manifest_object_filter_nodes_by_materialization_type(
         "include_tags",
         "exclude_tags",
         "expected_return",
-        "expected_raise",
     ],
     ids=[
         "Explicitly included",
@@ -1217,7 +1280,6 @@ def test_manifest_object_filter_nodes_by_materialization_type(
             ["test_tag"],
             None,
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -1228,7 +1290,6 @@ def test_manifest_object_filter_nodes_by_materialization_type(
             ["different_tag"],
             None,
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -1239,7 +1300,6 @@ def test_manifest_object_filter_nodes_by_materialization_type(
             None,
             ["test_tag"],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -1250,7 +1310,6 @@ def test_manifest_object_filter_nodes_by_materialization_type(
             None,
             ["different_tag"],
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -1261,7 +1320,6 @@ def test_manifest_object_filter_nodes_by_materialization_type(
             ["test_tag"],
             ["different_tag"],
             True,
-            does_not_raise(),
         ),
         (
             {
@@ -1272,7 +1330,6 @@ def test_manifest_object_filter_nodes_by_materialization_type(
             ["different_tag"],
             ["another_tag"],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -1283,7 +1340,6 @@ def test_manifest_object_filter_nodes_by_materialization_type(
             ["test_tag"],
             ["another_tag"],
             False,
-            does_not_raise(),
         ),
         (
             {
@@ -1293,8 +1349,7 @@ def test_manifest_object_filter_nodes_by_materialization_type(
             ManifestObject,
             ["test_tag"],
             None,
-            True,
-            pytest.raises(NotImplementedError),
+            None,
         ),
     ],
 )
@@ -1304,7 +1359,6 @@ def test_tag_filter_method_is_manifest_object_in_scope(
     include_tags: list[str],
     exclude_tags: list[str],
     expected_return: bool,
-    expected_raise: does_not_raise | RaisesExc[BaseException],
 ):
     manifest_object = object_type(data)
     instance = TagFilterMethod(
@@ -1313,8 +1367,7 @@ def test_tag_filter_method_is_manifest_object_in_scope(
             exclude_tags=exclude_tags,
         )
     )
-    with expected_raise:
-        assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
+    assert instance.is_manifest_object_in_scope(manifest_object) is expected_return
 
 
 @pytest.mark.parametrize(
@@ -1339,7 +1392,7 @@ def test_tag_filter_method_is_manifest_object_in_scope(
             },
             ["test_model", "another_model"],
             {"test_model"},
-            Mock(),
+            Mock(candidate_count=0),
             True,
             does_not_raise(),
         ),
@@ -1349,7 +1402,7 @@ def test_tag_filter_method_is_manifest_object_in_scope(
             },
             ["test_model", "another_model"],
             {"one_more_model"},
-            Mock(),
+            Mock(candidate_count=0),
             False,
             does_not_raise(),
         ),
@@ -1369,9 +1422,9 @@ def test_tag_filter_method_is_manifest_object_in_scope(
             },
             ["test_model", "another_model"],
             {"test_model"},
-            Mock(parent_map={}),
-            True,
-            pytest.raises(NotImplementedError),
+            Mock(lineage=LineageGraph.from_maps({}, {})),
+            None,
+            does_not_raise(),
         ),
     ],
 )
@@ -1422,7 +1475,7 @@ def test_direct_parents_filter_method_is_manifest_object_included(
             },
             ["test_model", "another_model"],
             {"test_model"},
-            Mock(),
+            Mock(candidate_count=0),
             True,
             does_not_raise(),
         ),
@@ -1432,7 +1485,7 @@ def test_direct_parents_filter_method_is_manifest_object_included(
             },
             ["test_model", "another_model"],
             {"one_more_model"},
-            Mock(),
+            Mock(candidate_count=0),
             False,
             does_not_raise(),
         ),
@@ -1452,9 +1505,9 @@ def test_direct_parents_filter_method_is_manifest_object_included(
             },
             ["test_model", "another_model"],
             {"test_model"},
-            Mock(parent_map={}),
-            True,
-            pytest.raises(NotImplementedError),
+            Mock(lineage=LineageGraph.from_maps({}, {})),
+            None,
+            does_not_raise(),
         ),
     ],
 )
@@ -1467,20 +1520,20 @@ def test_indirect_parents_filter_method_is_manifest_object_included(
     expected_raise: does_not_raise | RaisesExc[BaseException],
 ):
     manifest_object = ConcreteManifestObject(data)
-    with patch(
-        "utils.manifest_filter_conditions.get_all_parents",
-        return_value=indirect_parents,
-    ):
-        instance = IndirectParentsFilterMethod(
-            args=Namespace(
-                include_indirect_parents=include_indirect_parents,
-            ),
+    if manifest is not None:
+        manifest.get_reachability_index.return_value.has_relative_in.side_effect = (
+            lambda unique_id, values: not indirect_parents.isdisjoint(values)
+        )
+    instance = IndirectParentsFilterMethod(
+        args=Namespace(
+            include_indirect_parents=include_indirect_parents,
+        ),
+    )
+    with expected_raise:
+        assert (
+            instance.is_manifest_object_in_scope(manifest_object, manifest=manifest)
+            is expected_return
         )
-        with expected_raise:
-            assert (
-                instance.is_manifest_object_in_scope(manifest_object, manifest=manifest)
-                is expected_return
-            )
 
 
 @pytest.mark.parametrize(
@@ -1505,7 +1558,7 @@ def test_indirect_parents_filter_method_is_manifest_object_included(
             },
             ["test_model", "another_model"],
             {"test_model"},
-            Mock(),
+            Mock(candidate_count=0),
             True,
             does_not_raise(),
         ),
@@ -1515,7 +1568,7 @@ def test_indirect_parents_filter_method_is_manifest_object_included(
             },
             ["test_model", "another_model"],
             {"one_more_model"},
-            Mock(),
+            Mock(candidate_count=0),
             False,
             does_not_raise(),
         ),
@@ -1535,9 +1588,9 @@ def test_indirect_parents_filter_method_is_manifest_object_included(
             },
             ["test_model", "another_model"],
             {"test_model"},
-            Mock(child_map={}),
-            True,
-            pytest.raises(NotImplementedError),
+            Mock(lineage=LineageGraph.from_maps({}, {})),
+            None,
+            does_not_raise(),
         ),
     ],
 )
@@ -1588,7 +1641,7 @@ def test_direct_children_filter_method_is_manifest_object_included(
             },
             ["test_model", "another_model"],
             {"test_model"},
-            Mock(),
+            Mock(candidate_count=0),
             True,
             does_not_raise(),
         ),
@@ -1598,7 +1651,7 @@ def test_direct_children_filter_method_is_manifest_object_included(
             },
             ["test_model", "another_model"],
             {"one_more_model"},
-            Mock(),
+            Mock(candidate_count=0),
             False,
             does_not_raise(),
         ),
@@ -1618,9 +1671,9 @@ def test_direct_children_filter_method_is_manifest_object_included(
             },
             ["test_model", "another_model"],
             {"test_model"},
-            Mock(child_map={}),
-            True,
-            pytest.raises(NotImplementedError),
+            Mock(lineage=LineageGraph.from_maps({}, {})),
+            None,
+            does_not_raise(),
         ),
     ],
 )
@@ -1633,20 +1686,20 @@ def test_indirect_children_filter_method_is_manifest_object_included(
     expected_raise: does_not_raise | RaisesExc[BaseException],
 ):
     manifest_object = ConcreteManifestObject(data)
-    with patch(
-        "utils.manifest_filter_conditions.get_all_children",
-        return_value=indirect_children,
-    ):
-        instance = IndirectChildrenFilterMethod(
-            args=Namespace(
-                include_indirect_children=include_indirect_children,
-            ),
+    if manifest is not None:
+        manifest.get_reachability_index.return_value.has_relative_in.side_effect = (
+            lambda unique_id, values: not indirect_children.isdisjoint(values)
+        )
+    instance = IndirectChildrenFilterMethod(
+        args=Namespace(
+            include_indirect_children=include_indirect_children,
+        ),
+    )
+    with expected_raise:
+        assert (
+            instance.is_manifest_object_in_scope(manifest_object, manifest=manifest)
+            is expected_return
         )
-        with expected_raise:
-            assert (
-                instance.is_manifest_object_in_scope(manifest_object, manifest=manifest)
-                is expected_return
-            )
 
 
 @pytest.mark.parametrize(
@@ -1927,3 +1980,387 @@ def test_manifest_filter_method_excludes_summary(
         Namespace(exclude_test_filter=exclude_values)
     )
     assert instance.excludes_summary == expected_return
+
+
+def test_manifest_filter_conditions_signature():
+    args = Namespace(include_tags=["test_tag"], exclude_packages=["test_package"])
+    instance = ManifestFilterConditions(args)
+    assert instance.signature == ManifestFilterConditions(args).signature
+    assert hash(instance.signature)
+    assert ("tags", frozenset({"test_tag"}), None) in instance.signature
+    assert ("packages", None, frozenset({"test_package"})) in instance.signature
+    assert (
+        instance.signature
+        != ManifestFilterConditions(Namespace(include_tags=["another_tag"])).signature
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["filter_method_type", "patched_function"],
+    ids=["direct parents", "direct children"],
+    argvalues=[
+        (DirectParentsFilterMethod, "get_direct_parents"),
+        (DirectChildrenFilterMethod, "get_direct_children"),
+    ],
+)
+def test_lineage_filter_methods_look_up_relatives_once(
+    filter_method_type: Type[ManifestFilterMethod],
+    patched_function: str,
+):
+    manifest_object = ConcreteManifestObject({"unique_id": "test_model"})
+    with patch(
+        f"utils.manifest_filter_conditions.{patched_function}",
+        return_value={"another_model"},
+    ) as mock_get_relatives:
+        instance = filter_method_type(
+            include_values={"another_model"}, exclude_values={"one_more_model"}
+        )
+        assert (
+            instance.is_manifest_object_in_scope(
+                manifest_object, Mock(candidate_count=0)
+            )
+            is True
+        )
+        mock_get_relatives.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    argnames=["filter_method_type", "relation"],
+    ids=["indirect parents", "indirect children"],
+    argvalues=[
+        (IndirectParentsFilterMethod, "parents"),
+        (IndirectChildrenFilterMethod, "children"),
+    ],
+)
+def test_lineage_filter_methods_test_indirect_relatives_with_reachability_index(
+    filter_method_type: Type[ManifestFilterMethod],
+    relation: str,
+):
+    manifest_object = ConcreteManifestObject({"unique_id": "test_model"})
+    manifest = Mock(candidate_count=0)
+    index = manifest.get_reachability_index.return_value
+    index.has_relative_in.side_effect = lambda unique_id, values: (
+        "another_model" in values
+    )
+    instance = filter_method_type(
+        include_values={"another_model"}, exclude_values={"one_more_model"}
+    )
+    assert instance.is_manifest_object_in_scope(manifest_object, manifest) is True
+    manifest.get_reachability_index.assert_called_once_with(relation)
+    assert index.has_relative_in.call_args_list == [
+        call("test_model", frozenset({"one_more_model"})),
+        call("test_model", frozenset({"another_model"})),
+    ]
+
+
+@pytest.mark.parametrize(
+    argnames=["args", "candidate_count", "expected_in_scope"],
+    ids=[
+        "include indirect parents, expanded",
+        "include indirect parents, looked up",
+        "exclude direct parents, expanded",
+        "exclude direct parents, looked up",
+        "include indirect children, expanded",
+        "include direct children, looked up",
+    ],
+    argvalues=[
+        (
+            Namespace(include_indirect_parents=["source"]),
+            4,
+            {"base_model", "test_model", "another_model"},
+        ),
+        (
+            Namespace(include_indirect_parents=["source"]),
+            0,
+            {"base_model", "test_model", "another_model"},
+        ),
+        (
+            Namespace(exclude_direct_parents=["base_model"]),
+            4,
+            {"base_model", "source"},
+        ),
+        (
+            Namespace(exclude_direct_parents=["base_model"]),
+            0,
+            {"base_model", "source"},
+        ),
+        (
+            Namespace(include_indirect_children=["test_model"]),
+            4,
+            {"base_model", "source"},
+        ),
+        (
+            Namespace(include_direct_children=["test_model", "another_model"]),
+            0,
+            {"base_model"},
+        ),
+    ],
+)
+def test_lineage_filter_methods_expanded_vs_looked_up(
+    args: Namespace,
+    candidate_count: int,
+    expected_in_scope: set[str],
+):
+    parent_map = {
+        "source": [],
+        "base_model": ["source"],
+        "test_model": ["base_model"],
+        "another_model": ["base_model"],
+    }
+    child_map = {
+        "source": ["base_model"],
+        "base_model": ["test_model", "another_model"],
+        "test_model": [],
+        "another_model": [],
+    }
+    with (
+        patch(
+            "utils.artifact_data.get_json_artifact_data",
+            return_value={"parent_map": parent_map, "child_map": child_map},
+        ),
+        patch.object(
+            Manifest, "candidate_count", new_callable=PropertyMock
+        ) as mock_candidate_count,
+    ):
+        filter_conditions = ManifestFilterConditions(args)
+        manifest = Manifest(
+            manifest_dir=Path("test"), filter_conditions=filter_conditions
+        )
+        mock_candidate_count.return_value = candidate_count
+        in_scope = {
+            unique_id
+            for unique_id in parent_map
+            if filter_conditions.is_manifest_object_in_scope(
+                ConcreteManifestObject({"unique_id": unique_id}), manifest
+            )
+        }
+    assert in_scope == expected_in_scope
+
+
+@pytest.mark.parametrize(
+    argnames=["args", "expected_in_scope"],
+    ids=["include indirect parents", "exclude indirect children"],
+    argvalues=[
+        (
+            Namespace(
+                include_indirect_parents=["model.source", "model.b", "model.other"]
+            ),
+            ["model.a"],
+        ),
+        (
+            Namespace(exclude_indirect_children=["model.a", "model.b", "model.other"]),
+            ["model.a"],
+        ),
+    ],
+)
+def test_lineage_filter_methods_on_files_do_not_build_reachability_index(
+    args: Namespace, expected_in_scope: list[str]
+):
+    parent_map = {
+        "model.source": [],
+        "model.a": ["model.source"],
+        "model.b": [],
+        "model.other": [],
+    }
+    child_map = {
+        "model.source": ["model.a"],
+        "model.a": [],
+        "model.b": [],
+        "model.other": [],
+    }
+    nodes = {
+        unique_id: {
+            "unique_id": unique_id,
+            "resource_type": "model",
+            "name": unique_id.split(".")[1],
+            "original_file_path": f"models/{unique_id.split('.')[1]}.sql",
+        }
+        for unique_id in parent_map
+    }
+    with (
+        patch(
+            "utils.artifact_data.get_json_artifact_data",
+            return_value={
+                "nodes": nodes,
+                "parent_map": parent_map,
+                "child_map": child_map,
+            },
+        ),
+        patch(
+            "utils.artifact_data.build_reachability_index"
+        ) as mock_build_reachability_index,
+    ):
+        filter_conditions = ManifestFilterConditions(args)
+        manifest = Manifest(
+            manifest_dir=Path("test"),
+            filter_conditions=filter_conditions,
+            filepaths=[Path("models/source.sql"), Path("models/a.sql")],
+        )
+        in_scope = [model.unique_id for model in manifest.in_scope_models]
+    assert in_scope == expected_in_scope
+    mock_build_reachability_index.assert_not_called()
+
+
+def test_manifest_filter_conditions_plan():
+    instance = ManifestFilterConditions(
+        Namespace(
+            include_indirect_parents=["test_model"],
+            include_name_patterns=["^stg_"],
+            exclude_tags=["deprecated"],
+            exclude_packages=[],
+            include_unique_ids=["test_model", "another_model"],
+            include_materializations=["table"],
+        )
+    )
+    assert [type(filter_method) for filter_method in instance.plan] == [
+        UniqueIdFilterMethod,
+        MaterializationFilterMethod,
+        TagFilterMethod,
+        NamePatternFilterMethod,
+        IndirectParentsFilterMethod,
+    ]
+    assert ManifestFilterConditions().plan == ()
+
+
+def test_manifest_filter_conditions_plan_keeps_empty_includes():
+    instance = ManifestFilterConditions(Namespace(include_tags=[]))
+    assert instance.plan == (TagFilterMethod(include_values=set()),)
+    assert not instance.is_manifest_object_in_scope(
+        ManifestModel({"unique_id": "test_model", "tags": ["test_tag"]}), Mock()
+    )
+
+
+@pytest.mark.parametrize(
+    argnames=["object_type", "expected_type_plan"],
+    ids=["model", "column", "macro"],
+    argvalues=[
+        (ManifestModel, {0: False, 1: False, 2: False, 3: False}),
+        (ManifestColumn, {0: False, 1: True, 2: True, 3: False}),
+        (Macro, {0: False, 3: False}),
+    ],
+)
+def test_manifest_filter_conditions_get_type_plan(
+    object_type: Type[ManifestObject],
+    expected_type_plan: dict[int, bool],
+):
+    instance = ManifestFilterConditions(
+        Namespace(
+            include_unique_ids=["test_model"],
+            include_materializations=["table"],
+            exclude_tags=["deprecated"],
+            include_name_patterns=["^stg_"],
+        )
+    )
+    assert instance.get_type_plan(object_type) == expected_type_plan
+    assert instance.get_type_plan(object_type) is instance.get_type_plan(object_type)
+
+
+@pytest.mark.parametrize(
+    argnames=["column_name", "parent_data", "expected_return"],
+    ids=[
+        "in scope",
+        "parent materialization out of scope",
+        "parent tag out of scope",
+        "column name out of scope",
+        "parent without materialization",
+    ],
+    argvalues=[
+        (
+            "id",
+            {"unique_id": "test_model", "config": {"materialized": "table"}},
+            True,
+        ),
+        (
+            "id",
+            {"unique_id": "test_model", "config": {"materialized": "view"}},
+            False,
+        ),
+        (
+            "id",
+            {
+                "unique_id": "test_model",
+                "config": {"materialized": "table"},
+                "tags": ["deprecated"],
+            },
+            False,
+        ),
+        (
+            "_loaded_at",
+            {"unique_id": "test_model", "config": {"materialized": "table"}},
+            False,
+        ),
+        ("id", {"unique_id": "test_model"}, True),
+    ],
+)
+def test_manifest_filter_conditions_column_uses_parent(
+    column_name: str,
+    parent_data: dict,
+    expected_return: bool,
+):
+    instance = ManifestFilterConditions(
+        Namespace(
+            include_materializations=["table"],
+            exclude_tags=["deprecated"],
+            exclude_name_patterns=["^_"],
+        )
+    )
+    column = ManifestColumn({"name": column_name}, parent=ManifestModel(parent_data))
+    assert instance.is_manifest_object_in_scope(column, Mock()) is expected_return
+
+
+@pytest.mark.parametrize(
+    argnames=["column_name", "parent_data", "expected_return"],
+    ids=[
+        "in scope",
+        "parent materialization out of scope",
+        "parent tag out of scope",
+        "column name out of scope",
+        "parent without materialization",
+    ],
+    argvalues=[
+        (
+            "id",
+            {"unique_id": "test_model", "config": {"materialized": "table"}},
+            True,
+        ),
+        (
+            "id",
+            {"unique_id": "test_model", "config": {"materialized": "view"}},
+            False,
+        ),
+        (
+            "id",
+            {
+                "unique_id": "test_model",
+                "config": {"materialized": "table"},
+                "tags": ["deprecated"],
+            },
+            False,
+        ),
+        (
+            "_loaded_at",
+            {"unique_id": "test_model", "config": {"materialized": "table"}},
+            False,
+        ),
+        ("id", {"unique_id": "test_model"}, True),
+    ],
+)
+def test_manifest_filter_conditions_column_verdict_split_by_parent(
+    column_name: str,
+    parent_data: dict,
+    expected_return: bool,
+):
+    instance = ManifestFilterConditions(
+        Namespace(
+            include_materializations=["table"],
+            exclude_tags=["deprecated"],
+            exclude_name_patterns=["^_"],
+        )
+    )
+    parent = ManifestModel(parent_data)
+    column = ManifestColumn({"name": column_name}, parent=parent)
+    manifest = Mock()
+    assert (
+        instance.is_column_parent_in_scope(parent, manifest)
+        and instance.is_column_in_scope_given_parent(column, manifest)
+    ) is expected_return
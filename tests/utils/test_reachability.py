@@ -0,0 +1,151 @@
+import random
+from typing import Type
+from unittest.mock import patch
+
+import pytest
+
+from utils.lineage_graph import LineageGraph
+from utils.manifest_diff import get_relatives
+from utils.reachability import (
+    DEFAULT_MAX_CLOSURE_NODES,
+    MAX_CLOSURE_NODES_ENV_VAR,
+    ClosureReachabilityIndex,
+    IntervalReachabilityIndex,
+    ReachabilityIndex,
+    build_reachability_index,
+    get_max_closure_nodes,
+)
+
+PARENT_MAP = {
+    "source.a": [],
+    "model.b": ["source.a"],
+    "model.c": ["model.b"],
+    "model.d": ["model.b"],
+    "model.e": ["model.c", "model.d"],
+    "model.f": [],
+}
+CHILD_MAP = {
+    "source.a": ["model.b"],
+    "model.b": ["model.c", "model.d"],
+    "model.c": ["model.e"],
+    "model.d": ["model.e"],
+    "model.e": [],
+    "model.f": [],
+}
+
+
+@pytest.fixture(params=[ClosureReachabilityIndex, IntervalReachabilityIndex])
+def index_type(request: pytest.FixtureRequest) -> Type[ReachabilityIndex]:
+    return request.param
+
+
+@pytest.mark.parametrize(
+    argnames=["unique_id", "relation", "values", "expected"],
+    ids=[
+        "direct parent",
+        "indirect parent",
+        "not a parent",
+        "itself",
+        "any of several",
+        "indirect child",
+        "not a child",
+        "unknown object",
+        "unknown value",
+    ],
+    argvalues=[
+        ("model.b", "parents", {"source.a"}, True),
+        ("model.e", "parents", {"source.a"}, True),
+        ("model.c", "parents", {"model.d"}, False),
+        ("model.c", "parents", {"model.c"}, False),
+        ("model.e", "parents", {"model.f", "model.d"}, True),
+        ("source.a", "children", {"model.e"}, True),
+        ("model.d", "children", {"model.c", "model.f"}, False),
+        ("model.z", "parents", {"source.a"}, False),
+        ("model.e", "parents", {"model.z"}, False),
+    ],
+)
+def test_reachability_index_has_relative_in(
+    index_type: Type[ReachabilityIndex],
+    unique_id: str,
+    relation: str,
+    values: set[str],
+    expected: bool,
+):
+    index = index_type(LineageGraph.from_maps(PARENT_MAP, CHILD_MAP), relation)
+    assert index.has_relative_in(unique_id, frozenset(values)) is expected
+    assert index.has_relative_in(unique_id, frozenset(values)) is expected
+
+
+def test_reachability_index_matches_relation_map_traversal(
+    index_type: Type[ReachabilityIndex],
+):
+    generator = random.Random(0)
+    unique_ids = [f"model.m{position}" for position in range(300)]
+    parent_map: dict[str, list[str]] = {unique_id: [] for unique_id in unique_ids}
+    child_map: dict[str, list[str]] = {unique_id: [] for unique_id in unique_ids}
+    for position, unique_id in enumerate(unique_ids[1:], start=1):
+        for parent_id in generator.sample(
+            unique_ids[:position], min(position, generator.randint(0, 3))
+        ):
+            parent_map[unique_id].append(parent_id)
+            child_map[parent_id].append(unique_id)
+    graph = LineageGraph.from_maps(parent_map, child_map)
+    value_sets = [
+        frozenset(generator.sample(unique_ids, generator.randint(1, 20)))
+        for _ in range(5)
+    ]
+    for relation_map, relation in ((parent_map, "parents"), (child_map, "children")):
+        index = index_type(graph, relation)
+        for _ in range(500):
+            unique_id = generator.choice(unique_ids)
+            values = generator.choice(value_sets)
+            assert index.has_relative_in(unique_id, values) is (
+                not get_relatives([unique_id], relation_map).isdisjoint(values)
+            )
+
+
+def test_reachability_index_deep_lineage(index_type: Type[ReachabilityIndex]):
+    depth = 2_000
+    parent_map = {f"model_{i:04}": [f"model_{i + 1:04}"] for i in range(depth)}
+    child_map = {f"model_{i + 1:04}": [f"model_{i:04}"] for i in range(depth)}
+    index = index_type(LineageGraph.from_maps(parent_map, child_map), "parents")
+    assert index.has_relative_in("model_0000", frozenset({f"model_{depth:04}"}))
+    assert not index.has_relative_in(f"model_{depth:04}", frozenset({"model_0000"}))
+
+
+def test_reachability_index_memory_size(index_type: Type[ReachabilityIndex]):
+    index = index_type(LineageGraph.from_maps(PARENT_MAP, CHILD_MAP), "parents")
+    assert index.memory_size > 0
+
+
+@pytest.mark.parametrize(
+    argnames=["max_closure_nodes", "expected_type"],
+    ids=["within the limit", "over the limit"],
+    argvalues=[
+        (6, ClosureReachabilityIndex),
+        (5, IntervalReachabilityIndex),
+    ],
+)
+def test_build_reachability_index(
+    max_closure_nodes: int, expected_type: Type[ReachabilityIndex]
+):
+    index = build_reachability_index(
+        LineageGraph.from_maps(PARENT_MAP, CHILD_MAP),
+        "children",
+        max_closure_nodes=max_closure_nodes,
+    )
+    assert type(index) is expected_type
+    assert index.relation == "children"
+
+
+@pytest.mark.parametrize(
+    argnames=["environment", "expected"],
+    ids=["not set", "set"],
+    argvalues=[
+        ({}, DEFAULT_MAX_CLOSURE_NODES),
+        ({MAX_CLOSURE_NODES_ENV_VAR: "5"}, 5),
+    ],
+)
+def test_get_max_closure_nodes(environment: dict[str, str], expected: int):
+    with patch.dict("os.environ", environment, clear=True):
+        assert get_max_closure_nodes() == expected
@@ -0,0 +1,80 @@
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from utils.artifact_cache import ArtifactCache
+from utils.result_cache import MAX_IDLE_RUNS, ResultCache, get_check_key
+
+ARGS = Namespace(
+    check_id="models-have-tags",
+    must_have_any_tag_from=["a"],
+    include_tags=["b"],
+    files=[Path("models/a.sql")],
+    manifest_dir=Path("target"),
+)
+
+
+@pytest.mark.parametrize(
+    ids=["filters", "files", "artifacts"],
+    argnames=["changes"],
+    argvalues=[
+        ({"include_tags": ["c"], "exclude_packages": ["d"]},),
+        ({"files": None},),
+        ({"manifest_dir": Path("prod"), "state": Path("prod")},),
+    ],
+)
+def test_get_check_key_ignores_scope_arguments(changes):
+    assert get_check_key(Namespace(**{**vars(ARGS), **changes})) == get_check_key(ARGS)
+
+
+@pytest.mark.parametrize(
+    ids=["check", "check arguments"],
+    argnames=["changes"],
+    argvalues=[
+        ({"check_id": "models-have-descriptions"},),
+        ({"must_have_any_tag_from": ["b"]},),
+    ],
+)
+def test_get_check_key_changes_with_check_arguments(changes):
+    assert get_check_key(Namespace(**{**vars(ARGS), **changes})) != get_check_key(ARGS)
+
+
+def test_check_results_round_trip(tmp_path: Path):
+    cache = ResultCache(tmp_path)
+    results = cache.get_results(ARGS)
+    assert results.get(b"a") is None
+    results.put(b"a", (True, {"b"}))
+    results.save()
+    assert cache.get_results(ARGS).get(b"a") == (True, {"b"})
+
+
+def test_check_results_drop_idle_entries(tmp_path: Path):
+    cache = ResultCache(tmp_path)
+    results = cache.get_results(ARGS)
+    results.put(b"idle", (True, None))
+    results.put(b"used", (False, None))
+    results.save()
+    for _ in range(MAX_IDLE_RUNS):
+        results = cache.get_results(ARGS)
+        assert results.get(b"used") == (False, None)
+        results.save()
+    results = cache.get_results(ARGS)
+    assert results.get(b"idle") is None
+    assert results.get(b"used") == (False, None)
+
+
+def test_result_cache_and_artifact_cache_share_a_directory(tmp_path: Path):
+    artifact_path = tmp_path / "manifest.json"
+    artifact_path.write_text("{}")
+    artifact_cache = ArtifactCache(tmp_path / "cache", max_size=1_000)
+    entry_path = artifact_cache.get_entry_path(artifact_path)
+    mapped_entry_path = artifact_cache.get_mapped_entry_path(entry_path)
+    artifact_cache.save(entry_path, "snapshot")
+    result_cache = ResultCache(tmp_path / "cache", max_size=1)
+    results = result_cache.get_results(ARGS)
+    results.put(b"a", (True, "x" * 2_000))
+    results.save()
+    assert artifact_cache.load(entry_path) == "snapshot"
+    artifact_cache.save_mapped(mapped_entry_path, b"x")
+    assert result_cache.get_results(ARGS).get(b"a") == (True, "x" * 2_000)
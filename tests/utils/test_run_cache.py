@@ -0,0 +1,116 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from utils.run_cache import (
+    RACY_WINDOW_NS,
+    RUN_CACHE_DIR_ENV_VAR,
+    RunCache,
+    RunRecord,
+    get_file_key,
+)
+
+
+def test_get_file_key(tmp_path: Path):
+    path = tmp_path / "manifest.json"
+    assert get_file_key(path) is None
+    path.write_text("{}")
+    file_key = get_file_key(path)
+    assert file_key == get_file_key(path)
+    path.write_text("{} ")
+    assert get_file_key(path) != file_key
+
+
+@pytest.mark.parametrize(
+    ids=["unset", "empty", "set"],
+    argnames=["cache_dir", "expected_cache_dir"],
+    argvalues=[(None, None), ("", None), ("runs", Path("runs"))],
+)
+def test_run_cache_from_environment(monkeypatch, cache_dir, expected_cache_dir):
+    if cache_dir is None:
+        monkeypatch.delenv(RUN_CACHE_DIR_ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(RUN_CACHE_DIR_ENV_VAR, cache_dir)
+    run_cache = RunCache.from_environment()
+    assert (run_cache and run_cache.cache_dir) == expected_cache_dir
+
+
+def test_run_cache_get_entry_path(tmp_path: Path):
+    run_cache = RunCache(tmp_path)
+    entry_path = run_cache.get_entry_path(["-c", "models-have-tags"], Path("a"))
+    assert entry_path.parent == tmp_path
+    assert entry_path == run_cache.get_entry_path(["-c", "models-have-tags"], Path("a"))
+    assert entry_path != run_cache.get_entry_path(["-c", "models-have-tags"], Path("b"))
+    assert entry_path != run_cache.get_entry_path([], Path("a"))
+
+
+def test_run_cache_round_trip(tmp_path: Path):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{}")
+    run_cache = RunCache(tmp_path / "runs")
+    entry_path = run_cache.get_entry_path([], tmp_path)
+    assert run_cache.load(entry_path) is None
+    record = RunRecord(
+        dependencies={
+            str(manifest_path): get_file_key(manifest_path),
+            str(tmp_path / "catalog.json"): None,
+        },
+        exit_code="1/1 checks failed",
+        output="models-have-tags failed\n",
+    )
+    run_cache.save(entry_path, record)
+    assert run_cache.load(entry_path) == RunRecord(
+        dependencies={
+            str(manifest_path): list(get_file_key(manifest_path)),
+            str(tmp_path / "catalog.json"): None,
+        },
+        exit_code=record.exit_code,
+        output=record.output,
+    )
+    (tmp_path / "catalog.json").write_text("{}")
+    assert run_cache.load(entry_path) is None
+
+
+def test_run_cache_load_ignores_invalid_entries(tmp_path: Path):
+    entry_path = tmp_path / "entry.json"
+    entry_path.write_text('{"output": ""}')
+    assert RunCache(tmp_path).load(entry_path) is None
+
+
+@pytest.mark.parametrize(
+    ids=["no files", "missing file", "old file", "recent file"],
+    argnames=["dependencies", "expected_return"],
+    argvalues=[
+        ({}, False),
+        ({"a": None}, False),
+        ({"a": (1, 2, 10 * RACY_WINDOW_NS, 0)}, False),
+        ({"a": None, "b": (1, 2, 11 * RACY_WINDOW_NS, 0)}, True),
+    ],
+)
+def test_run_record_is_racy(dependencies, expected_return):
+    record = RunRecord(dependencies=dependencies, exit_code=0, output="")
+    assert record.is_racy(12 * RACY_WINDOW_NS) == expected_return
+
+
+def test_run_record_replay(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        RunRecord(dependencies={}, exit_code=0, output="2/2 checks passed\n").replay()
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().err == "2/2 checks passed\n"
+
+
+def test_run_cache_evict(tmp_path: Path):
+    run_cache = RunCache(tmp_path)
+    with patch("utils.run_cache.MAX_RUN_CACHE_ENTRIES", 2):
+        for index in range(3):
+            run_cache.save(
+                tmp_path / f"{index}.json",
+                RunRecord(dependencies={}, exit_code=0, output=""),
+            )
+    assert {entry.name for entry in tmp_path.iterdir()} <= {
+        "0.json",
+        "1.json",
+        "2.json",
+    }
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,120 @@
+import io
+import json
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+from _pytest.raises import RaisesExc
+
+from utils.streaming_json import (
+    JsonReader,
+    decode_object_members,
+    decode_value,
+    skip_whitespace,
+)
+
+DOCUMENT = {
+    "metadata": {"dbt_schema_version": "v12"},
+    "docs": {"doc.a": {"block_contents": 'quoted "} ] braces\\'}},
+    "nodes": {"model.a": {"raw_code": "select '{'", "tags": ["a", "b"]}},
+    "disabled": [[{"a": None}], True, 1.5, "x", 12345, {}, []],
+    "parent_map": {"model.a": []},
+}
+
+
+class RecordingStringIO(io.StringIO):
+    """StringIO which records the size of each read."""
+
+    def __init__(self, text: str):
+        super().__init__(text)
+        self.read_sizes: list[int] = []
+
+    def read(self, size: int | None = -1) -> str:
+        self.read_sizes.append(-1 if size is None else size)
+        return super().read(size)
+
+
+def test_skip_whitespace():
+    assert skip_whitespace(" \n\t\r x", 0) == 5
+
+
+@pytest.mark.parametrize(
+    ids=["all", "selected", "missing key", "empty selection"],
+    argnames="keys",
+    argvalues=[
+        None,
+        {"metadata", "parent_map"},
+        {"nodes", "exposures"},
+        set(),
+    ],
+)
+@pytest.mark.parametrize(argnames="chunk_size", argvalues=[1, 7, 1 << 20])
+def test_decode_object_members(keys: set[str] | None, chunk_size: int):
+    reader = JsonReader(
+        io.StringIO(json.dumps(DOCUMENT, indent=2)), chunk_size=chunk_size
+    )
+    assert decode_object_members(reader, keys=keys) == {
+        key: value for key, value in DOCUMENT.items() if keys is None or key in keys
+    }
+
+
+def test_decode_object_members_stops_after_selected_members():
+    reader = JsonReader(io.StringIO(json.dumps(DOCUMENT)))
+    decode_object_members(reader, keys={"metadata"})
+    assert reader.peek() == '"'
+    assert reader.text[reader.index :].startswith('"docs"')
+
+
+def test_decode_object_members_value_decoder():
+    reader = JsonReader(io.StringIO(json.dumps(DOCUMENT)), chunk_size=5)
+    members = decode_object_members(
+        reader,
+        keys={"nodes", "parent_map"},
+        value_decoder=lambda key, reader: (key, decode_value(key, reader)),
+    )
+    assert members == {
+        "nodes": ("nodes", DOCUMENT["nodes"]),
+        "parent_map": ("parent_map", DOCUMENT["parent_map"]),
+    }
+    assert reader.peek() == ""
+
+
+def test_json_reader_reads_in_chunks():
+    text = json.dumps({f"model.{index}": {"name": index} for index in range(1000)})
+    file_handler = RecordingStringIO(text)
+    reader = JsonReader(file_handler, chunk_size=64)
+    assert len(decode_object_members(reader)) == 1000
+    assert len(file_handler.read_sizes) > len(text) // 64
+    assert max(file_handler.read_sizes) < len(text) // 10
+
+
+def test_json_reader_reads_values_longer_than_a_chunk():
+    text = json.dumps({"a": "x" * 1000, "b": 10**100})
+    file_handler = RecordingStringIO(text)
+    reader = JsonReader(file_handler, chunk_size=16)
+    assert decode_object_members(reader) == json.loads(text)
+    assert len(file_handler.read_sizes) < 20
+
+
+@pytest.mark.parametrize(
+    argnames=["text", "expected_raise"],
+    argvalues=[
+        ("{}", does_not_raise()),
+        ("", pytest.raises(json.JSONDecodeError, match="Expecting '{'")),
+        ("[]", pytest.raises(json.JSONDecodeError, match="Expecting '{'")),
+        ('{"a" 1}', pytest.raises(json.JSONDecodeError, match="':' delimiter")),
+        ('{"a": 1 "b": 2}', pytest.raises(json.JSONDecodeError, match="',' delimiter")),
+        ("{a: 1}", pytest.raises(json.JSONDecodeError, match="property name")),
+        ('{"a": {"b": 1}', pytest.raises(json.JSONDecodeError)),
+        ('{"a": [1 2]}', pytest.raises(json.JSONDecodeError, match="',' delimiter")),
+        ('{"a": tru}', pytest.raises(json.JSONDecodeError, match="Expecting value")),
+        (
+            '{"b": "unterminated}',
+            pytest.raises(json.JSONDecodeError, match="Unterminated"),
+        ),
+    ],
+)
+def test_decode_object_members_invalid(
+    text: str, expected_raise: does_not_raise | RaisesExc[BaseException]
+):
+    with expected_raise:
+        decode_object_members(JsonReader(io.StringIO(text), chunk_size=2), keys={"c"})